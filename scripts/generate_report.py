@@ -301,7 +301,7 @@ def render_timing_analysis(data: dict) -> str:
     max_time = max(timing_avgs.values()) if timing_avgs else 1
 
     # 순서 정렬 (파이프라인 순서대로)
-    order = ["query_enhance", "preprocess", "embedding", "query_build", "search", "filter", "chunk_expand", "context_build", "prompt_render", "llm"]
+    order = ["query_enhance", "preprocess", "embedding", "cache_lookup", "search_bm25", "query_build", "search", "fusion", "filter", "chunk_expand", "context_build", "prompt_render", "llm"]
     sorted_timings = [(name, timing_avgs[name]) for name in order if name in timing_avgs]
 
     bars_html = ""
@@ -338,10 +338,11 @@ def render_questions(data: dict) -> str:
         # 타이밍 상세
         timing_html = ""
         for name, ms in r.get("timings", {}).items():
+            value = ("HIT" if ms else "MISS") if name == "cache_hit" else f"{ms:.0f}ms"
             timing_html += f"""
             <div class="timing-item">
                 <div class="name">{name}</div>
-                <div class="value">{ms:.0f}ms</div>
+                <div class="value">{value}</div>
             </div>
             """
 
@@ -0,0 +1,449 @@
+"""가짜 백엔드 부하 테스트
+
+외부 서비스(Bedrock / Vertex / OpenSearch / Reranker)를 src.fake_backends의 합성 백엔드로 바꿔
+동시 요청 100개 이상에서 파이프라인/Agent 오케스트레이션을 실행합니다.
+백엔드 지연은 sleep이므로 벽시계 시간 대비 CPU 시간, 단계별 타이밍, 프로파일에서
+우리 코드(스레드 풀, 락, 직렬화, 컨텍스트 조립 등)가 병목이 되는 지점을 확인할 수 있습니다.
+
+Usage:
+    # 파이프라인 query_batch (질문 200개, 동시 LLM 100)
+    uv run python scripts/load_test.py --requests 200 --concurrency 100
+
+    # 사용자 100명이 동시에 query() / aquery() 호출
+    uv run python scripts/load_test.py --driver threads --concurrency 100
+    uv run python scripts/load_test.py --driver async --concurrency 100 --pipeline full
+
+    # Agent 오케스트레이션 (도구 호출 1회 → 최종 답변)
+    uv run python scripts/load_test.py --target agent --requests 200 --concurrency 100
+
+    # 롱테일 스파이크 + 오류/스로틀링
+    uv run python scripts/load_test.py --spike-rate 0.02 --error-rate 0.01 --throttle-rate 0.02
+
+    # 모든 지연을 1/10로 줄여 빠르게 (CPU 병목이 더 잘 드러남) + 스레드별 프로파일
+    uv run python scripts/load_test.py --time-scale 0.1 --profile data/results/load_test.prof
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import pstats
+import statistics
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.fake_backends import (  # noqa: E402
+    FakeEmbeddingClient,
+    FakeLLMClient,
+    FakeRerankerFilter,
+    FakeSearchClient,
+    FaultModel,
+    LatencyModel,
+)
+from src.rag import RAGPipeline  # noqa: E402
+from src.rag.modules import (  # noqa: E402
+    CompositeFilter,
+    HybridQueryBuilder,
+    KNNQueryBuilder,
+    KoreanPreprocessor,
+    NeighborChunkExpander,
+    ProjectSizeCache,
+    RankedContextBuilder,
+    SimpleContextBuilder,
+    SimplePromptTemplate,
+    StrictPromptTemplate,
+    TopKFilter,
+)
+
+INDEX = "rag-index-fake"
+PROJECT_ID = 334
+
+QUESTIONS = [
+    "연차 휴가는 며칠까지 이월할 수 있나요?",
+    "출장비 정산 기한과 필요한 증빙 서류는 무엇인가요?",
+    "재택근무 신청 절차를 알려주세요",
+    "보안 사고 발생 시 보고 체계는 어떻게 되나요?",
+    "신규 입사자 교육 일정은 어떻게 되나요?",
+]
+
+
+# =============================================================================
+# 백엔드 / 파이프라인 구성
+# =============================================================================
+
+
+def build_backends(args) -> dict:
+    """인자로 지연/실패 모델을 만들어 가짜 백엔드 생성"""
+    scale = args.time_scale
+
+    def latency(median_ms: float) -> LatencyModel:
+        return LatencyModel(
+            median_ms=median_ms * scale,
+            sigma=args.sigma,
+            spike_rate=args.spike_rate,
+            spike_multiplier=args.spike_multiplier,
+        )
+
+    faults = FaultModel(error_rate=args.error_rate, throttle_rate=args.throttle_rate)
+    return {
+        "embedding": FakeEmbeddingClient(latency=latency(args.embed_ms), faults=faults, seed=args.seed),
+        "search": FakeSearchClient(
+            latency=latency(args.search_ms),
+            faults=faults,
+            seed=args.seed,
+            msearch_entry_ms=5.0 * scale,
+        ),
+        "llm": FakeLLMClient(
+            latency=latency(args.llm_ms),
+            faults=faults,
+            seed=args.seed,
+            output_tokens=args.output_tokens,
+            ms_per_output_token=args.ms_per_token * scale,
+        ),
+        "reranker": FakeRerankerFilter(
+            top_k=5,
+            latency=latency(5.0),
+            ms_per_doc=args.rerank_ms_per_doc * scale,
+            cpu_bound=args.rerank_cpu_bound,
+            faults=faults,
+            seed=args.seed,
+        ),
+    }
+
+
+def build_pipeline(name: str, backends: dict) -> RAGPipeline:
+    """create_*_pipeline과 같은 모듈 구성으로 가짜 백엔드 파이프라인 생성"""
+    search_client = backends["search"]
+    common = {
+        "search_client": search_client,
+        "embedding_client": backends["embedding"],
+        "llm_client": backends["llm"],
+        "index": INDEX,
+        "project_id": PROJECT_ID,
+    }
+    project_size = ProjectSizeCache(partial(search_client.get_doc_count_by_project, INDEX))
+
+    if name == "minimal":
+        return RAGPipeline(
+            **common,
+            query_builder=KNNQueryBuilder(project_size=project_size),
+            context_builder=SimpleContextBuilder(),
+            prompt_template=SimplePromptTemplate(),
+            search_size=5,
+        )
+    if name == "standard":
+        return RAGPipeline(
+            **common,
+            query_builder=HybridQueryBuilder(project_size=project_size),
+            result_filter=TopKFilter(k=5),
+            context_builder=RankedContextBuilder(reorder=True),
+            prompt_template=StrictPromptTemplate(),
+            search_size=20,
+            search_pipeline=HybridQueryBuilder.SEARCH_PIPELINE,
+        )
+    return RAGPipeline(
+        **common,
+        preprocessor=KoreanPreprocessor(),
+        query_builder=HybridQueryBuilder(project_size=project_size),
+        result_filter=CompositeFilter([TopKFilter(k=20), backends["reranker"]]),
+        chunk_expander=NeighborChunkExpander(opensearch_client=search_client.client, index_name=INDEX, window=5),
+        context_builder=RankedContextBuilder(reorder=True),
+        prompt_template=StrictPromptTemplate(),
+        search_size=50,
+        search_pipeline=HybridQueryBuilder.SEARCH_PIPELINE,
+    )
+
+
+def make_questions(n: int) -> list[str]:
+    """중복 없는 질문 n개 (임베딩/답변 중복 제거가 부하를 줄이지 않도록 번호를 붙임)"""
+    return [f"{QUESTIONS[i % len(QUESTIONS)]} (#{i})" for i in range(n)]
+
+
+# =============================================================================
+# 실행 드라이버
+# =============================================================================
+
+
+def run_threads(func, questions: list[str], concurrency: int) -> list[tuple[float, object]]:
+    """스레드 풀에서 func(question) 동시 실행 → [(요청 지연 ms, 결과 또는 예외)]"""
+
+    def timed(question: str):
+        start = time.perf_counter()
+        try:
+            result = func(question)
+        except Exception as e:
+            result = e
+        return (time.perf_counter() - start) * 1000, result
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(timed, q) for q in questions]
+        return [future.result() for future in as_completed(futures)]
+
+
+def run_async(pipeline: RAGPipeline, questions: list[str], concurrency: int) -> list[tuple[float, object]]:
+    """asyncio에서 aquery 동시 실행 (세마포어로 동시 요청 수 제한)"""
+
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed(question: str):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result = await pipeline.aquery(question)
+                except Exception as e:
+                    result = e
+                return (time.perf_counter() - start) * 1000, result
+
+        return await asyncio.gather(*(timed(q) for q in questions))
+
+    return asyncio.run(main())
+
+
+def run_batch(pipeline: RAGPipeline, questions: list[str], concurrency: int) -> list[tuple[float, object]]:
+    """query_batch 일괄 실행 (요청 지연 = 배치 시작부터 해당 질문 완료까지)"""
+    start = time.perf_counter()
+    done: list[tuple[float, object]] = []
+
+    def on_result(_: int, result) -> None:
+        done.append(((time.perf_counter() - start) * 1000, result))
+
+    pipeline.query_batch(questions, concurrency=concurrency, return_exceptions=True, on_result=on_result)
+    return done
+
+
+def run_agent(backends: dict, args, questions: list[str]) -> tuple[list[tuple[float, object]], object]:
+    """질문마다 AgentRAG를 만들어 스레드 풀에서 동시 실행 (모델/검색 백엔드는 공유)"""
+    from src.agent import AgentRAG
+    from src.agent.fake_model import FakeAgentModel
+    from src.agent.tools import SearchSession
+
+    scale = args.time_scale
+    model = FakeAgentModel(
+        latency=LatencyModel(
+            median_ms=args.llm_ms * scale,
+            sigma=args.sigma,
+            spike_rate=args.spike_rate,
+            spike_multiplier=args.spike_multiplier,
+        ),
+        faults=FaultModel(error_rate=args.error_rate, throttle_rate=args.throttle_rate),
+        seed=args.seed,
+        output_tokens=args.output_tokens,
+        ms_per_output_token=args.ms_per_token * scale,
+        tool_rounds=args.tool_rounds,
+    )
+
+    def ask(question: str):
+        session = SearchSession(search_client=backends["search"], embedding_client=backends["embedding"])
+        return AgentRAG(project_id=PROJECT_ID, model=model, search=session, print_stream=False).query(question)
+
+    return run_threads(ask, questions, args.concurrency), model
+
+
+# =============================================================================
+# 프로파일 / 리포트
+# =============================================================================
+
+
+class ThreadProfiler:
+    """모든 스레드 cProfile (cProfile.Profile은 켠 스레드만 측정하므로 새 스레드마다 하나씩 생성)"""
+
+    def __init__(self):
+        self.profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def _start_thread(self, frame, event, arg) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            self.profiles.append(profile)
+        profile.enable()  # sys.setprofile 훅을 이 프로파일러로 교체
+
+    def __enter__(self) -> "ThreadProfiler":
+        threading.setprofile(self._start_thread)
+        main = cProfile.Profile()
+        self.profiles.append(main)
+        main.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        threading.setprofile(None)
+        self.profiles[0].disable()
+
+    def save(self, path: Path, top: int = 25) -> None:
+        stats = pstats.Stats(*self.profiles)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(path)
+        print(f"\n프로파일 저장: {path} (스레드 {len(self.profiles)}개)")
+        stats.sort_stats("tottime").print_stats(top)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """백분위수 (최근접 순위)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(outcomes: list[tuple[float, object]], wall: float, cpu: float, peak_threads: int) -> dict:
+    """요청 지연 분포 / 처리량 / 오류 / 단계별 평균 타이밍"""
+    latencies = [ms for ms, result in outcomes if not isinstance(result, Exception)]
+    errors = Counter(type(result).__name__ for _, result in outcomes if isinstance(result, Exception))
+
+    stage_totals: dict[str, list[float]] = defaultdict(list)
+    for _, result in outcomes:
+        for stage, ms in (getattr(result, "timings", None) or {}).items():
+            stage_totals[stage].append(ms)
+
+    summary = {
+        "requests": len(outcomes),
+        "ok": len(latencies),
+        "errors": dict(errors),
+        "wall_s": round(wall, 2),
+        "throughput_rps": round(len(outcomes) / wall, 1) if wall else 0.0,
+        "cpu_s": round(cpu, 2),
+        "cpu_util": round(cpu / wall, 2) if wall else 0.0,
+        "peak_threads": peak_threads,
+        "stages_mean_ms": {stage: round(statistics.fmean(v), 1) for stage, v in stage_totals.items()},
+    }
+    if latencies:
+        summary["latency_ms"] = {
+            "p50": round(_percentile(latencies, 50), 1),
+            "p95": round(_percentile(latencies, 95), 1),
+            "p99": round(_percentile(latencies, 99), 1),
+            "max": round(max(latencies), 1),
+        }
+    return summary
+
+
+def print_report(summary: dict, backends: dict) -> None:
+    print("\n" + "=" * 60)
+    print("부하 테스트 결과")
+    print("=" * 60)
+    print(f"요청: {summary['requests']} (성공 {summary['ok']}, 실패 {summary['requests'] - summary['ok']})")
+    if summary["errors"]:
+        print(f"오류: {summary['errors']}")
+    print(f"소요: {summary['wall_s']}s, 처리량: {summary['throughput_rps']} req/s")
+    print(f"CPU: {summary['cpu_s']}s (벽시계 대비 {summary['cpu_util']:.0%}), 최대 스레드: {summary['peak_threads']}")
+    if "latency_ms" in summary:
+        lat = summary["latency_ms"]
+        print(f"지연(ms): p50 {lat['p50']}, p95 {lat['p95']}, p99 {lat['p99']}, max {lat['max']}")
+    if summary["stages_mean_ms"]:
+        print("\n단계별 평균(ms):")
+        for stage, ms in sorted(summary["stages_mean_ms"].items(), key=lambda item: -item[1]):
+            print(f"  {stage:<20} {ms:>10.1f}")
+    print("\n백엔드:")
+    for name, backend in backends.items():
+        stats = backend.stats.summary()
+        if stats["calls"]:
+            print(f"  {name:<10} {stats}")
+
+
+# =============================================================================
+# 메인
+# =============================================================================
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="가짜 백엔드 부하 테스트")
+    parser.add_argument("--target", choices=["pipeline", "agent"], default="pipeline", help="부하 대상")
+    parser.add_argument("--pipeline", choices=["minimal", "standard", "full"], default="standard")
+    parser.add_argument(
+        "--driver",
+        choices=["batch", "threads", "async"],
+        default="batch",
+        help="파이프라인 실행 방식 (query_batch / 스레드별 query / asyncio aquery)",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="요청 수")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시 요청 수")
+
+    latency = parser.add_argument_group("지연 / 실패")
+    latency.add_argument("--embed-ms", type=float, default=120.0, help="임베딩 지연 중앙값")
+    latency.add_argument("--search-ms", type=float, default=40.0, help="검색 지연 중앙값")
+    latency.add_argument("--llm-ms", type=float, default=600.0, help="LLM 첫 토큰 지연 중앙값")
+    latency.add_argument("--ms-per-token", type=float, default=15.0, help="LLM 출력 토큰당 지연")
+    latency.add_argument("--output-tokens", type=int, default=200, help="LLM 출력 토큰 수 중앙값")
+    latency.add_argument("--rerank-ms-per-doc", type=float, default=3.0, help="Reranker 문서당 지연")
+    latency.add_argument("--rerank-cpu-bound", action="store_true", help="Reranker를 바쁜 대기로 (GIL 점유)")
+    latency.add_argument("--sigma", type=float, default=0.4, help="로그정규 sigma")
+    latency.add_argument("--spike-rate", type=float, default=0.0, help="롱테일 스파이크 확률")
+    latency.add_argument("--spike-multiplier", type=float, default=10.0, help="스파이크 지연 배수")
+    latency.add_argument("--error-rate", type=float, default=0.0, help="오류 비율")
+    latency.add_argument("--throttle-rate", type=float, default=0.0, help="스로틀링 비율")
+    latency.add_argument("--time-scale", type=float, default=1.0, help="모든 지연 배수 (0.1이면 10배 빠르게)")
+    latency.add_argument("--tool-rounds", type=int, default=1, help="Agent 최종 답변 전 검색 도구 호출 수")
+    latency.add_argument("--seed", type=int, default=0, help="난수 시드")
+
+    parser.add_argument("--profile", type=Path, help="스레드별 cProfile 결과 저장 경로 (pstats)")
+    parser.add_argument("--output", type=Path, help="요약 JSON 저장 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    backends = build_backends(args)
+    questions = make_questions(args.requests)
+
+    label = "agent" if args.target == "agent" else f"{args.pipeline} / {args.driver}"
+    print(f"부하 테스트: {label}, 요청 {args.requests}개, 동시 {args.concurrency}")
+
+    peak_threads = threading.active_count()
+    stop = threading.Event()
+
+    def watch_threads():
+        nonlocal peak_threads
+        while not stop.wait(0.05):
+            peak_threads = max(peak_threads, threading.active_count())
+
+    watcher = threading.Thread(target=watch_threads, daemon=True)
+    watcher.start()
+
+    profiler = ThreadProfiler() if args.profile else None
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    if profiler:
+        profiler.__enter__()
+    try:
+        if args.target == "agent":
+            outcomes, model = run_agent(backends, args, questions)
+            backends = {"agent_llm": model, **{k: v for k, v in backends.items() if k != "llm"}}
+        else:
+            pipeline = build_pipeline(args.pipeline, backends)
+            if args.driver == "batch":
+                outcomes = run_batch(pipeline, questions, args.concurrency)
+            elif args.driver == "threads":
+                outcomes = run_threads(pipeline.query, questions, args.concurrency)
+            else:
+                outcomes = run_async(pipeline, questions, args.concurrency)
+    finally:
+        if profiler:
+            profiler.__exit__(None, None, None)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        stop.set()
+        watcher.join()
+
+    summary = summarize(outcomes, wall, cpu, peak_threads)
+    print_report(summary, backends)
+
+    if profiler:
+        profiler.save(args.profile)
+
+    if args.output:
+        summary["args"] = {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()}
+        summary["backends"] = {name: backend.stats.summary() for name, backend in backends.items()}
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n요약 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,19 +7,71 @@ Commands:
     test                    연결 테스트
     explore [index]         인덱스 구조 탐색
     count <project_id>      프로젝트별 청크 개수
-    collect <project_id>    텍스트 수집
+    collect <project_id>    텍스트 수집 (--include-vectors: 임베딩 포함, --from-json 입력용)
+    export <project_id>     NDJSON 스트리밍 내보내기 (PIT + search_after)
+    snapshot <project_id>   바이너리 스냅샷 내보내기 (mmap .npy 임베딩 + 컬럼형 메타데이터)
     get-doc <document_id>   문서 조회
+    bench-transport         전송 계층/풀/압축 설정별 검색 레이턴시·처리량 비교
+    bench-local             로컬 스냅샷 검색(KNN/하이브리드) vs 원격 OpenSearch 레이턴시·recall 비교
+    bench-exact             프로젝트 크기별 근사 knn vs 정확 script_score 레이턴시·recall 비교
+    sweep                   질문셋으로 ef_search/k/search_size 조합별 recall(정확 검색 기준)·레이턴시 측정
+    create-index <name>     최적화 설정(faiss/lucene, m/ef_construction, fp16/byte, Nori)으로 인덱스 생성
+    reindex <project_id>    프로젝트 청크를 새 인덱스로 재색인 + 전후 용량/레이턴시/recall 비교
+    bench-routing <project_id>  다중 샤드 인덱스에서 project_id 라우팅 유무별 KNN/하이브리드 레이턴시 비교
+    ingest [root]           로컬 파일(data/test_docs/**.txt) 청크 → 배치 임베딩 → 병렬 _bulk 색인 + docs/sec
+    sync [root]             md5_hash 증분 동기화 (바뀐 청크만 임베딩/upsert, 고아 청크 삭제, 로컬 매니페스트)
+
+Local single-node OpenSearch (보안 플러그인 off, analysis-nori 설치):
+    cli.py collect 334 --include-vectors  # --from-json 입력은 임베딩 포함 파일만 가능
+    cli.py create-index rag-index-optimized --host localhost --port 9200 --no-ssl
+    cli.py reindex 334 --dest rag-index-optimized --from-json data/texts_334.json --port 9200 --no-ssl
+    cli.py reindex 334 --dest rag-index-routed --create --route-by-project --shards 4 --port 9200 --no-ssl
+    cli.py bench-routing 334 --from-json data/texts_334.json --shards 8 --copies 8 --port 9200 --no-ssl
+    cli.py ingest data/test_docs --project-id 334 --index rag-index-ingest --create --port 9200 --no-ssl
+    cli.py sync data/test_docs --project-id 334 --index rag-index-ingest --port 9200 --no-ssl
 """
 
 import argparse
+import itertools
 import json
+import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
 
-sys.path.insert(0, "src")
+# 프로젝트 루트를 path에 추가
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
 
-from opensearch_client import OpenSearchClient
+from src.embedding_cache import CachedEmbeddingClient  # noqa: E402
+from src.embedding_client import EmbeddingClient  # noqa: E402
+from src.index_schema import (  # noqa: E402
+    ENCODINGS,
+    ENGINES,
+    build_index_body,
+    search_pipeline_body,
+    to_index_doc,
+)
+from src.ingest import BulkIngestor, IncrementalSync, TextChunker, iter_documents  # noqa: E402
+from src.local_search.client import LocalSearchClient  # noqa: E402
+from src.local_search.fusion import PIPELINE_RANK_CONSTANTS  # noqa: E402
+from src.local_search.snapshot import ChunkSnapshot, SnapshotWriter  # noqa: E402
+from src.opensearch_client import ROUTING_FIELD, VECTOR_FIELDS, OpenSearchClient, project_routing  # noqa: E402
+from src.rag.modules.query_builder import HybridQueryBuilder, KNNQueryBuilder  # noqa: E402
 
 DEFAULT_INDEX = "rag-index-fargate-live"
+QUESTIONS_PATH = Path("data/questions/question_set.json")
+MANIFEST_DIR = Path("data/manifests")
+
+# HybridQueryBuilder.SEARCH_FIELDS / SEARCH_PIPELINE과 동일
+HYBRID_FIELDS = ["chunk_text^4.0", "text.ko^3.5", "text.en^1.8"]
+HYBRID_PIPELINE = "hybrid-rrf"
+
+# bench-routing 합성 프로젝트 ID 간격 (원본 project_id와 겹치지 않게)
+SYNTHETIC_PROJECT_STEP = 1_000_000
 
 
 def cmd_test(args):
@@ -75,44 +127,161 @@ def cmd_count(args):
     print(f"project_id={args.project_id}: {count} chunks")
 
 
+def _to_record(hit: dict) -> dict:
+    """검색 hit → 저장 형식 {"id", "text", "metadata"}"""
+    source = hit["_source"]
+    return {
+        "id": hit["_id"],
+        "text": source.get("text", ""),
+        "metadata": {k: v for k, v in source.items() if k != "text"},
+    }
+
+
 def cmd_collect(args):
-    """텍스트 수집"""
-    client = OpenSearchClient()
+    """텍스트 수집 (벡터 필드는 --include-vectors일 때만, 나머지 메타데이터는 모두 유지)
+
+    PIT + search_after로 페이지 단위 조회하며 바로 파일에 씁니다 (메모리 사용량 일정).
+    snapshot / reindex / bench-routing의 --from-json 입력으로 쓰려면 --include-vectors가 필요합니다.
+    """
+    client = OpenSearchClient(source_fields=None)
     project_id = args.project_id
     index = args.index
 
     print(f"📥 Collecting texts for project: {project_id}")
-    print(f"   Index: {index}")
+    print(f"   Index: {index} (vectors={'on' if args.include_vectors else 'off'})")
+
+    output_path = f"data/texts_{project_id}.json"
+    count = 0
+    sample = None
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for hit in client.iter_docs_by_project(index, project_id, include_vectors=args.include_vectors):
+            record = _to_record(hit)
+            if count:
+                f.write(",\n")
+            f.write(json.dumps(record, ensure_ascii=False))
+            count += 1
+            sample = sample or record
+        f.write("\n]\n")
 
-    docs = client.get_all_docs_by_project(index, project_id)
-    print(f"   Found {len(docs)} chunks")
+    print(f"   Found {count} chunks")
 
-    if not docs:
+    if not count:
         print("❌ No documents found")
         return
 
-    texts = []
-    for doc in docs:
-        source = doc["_source"]
-        texts.append({
-            "id": doc["_id"],
-            "text": source.get("text", ""),
-            "metadata": {k: v for k, v in source.items() if k not in ["text", "embedding"]},
-        })
-
-    output_path = f"data/texts_{project_id}.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(texts, f, ensure_ascii=False, indent=2)
-
     print(f"✅ Saved to {output_path}")
 
-    if texts:
-        sample = texts[0]
-        print(f"\n📄 Sample (first chunk):")
+    if sample:
+        print("\n📄 Sample (first chunk):")
         print(f"   ID: {sample['id']}")
         print(f"   Text: {sample['text'][:200]}...")
 
 
+def cmd_export(args):
+    """프로젝트 청크를 NDJSON으로 내보내기 (대용량용)
+
+    한 줄에 청크 하나 {"id", "text", "metadata"}를 씁니다.
+    PIT + search_after 페이지 단위 스트리밍이라 수백만 청크도 메모리 사용량이 일정합니다.
+    """
+    client = OpenSearchClient(source_fields=None, timeout=args.timeout)
+    output_path = Path(args.output or f"data/export_{args.project_id}.ndjson")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    print(f"📤 Exporting project {args.project_id} from {args.index}")
+    print(f"   Output: {output_path} (page_size={args.page_size}, vectors={'on' if args.include_vectors else 'off'})")
+
+    start = time.time()
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        hits = client.iter_docs_by_project(
+            args.index,
+            args.project_id,
+            page_size=args.page_size,
+            include_vectors=args.include_vectors,
+        )
+        for hit in hits:
+            f.write(json.dumps(_to_record(hit), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+            if count % (args.page_size * 10) == 0:
+                print(f"   ... {count:,} chunks ({time.time() - start:.1f}s)")
+
+    print(f"✅ Exported {count:,} chunks in {time.time() - start:.1f}s")
+
+
+def _from_record(record: dict) -> dict:
+    """저장 형식 {"id", "text", "metadata"} → 검색 hit (_to_record의 역변환)"""
+    return {"_id": record["id"], "_source": {**record.get("metadata", {}), "text": record.get("text", "")}}
+
+
+def _iter_records(path: Path):
+    """collect(.json) / export(.ndjson) 결과 파일에서 hit 순회"""
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".ndjson":
+            for line in f:
+                if line.strip():
+                    yield _from_record(json.loads(line))
+        else:
+            for record in json.load(f):
+                yield _from_record(record)
+
+
+def _iter_vector_records(path: Path):
+    """임베딩이 포함된 결과 파일에서 hit 순회 (--from-json 입력용)
+
+    첫 레코드에 임베딩 필드가 없으면 출력을 만들기 전에 바로 종료합니다.
+    """
+    hits = _iter_records(path)
+    first = next(hits, None)
+    if first is None:
+        return iter(())
+    if not any(first["_source"].get(field) for field in VECTOR_FIELDS):
+        sys.exit(
+            f"❌ {path}에 임베딩 필드({', '.join(VECTOR_FIELDS)})가 없습니다. "
+            "collect --include-vectors 또는 export --include-vectors로 다시 만드세요"
+        )
+    return itertools.chain([first], hits)
+
+
+def cmd_snapshot(args):
+    """프로젝트 청크를 바이너리 스냅샷으로 내보내기
+
+    임베딩은 (N, D) .npy 행렬, 메타데이터는 컬럼별 파일로 저장합니다.
+    ChunkSnapshot.open()으로 JSON 파싱 없이 mmap으로 바로 열 수 있습니다.
+    --from-json을 주면 OpenSearch 대신 collect/export --include-vectors 결과 파일에서 변환합니다.
+    """
+    output_path = Path(args.output or f"data/snapshots/{args.project_id}")
+
+    if args.from_json:
+        source = args.from_json
+        hits = _iter_vector_records(Path(source))
+    else:
+        source = args.index
+        client = OpenSearchClient(source_fields=None, timeout=args.timeout)
+        hits = client.iter_docs_by_project(
+            args.index, args.project_id, page_size=args.page_size, include_vectors=True
+        )
+
+    print(f"📦 Snapshot project {args.project_id} from {source}")
+    print(f"   Output: {output_path} (dtype={args.dtype}, dimensions={args.dimensions})")
+
+    start = time.time()
+    with SnapshotWriter(output_path, dimensions=args.dimensions, dtype=args.dtype, source=source) as writer:
+        for hit in hits:
+            writer.add_hit(hit)
+    elapsed = time.time() - start
+
+    size_mb = sum(f.stat().st_size for f in output_path.iterdir()) / 1024 / 1024
+    print(f"✅ Wrote {writer.count:,} chunks in {elapsed:.1f}s ({size_mb:.1f} MB)")
+
+    start = time.perf_counter()
+    snapshot = ChunkSnapshot.open(output_path)
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"   Load check: {len(snapshot):,} chunks, {snapshot.embeddings.shape} in {load_ms:.1f}ms")
+    snapshot.close()
+
+
 def cmd_get_doc(args):
     """문서 조회"""
     client = OpenSearchClient()
@@ -142,6 +311,737 @@ def cmd_get_doc(args):
                 print(f"   - {key}: {value}")
 
 
+def _percentile(values: list[float], pct: float) -> float:
+    """백분위수 (최근접 순위)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def cmd_bench_transport(args):
+    """전송 계층 벤치마크
+
+    설정(transport × 압축 × keep-alive)마다 클라이언트를 새로 만들고,
+    동시 검색 수별로 같은 KNN 쿼리를 반복 실행해 레이턴시와 처리량을 측정합니다.
+    """
+    concurrencies = [int(c) for c in args.concurrency.split(",")]
+    pool_maxsize = args.pool_maxsize or max(concurrencies)
+
+    rng = random.Random(0)
+    vector = [rng.uniform(-1, 1) for _ in range(args.dimensions)]
+    query = {
+        "query": {
+            "knn": {
+                "embedding": {
+                    "vector": vector,
+                    "k": args.k,
+                    "filter": {"term": {"project_id": args.project_id}},
+                }
+            }
+        }
+    }
+
+    configs = [
+        (transport, compress, keep_alive)
+        for transport in args.transports.split(",")
+        for compress in (c == "on" for c in args.compress.split(","))
+        for keep_alive in (k == "on" for k in args.keep_alive.split(","))
+    ]
+
+    print(f"📊 Transport benchmark: index={args.index}, project_id={args.project_id}")
+    print(f"   requests/level={args.requests}, pool_maxsize={pool_maxsize}, k={args.k}")
+    print()
+    print(f"{'transport':<10} {'compress':<9} {'keepalive':<10} {'conc':>5} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>9}")
+    print("-" * 67)
+
+    for transport, compress, keep_alive in configs:
+        client = OpenSearchClient(
+            transport=transport,
+            pool_maxsize=pool_maxsize,
+            http_compress=compress,
+            keep_alive=keep_alive,
+            timeout=args.timeout,
+        )
+
+        def run_one(_) -> float:
+            start = time.perf_counter()
+            client.search(args.index, query, size=args.k)
+            return (time.perf_counter() - start) * 1000
+
+        # 워밍업 (커넥션 생성/TLS 핸드셰이크 제외)
+        with ThreadPoolExecutor(max_workers=max(concurrencies)) as executor:
+            list(executor.map(run_one, range(max(concurrencies))))
+
+        for concurrency in concurrencies:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                wall_start = time.perf_counter()
+                latencies = list(executor.map(run_one, range(args.requests)))
+                wall = time.perf_counter() - wall_start
+
+            print(
+                f"{transport:<10} {'on' if compress else 'off':<9} {'on' if keep_alive else 'off':<10} "
+                f"{concurrency:>5} {_percentile(latencies, 50):>9.1f} {_percentile(latencies, 95):>9.1f} "
+                f"{args.requests / wall:>9.1f}"
+            )
+
+        client.client.close()
+
+
+def _knn_query(vector: list[float], k: int, project_id: int) -> dict:
+    """벤치마크용 KNN 쿼리 (KNNQueryBuilder와 같은 형식)"""
+    return {
+        "query": {
+            "knn": {
+                "embedding": {
+                    "vector": vector,
+                    "k": k,
+                    "filter": {"term": {"project_id": project_id}},
+                }
+            }
+        }
+    }
+
+
+def _exact_query(vector: list[float], project_id: int, space_type: str = "l2") -> dict:
+    """벤치마크용 정확 검색 쿼리 (KNNQueryBuilder 정확 검색과 같은 형식)"""
+    return {
+        "query": {
+            "script_score": {
+                "query": {"bool": {"filter": [{"term": {"project_id": project_id}}]}},
+                "script": {
+                    "source": "knn_score",
+                    "lang": "knn",
+                    "params": {"field": "embedding", "query_value": vector, "space_type": space_type},
+                },
+            }
+        }
+    }
+
+
+def _hybrid_query(text: str, vector: list[float], k: int, project_id: int) -> dict:
+    """벤치마크용 하이브리드 쿼리 (HybridQueryBuilder와 같은 형식)"""
+    filter_clause = {"term": {"project_id": project_id}}
+    return {
+        "query": {
+            "hybrid": {
+                "queries": [
+                    {
+                        "bool": {
+                            "must": [{"multi_match": {"query": text, "fields": HYBRID_FIELDS}}],
+                            "filter": [filter_clause],
+                        }
+                    },
+                    {"knn": {"embedding": {"vector": vector, "k": k, "filter": filter_clause}}},
+                ]
+            }
+        }
+    }
+
+
+def _timed_search(
+    client, index: str, queries: list[dict], k: int, pipeline: str | None = None
+) -> tuple[list[float], list[list[str]]]:
+    """쿼리별 레이턴시(ms)와 결과 ID"""
+    latencies, ids = [], []
+    for query in queries:
+        start = time.perf_counter()
+        if pipeline:
+            hits = client.search_with_pipeline(index, query, size=k, pipeline=pipeline)
+        else:
+            hits = client.search(index, query, size=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids.append([hit["_id"] for hit in hits])
+    return latencies, ids
+
+
+def _recall(expected: list[list[str]], actual: list[list[str]]) -> float:
+    """expected 대비 actual의 평균 recall@k"""
+    ratios = [len(set(e) & set(a)) / len(e) for e, a in zip(expected, actual) if e]
+    return sum(ratios) / len(ratios) if ratios else 0.0
+
+
+def cmd_bench_local(args):
+    """로컬 검색 벤치마크
+
+    스냅샷 청크 임베딩에 잡음을 더한 벡터를 쿼리로 사용해
+    로컬 정확 검색(BruteForce), 로컬 HNSW(hnswlib 설치 시), 원격 OpenSearch를 비교합니다.
+    하이브리드는 같은 청크 본문 앞부분을 BM25 질의로 사용합니다.
+    recall은 로컬 정확 검색(하이브리드는 로컬 하이브리드) 결과를 기준으로 계산합니다.
+    """
+    snapshot_path = Path(args.snapshot or f"data/snapshots/{args.project_id}")
+
+    start = time.perf_counter()
+    local = LocalSearchClient.from_snapshot(snapshot_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    rows = np.flatnonzero(local.snapshot.project_id == args.project_id)
+    if not len(rows):
+        print(f"❌ No chunks for project_id={args.project_id} in {snapshot_path}")
+        return
+
+    rng = np.random.default_rng(0)
+    sampled = rng.choice(rows, size=args.queries)
+    picked = local.snapshot.embeddings[sampled].astype(np.float32)
+    vectors = picked + rng.normal(scale=args.noise, size=picked.shape).astype(np.float32)
+    queries = [_knn_query(vector.tolist(), args.k, args.project_id) for vector in vectors]
+    hybrid_queries = [
+        _hybrid_query(local.snapshot.text(int(row))[:40], vector.tolist(), args.k, args.project_id)
+        for row, vector in zip(sampled, vectors)
+    ]
+
+    print(f"📊 Local search benchmark: {snapshot_path} (project_id={args.project_id}, {len(rows):,} chunks)")
+    print(f"   queries={args.queries}, k={args.k}, snapshot load={load_ms:.1f}ms")
+    print()
+    print(f"{'backend':<12} {'build ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'recall':>8}")
+    print("-" * 61)
+
+    def report(name: str, build_ms: float, latencies: list[float], recall: float | None) -> None:
+        recall_text = f"{recall:>8.3f}" if recall is not None else f"{'-':>8}"
+        print(
+            f"{name:<12} {build_ms:>9.1f} {_percentile(latencies, 50):>9.2f} {_percentile(latencies, 95):>9.2f} "
+            f"{_percentile(latencies, 99):>9.2f} {recall_text}"
+        )
+
+    # 로컬 정확 검색 (첫 검색에서 프로젝트 인덱스 생성)
+    local.hnsw_threshold = len(local.snapshot) + 1
+    start = time.perf_counter()
+    local.search(args.index, queries[0], size=args.k)
+    build_ms = (time.perf_counter() - start) * 1000
+    latencies, exact_ids = _timed_search(local, args.index, queries, args.k)
+    report("bruteforce", build_ms, latencies, 1.0)
+
+    # 로컬 하이브리드 (BM25 + KNN, RRF)
+    start = time.perf_counter()
+    local.search_with_pipeline(args.index, hybrid_queries[0], size=args.k, pipeline=HYBRID_PIPELINE)
+    build_ms = (time.perf_counter() - start) * 1000
+    latencies, hybrid_ids = _timed_search(local, args.index, hybrid_queries, args.k, HYBRID_PIPELINE)
+    report("hybrid", build_ms, latencies, 1.0)
+
+    # 로컬 HNSW
+    try:
+        hnsw = LocalSearchClient(local.snapshot, hnsw_threshold=0, hnsw_ef_search=args.ef_search)
+        start = time.perf_counter()
+        hnsw.search(args.index, queries[0], size=args.k)
+        build_ms = (time.perf_counter() - start) * 1000
+        latencies, ids = _timed_search(hnsw, args.index, queries, args.k)
+        report("hnsw", build_ms, latencies, _recall(exact_ids, ids))
+    except ImportError as e:
+        print(f"{'hnsw':<12} skipped ({e})")
+
+    # 원격 OpenSearch
+    if args.skip_remote:
+        return
+    try:
+        remote = OpenSearchClient(timeout=args.timeout)
+        remote.search(args.index, queries[0], size=args.k)  # 워밍업
+        latencies, ids = _timed_search(remote, args.index, queries, args.k)
+        report("opensearch", 0.0, latencies, _recall(exact_ids, ids))
+        latencies, ids = _timed_search(remote, args.index, hybrid_queries, args.k, HYBRID_PIPELINE)
+        report("os-hybrid", 0.0, latencies, _recall(hybrid_ids, ids))
+    except Exception as e:
+        print(f"{'opensearch':<12} skipped ({type(e).__name__}: {e})")
+
+
+def _pick_projects(counts: dict[int, int], sizes: list[int]) -> list[tuple[int, int]]:
+    """목표 크기별로 청크 수가 가장 가까운 프로젝트 (중복 제거, 크기 오름차순)"""
+    picked = {}
+    for size in sizes:
+        project_id = min(counts, key=lambda pid: abs(counts[pid] - size))
+        picked[project_id] = counts[project_id]
+    return sorted(picked.items(), key=lambda item: item[1])
+
+
+def cmd_bench_exact(args):
+    """정확 검색 전환 임계값 벤치마크
+
+    프로젝트 크기별로 필터된 근사 knn과 script_score(knn_score) 정확 검색을 비교합니다.
+    쿼리는 프로젝트 청크 임베딩에 잡음을 더한 벡터이고, recall은 정확 검색 결과 기준입니다.
+    정확 검색 p50이 knn보다 빠른 가장 큰 프로젝트 크기가 QueryBuilder exact_threshold 후보입니다.
+    """
+    client = OpenSearchClient(timeout=args.timeout)
+
+    if args.project_ids:
+        project_ids = [int(pid) for pid in args.project_ids.split(",")]
+        projects = [(pid, client.get_doc_count_by_project(args.index, pid)) for pid in project_ids]
+    else:
+        counts = client.get_project_doc_counts(args.index, size=args.max_projects)
+        projects = _pick_projects(counts, [int(size) for size in args.sizes.split(",")])
+
+    print(f"📊 Exact vs approximate KNN: index={args.index}, space_type={args.space_type}")
+    print(f"   queries/project={args.queries}, k={args.k}, noise={args.noise}")
+    print()
+    print(
+        f"{'project':>8} {'chunks':>8} {'knn p50':>9} {'knn p95':>9} "
+        f"{'exact p50':>10} {'exact p95':>10} {'knn recall':>11}"
+    )
+    print("-" * 71)
+
+    rng = np.random.default_rng(0)
+    faster_up_to = None
+    for project_id, chunks in projects:
+        docs = client.get_docs_by_project(args.index, project_id, size=args.queries, include_vectors=True)
+        picked = np.array([doc["_source"]["embedding"] for doc in docs if "embedding" in doc["_source"]], np.float32)
+        if not len(picked):
+            print(f"{project_id:>8} {chunks:>8} skipped (no embeddings)")
+            continue
+        vectors = picked + rng.normal(scale=args.noise, size=picked.shape).astype(np.float32)
+
+        knn_queries = [_knn_query(vector.tolist(), args.k, project_id) for vector in vectors]
+        exact_queries = [_exact_query(vector.tolist(), project_id, args.space_type) for vector in vectors]
+
+        # 워밍업 (세그먼트 캐시/그래프 로드 제외)
+        client.search(args.index, knn_queries[0], size=args.k)
+        client.search(args.index, exact_queries[0], size=args.k)
+
+        exact_latencies, exact_ids = _timed_search(client, args.index, exact_queries, args.k)
+        knn_latencies, knn_ids = _timed_search(client, args.index, knn_queries, args.k)
+
+        exact_p50, knn_p50 = _percentile(exact_latencies, 50), _percentile(knn_latencies, 50)
+        if exact_p50 <= knn_p50:
+            faster_up_to = chunks
+        print(
+            f"{project_id:>8} {chunks:>8} {knn_p50:>9.1f} {_percentile(knn_latencies, 95):>9.1f} "
+            f"{exact_p50:>10.1f} {_percentile(exact_latencies, 95):>10.1f} {_recall(exact_ids, knn_ids):>11.3f}"
+        )
+
+    print()
+    if faster_up_to is None:
+        print("정확 검색이 더 빠른 프로젝트 없음 → exact_threshold=0 (항상 knn)")
+    else:
+        print(f"정확 검색이 knn 이하 p50인 최대 크기: {faster_up_to} chunks → exact_threshold 후보 > {faster_up_to}")
+
+
+def _int_list(value: str) -> list[int]:
+    """"32,64,128" → [32, 64, 128]"""
+    return [int(item) for item in value.split(",")]
+
+
+def cmd_sweep(args):
+    """근사 knn 튜닝 sweep
+
+    질문셋 질문 임베딩으로 ef_search × k × search_size 조합마다 검색을 반복하고,
+    같은 search_size의 정확 검색(script_score) 결과 대비 recall과 p50/p95 레이턴시를 출력합니다.
+    하이브리드 모드는 BM25 + 정확 KNN을 같은 RRF 파이프라인으로 융합한 결과가 기준입니다.
+    --target-recall을 만족하는 조합 중 p50이 가장 낮은 조합을 추천합니다.
+    """
+    with open(args.questions, encoding="utf-8") as f:
+        questions = [q["question"] for q in json.load(f)["questions"]]
+
+    start = time.perf_counter()
+    embedder = CachedEmbeddingClient.from_env(EmbeddingClient())
+    embeddings = [embedder.embed(question) for question in questions]
+    embed_s = time.perf_counter() - start
+
+    if args.snapshot:
+        client = LocalSearchClient.from_snapshot(args.snapshot)
+    else:
+        client = OpenSearchClient(timeout=args.timeout)
+    builder_cls = HybridQueryBuilder if args.mode == "hybrid" else KNNQueryBuilder
+    pipeline = HYBRID_PIPELINE if args.mode == "hybrid" else None
+
+    def run(builder, size: int) -> tuple[list[float], list[list[str]]]:
+        queries = [builder.build(q, e, args.project_id, k=size) for q, e in zip(questions, embeddings)]
+        _timed_search(client, args.index, queries[:1], size, pipeline)  # 워밍업
+        latencies, ids = _timed_search(client, args.index, queries * args.repeat, size, pipeline)
+        return latencies, ids[: len(questions)]
+
+    print(f"📊 KNN sweep: {'snapshot ' + args.snapshot if args.snapshot else args.index} (mode={args.mode})")
+    print(f"   questions={len(questions)} x {args.repeat}, project_id={args.project_id}, embed={embed_s:.1f}s")
+    print()
+
+    # 정확 검색 기준 (project_size가 항상 0 → script_score)
+    exact_builder = builder_cls(project_size=lambda project_id: 0)
+    expected = {}
+    for size in _int_list(args.search_size):
+        latencies, expected[size] = run(exact_builder, size)
+        print(f"   exact size={size}: p50={_percentile(latencies, 50):.1f}ms p95={_percentile(latencies, 95):.1f}ms")
+    print()
+    print(f"{'ef_search':>9} {'k':>5} {'size':>5} {'p50 ms':>9} {'p95 ms':>9} {'recall':>8}")
+    print("-" * 50)
+
+    results = []
+    for ef_search in _int_list(args.ef_search):
+        for k in _int_list(args.k):
+            for size in _int_list(args.search_size):
+                builder = builder_cls(knn_k=k, ef_search=ef_search, oversample_factor=args.oversample_factor)
+                latencies, ids = run(builder, size)
+                p50, p95 = _percentile(latencies, 50), _percentile(latencies, 95)
+                recall = _recall(expected[size], ids)
+                results.append((ef_search, k, size, p50, recall))
+                print(f"{ef_search:>9} {k:>5} {size:>5} {p50:>9.1f} {p95:>9.1f} {recall:>8.3f}")
+
+    print()
+    passing = [r for r in results if r[4] >= args.target_recall]
+    if not passing:
+        print(f"recall >= {args.target_recall} 조합 없음 → ef_search/k를 늘려 다시 측정")
+        return
+    for size in sorted({r[2] for r in passing}):
+        ef_search, k, _, p50, recall = min((r for r in passing if r[2] == size), key=lambda r: r[3])
+        print(f"size={size}: ef_search={ef_search}, knn_k={k} (p50 {p50:.1f}ms, recall {recall:.3f})")
+
+
+def _target_client(args) -> OpenSearchClient:
+    """create-index / reindex 대상 클러스터 클라이언트 (--host/--port/--no-ssl)"""
+    return OpenSearchClient(host=args.host, port=args.port, use_ssl=not args.no_ssl, timeout=args.timeout)
+
+
+def _index_body(args, route_by_project: bool | None = None) -> dict:
+    """인덱스 생성 옵션 → 생성 body (route_by_project=None이면 --route-by-project 사용)"""
+    return build_index_body(
+        dimensions=args.dimensions,
+        engine=args.engine,
+        encoding=args.encoding,
+        m=args.m,
+        ef_construction=args.ef_construction,
+        ef_search=args.ef_search,
+        shards=args.shards,
+        replicas=args.replicas,
+        source_vectors=not args.no_source_vectors,
+        routing_required=args.route_by_project if route_by_project is None else route_by_project,
+    )
+
+
+def _create_index(client: OpenSearchClient, name: str, args, route_by_project: bool | None = None) -> None:
+    """인덱스 생성 (+ RRF 검색 파이프라인), 이미 있으면 --recreate일 때만 다시 생성"""
+    body = _index_body(args, route_by_project)
+    if client.index_exists(name):
+        if not args.recreate:
+            print(f"   Index {name} already exists (--recreate로 다시 생성)")
+            return
+        client.delete_index(name)
+        print(f"   Deleted existing index {name}")
+
+    client.create_index(name, body)
+    method = body["mappings"]["properties"]["embedding"]["method"]
+    print(f"✅ Created {name}: {method['engine']} hnsw m={args.m} ef_construction={args.ef_construction}")
+    routing = "project_id" if "_routing" in body["mappings"] else "_id"
+    print(f"   encoding={args.encoding}, shards={args.shards}, replicas={args.replicas}, routing={routing}")
+
+    if not args.skip_pipelines:
+        for pipeline, rank_constant in PIPELINE_RANK_CONSTANTS.items():
+            client.put_search_pipeline(pipeline, search_pipeline_body(rank_constant))
+        print(f"   Search pipelines: {', '.join(PIPELINE_RANK_CONSTANTS)}")
+
+
+def cmd_create_index(args):
+    """최적화 설정으로 인덱스 생성 (--dry-run이면 body만 출력)"""
+    if args.dry_run:
+        print(json.dumps(_index_body(args), indent=2, ensure_ascii=False))
+        return
+
+    client = _target_client(args)
+    print(f"📦 Create index on {client.host}:{client.port}")
+    _create_index(client, args.name, args)
+
+
+def cmd_reindex(args):
+    """프로젝트 청크를 새 인덱스로 재색인
+
+    원본 인덱스(또는 --from-json 파일)를 스트리밍으로 읽어 _bulk로 색인하고,
+    색인 전(원본)/후(대상) 인덱스의 용량과 KNN 레이턴시, recall(정확 검색 기준)을 출력합니다.
+    대상 클러스터가 달라도 되므로 원격 → 로컬 단일 노드 복사에도 사용할 수 있습니다.
+    쿼리 벡터는 재색인한 청크 임베딩에서 무작위 추출합니다.
+    --route-by-project면 project_id를 _routing으로 색인합니다 (대상 인덱스도 --route-by-project로 생성).
+    """
+    dest = _target_client(args)
+    if args.create or args.recreate:
+        _create_index(dest, args.dest, args)
+    if not dest.index_exists(args.dest):
+        print(f"❌ Index {args.dest} not found (--create로 생성)")
+        return
+
+    source = None
+    if args.from_json:
+        hits = _iter_vector_records(Path(args.from_json))
+        origin = args.from_json
+    else:
+        source = OpenSearchClient(source_fields=None, timeout=args.timeout)
+        hits = source.iter_docs_by_project(
+            args.source_index, args.project_id, page_size=args.page_size, include_vectors=True
+        )
+        origin = args.source_index
+
+    rng = random.Random(0)
+    samples: list[list[float]] = []
+    seen = 0
+
+    def docs():
+        """hit → (ID, 새 인덱스 문서), 쿼리 벡터 reservoir sampling"""
+        nonlocal seen
+        for hit in hits:
+            doc = to_index_doc(hit["_source"])
+            seen += 1
+            if len(samples) < args.queries:
+                samples.append(doc["embedding"])
+            elif (slot := rng.randrange(seen)) < args.queries:
+                samples[slot] = doc["embedding"]
+            yield hit["_id"], doc
+
+    print(f"📦 Reindex project {args.project_id}: {origin} → {args.dest} ({dest.host}:{dest.port})")
+    start = time.time()
+    dest.update_index_settings(args.dest, {"refresh_interval": "-1"})
+    try:
+        count = dest.bulk_index(
+            args.dest,
+            docs(),
+            chunk_size=args.batch_size,
+            routing_field=ROUTING_FIELD if args.route_by_project else None,
+        )
+    finally:
+        dest.update_index_settings(args.dest, {"refresh_interval": args.refresh_interval})
+        dest.refresh(args.dest)
+    elapsed = time.time() - start
+    print(f"✅ Indexed {count:,} chunks in {elapsed:.1f}s ({count / max(elapsed, 1e-9):,.0f} docs/s)")
+
+    if not samples:
+        return
+    queries = [_knn_query(vector, args.k, args.project_id) for vector in samples]
+    exact_queries = [_exact_query(vector, args.project_id) for vector in samples]
+
+    print()
+    print(f"{'':<7} {'index':<28} {'docs':>9} {'store MB':>9} {'B/doc':>8} {'p50 ms':>8} {'p95 ms':>8} {'recall':>7}")
+    print("-" * 91)
+    targets = [("before", source, args.source_index)] if source else []
+    targets.append(("after", dest, args.dest))
+    for label, client, index in targets:
+        docs_count = client.get_doc_count(index)
+        store = client.get_index_store_size(index)
+        _timed_search(client, index, queries[:1], args.k)  # 워밍업 (그래프 로드 제외)
+        latencies, ids = _timed_search(client, index, queries, args.k)
+        _, exact_ids = _timed_search(client, index, exact_queries, args.k)
+        print(
+            f"{label:<7} {index:<28} {docs_count:>9,} {store / 1024 / 1024:>9.1f} {store / max(docs_count, 1):>8,.0f} "
+            f"{_percentile(latencies, 50):>8.1f} {_percentile(latencies, 95):>8.1f} {_recall(exact_ids, ids):>7.3f}"
+        )
+
+    memory_kb = dest.get_knn_memory_kb()
+    if memory_kb is not None:
+        print(f"\n   k-NN native graph memory ({dest.host}): {memory_kb / 1024:.1f} MB")
+
+
+def _shards_searched(client: OpenSearchClient, index: str, query: dict, k: int, routed: bool) -> int:
+    """검색이 실제로 조회한 샤드 수 (_shards.total)"""
+    params = {"routing": project_routing(query)} if routed else {}
+    response = client.client.search(index=index, body={**query, "_source": False}, size=k, params=params)
+    return response["_shards"]["total"]
+
+
+def cmd_bench_routing(args):
+    """project_id 라우팅 유무별 검색 레이턴시 비교 (다중 샤드 클러스터)
+
+    같은 데이터를 _id 라우팅(기본) / project_id 라우팅 인덱스 두 개에 색인하고
+    프로젝트 필터 KNN·하이브리드 검색 레이턴시와 조회 샤드 수를 비교합니다.
+    프로젝트 하나를 --copies개의 합성 프로젝트(project_id + i × SYNTHETIC_PROJECT_STEP)로 복제해
+    여러 프로젝트가 샤드에 나뉘어 있는 운영 인덱스를 흉내 냅니다.
+    라우팅 인덱스는 OpenSearchClient가 매핑(_routing.required)을 보고 routing을 자동 지정합니다.
+    """
+    if args.from_json:
+        hits = _iter_vector_records(Path(args.from_json))
+        origin = args.from_json
+    else:
+        source = OpenSearchClient(source_fields=None, timeout=args.timeout)
+        hits = source.iter_docs_by_project(
+            args.source_index, args.project_id, page_size=args.page_size, include_vectors=True
+        )
+        origin = args.source_index
+    base = [(hit["_id"], to_index_doc(hit["_source"])) for hit in hits]
+    if not base:
+        print(f"❌ No chunks for project {args.project_id} in {origin}")
+        return
+    project_ids = [args.project_id + i * SYNTHETIC_PROJECT_STEP for i in range(args.copies)]
+
+    def docs():
+        """원본 청크 × 합성 프로젝트 (벡터 리스트는 공유)"""
+        for i, project_id in enumerate(project_ids):
+            for doc_id, doc in base:
+                yield f"{doc_id}-{i}", {**doc, "project_id": project_id}
+
+    rng = random.Random(0)
+    samples = [rng.choice(base)[1] for _ in range(args.queries)]
+    targets = [rng.choice(project_ids) for _ in samples]
+    knn_queries = [_knn_query(doc["embedding"], args.k, pid) for doc, pid in zip(samples, targets)]
+    hybrid_queries = [
+        _hybrid_query((doc.get("chunk_text") or doc.get("text") or "")[:50], doc["embedding"], args.k, pid)
+        for doc, pid in zip(samples, targets)
+    ]
+
+    client = _target_client(args)
+    total = len(base) * len(project_ids)
+    print(f"📦 {len(base):,} chunks × {len(project_ids)} projects = {total:,} docs, shards={args.shards}")
+    print(f"   {origin} → {client.host}:{client.port}")
+
+    names = {False: f"{args.prefix}-unrouted", True: f"{args.prefix}-routed"}
+    for routed, name in names.items():
+        _create_index(client, name, args, route_by_project=routed)
+        client.update_index_settings(name, {"refresh_interval": "-1"})
+        try:
+            client.bulk_index(
+                name, docs(), chunk_size=args.batch_size, routing_field=ROUTING_FIELD if routed else None
+            )
+        finally:
+            client.update_index_settings(name, {"refresh_interval": "1s"})
+            client.refresh(name)
+
+    print()
+    print(f"{'index':<28} {'shards':>7} {'knn p50':>8} {'knn p95':>8} {'hyb p50':>8} {'hyb p95':>8} {'overlap':>8}")
+    print("-" * 82)
+    baseline_ids: list[list[str]] = []
+    for routed, name in names.items():
+        shards = _shards_searched(client, name, knn_queries[0], args.k, routed)
+        _timed_search(client, name, knn_queries[:5], args.k)  # 워밍업 (그래프 로드 제외)
+        knn_latencies, ids = _timed_search(client, name, knn_queries, args.k)
+        hybrid_latencies, _ = _timed_search(client, name, hybrid_queries, args.k, HYBRID_PIPELINE)
+        overlap = _recall(baseline_ids, ids) if baseline_ids else 1.0
+        baseline_ids = baseline_ids or ids
+        print(
+            f"{name:<28} {shards:>7} {_percentile(knn_latencies, 50):>8.1f} {_percentile(knn_latencies, 95):>8.1f} "
+            f"{_percentile(hybrid_latencies, 50):>8.1f} {_percentile(hybrid_latencies, 95):>8.1f} {overlap:>8.3f}"
+        )
+
+    if not args.keep:
+        for name in names.values():
+            client.delete_index(name)
+        print(f"\n   Deleted {', '.join(names.values())} (--keep로 유지)")
+
+
+def _ingest_setup(args):
+    """ingest / sync 공통: 대상 인덱스 확인 + BulkIngestor + 로컬 문서 순회 (인덱스 없으면 None)"""
+    client = _target_client(args)
+    if args.create or args.recreate:
+        _create_index(client, args.index, args)
+    if not client.index_exists(args.index):
+        print(f"❌ Index {args.index} not found (--create로 생성)")
+        return None
+
+    embedder = CachedEmbeddingClient.from_env(
+        EmbeddingClient(dimensions=args.dimensions, max_workers=args.embed_workers, rate_per_sec=args.embed_rate)
+    )
+    ingestor = BulkIngestor(
+        client,
+        embedder,
+        args.index,
+        project_id=args.project_id,
+        chunker=TextChunker(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap),
+        embed_batch_size=args.embed_batch_size,
+        bulk_size=args.bulk_size,
+        workers=args.workers,
+        max_pending=args.max_pending,
+        max_retries=args.max_retries,
+        routing_field=ROUTING_FIELD if args.route_by_project else None,
+    )
+    patterns = tuple(args.pattern or ["**/*.txt"])
+    print(f"📥 {args.root} ({', '.join(patterns)}) → {args.index} ({client.host}:{client.port})")
+    return ingestor, iter_documents(args.root, args.project_id, patterns=patterns)
+
+
+def _print_ingest_stats(stats, embedder) -> None:
+    """색인 처리량/임베딩/실패 요약"""
+    print(f"   Indexed {stats.indexed:,} / {stats.chunks:,} chunks ({stats.embedded:,} embedded)")
+    print(f"   Throughput: {stats.docs_per_sec:,.1f} docs/s over {stats.elapsed_seconds:.1f}s")
+    print(f"   Embedding wait: {stats.embed_seconds:.1f}s, retries: {stats.retries}, failed: {stats.failed}")
+    for error in stats.errors:
+        print(f"   ⚠️ {error}")
+    print(f"   Embedding cache: {embedder.stats()}")
+
+
+def cmd_ingest(args):
+    """로컬 파일 대량 수집 (청크 → 배치 임베딩 → 병렬 _bulk)
+
+    색인 중에는 refresh_interval을 -1로 두고, 끝나면 복구 후 refresh 합니다.
+    수집 처리량(docs/s)과 임베딩 대기 시간, 재시도/실패 수를 출력합니다.
+    """
+    setup = _ingest_setup(args)
+    if setup is None:
+        return
+    ingestor, documents = setup
+    client = ingestor.search_client
+
+    client.update_index_settings(args.index, {"refresh_interval": "-1"})
+    try:
+        stats = ingestor.ingest(documents)
+    finally:
+        client.update_index_settings(args.index, {"refresh_interval": args.refresh_interval})
+        client.refresh(args.index)
+
+    print(f"✅ Ingested {stats.documents:,} files")
+    _print_ingest_stats(stats, ingestor.embedding_client)
+
+
+def cmd_sync(args):
+    """md5_hash 증분 동기화 (바뀐 청크만 임베딩/upsert, 고아 청크 삭제)
+
+    로컬 매니페스트(--manifest, 기본 data/manifests/<index>_<project_id>.json)와 파일 MD5를 비교해
+    바뀐 파일만 청크 단위로 비교합니다. 매니페스트가 없거나 --verify면 인덱스를 조회해 비교합니다.
+    """
+    setup = _ingest_setup(args)
+    if setup is None:
+        return
+    ingestor, documents = setup
+    client = ingestor.search_client
+    manifest = Path(args.manifest or MANIFEST_DIR / f"{args.index}_{args.project_id}.json")
+
+    stats = IncrementalSync(ingestor, manifest).run(documents, verify=args.verify, dry_run=args.dry_run)
+    if not args.dry_run and stats.upserts + stats.deleted:
+        client.refresh(args.index)
+
+    print(f"{'🔍 Dry run' if args.dry_run else '✅ Synced'} (state from {stats.source}, {stats.elapsed_seconds:.1f}s)")
+    print(
+        f"   Files: {stats.documents:,} local, {stats.unchanged_documents:,} unchanged, "
+        f"{stats.changed_documents:,} changed ({stats.new_documents:,} new), {stats.removed_documents:,} removed"
+    )
+    print(
+        f"   Chunks: {stats.unchanged_chunks:,} unchanged, {stats.upserts:,} upserts "
+        f"({stats.reused_vectors:,} reused vectors), {stats.deleted:,} {'to delete' if args.dry_run else 'deleted'}"
+    )
+    if not args.dry_run:
+        _print_ingest_stats(stats.ingest, ingestor.embedding_client)
+        print(f"   Manifest: {manifest}")
+
+
+def _add_target_options(parser: argparse.ArgumentParser) -> None:
+    """대상 클러스터 연결 옵션"""
+    parser.add_argument("--host", default="localhost", help="대상 OpenSearch 호스트")
+    parser.add_argument("--port", type=int, default=9443, help="대상 포트 (로컬 단일 노드는 보통 9200)")
+    parser.add_argument("--no-ssl", action="store_true", help="HTTP 사용 (보안 플러그인 off 로컬 노드)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+
+
+def _add_index_options(parser: argparse.ArgumentParser) -> None:
+    """인덱스 생성 설정 옵션 (index_schema.build_index_body)"""
+    parser.add_argument("--engine", choices=ENGINES, default="faiss", help="벡터 엔진")
+    parser.add_argument("--encoding", choices=ENCODINGS, default="fp16", help="벡터 인코딩 (fp16=faiss, byte=lucene)")
+    parser.add_argument("--m", type=int, default=16, help="HNSW m")
+    parser.add_argument("--ef-construction", type=int, default=128, help="HNSW ef_construction")
+    parser.add_argument("--ef-search", type=int, default=100, help="기본 ef_search (faiss)")
+    parser.add_argument("--dimensions", type=int, default=1024, help="임베딩 차원")
+    parser.add_argument("--shards", type=int, default=1, help="primary 샤드 수")
+    parser.add_argument("--replicas", type=int, default=0, help="레플리카 수")
+    parser.add_argument("--no-source-vectors", action="store_true", help="_source에서 벡터 제외 (디스크 절약)")
+    parser.add_argument("--route-by-project", action="store_true", help="project_id를 _routing으로 색인 (필수)")
+    parser.add_argument("--recreate", action="store_true", help="이미 있으면 삭제 후 다시 생성")
+    parser.add_argument("--skip-pipelines", action="store_true", help="hybrid-rrf 검색 파이프라인 생성 생략")
+
+
+def _add_ingest_options(parser: argparse.ArgumentParser) -> None:
+    """ingest / sync 공통 옵션 (수집 대상, 청크, 임베딩, _bulk, 인덱스 생성, 대상 클러스터)"""
+    parser.add_argument("root", nargs="?", default="data/test_docs", help="수집 루트 디렉터리")
+    parser.add_argument("--project-id", type=int, required=True, help="수집 문서의 프로젝트 ID")
+    parser.add_argument("--index", required=True, help="대상 인덱스 이름")
+    parser.add_argument("--pattern", action="append", default=None, help="파일 glob (반복 가능, 기본 **/*.txt)")
+    parser.add_argument("--create", action="store_true", help="대상 인덱스가 없으면 생성")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="청크 최대 글자 수")
+    parser.add_argument("--chunk-overlap", type=int, default=100, help="이웃 청크 겹침 글자 수")
+    parser.add_argument("--embed-batch-size", type=int, default=64, help="embed_batch 1회 텍스트 수")
+    parser.add_argument("--embed-workers", type=int, default=8, help="임베딩 동시 요청 수")
+    parser.add_argument("--embed-rate", type=float, default=20.0, help="임베딩 초당 최대 요청 수")
+    parser.add_argument("--bulk-size", type=int, default=200, help="_bulk 요청당 청크 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시 _bulk 요청 수")
+    parser.add_argument("--max-pending", type=int, default=None, help="대기 _bulk 요청 상한 (기본 workers×2)")
+    parser.add_argument("--max-retries", type=int, default=3, help="_bulk 실패 재시도 횟수")
+    _add_index_options(parser)
+    _add_target_options(parser)
+
+
 def main():
     parser = argparse.ArgumentParser(description="OpenSearch CLI")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -162,12 +1062,146 @@ def main():
     p_collect = subparsers.add_parser("collect", help="텍스트 수집")
     p_collect.add_argument("project_id", type=int, help="프로젝트 ID")
     p_collect.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_collect.add_argument(
+        "--include-vectors", action="store_true", help="임베딩 벡터 포함 (snapshot/reindex/bench-routing --from-json용)"
+    )
+
+    # export
+    p_export = subparsers.add_parser("export", help="NDJSON 스트리밍 내보내기")
+    p_export.add_argument("project_id", type=int, help="프로젝트 ID")
+    p_export.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_export.add_argument("--output", default=None, help="출력 경로 (기본: data/export_<project_id>.ndjson)")
+    p_export.add_argument("--page-size", type=int, default=2000, help="페이지 크기 (최대 10000)")
+    p_export.add_argument("--include-vectors", action="store_true", help="임베딩 벡터 포함")
+    p_export.add_argument("--timeout", type=float, default=60.0, help="페이지 요청 타임아웃 (초)")
+
+    # snapshot
+    p_snapshot = subparsers.add_parser("snapshot", help="바이너리 스냅샷 내보내기")
+    p_snapshot.add_argument("project_id", type=int, help="프로젝트 ID")
+    p_snapshot.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_snapshot.add_argument("--output", default=None, help="출력 디렉터리 (기본: data/snapshots/<project_id>)")
+    p_snapshot.add_argument("--dtype", choices=["float32", "float16"], default="float32", help="임베딩 저장 타입")
+    p_snapshot.add_argument("--dimensions", type=int, default=1024, help="임베딩 차원")
+    p_snapshot.add_argument(
+        "--from-json", default=None, help="collect/export --include-vectors 결과 파일(.json/.ndjson)에서 변환"
+    )
+    p_snapshot.add_argument("--page-size", type=int, default=2000, help="페이지 크기 (최대 10000)")
+    p_snapshot.add_argument("--timeout", type=float, default=60.0, help="페이지 요청 타임아웃 (초)")
 
     # get-doc
     p_get_doc = subparsers.add_parser("get-doc", help="문서 조회")
     p_get_doc.add_argument("document_id", type=int, help="문서 ID")
     p_get_doc.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
 
+    # bench-transport
+    p_bench = subparsers.add_parser("bench-transport", help="전송 계층 벤치마크")
+    p_bench.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_bench.add_argument("--project-id", type=int, default=334, help="프로젝트 ID (KNN 필터)")
+    p_bench.add_argument("--concurrency", default="1,8,32", help="동시 검색 수 목록 (쉼표 구분)")
+    p_bench.add_argument("--requests", type=int, default=128, help="동시성 단계별 요청 수")
+    p_bench.add_argument("--transports", default="requests,urllib3", help="전송 계층 목록 (requests,urllib3)")
+    p_bench.add_argument("--compress", default="off,on", help="http_compress 목록 (off,on)")
+    p_bench.add_argument("--keep-alive", default="on", help="keep-alive 목록 (on,off)")
+    p_bench.add_argument("--pool-maxsize", type=int, default=None, help="커넥션 풀 크기 (기본: 최대 동시성)")
+    p_bench.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    p_bench.add_argument("--dimensions", type=int, default=1024, help="쿼리 벡터 차원")
+    p_bench.add_argument("--k", type=int, default=5, help="KNN k / 결과 개수")
+
+    # bench-local
+    p_bench_local = subparsers.add_parser("bench-local", help="로컬 검색 vs 원격 벤치마크")
+    p_bench_local.add_argument("--index", default=DEFAULT_INDEX, help="원격 인덱스 이름")
+    p_bench_local.add_argument("--project-id", type=int, default=334, help="프로젝트 ID")
+    p_bench_local.add_argument("--snapshot", default=None, help="스냅샷 디렉터리 (기본: data/snapshots/<project_id>)")
+    p_bench_local.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    p_bench_local.add_argument("--k", type=int, default=5, help="KNN k / 결과 개수")
+    p_bench_local.add_argument("--noise", type=float, default=0.01, help="쿼리 벡터 잡음 표준편차")
+    p_bench_local.add_argument("--ef-search", type=int, default=100, help="HNSW ef_search")
+    p_bench_local.add_argument("--skip-remote", action="store_true", help="원격 OpenSearch 측정 생략")
+    p_bench_local.add_argument("--timeout", type=float, default=30.0, help="원격 요청 타임아웃 (초)")
+
+    # bench-exact
+    p_bench_exact = subparsers.add_parser("bench-exact", help="근사 knn vs 정확 검색 벤치마크")
+    p_bench_exact.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_bench_exact.add_argument("--project-ids", default=None, help="측정할 프로젝트 ID 목록 (쉼표 구분)")
+    p_bench_exact.add_argument(
+        "--sizes", default="50,200,1000,5000,20000", help="프로젝트 크기 목표 (--project-ids 없을 때, 쉼표 구분)"
+    )
+    p_bench_exact.add_argument("--max-projects", type=int, default=1000, help="크기 집계 대상 프로젝트 수")
+    p_bench_exact.add_argument("--queries", type=int, default=50, help="프로젝트별 쿼리 수")
+    p_bench_exact.add_argument("--k", type=int, default=5, help="KNN k / 결과 개수")
+    p_bench_exact.add_argument("--noise", type=float, default=0.01, help="쿼리 벡터 잡음 표준편차")
+    p_bench_exact.add_argument("--space-type", choices=["l2", "cosinesimil"], default="l2", help="정확 검색 거리")
+    p_bench_exact.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+
+    # sweep
+    p_sweep = subparsers.add_parser("sweep", help="ef_search/k/search_size recall·레이턴시 sweep")
+    p_sweep.add_argument("--index", default=DEFAULT_INDEX, help="인덱스 이름")
+    p_sweep.add_argument("--project-id", type=int, default=334, help="프로젝트 ID")
+    p_sweep.add_argument("--questions", default=str(QUESTIONS_PATH), help="질문셋 경로")
+    p_sweep.add_argument("--mode", choices=["knn", "hybrid"], default="knn", help="쿼리 빌더 (knn / hybrid)")
+    p_sweep.add_argument("--ef-search", default="16,32,64,100,256", help="ef_search 목록 (쉼표 구분)")
+    p_sweep.add_argument("--k", default="5,20,50", help="KNN 후보 수 목록 (쉼표 구분)")
+    p_sweep.add_argument("--search-size", default="5,20", help="검색 size 목록 (쉼표 구분)")
+    p_sweep.add_argument("--oversample-factor", type=float, default=None, help="재점수화 후보 배수")
+    p_sweep.add_argument("--repeat", type=int, default=3, help="질문셋 반복 횟수 (레이턴시 표본)")
+    p_sweep.add_argument("--target-recall", type=float, default=0.95, help="추천 조합 최소 recall")
+    p_sweep.add_argument("--snapshot", default=None, help="원격 대신 로컬 스냅샷으로 측정")
+    p_sweep.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+
+    # create-index
+    p_create = subparsers.add_parser("create-index", help="최적화 설정으로 인덱스 생성")
+    p_create.add_argument("name", help="생성할 인덱스 이름")
+    p_create.add_argument("--dry-run", action="store_true", help="생성 body만 출력")
+    _add_index_options(p_create)
+    _add_target_options(p_create)
+
+    # reindex
+    p_reindex = subparsers.add_parser("reindex", help="프로젝트 청크를 새 인덱스로 재색인")
+    p_reindex.add_argument("project_id", type=int, help="프로젝트 ID")
+    p_reindex.add_argument("--dest", required=True, help="대상 인덱스 이름")
+    p_reindex.add_argument("--source-index", default=DEFAULT_INDEX, help="원본 인덱스 (기본 클러스터 연결)")
+    p_reindex.add_argument(
+        "--from-json", default=None, help="원본 대신 collect/export --include-vectors 결과 파일(.json/.ndjson) 사용"
+    )
+    p_reindex.add_argument("--create", action="store_true", help="대상 인덱스가 없으면 생성")
+    p_reindex.add_argument("--page-size", type=int, default=1000, help="원본 조회 페이지 크기")
+    p_reindex.add_argument("--batch-size", type=int, default=500, help="_bulk 요청당 문서 수")
+    p_reindex.add_argument("--refresh-interval", default="1s", help="색인 후 복구할 refresh_interval")
+    p_reindex.add_argument("--queries", type=int, default=50, help="전후 비교 쿼리 수")
+    p_reindex.add_argument("--k", type=int, default=5, help="KNN k / 결과 개수")
+    _add_index_options(p_reindex)
+    _add_target_options(p_reindex)
+
+    # bench-routing
+    p_routing = subparsers.add_parser("bench-routing", help="project_id 라우팅 유무별 검색 레이턴시 비교")
+    p_routing.add_argument("project_id", type=int, help="프로젝트 ID (합성 프로젝트의 원본)")
+    p_routing.add_argument("--source-index", default=DEFAULT_INDEX, help="원본 인덱스 (기본 클러스터 연결)")
+    p_routing.add_argument(
+        "--from-json", default=None, help="원본 대신 collect/export --include-vectors 결과 파일(.json/.ndjson) 사용"
+    )
+    p_routing.add_argument("--page-size", type=int, default=1000, help="원본 조회 페이지 크기")
+    p_routing.add_argument("--prefix", default="rag-bench-routing", help="비교 인덱스 이름 접두사")
+    p_routing.add_argument("--copies", type=int, default=8, help="합성 프로젝트 수")
+    p_routing.add_argument("--batch-size", type=int, default=500, help="_bulk 요청당 문서 수")
+    p_routing.add_argument("--queries", type=int, default=100, help="쿼리 수")
+    p_routing.add_argument("--k", type=int, default=5, help="KNN k / 결과 개수")
+    p_routing.add_argument("--keep", action="store_true", help="벤치마크 후 인덱스 유지")
+    _add_index_options(p_routing)
+    _add_target_options(p_routing)
+    p_routing.set_defaults(shards=8, recreate=True)
+
+    # ingest
+    p_ingest = subparsers.add_parser("ingest", help="로컬 파일 청크/임베딩/대량 색인")
+    p_ingest.add_argument("--refresh-interval", default="1s", help="색인 후 복구할 refresh_interval")
+    _add_ingest_options(p_ingest)
+
+    # sync
+    p_sync = subparsers.add_parser("sync", help="md5_hash 증분 동기화")
+    p_sync.add_argument("--manifest", default=None, help="매니페스트 경로 (기본 data/manifests/<index>_<project>.json)")
+    p_sync.add_argument("--verify", action="store_true", help="매니페스트 대신 인덱스를 조회해 비교")
+    p_sync.add_argument("--dry-run", action="store_true", help="비교 결과만 출력")
+    _add_ingest_options(p_sync)
+
     args = parser.parse_args()
 
     if args.command == "test":
@@ -178,8 +1212,30 @@ def main():
         cmd_count(args)
     elif args.command == "collect":
         cmd_collect(args)
+    elif args.command == "export":
+        cmd_export(args)
+    elif args.command == "snapshot":
+        cmd_snapshot(args)
     elif args.command == "get-doc":
         cmd_get_doc(args)
+    elif args.command == "bench-transport":
+        cmd_bench_transport(args)
+    elif args.command == "bench-local":
+        cmd_bench_local(args)
+    elif args.command == "bench-exact":
+        cmd_bench_exact(args)
+    elif args.command == "sweep":
+        cmd_sweep(args)
+    elif args.command == "create-index":
+        cmd_create_index(args)
+    elif args.command == "reindex":
+        cmd_reindex(args)
+    elif args.command == "bench-routing":
+        cmd_bench_routing(args)
+    elif args.command == "ingest":
+        cmd_ingest(args)
+    elif args.command == "sync":
+        cmd_sync(args)
     else:
         parser.print_help()
 
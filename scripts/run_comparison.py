@@ -18,23 +18,38 @@ Usage:
 
     # 기존 결과로 비교만
     uv run python scripts/run_comparison.py --compare-only data/results/basic.json data/results/agent.json
+
+    # 동시 실행 + 공급자별 속도 제한 (결과는 data/results/checkpoints/<mode>.jsonl에 즉시 기록)
+    uv run python scripts/run_comparison.py --level 4 --concurrency 8 --rate-limit vertex=2 --rate-limit tavily=1
+
+    # 중단된 실행 이어서
+    uv run python scripts/run_comparison.py --level 4 --resume
+
+    # 외부 호출(Bedrock/Vertex/OpenSearch/Tavily) 녹화 → 네트워크 없이 결정적으로 재생
+    uv run python scripts/run_comparison.py --level 1 --cassette data/cassettes/comparison --cassette-mode record
+    uv run python scripts/run_comparison.py --level 1 --cassette data/cassettes/comparison --replay-latency 1.0
 """
 
 import argparse
 import json
 import re
 import sys
+import time
 from collections import defaultdict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # 프로젝트 루트를 path에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from tqdm import tqdm
+
 from src import create_service
+from src.cassette import use_cassette
 from src.cost import calculate_cost, format_cost
-from tqdm import tqdm
+from src.eval_runner import JSONLCheckpoint, configure_rate_limits, run_checkpointed
 
 
 # =============================================================================
@@ -91,6 +106,7 @@ def check_key_facts(answer: str, key_facts: list[str]) -> dict:
 
 QUESTIONS_PATH = PROJECT_ROOT / "data" / "questions" / "question_set.json"
 RESULTS_DIR = PROJECT_ROOT / "data" / "results"
+CHECKPOINT_DIR = RESULTS_DIR / "checkpoints"
 
 
 # =============================================================================
@@ -127,65 +143,86 @@ def filter_questions(
 # =============================================================================
 
 
+def to_record(mode: str, q: dict, result) -> dict:
+    """질문 + 실행 결과(ServiceResult 또는 예외) → 결과 기록 (체크포인트 한 줄)"""
+    record = {
+        "id": q["id"],
+        "level": q["level"],
+        "category": q["category"],
+        "question": q["question"],
+        "expected_answer": q.get("expected_answer", ""),
+        "key_facts": q.get("key_facts", []),
+        "documents_required": q.get("documents_required", []),
+    }
+    if isinstance(result, Exception):
+        return {
+            **record,
+            "answer": f"ERROR: {result}",
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "latency_ms": 0,
+            "model": "",
+            "error": str(result),
+            "sources": [],
+            "tool_calls": [],
+            "call_history": [],
+            "timings": {},
+        }
+    return {
+        **record,
+        "answer": result.answer,
+        "input_tokens": result.input_tokens,
+        "output_tokens": result.output_tokens,
+        "cache_read_tokens": result.cache_read_tokens,
+        "cache_write_tokens": result.cache_write_tokens,
+        "latency_ms": round(result.latency_ms, 1),
+        "model": result.model,
+        # 모드 공통 정보
+        "sources": result.sources,
+        "timings": result.timings,
+        # Agent 모드 전용
+        "tool_calls": result.tool_calls if mode == "agent" else [],
+        "call_history": result.call_history if mode == "agent" else [],
+    }
+
+
 def run_mode(
     mode: str,
     questions: list[dict],
     project_id: int = 334,
+    concurrency: int = 8,
+    resume: bool = False,
 ) -> list[dict]:
-    """특정 모드로 질문셋 실행"""
+    """특정 모드로 질문셋 실행
+
+    service.query_batch로 최대 concurrency개 질문을 동시에 처리하고 (basic은 임베딩/검색 묶음 처리),
+    결과는 나오는 즉시 data/results/checkpoints/<mode>.jsonl에 기록합니다.
+    resume=True면 체크포인트에 성공 기록이 있는 질문은 건너뜁니다.
+    """
     print(f"\n🚀 {mode.upper()} 모드 실행 중...")
 
     service = create_service(mode=mode, project_id=project_id)
-    results = []
-
-    for q in tqdm(questions, desc=f"{mode} 처리"):
-        try:
-            result = service.query(q["question"])
-            results.append(
-                {
-                    "id": q["id"],
-                    "level": q["level"],
-                    "category": q["category"],
-                    "question": q["question"],
-                    "expected_answer": q.get("expected_answer", ""),
-                    "key_facts": q.get("key_facts", []),
-                    "documents_required": q.get("documents_required", []),
-                    "answer": result.answer,
-                    "input_tokens": result.input_tokens,
-                    "output_tokens": result.output_tokens,
-                    "latency_ms": round(result.latency_ms, 1),
-                    "model": result.model,
-                    # 모드 공통 정보
-                    "sources": result.sources,
-                    "timings": result.timings,
-                    # Agent 모드 전용
-                    "tool_calls": result.tool_calls if mode == "agent" else [],
-                    "call_history": result.call_history if mode == "agent" else [],
-                }
-            )
-        except Exception as e:
-            print(f"\n❌ 질문 {q['id']} 실패: {e}")
-            results.append(
-                {
-                    "id": q["id"],
-                    "level": q["level"],
-                    "category": q["category"],
-                    "question": q["question"],
-                    "expected_answer": q.get("expected_answer", ""),
-                    "key_facts": q.get("key_facts", []),
-                    "documents_required": q.get("documents_required", []),
-                    "answer": f"ERROR: {e}",
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "latency_ms": 0,
-                    "model": "",
-                    "error": str(e),
-                    "sources": [],
-                    "tool_calls": [],
-                    "call_history": [],
-                    "timings": {},
-                }
-            )
+    checkpoint = JSONLCheckpoint(CHECKPOINT_DIR / f"{mode}.jsonl")
+    print(f"📌 체크포인트: {checkpoint.path}{' (재개)' if resume else ''}")
+
+    start = time.time()
+    with tqdm(total=len(questions), desc=f"{mode} 처리") as bar:
+
+        def on_record(record: dict) -> None:
+            if record.get("error"):
+                tqdm.write(f"❌ 질문 {record['id']} 실패: {record['error']}")
+            bar.update(1)
+
+        results = run_checkpointed(
+            questions,
+            lambda texts, on_result: service.query_batch(texts, concurrency=concurrency, on_result=on_result),
+            partial(to_record, mode),
+            checkpoint=checkpoint,
+            resume=resume,
+            on_record=on_record,
+        )
+        bar.update(len(questions) - bar.n)  # 체크포인트에서 재사용한 질문
+    print(f"⏱️  {len(questions)}개 질문 {time.time() - start:.1f}초")
 
     return results
 
@@ -269,6 +306,8 @@ def merge_results(basic_results: list[dict], agent_results: list[dict]) -> list[
                 "tokens_basic": {
                     "input": b["input_tokens"],
                     "output": b["output_tokens"],
+                    "cache_read": b.get("cache_read_tokens", 0),
+                    "cache_write": b.get("cache_write_tokens", 0),
                     "total": b["input_tokens"] + b["output_tokens"],
                 },
                 "sources_basic": b.get("sources", []),
@@ -283,6 +322,8 @@ def merge_results(basic_results: list[dict], agent_results: list[dict]) -> list[
                 "tokens_agent": {
                     "input": a.get("input_tokens", 0),
                     "output": a.get("output_tokens", 0),
+                    "cache_read": a.get("cache_read_tokens", 0),
+                    "cache_write": a.get("cache_write_tokens", 0),
                     "total": a.get("input_tokens", 0) + a.get("output_tokens", 0),
                 },
                 "sources_agent": a.get("sources", []),
@@ -316,9 +357,19 @@ def calculate_comparison_stats(merged: list[dict]) -> dict:
     agent_output = sum(m["tokens_agent"]["output"] for m in merged)
     agent_tokens = agent_input + agent_output
 
-    # 비용 계산 (정확한 input/output 값 사용)
-    basic_cost = calculate_cost(basic_input, basic_output)
-    agent_cost = calculate_cost(agent_input, agent_output)
+    # 프롬프트 캐시 토큰 (이전 결과 파일에는 없을 수 있음)
+    basic_cache_read = sum(m["tokens_basic"].get("cache_read", 0) for m in merged)
+    basic_cache_write = sum(m["tokens_basic"].get("cache_write", 0) for m in merged)
+    agent_cache_read = sum(m["tokens_agent"].get("cache_read", 0) for m in merged)
+    agent_cache_write = sum(m["tokens_agent"].get("cache_write", 0) for m in merged)
+
+    # 비용 계산 (정확한 input/output + 캐시 읽기/쓰기 값 사용)
+    basic_cost = calculate_cost(
+        basic_input, basic_output, cache_read_tokens=basic_cache_read, cache_write_tokens=basic_cache_write
+    )
+    agent_cost = calculate_cost(
+        agent_input, agent_output, cache_read_tokens=agent_cache_read, cache_write_tokens=agent_cache_write
+    )
 
     # 정확도 통계
     basic_accuracies = [m["accuracy_basic"] for m in merged if m.get("key_facts")]
@@ -888,6 +939,40 @@ def main():
         default=334,
         help="프로젝트 ID (기본: 334)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="동시 질문 처리 수 (basic: 동시 LLM 호출 수, agent: 동시 Agent 수, 기본: 8)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        action="append",
+        metavar="PROVIDER=RPS",
+        help="공급자별 초당 요청 수 (vertex/bedrock/gemini/tavily, 반복 지정 가능, 예: vertex=4)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="모드별 체크포인트에서 이어서 실행 (성공한 질문 ID 건너뜀)",
+    )
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        help="외부 호출 녹화/재생 카세트 디렉터리 (예: data/cassettes/comparison)",
+    )
+    parser.add_argument(
+        "--cassette-mode",
+        choices=["record", "replay"],
+        default="replay",
+        help="record: 실제 호출을 녹화, replay: 녹화된 응답으로 오프라인 실행 (기본: replay)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="재생 시 녹화된 소요 시간 배율 (0: 대기 없음, 1.0: 녹화 당시 그대로, 기본: 0)",
+    )
     parser.add_argument(
         "--compare-only",
         nargs=2,
@@ -901,6 +986,10 @@ def main():
     )
 
     args = parser.parse_args()
+    try:
+        configure_rate_limits(args.rate_limit)
+    except ValueError as e:
+        parser.error(str(e))
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # 기존 결과로 비교만
@@ -933,6 +1022,11 @@ def main():
         print("❌ 실행할 질문이 없습니다.")
         return
 
+    # 카세트 (서비스 생성 전에 설정해야 클라이언트/Agent 모델이 녹화/재생 프록시로 감싸짐)
+    cassette = use_cassette(args.cassette, args.cassette_mode, args.replay_latency) if args.cassette else None
+    if cassette is not None:
+        print(f"📼 카세트: {cassette.path} ({cassette.mode})")
+
     # dry-run
     if args.dry_run:
         print(f"\n🔧 실행 설정")
@@ -951,15 +1045,18 @@ def main():
 
     # 실행
     if args.mode in ["basic", "both"]:
-        basic_results = run_mode("basic", questions, args.project_id)
+        basic_results = run_mode("basic", questions, args.project_id, args.concurrency, args.resume)
         basic_path = save_results(basic_results, "basic", run_id)
         print(f"\n💾 Basic 결과: {basic_path}")
 
     if args.mode in ["agent", "both"]:
-        agent_results = run_mode("agent", questions, args.project_id)
+        agent_results = run_mode("agent", questions, args.project_id, args.concurrency, args.resume)
         agent_path = save_results(agent_results, "agent", run_id)
         print(f"\n💾 Agent 결과: {agent_path}")
 
+    if cassette is not None:
+        print(f"\n📼 카세트: {cassette.stats()}")
+
     # 비교
     if args.mode == "both" and basic_results and agent_results:
         merged = merge_results(basic_results, agent_results)
@@ -19,11 +19,22 @@ Usage:
 
     # 설정만 출력
     uv run python scripts/run_rag.py --dry-run
+
+    # 동시 LLM 호출 수 (임베딩/검색/필터는 항상 묶어서 실행) + 공급자별 속도 제한
+    uv run python scripts/run_rag.py --concurrency 16 --rate-limit vertex=4
+
+    # 중단된 실행 이어서 (체크포인트에 성공 기록이 있는 질문은 건너뜀)
+    uv run python scripts/run_rag.py --level 4 --resume
+
+    # 외부 호출 녹화 → 네트워크 없이 재생 (녹화된 지연 그대로 재현하려면 --replay-latency 1.0)
+    uv run python scripts/run_rag.py --pipeline standard --cassette data/cassettes/standard --cassette-mode record
+    uv run python scripts/run_rag.py --pipeline standard --cassette data/cassettes/standard
 """
 
 import argparse
 import json
 import sys
+import time
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -34,11 +45,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from tqdm import tqdm
 
+from src.cassette import use_cassette
+from src.eval_runner import JSONLCheckpoint, configure_rate_limits, run_checkpointed
 from src.rag import (
+    RAGResult,
     create_full_pipeline,
     create_minimal_pipeline,
     create_standard_pipeline,
 )
+from src.rag.modules import RRFFusion, ZScoreFusion
 
 # =============================================================================
 # 경로 설정
@@ -46,6 +61,7 @@ from src.rag import (
 
 QUESTIONS_PATH = PROJECT_ROOT / "data" / "questions" / "question_set.json"
 RESULTS_DIR = PROJECT_ROOT / "data" / "results"
+CHECKPOINT_DIR = RESULTS_DIR / "checkpoints"
 
 
 # =============================================================================
@@ -135,6 +151,48 @@ def get_pipeline_config(pipeline_name: str) -> dict:
 # 결과 저장
 # =============================================================================
 
+def to_record(q: dict, result: RAGResult | Exception) -> dict:
+    """질문 + 실행 결과(또는 예외) → 결과 기록 (체크포인트 한 줄)"""
+    record = {
+        "id": q["id"],
+        "level": q["level"],
+        "category": q["category"],
+        "question": q["question"],
+        "expected_answer": q.get("expected_answer", ""),
+        "key_facts": q.get("key_facts", []),
+        "documents_required": q.get("documents_required", []),
+    }
+    if isinstance(result, Exception):
+        return {
+            **record,
+            "answer": f"ERROR: {result}",
+            "sources": [],
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "latency_ms": 0,
+            "timings": {},
+            "model": "",
+            "error": str(result),
+        }
+    return {
+        **record,
+        "answer": result.answer,
+        "sources": [
+            {
+                "file_name": s["_source"].get("file_name", "unknown"),
+                "score": s.get("_score", 0),
+            }
+            for s in result.sources
+        ],
+        "input_tokens": result.input_tokens,
+        "output_tokens": result.output_tokens,
+        "cache_read_tokens": result.cache_read_tokens,
+        "cache_write_tokens": result.cache_write_tokens,
+        "latency_ms": round(result.latency_ms, 1),
+        "timings": result.timings,
+        "model": result.model,
+    }
+
 
 def save_results(
     results: list[dict],
@@ -277,8 +335,91 @@ def main():
         default=334,
         help="프로젝트 ID (기본: 334)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="동시 LLM 호출 수 (기본: 8)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        action="append",
+        metavar="PROVIDER=RPS",
+        help="공급자별 초당 요청 수 (vertex/bedrock/gemini/tavily, 반복 지정 가능, 예: vertex=4)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="JSONL 체크포인트 경로 (기본: data/results/checkpoints/rag_<pipeline>.jsonl)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="체크포인트에서 이어서 실행 (성공한 질문 ID 건너뜀)",
+    )
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        help="외부 호출 녹화/재생 카세트 디렉터리 (예: data/cassettes/standard)",
+    )
+    parser.add_argument(
+        "--cassette-mode",
+        choices=["record", "replay"],
+        default="replay",
+        help="record: 실제 호출을 녹화, replay: 녹화된 응답으로 오프라인 실행 (기본: replay)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="재생 시 녹화된 소요 시간 배율 (0: 대기 없음, 1.0: 녹화 당시 그대로, 기본: 0)",
+    )
+    parser.add_argument(
+        "--fusion",
+        choices=["rrf", "zscore"],
+        help="클라이언트 BM25/KNN 융합 (hybrid-rrf 파이프라인 대신, standard/full만)",
+    )
+    parser.add_argument(
+        "--rank-constant",
+        type=int,
+        default=60,
+        help="RRF rank_constant (기본: 60)",
+    )
+    parser.add_argument(
+        "--fusion-weights",
+        type=str,
+        help="융합 가중치 bm25,knn (예: 1.0,1.5)",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="로컬 스냅샷 디렉터리 (지정 시 OpenSearch 대신 로컬 검색, minimal/standard만)",
+    )
+    parser.add_argument(
+        "--ef-search",
+        type=int,
+        help="HNSW ef_search (기본: 인덱스 설정값, cli.py sweep으로 선택)",
+    )
+    parser.add_argument(
+        "--knn-k",
+        type=int,
+        help="KNN 후보 수 (기본: 검색 size)",
+    )
+    parser.add_argument(
+        "--oversample-factor",
+        type=float,
+        help="양자화 인덱스 재점수화 후보 배수 (지정 시 rescore 사용)",
+    )
 
     args = parser.parse_args()
+    if args.fusion and args.pipeline == "minimal":
+        parser.error("--fusion은 하이브리드 검색을 쓰는 standard/full 파이프라인만 지원합니다")
+    if args.snapshot and args.pipeline == "full":
+        parser.error("--snapshot은 minimal/standard 파이프라인만 지원합니다 (full은 이웃 청크 확장에 OpenSearch 필요)")
+    try:
+        configure_rate_limits(args.rate_limit)
+    except ValueError as e:
+        parser.error(str(e))
 
     # 설정 로드
     config = get_pipeline_config(args.pipeline)
@@ -294,10 +435,35 @@ def main():
             print(f"  [{q['id']}] Level {q['level']}: {q['question'][:40]}...")
         return
 
+    # 카세트 (파이프라인 생성 전에 설정해야 클라이언트가 녹화/재생 프록시로 감싸짐)
+    cassette = use_cassette(args.cassette, args.cassette_mode, args.replay_latency) if args.cassette else None
+    if cassette is not None:
+        print(f"📼 카세트: {cassette.path} ({cassette.mode})")
+
     # 파이프라인 생성
     print(f"\n🚀 파이프라인 생성 중... ({args.pipeline})")
     factory = PIPELINE_FACTORIES[args.pipeline]
-    pipeline = factory(project_id=args.project_id)
+    factory_kwargs: dict = {"project_id": args.project_id}
+    if args.snapshot:
+        factory_kwargs["snapshot"] = args.snapshot
+    if args.fusion:
+        weights = [float(w) for w in args.fusion_weights.split(",")] if args.fusion_weights else None
+        if args.fusion == "rrf":
+            factory_kwargs["fusion"] = RRFFusion(rank_constant=args.rank_constant, weights=weights)
+        else:
+            factory_kwargs["fusion"] = ZScoreFusion(weights=weights)
+    knn_options = {
+        name: value
+        for name, value in [
+            ("ef_search", args.ef_search),
+            ("knn_k", args.knn_k),
+            ("oversample_factor", args.oversample_factor),
+        ]
+        if value is not None
+    }
+    if knn_options:
+        factory_kwargs["knn_options"] = knn_options
+    pipeline = factory(**factory_kwargs)
 
     # 질문 로드 및 필터
     questions = load_questions()
@@ -310,52 +476,32 @@ def main():
 
     print(f"📝 {len(questions)}개 질문 실행 예정\n")
 
-    # 실행
-    results = []
-    for q in tqdm(questions, desc="질문 처리"):
-        try:
-            result = pipeline.query(q["question"])
-            results.append({
-                "id": q["id"],
-                "level": q["level"],
-                "category": q["category"],
-                "question": q["question"],
-                "expected_answer": q.get("expected_answer", ""),
-                "key_facts": q.get("key_facts", []),
-                "documents_required": q.get("documents_required", []),
-                "answer": result.answer,
-                "sources": [
-                    {
-                        "file_name": s["_source"].get("file_name", "unknown"),
-                        "score": s.get("_score", 0),
-                    }
-                    for s in result.sources
-                ],
-                "input_tokens": result.input_tokens,
-                "output_tokens": result.output_tokens,
-                "latency_ms": round(result.latency_ms, 1),
-                "timings": result.timings,
-                "model": result.model,
-            })
-        except Exception as e:
-            print(f"\n❌ 질문 {q['id']} 실패: {e}")
-            results.append({
-                "id": q["id"],
-                "level": q["level"],
-                "category": q["category"],
-                "question": q["question"],
-                "expected_answer": q.get("expected_answer", ""),
-                "key_facts": q.get("key_facts", []),
-                "documents_required": q.get("documents_required", []),
-                "answer": f"ERROR: {e}",
-                "sources": [],
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "latency_ms": 0,
-                "timings": {},
-                "model": "",
-                "error": str(e),
-            })
+    # 실행 (임베딩/검색/필터는 묶어서, LLM은 concurrency개 동시 호출, 결과는 나오는 즉시 체크포인트에 기록)
+    checkpoint = JSONLCheckpoint(args.checkpoint or CHECKPOINT_DIR / f"rag_{args.pipeline}.jsonl")
+    print(f"📌 체크포인트: {checkpoint.path}{' (재개)' if args.resume else ''}")
+    start = time.time()
+    with tqdm(total=len(questions), desc="질문 처리") as bar:
+
+        def on_record(record: dict) -> None:
+            if record.get("error"):
+                tqdm.write(f"❌ 질문 {record['id']} 실패: {record['error']}")
+            bar.update(1)
+
+        results = run_checkpointed(
+            questions,
+            lambda texts, on_result: pipeline.query_batch(
+                texts, concurrency=args.concurrency, return_exceptions=True, on_result=on_result
+            ),
+            to_record,
+            checkpoint=checkpoint,
+            resume=args.resume,
+            on_record=on_record,
+        )
+        bar.update(len(questions) - bar.n)  # 체크포인트에서 재사용한 질문
+    print(f"⏱️  {time.time() - start:.1f}초")
+    if cassette is not None:
+        print(f"📼 카세트: {cassette.stats()}")
+    print()
 
     # 결과 저장
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
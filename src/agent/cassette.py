@@ -0,0 +1,119 @@
+"""Agent 외부 호출 녹화/재생
+
+src.cassette의 활성 카세트로 Strands Agent 모델 호출(LiteLLM Vertex)과 외부 도구(tavily_search)를
+녹화/재생합니다. search_documents는 내부에서 OpenSearchClient / EmbeddingClient 프록시를 사용합니다.
+
+Usage:
+    model = with_cassette_model(LiteLLMModel(...))
+    agent = Agent(model=model, tools=[session.search_documents, with_cassette_tool(tavily_search)])
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from strands.models import Model
+from strands.tools.decorator import DecoratedFunctionTool
+
+from src.cassette import Cassette, active_cassette
+
+
+class CassetteModel(Model):
+    """Strands 모델 스트림 녹화/재생 (이벤트 목록 저장, 구조화 출력은 원본으로 위임)
+
+    Args:
+        wrapped: 원본 모델 (LiteLLMModel 등)
+        cassette: 카세트
+        provider: 저장 위치 공급자 이름
+    """
+
+    def __init__(self, wrapped: Model, cassette: Cassette, provider: str = "vertex"):
+        self.wrapped = wrapped
+        self.cassette = cassette
+        self.provider = provider
+
+    def update_config(self, **model_config: Any) -> None:
+        self.wrapped.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        return self.wrapped.get_config()
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs) -> AsyncGenerator:
+        return self.wrapped.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        *,
+        tool_choice=None,
+        system_prompt_content=None,
+        **kwargs: Any,
+    ) -> AsyncGenerator:
+        request = {
+            "model_id": self.get_config().get("model_id"),
+            "messages": messages,
+            "tool_specs": tool_specs,
+            "system_prompt": system_prompt,
+            "system_prompt_content": system_prompt_content,
+            "tool_choice": tool_choice,
+        }
+        if self.cassette.replaying:
+            entry = self.cassette.load(self.provider, "stream", request)
+            wait = self.cassette.delay(entry["latency_ms"])
+            if wait:
+                await asyncio.sleep(wait)
+            for event in entry["response"]:
+                yield event
+            return
+
+        start = time.perf_counter()
+        events = []
+        async for event in self.wrapped.stream(
+            messages,
+            tool_specs,
+            system_prompt,
+            tool_choice=tool_choice,
+            system_prompt_content=system_prompt_content,
+            **kwargs,
+        ):
+            events.append(event)
+            yield event
+        self.cassette.put(self.provider, "stream", request, events, (time.perf_counter() - start) * 1000)
+
+
+def with_cassette_model(model: Model, provider: str = "vertex") -> Model:
+    """활성 카세트가 있으면 모델을 CassetteModel로 감싸서 반환 (없으면 그대로)"""
+    cassette = active_cassette()
+    return CassetteModel(model, cassette, provider) if cassette is not None else model
+
+
+def with_cassette_tool(tool: DecoratedFunctionTool, provider: str = "tavily") -> DecoratedFunctionTool:
+    """활성 카세트가 있으면 @tool 함수 호출을 녹화/재생하는 도구로 감싸서 반환 (없으면 그대로)
+
+    입력 검증/도구 스펙은 원본 그대로 사용하고, 검증된 입력을 키로 함수 결과만 녹화합니다.
+    """
+    cassette = active_cassette()
+    if cassette is None:
+        return tool
+
+    func = tool._tool_func
+    name = tool.tool_name
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def replayable(**kwargs):
+            return await cassette.acall(provider, name, kwargs, lambda: func(**kwargs))
+
+    else:
+
+        @functools.wraps(func)
+        def replayable(**kwargs):
+            return cassette.call(provider, name, kwargs, lambda: func(**kwargs))
+
+    return DecoratedFunctionTool(name, tool.tool_spec, replayable, tool._metadata)
@@ -0,0 +1,145 @@
+"""부하 테스트용 가짜 Agent 모델
+
+FakeLLMClient의 지연/토큰/실패 모델로 Strands 스트림 이벤트를 합성합니다.
+대화에서 도구 호출 라운드가 tool_rounds보다 적으면 search_documents 호출을, 아니면 최종 답변을 생성하므로
+Agent 이벤트 루프/도구 실행/훅 등 오케스트레이션 경로를 그대로 통과합니다.
+
+스로틀링은 ModelThrottledException으로 올라가 Strands 이벤트 루프의 재시도(4초부터 지수 백오프)를 탑니다.
+
+Usage:
+    from src.agent import AgentRAG
+    from src.agent.fake_model import FakeAgentModel
+    from src.agent.tools import SearchSession
+    from src.fake_backends import FakeEmbeddingClient, FakeSearchClient
+
+    agent = AgentRAG(
+        model=FakeAgentModel(),
+        search=SearchSession(search_client=FakeSearchClient(), embedding_client=FakeEmbeddingClient()),
+    )
+"""
+
+import json
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from strands.models import Model
+from strands.types.exceptions import ModelThrottledException
+
+from src.fake_backends import FakeLLMClient, FakeThrottlingError, FaultModel, LatencyModel
+
+
+class FakeAgentModel(FakeLLMClient, Model):
+    """Strands Model 대체 (도구 호출 → 최종 답변)
+
+    Args:
+        latency: 첫 토큰까지 지연 분포 (기본: ~600ms)
+        faults: 실패 비율
+        seed: 난수 시드
+        output_tokens: 최종 답변 출력 토큰 수 중앙값
+        ms_per_output_token: 출력 토큰당 지연 (밀리초)
+        tool_rounds: 최종 답변 전 search_documents 호출 횟수
+        tool_call_tokens: 도구 호출 메시지의 출력 토큰 수
+        model_id: get_config()의 model_id
+    """
+
+    def __init__(
+        self,
+        latency: LatencyModel | None = None,
+        faults: FaultModel | None = None,
+        seed: int | None = 0,
+        output_tokens: int = 200,
+        ms_per_output_token: float = 15.0,
+        tool_rounds: int = 1,
+        tool_call_tokens: int = 40,
+        model_id: str = "fake-agent",
+    ):
+        super().__init__(
+            latency=latency,
+            faults=faults,
+            seed=seed,
+            output_tokens=output_tokens,
+            ms_per_output_token=ms_per_output_token,
+            model=model_id,
+        )
+        self.tool_rounds = tool_rounds
+        self.tool_call_tokens = tool_call_tokens
+        self.config: dict[str, Any] = {"model_id": model_id}
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs) -> AsyncGenerator:
+        raise NotImplementedError("FakeAgentModel은 구조화 출력을 지원하지 않습니다")
+        yield
+
+    @staticmethod
+    def _texts(messages) -> list[str]:
+        """메시지의 텍스트/도구 결과 텍스트 (입력 토큰 추정용)"""
+        texts = []
+        for message in messages:
+            for block in message.get("content", []):
+                if "text" in block:
+                    texts.append(block["text"])
+                elif "toolResult" in block:
+                    texts.extend(item.get("text", "") for item in block["toolResult"].get("content", []))
+        return texts
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        *,
+        tool_choice=None,
+        system_prompt_content=None,
+        **kwargs: Any,
+    ) -> AsyncGenerator:
+        rounds = sum(
+            1
+            for message in messages
+            if message["role"] == "assistant" and any("toolUse" in block for block in message["content"])
+        )
+        call_tool = rounds < self.tool_rounds and any(spec["name"] == "search_documents" for spec in tool_specs or [])
+        question = next(iter(self._texts(messages[:1])), "")
+        input_tokens, output_tokens = self._tokens("\n".join(self._texts(messages)), system_prompt, 2048)
+        if call_tool:
+            output_tokens = self.tool_call_tokens
+
+        start = time.perf_counter()
+        try:
+            await self._arequest(output_tokens * self.ms_per_output_token)
+        except FakeThrottlingError as e:
+            raise ModelThrottledException(str(e)) from e
+        latency_ms = round((time.perf_counter() - start) * 1000)
+
+        yield {"messageStart": {"role": "assistant"}}
+        if call_tool:
+            tool_input = {"query": f"{question} ({rounds + 1})", "k": 5}
+            yield {
+                "contentBlockStart": {
+                    "start": {"toolUse": {"toolUseId": f"fake-{rounds + 1}", "name": "search_documents"}}
+                }
+            }
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input, ensure_ascii=False)}}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "tool_use"
+        else:
+            content = self._response(question, input_tokens, output_tokens).content
+            yield {"contentBlockDelta": {"delta": {"text": content}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "end_turn"
+        yield {"messageStop": {"stopReason": stop_reason}}
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": output_tokens,
+                    "totalTokens": input_tokens + output_tokens,
+                },
+                "metrics": {"latencyMs": latency_ms},
+            }
+        }
@@ -0,0 +1,38 @@
+"""Agent 훅
+
+Strands Agent 이벤트에 연결하는 HookProvider 모음입니다.
+"""
+
+from typing import Any
+
+from strands.hooks import BeforeModelCallEvent, BeforeToolCallEvent, HookProvider, HookRegistry
+
+from src.rate_limit import aacquire_provider
+
+
+class ProviderRateLimitHook(HookProvider):
+    """Agent 모델 호출 / 외부 도구 호출에 공급자별 속도 제한 적용
+
+    set_provider_limit()로 제한을 설정한 공급자만 대기합니다 (설정이 없으면 영향 없음).
+    search_documents의 임베딩은 EmbeddingClient가 "bedrock" 제한을 직접 적용합니다.
+
+    Args:
+        model_provider: Agent 모델 공급자 (기본: "vertex" - LiteLLM Vertex AI Claude)
+        tool_providers: 도구 이름 → 공급자 (기본: tavily_search → "tavily")
+    """
+
+    def __init__(self, model_provider: str = "vertex", tool_providers: dict[str, str] | None = None):
+        self.model_provider = model_provider
+        self.tool_providers = tool_providers if tool_providers is not None else {"tavily_search": "tavily"}
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeModelCallEvent, self._before_model_call)
+        registry.add_callback(BeforeToolCallEvent, self._before_tool_call)
+
+    async def _before_model_call(self, event: BeforeModelCallEvent) -> None:
+        await aacquire_provider(self.model_provider)
+
+    async def _before_tool_call(self, event: BeforeToolCallEvent) -> None:
+        provider = self.tool_providers.get(event.tool_use["name"])
+        if provider is not None:
+            await aacquire_provider(provider)
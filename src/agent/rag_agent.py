@@ -10,6 +10,7 @@ Usage:
     result = agent_rag.query("연차 휴가는 며칠인가요?")
 """
 
+import json
 import logging
 import os
 import time
@@ -18,12 +19,18 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 from strands import Agent
+from strands.handlers import PrintingCallbackHandler
+from strands.models import Model
 from strands.models.litellm import LiteLLMModel
 from strands.types.exceptions import MaxTokensReachedException
 
 from strands_tools.tavily import tavily_search
 
-from .tools.search import clear_sources, get_call_history, get_last_sources, search_documents
+from src.llm_client import MIN_CACHE_TOKENS, estimate_tokens
+
+from .cassette import with_cassette_model, with_cassette_tool
+from .hooks import ProviderRateLimitHook
+from .tools.search import SearchSession
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +56,10 @@ class AgentRAGResult:
         answer: Agent 생성 답변
         tool_calls: 도구 호출 목록 [{"name": str, "args": dict}, ...]
         tool_call_count: 도구 호출 횟수
-        input_tokens: LLM 입력 토큰 수
+        input_tokens: LLM 입력 토큰 수 (프롬프트 캐시 토큰 제외)
         output_tokens: LLM 출력 토큰 수
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_write_tokens: 프롬프트 캐시에 새로 쓴 입력 토큰 수
         latency_ms: 전체 파이프라인 소요 시간 (밀리초)
         model: 사용된 LLM 모델명
         sources: 검색된 소스 목록 [{"file_name": str, "score": float, "query": str}, ...]
@@ -64,6 +73,8 @@ class AgentRAGResult:
     tool_call_count: int = 0
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     latency_ms: float = 0.0
     model: str = ""
     sources: list[dict] = field(default_factory=list)
@@ -102,6 +113,22 @@ AGENT_SYSTEM_PROMPT = """당신은 문서 검색 및 질문 답변 전문가입
 """
 
 
+def cached_system_prompt(prompt: str, tools: list | None = None) -> list[dict]:
+    """프롬프트 캐시 브레이크포인트가 설정된 시스템 프롬프트
+
+    Agent는 도구 호출마다 같은 도구 스펙 + 시스템 프롬프트를 다시 보내므로
+    그 뒤에 cachePoint를 두면 두 번째 호출부터 캐시 읽기 단가(입력의 10%)로 처리됩니다.
+    (LiteLLMModel이 cachePoint를 Anthropic cache_control로 변환)
+
+    도구 스펙 + 프롬프트 추정 토큰 수가 MIN_CACHE_TOKENS(1024) 미만이면 캐시되지 않으므로
+    cachePoint 없이 반환합니다 (현재 Agent 프롬프트 ~550자 + 도구 2~3개는 미달).
+    """
+    specs = [json.dumps(tool.tool_spec, ensure_ascii=False) for tool in tools or [] if hasattr(tool, "tool_spec")]
+    if estimate_tokens(prompt) + sum(estimate_tokens(spec) for spec in specs) < MIN_CACHE_TOKENS:
+        return [{"text": prompt}]
+    return [{"text": prompt}, {"cachePoint": {"type": "default"}}]
+
+
 # =============================================================================
 # Agent RAG 클래스
 # =============================================================================
@@ -117,11 +144,17 @@ class AgentRAG:
         self,
         project_id: int = 334,
         model_id: str | None = None,
+        model: Model | None = None,
+        search: SearchSession | None = None,
+        print_stream: bool = True,
     ):
         """
         Args:
             project_id: 프로젝트 ID (검색 필터용)
             model_id: LiteLLM 모델 ID (기본: vertex_ai/claude-sonnet-4-5@20250929)
+            model: Strands 모델 직접 지정 (부하 테스트용 FakeAgentModel 등, 지정 시 model_id는 표시용)
+            search: 검색 세션 직접 지정 (가짜 검색/임베딩 클라이언트 주입용)
+            print_stream: False면 생성 중인 답변/도구 호출을 stdout에 출력하지 않음 (동시 실행/부하 테스트용)
         """
         self.project_id = project_id
 
@@ -131,21 +164,30 @@ class AgentRAG:
             "vertex_ai/claude-sonnet-4-5@20250929",
         )
 
-        # LiteLLM 모델 설정 (Vertex AI)
-        self.model = LiteLLMModel(
-            model_id=self.model_id,
-            params={
-                "vertex_project": os.getenv("GCP_PROJECT_ID"),
-                "vertex_location": os.getenv("GCP_REGION", "us-east5"),
-                "max_tokens": 2048,
-            },
-        )
+        if model is None:
+            # LiteLLM 모델 설정 (Vertex AI)
+            model = LiteLLMModel(
+                model_id=self.model_id,
+                params={
+                    "vertex_project": os.getenv("GCP_PROJECT_ID"),
+                    "vertex_location": os.getenv("GCP_REGION", "us-east5"),
+                    "max_tokens": 2048,
+                },
+            )
+        # 카세트가 활성화돼 있으면 모델 호출을 녹화/재생
+        self.model = with_cassette_model(model)
+
+        # Agent별 검색 상태 (여러 Agent를 동시에 실행해도 소스/호출 이력이 섞이지 않음)
+        self.search = search or SearchSession()
 
         # Agent 생성
+        tools = [self.search.search_documents, with_cassette_tool(tavily_search)]
         self.agent = Agent(
             model=self.model,
-            system_prompt=AGENT_SYSTEM_PROMPT,
-            tools=[search_documents, tavily_search],
+            system_prompt=cached_system_prompt(AGENT_SYSTEM_PROMPT, tools),
+            tools=tools,
+            hooks=[ProviderRateLimitHook()],
+            callback_handler=PrintingCallbackHandler() if print_stream else None,
         )
 
     def query(self, question: str) -> AgentRAGResult:
@@ -160,7 +202,7 @@ class AgentRAG:
         start = time.time()
 
         # 검색 결과 초기화
-        clear_sources()
+        self.search.clear()
 
         try:
             # Agent 호출 - 반환 타입: AgentResult
@@ -170,8 +212,8 @@ class AgentRAG:
             elapsed_ms = (time.time() - start) * 1000
 
             # 검색 결과 및 호출 이력 수집
-            sources = get_last_sources()
-            call_history = get_call_history()
+            sources = self.search.sources.copy()
+            call_history = self.search.call_history.copy()
 
             # 도구 호출 정보 추출 (metrics.tool_metrics에서)
             # ToolMetrics 필드: tool, call_count, success_count, error_count, total_time
@@ -197,15 +239,24 @@ class AgentRAG:
             }
 
             # 토큰 사용량 추출 (metrics.accumulated_usage에서)
-            # Usage: {"inputTokens": int, "outputTokens": int, "totalTokens": int}
+            # Usage: {"inputTokens": int, "outputTokens": int, "totalTokens": int,
+            #         "cacheReadInputTokens": int, "cacheWriteInputTokens": int}
+            # LiteLLM의 inputTokens는 캐시 읽기/쓰기 토큰을 포함하므로 빼서 LLMClient 기준과 맞춤
             input_tokens = 0
             output_tokens = 0
+            cache_read_tokens = 0
+            cache_write_tokens = 0
             if result.metrics and result.metrics.accumulated_usage:
                 usage = result.metrics.accumulated_usage
-                input_tokens = usage.get("inputTokens", 0)
+                cache_read_tokens = usage.get("cacheReadInputTokens", 0)
+                cache_write_tokens = usage.get("cacheWriteInputTokens", 0)
+                input_tokens = max(0, usage.get("inputTokens", 0) - cache_read_tokens - cache_write_tokens)
                 output_tokens = usage.get("outputTokens", 0)
                 total_used = input_tokens + output_tokens
-                logger.debug(f"Token usage: {total_used} (input={input_tokens}, output={output_tokens})")
+                logger.debug(
+                    f"Token usage: {total_used} (input={input_tokens}, output={output_tokens}, "
+                    f"cache_read={cache_read_tokens}, cache_write={cache_write_tokens})"
+                )
 
             # 답변 텍스트 추출 (message.content에서)
             # Message는 {"role": str, "content": [{"text": "..."}, ...]} 형태
@@ -223,6 +274,8 @@ class AgentRAG:
                 tool_call_count=len(tool_calls),
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
                 latency_ms=round(elapsed_ms, 1),
                 model=self.model_id,
                 sources=sources,
@@ -232,8 +285,8 @@ class AgentRAG:
 
         except MaxTokensReachedException as e:
             elapsed_ms = (time.time() - start) * 1000
-            sources = get_last_sources()
-            call_history = get_call_history()
+            sources = self.search.sources.copy()
+            call_history = self.search.call_history.copy()
 
             logger.warning(f"MaxTokensReachedException: {question[:50]}...")
             logger.warning(f"Sources before error: {len(sources)}")
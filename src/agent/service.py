@@ -52,6 +52,8 @@ class AgentRAGService(RAGServiceBase):
             answer=result.answer,
             input_tokens=result.input_tokens,
             output_tokens=result.output_tokens,
+            cache_read_tokens=result.cache_read_tokens,
+            cache_write_tokens=result.cache_write_tokens,
             latency_ms=result.latency_ms,
             model=result.model,
             tool_calls=result.tool_calls,
@@ -3,6 +3,6 @@
 Strands Agent에서 사용하는 도구들입니다.
 """
 
-from .search import search_documents
+from .search import SearchSession, search_documents
 
-__all__ = ["search_documents"]
+__all__ = ["SearchSession", "search_documents"]
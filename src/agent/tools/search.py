@@ -1,13 +1,20 @@
 """OpenSearch 검색 도구
 
 Strands Agent에서 사용할 문서 검색 도구입니다.
+
+검색 소스/호출 이력은 SearchSession에 기록됩니다. Agent를 여러 개 동시에 실행할 때는
+Agent마다 SearchSession을 만들어 그 search_documents를 도구로 넘깁니다.
+모듈 수준 search_documents / get_last_sources / clear_sources는 기본 세션을 사용합니다.
 """
 
 import logging
+import threading
 import time
 
 from strands import tool
 
+from src.cassette import with_cassette
+from src.embedding_cache import CachedEmbeddingClient
 from src.embedding_client import EmbeddingClient
 from src.opensearch_client import OpenSearchClient
 
@@ -17,165 +24,195 @@ logger = logging.getLogger(__name__)
 SEARCH_FIELDS = ["chunk_text^4.0", "text.ko^3.5", "text.en^1.8"]
 SEARCH_PIPELINE = "hybrid-rrf"
 
-# 싱글턴 클라이언트 (Agent 내에서 재사용)
+# 싱글턴 클라이언트 (모든 Agent가 공유, thread-safe)
 _opensearch_client: OpenSearchClient | None = None
-_embedding_client: EmbeddingClient | None = None
-
-# 검색 결과 저장 (Agent 호출 간 공유)
-_last_search_sources: list[dict] = []
-
-# 도구 호출 이력 저장
-_call_history: list[dict] = []
-
+_embedding_client: CachedEmbeddingClient | None = None
+_clients_lock = threading.Lock()
 
-def get_last_sources() -> list[dict]:
-    """마지막 검색 소스 반환"""
-    return _last_search_sources.copy()
-
-
-def clear_sources() -> None:
-    """검색 소스 초기화"""
-    global _last_search_sources, _call_history
-    _last_search_sources = []
-    _call_history = []
 
-
-def get_call_history() -> list[dict]:
-    """도구 호출 이력 반환"""
-    return _call_history.copy()
-
-
-def _get_clients() -> tuple[OpenSearchClient, EmbeddingClient]:
+def _get_clients() -> tuple[OpenSearchClient, CachedEmbeddingClient]:
     """클라이언트 싱글턴 반환"""
     global _opensearch_client, _embedding_client
-    if _opensearch_client is None:
-        _opensearch_client = OpenSearchClient()
-    if _embedding_client is None:
-        _embedding_client = EmbeddingClient()
+    with _clients_lock:
+        if _opensearch_client is None:
+            _opensearch_client = with_cassette(OpenSearchClient(), "opensearch")
+        if _embedding_client is None:
+            _embedding_client = CachedEmbeddingClient.from_env(with_cassette(EmbeddingClient(), "bedrock"))
     return _opensearch_client, _embedding_client
 
 
-@tool
-def search_documents(
-    query: str,
-    k: int = 5,
-    project_id: int = 334,
-) -> str:
-    """OpenSearch에서 관련 문서를 검색합니다.
-
-    사용자 질문에 답하기 위해 관련 문서를 검색할 때 사용합니다.
-    검색 결과가 불충분하면 다른 키워드로 재검색할 수 있습니다.
+class SearchSession:
+    """Agent별 검색 상태 (검색 소스 + 도구 호출 이력)
 
     Args:
-        query: 검색할 질문 또는 키워드
-        k: 반환할 문서 개수 (기본값: 5)
-        project_id: 프로젝트 ID (기본값: 334)
-
-    Returns:
-        검색된 문서들의 내용 (문서별 구분자로 분리)
+        search_client: 검색 클라이언트 (기본: 공유 OpenSearchClient 싱글턴)
+        embedding_client: 임베딩 클라이언트 (기본: 공유 CachedEmbeddingClient 싱글턴)
+
+    Usage:
+        session = SearchSession()
+        agent = Agent(model=model, tools=[session.search_documents, tavily_search])
+        agent(question)
+        print(session.sources, session.call_history)
     """
-    global _last_search_sources, _call_history
-
-    call_start = time.time()
-    call_index = len(_call_history) + 1
-
-    logger.info(f"[Call #{call_index}] search_documents(query='{query}', k={k})")
-
-    opensearch, embedding = _get_clients()
-
-    # 임베딩 생성
-    vector = embedding.embed(query)
-
-    # Hybrid 쿼리 생성 (KNN + BM25)
-    filter_clause = {"term": {"project_id": project_id}}
-
-    search_query = {
-        "query": {
-            "hybrid": {
-                "queries": [
-                    # BM25 서브쿼리
-                    {
-                        "bool": {
-                            "must": [{"multi_match": {"query": query, "fields": SEARCH_FIELDS}}],
-                            "filter": [filter_clause],
-                        }
-                    },
-                    # KNN 서브쿼리
-                    {
-                        "knn": {
-                            "embedding": {
-                                "vector": vector,
-                                "k": k,
-                                "filter": filter_clause,
+
+    def __init__(self, search_client=None, embedding_client=None):
+        self.search_client = search_client
+        self.embedding_client = embedding_client
+        self.sources: list[dict] = []
+        self.call_history: list[dict] = []
+
+    def clear(self) -> None:
+        """검색 소스/호출 이력 초기화"""
+        self.sources = []
+        self.call_history = []
+
+    def _clients(self) -> tuple:
+        """(검색 클라이언트, 임베딩 클라이언트) - 지정하지 않은 쪽은 공유 싱글턴"""
+        if self.search_client is not None and self.embedding_client is not None:
+            return self.search_client, self.embedding_client
+        opensearch, embedding = _get_clients()
+        return self.search_client or opensearch, self.embedding_client or embedding
+
+    @tool
+    def search_documents(
+        self,
+        query: str,
+        k: int = 5,
+        project_id: int = 334,
+    ) -> str:
+        """OpenSearch에서 관련 문서를 검색합니다.
+
+        사용자 질문에 답하기 위해 관련 문서를 검색할 때 사용합니다.
+        검색 결과가 불충분하면 다른 키워드로 재검색할 수 있습니다.
+
+        Args:
+            query: 검색할 질문 또는 키워드
+            k: 반환할 문서 개수 (기본값: 5)
+            project_id: 프로젝트 ID (기본값: 334)
+
+        Returns:
+            검색된 문서들의 내용 (문서별 구분자로 분리)
+        """
+        call_start = time.time()
+        call_index = len(self.call_history) + 1
+
+        logger.info(f"[Call #{call_index}] search_documents(query='{query}', k={k})")
+
+        opensearch, embedding = self._clients()
+
+        # 임베딩 생성
+        vector = embedding.embed(query)
+
+        # Hybrid 쿼리 생성 (KNN + BM25)
+        filter_clause = {"term": {"project_id": project_id}}
+
+        search_query = {
+            "query": {
+                "hybrid": {
+                    "queries": [
+                        # BM25 서브쿼리
+                        {
+                            "bool": {
+                                "must": [{"multi_match": {"query": query, "fields": SEARCH_FIELDS}}],
+                                "filter": [filter_clause],
                             }
-                        }
-                    },
-                ]
+                        },
+                        # KNN 서브쿼리
+                        {
+                            "knn": {
+                                "embedding": {
+                                    "vector": vector,
+                                    "k": k,
+                                    "filter": filter_clause,
+                                }
+                            }
+                        },
+                    ]
+                }
             }
         }
-    }
-
-    # 검색 실행 (Hybrid RRF 파이프라인)
-    results = opensearch.search_with_pipeline(
-        index="rag-index-fargate-live",
-        query=search_query,
-        size=k,
-        pipeline=SEARCH_PIPELINE,
-    )
 
-    elapsed_ms = (time.time() - call_start) * 1000
-
-    if not results:
-        # 호출 이력 저장 (결과 없음)
-        _call_history.append({
+        # 검색 실행 (Hybrid RRF 파이프라인)
+        results = opensearch.search_with_pipeline(
+            index="rag-index-fargate-live",
+            query=search_query,
+            size=k,
+            pipeline=SEARCH_PIPELINE,
+        )
+
+        elapsed_ms = (time.time() - call_start) * 1000
+
+        if not results:
+            # 호출 이력 저장 (결과 없음)
+            self.call_history.append({
+                "call_index": call_index,
+                "tool": "search_documents",
+                "query": query,
+                "k": k,
+                "elapsed_ms": round(elapsed_ms, 1),
+                "result_count": 0,
+                "documents": [],
+            })
+            logger.info(f"[Call #{call_index}] No results ({elapsed_ms:.1f}ms)")
+            return "검색 결과가 없습니다."
+
+        # 결과 포맷팅 및 소스 저장
+        output = []
+        documents = []
+        for i, hit in enumerate(results, 1):
+            source = hit["_source"]
+            score = hit.get("_score", 0)
+            file_name = source.get("file_name", "unknown")
+            text = source.get("text", "")
+
+            # 검색 결과 저장 (sources용)
+            self.sources.append({
+                "file_name": file_name,
+                "score": round(score, 6),
+                "query": query,
+            })
+
+            # 호출 이력용 문서 정보
+            documents.append({
+                "rank": i,
+                "file_name": file_name,
+                "score": round(score, 4),
+                "text_preview": text[:100] + "..." if len(text) > 100 else text,
+            })
+
+            output.append(f"[문서 {i}] ({file_name}, 점수: {score:.3f})\n{text}")
+
+        # 호출 이력 저장
+        self.call_history.append({
             "call_index": call_index,
             "tool": "search_documents",
             "query": query,
             "k": k,
             "elapsed_ms": round(elapsed_ms, 1),
-            "result_count": 0,
-            "documents": [],
-        })
-        logger.info(f"[Call #{call_index}] No results ({elapsed_ms:.1f}ms)")
-        return "검색 결과가 없습니다."
-
-    # 결과 포맷팅 및 소스 저장
-    output = []
-    documents = []
-    for i, hit in enumerate(results, 1):
-        source = hit["_source"]
-        score = hit.get("_score", 0)
-        file_name = source.get("file_name", "unknown")
-        text = source.get("text", "")
-
-        # 검색 결과 저장 (sources용)
-        _last_search_sources.append({
-            "file_name": file_name,
-            "score": round(score, 6),
-            "query": query,
+            "result_count": len(results),
+            "documents": documents,
         })
 
-        # 호출 이력용 문서 정보
-        documents.append({
-            "rank": i,
-            "file_name": file_name,
-            "score": round(score, 4),
-            "text_preview": text[:100] + "..." if len(text) > 100 else text,
-        })
+        logger.info(f"[Call #{call_index}] Found {len(results)} docs ({elapsed_ms:.1f}ms)")
+
+        return "\n\n---\n\n".join(output)
 
-        output.append(f"[문서 {i}] ({file_name}, 점수: {score:.3f})\n{text}")
 
-    # 호출 이력 저장
-    _call_history.append({
-        "call_index": call_index,
-        "tool": "search_documents",
-        "query": query,
-        "k": k,
-        "elapsed_ms": round(elapsed_ms, 1),
-        "result_count": len(results),
-        "documents": documents,
-    })
+# 기본 세션 (단일 Agent / CLI용)
+_default_session = SearchSession()
+search_documents = _default_session.search_documents
 
-    logger.info(f"[Call #{call_index}] Found {len(results)} docs ({elapsed_ms:.1f}ms)")
 
-    return "\n\n---\n\n".join(output)
+def get_last_sources() -> list[dict]:
+    """마지막 검색 소스 반환 (기본 세션)"""
+    return _default_session.sources.copy()
+
+
+def clear_sources() -> None:
+    """검색 소스 초기화 (기본 세션)"""
+    _default_session.clear()
+
+
+def get_call_history() -> list[dict]:
+    """도구 호출 이력 반환 (기본 세션)"""
+    return _default_session.call_history.copy()
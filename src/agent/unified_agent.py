@@ -16,6 +16,7 @@ from strands.session.file_session_manager import FileSessionManager
 
 from strands_tools.tavily import tavily_search
 
+from .rag_agent import cached_system_prompt
 from .tools.ask_user import ask_user
 from .tools.search import search_documents
 
@@ -137,7 +138,7 @@ class UnifiedAgent:
             session_manager=self.session_manager,
             conversation_manager=self.conversation_manager,
             tools=config["tools"],
-            system_prompt=config["prompt"],
+            system_prompt=cached_system_prompt(config["prompt"], config["tools"]),
         )
 
         return self._agent
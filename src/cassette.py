@@ -0,0 +1,490 @@
+"""외부 호출 녹화/재생 (카세트)
+
+Bedrock 임베딩 / Vertex Claude / Gemini / OpenSearch 호출을 카세트 디렉터리에 녹화하고,
+재생 모드에서는 네트워크 없이 녹화된 응답을 돌려줍니다. 파이프라인 자체 오버헤드를
+오프라인에서 결정적으로 측정/프로파일링하기 위한 용도입니다.
+
+- 녹화(record): 실제 호출 후 요청/응답/소요 시간을 저장 (같은 요청은 덮어씀)
+- 재생(replay): 저장된 응답 반환, 없으면 CassetteMissError. latency_scale > 0이면
+  녹화된 소요 시간 × latency_scale만큼 대기 후 반환 (1.0 = 녹화 당시 그대로)
+
+카세트 키: sha256(공급자 + 메서드 + 정규화된 요청 JSON) - 내용 주소 방식이라 실행 순서/동시성과 무관합니다.
+요청의 float는 float32로 반올림해 키를 만듭니다 (임베딩 디스크 캐시의 float32 벡터와 같은 키).
+저장 위치: <카세트 디렉터리>/<공급자>/<키 앞 2자>/<키>.json
+
+단건/배치 호출은 같은 키를 공유합니다 (embed ↔ embed_batch 항목, search ↔ msearch 항목).
+그래서 query()로 녹화한 카세트를 query_batch()로 재생할 수 있습니다.
+모델/차원 등 설정을 바꾸면 요청이 달라지므로 새로 녹화해야 합니다.
+
+Usage:
+    from src.cassette import use_cassette
+
+    use_cassette("data/cassettes/basic", mode="record")  # 또는 mode="replay", latency_scale=1.0
+    pipeline = create_standard_pipeline()  # 팩토리가 with_cassette()로 클라이언트를 감쌈
+
+    # 환경변수로도 활성화: RAG_CASSETTE=data/cassettes/basic RAG_CASSETTE_MODE=replay
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import struct
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+MODES = ("record", "replay")
+
+
+class CassetteMissError(LookupError):
+    """재생 모드에서 녹화되지 않은 요청"""
+
+
+def _canonical(value: Any) -> Any:
+    """키용 정규화 (tuple → list, float → float32 반올림)"""
+    if isinstance(value, float):
+        return struct.unpack("f", struct.pack("f", value))[0]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _bind(func: Callable, args: tuple, kwargs: dict) -> dict:
+    """호출 인자 → 기본값을 채운 {파라미터: 값} (위치/키워드 인자 차이와 무관한 요청)"""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+class Cassette:
+    """내용 주소 방식 녹화/재생 저장소 (thread-safe)
+
+    Args:
+        path: 카세트 디렉터리
+        mode: "record" | "replay"
+        latency_scale: 재생 시 녹화된 소요 시간에 곱할 배율 (0이면 대기 없음)
+    """
+
+    def __init__(self, path: str | Path, mode: str = "replay", latency_scale: float = 0.0):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode} ({' | '.join(MODES)})")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(provider: str, method: str, request: dict) -> str:
+        """요청 → 카세트 키"""
+        payload = json.dumps([provider, method, _canonical(request)], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _file(self, provider: str, key: str) -> Path:
+        return self.path / provider / key[:2] / f"{key}.json"
+
+    def get(self, provider: str, method: str, request: dict) -> dict | None:
+        """녹화 항목 {"response", "latency_ms", ...} (없으면 None, 히트/미스 집계)"""
+        file = self._file(provider, self.key(provider, method, request))
+        try:
+            with open(file, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def load(self, provider: str, method: str, request: dict) -> dict:
+        """녹화 항목 (없으면 CassetteMissError)"""
+        entry = self.get(provider, method, request)
+        if entry is None:
+            key = self.key(provider, method, request)
+            raise CassetteMissError(f"카세트에 없는 요청: {provider}.{method} ({key[:12]}, {self.path})")
+        return entry
+
+    def put(self, provider: str, method: str, request: dict, response: Any, latency_ms: float) -> None:
+        """녹화 (임시 파일에 쓴 뒤 교체 - 동시 녹화/중단에도 항목이 깨지지 않음)"""
+        file = self._file(provider, self.key(provider, method, request))
+        file.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "provider": provider,
+            "method": method,
+            "request": request,
+            "response": response,
+            "latency_ms": round(latency_ms, 3),
+        }
+        tmp_path = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, file)
+        with self._lock:
+            self.recorded += 1
+
+    def delay(self, latency_ms: float) -> float:
+        """재생 대기 시간 (초)"""
+        return max(0.0, latency_ms) * self.latency_scale / 1000
+
+    def call(
+        self,
+        provider: str,
+        method: str,
+        request: dict,
+        func: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """녹화 모드면 func() 실행 후 저장, 재생 모드면 저장된 응답 반환"""
+        if self.replaying:
+            entry = self.load(provider, method, request)
+            wait = self.delay(entry["latency_ms"])
+            if wait:
+                time.sleep(wait)
+            return decode(entry["response"])
+
+        start = time.perf_counter()
+        value = func()
+        self.put(provider, method, request, encode(value), (time.perf_counter() - start) * 1000)
+        return value
+
+    async def acall(
+        self,
+        provider: str,
+        method: str,
+        request: dict,
+        func: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """call()의 비동기 버전 (재생 대기는 asyncio.sleep)"""
+        if self.replaying:
+            entry = self.load(provider, method, request)
+            wait = self.delay(entry["latency_ms"])
+            if wait:
+                await asyncio.sleep(wait)
+            return decode(entry["response"])
+
+        start = time.perf_counter()
+        value = await func()
+        self.put(provider, method, request, encode(value), (time.perf_counter() - start) * 1000)
+        return value
+
+    def stats(self) -> dict:
+        """히트/미스/녹화 수"""
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+# =============================================================================
+# 활성 카세트 (스크립트 인자 또는 환경변수)
+# =============================================================================
+
+_active: Cassette | None = None
+_env_checked = False
+_active_lock = threading.Lock()
+
+
+def use_cassette(path: str | Path | None, mode: str = "replay", latency_scale: float = 0.0) -> Cassette | None:
+    """전역 카세트 설정 (path=None이면 해제). 이후 생성되는 클라이언트부터 적용"""
+    global _active, _env_checked
+    with _active_lock:
+        _active = Cassette(path, mode, latency_scale) if path else None
+        _env_checked = True
+        return _active
+
+
+def active_cassette() -> Cassette | None:
+    """현재 카세트 (use_cassette로 설정하지 않았으면 RAG_CASSETTE* 환경변수에서 한 번 생성)"""
+    global _active, _env_checked
+    with _active_lock:
+        if not _env_checked:
+            _env_checked = True
+            if os.getenv("RAG_CASSETTE"):
+                _active = Cassette(
+                    os.environ["RAG_CASSETTE"],
+                    mode=os.getenv("RAG_CASSETTE_MODE", "replay"),
+                    latency_scale=float(os.getenv("RAG_CASSETTE_LATENCY", "0")),
+                )
+        return _active
+
+
+def with_cassette(client: Any, provider: str) -> Any:
+    """활성 카세트가 있으면 클라이언트를 녹화/재생 프록시로 감싸서 반환 (없으면 그대로)
+
+    Args:
+        client: EmbeddingClient | LLMClient | GeminiClient | OpenSearchClient
+        provider: "bedrock" | "vertex" | "gemini" | "opensearch"
+    """
+    cassette = active_cassette()
+    if cassette is None:
+        return client
+    if provider == "bedrock":
+        return CassetteEmbeddingClient(client, cassette)
+    if provider == "vertex":
+        from src.llm_client import LLMResponse
+
+        return CassetteLLMClient(client, cassette, provider, LLMResponse, model=client.model)
+    if provider == "gemini":
+        from src.gemini_client import GeminiResponse
+
+        return CassetteLLMClient(client, cassette, provider, GeminiResponse, model=client.model_name)
+    if provider == "opensearch":
+        return CassetteSearchClient(client, cassette)
+    raise ValueError(f"카세트를 지원하지 않는 공급자: {provider}")
+
+
+# =============================================================================
+# 클라이언트 프록시
+# =============================================================================
+
+
+class _CassetteProxy:
+    """녹화/재생 프록시 공통 (정의하지 않은 속성/메서드는 원본 클라이언트로 위임)"""
+
+    provider = ""
+
+    def __init__(self, wrapped: Any, cassette: Cassette):
+        self.wrapped = wrapped
+        self.cassette = cassette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+    def _call(self, method: str, request: dict, func: Callable[[], Any], **codec) -> Any:
+        return self.cassette.call(self.provider, method, request, func, **codec)
+
+    async def _acall(self, method: str, request: dict, func: Callable[[], Awaitable[Any]], **codec) -> Any:
+        return await self.cassette.acall(self.provider, method, request, func, **codec)
+
+
+class CassetteEmbeddingClient(_CassetteProxy):
+    """EmbeddingClient 녹화/재생 (embed_batch는 항목별 embed 키로 저장)"""
+
+    provider = "bedrock"
+
+    def _request(self, text: str) -> dict:
+        return {"model_id": self.wrapped.model_id, "dimensions": self.wrapped.dimensions, "text": text}
+
+    def embed(self, text: str) -> list[float]:
+        return self._call("embed", self._request(text), lambda: self.wrapped.embed(text))
+
+    async def aembed(self, text: str) -> list[float]:
+        return await self._acall("embed", self._request(text), lambda: self.wrapped.aembed(text))
+
+    def embed_batch(self, texts: list[str], max_workers: int | None = None, max_retries: int = 5):
+        """배치 임베딩 (재생 시 녹화되지 않은 항목은 errors에 기록, 대기 시간은 항목 중 최대)"""
+        workers = max(1, min(max_workers or getattr(self.wrapped, "max_workers", 1), len(texts) or 1))
+        if not self.cassette.replaying:
+            start = time.perf_counter()
+            result = self.wrapped.embed_batch(texts, max_workers=max_workers, max_retries=max_retries)
+            # 항목별 소요 시간은 알 수 없으므로 동시 요청 수 기준으로 근사
+            latency_ms = (time.perf_counter() - start) * 1000 * workers / max(1, len(texts))
+            for text, vector in zip(texts, result.embeddings, strict=True):
+                if vector is not None:
+                    self.cassette.put(self.provider, "embed", self._request(text), vector, latency_ms)
+            return result
+
+        from src.embedding_client import BatchEmbeddingResult
+
+        result = BatchEmbeddingResult(embeddings=[None] * len(texts))
+        latency_ms = 0.0
+        for i, text in enumerate(texts):
+            entry = self.cassette.get(self.provider, "embed", self._request(text))
+            if entry is None:
+                result.errors[i] = f"CassetteMissError: 카세트에 없는 요청: {self.provider}.embed"
+                continue
+            result.embeddings[i] = entry["response"]
+            latency_ms = max(latency_ms, entry["latency_ms"])
+        wait = self.cassette.delay(latency_ms)
+        if wait:
+            time.sleep(wait)
+        return result
+
+
+class CassetteLLMClient(_CassetteProxy):
+    """LLMClient / GeminiClient 녹화/재생 (call과 acall은 같은 키)
+
+    Args:
+        wrapped: 원본 클라이언트
+        cassette: 카세트
+        provider: "vertex" | "gemini"
+        response_type: 응답 dataclass (LLMResponse | GeminiResponse)
+        model: 요청 키에 포함할 모델명
+    """
+
+    def __init__(self, wrapped: Any, cassette: Cassette, provider: str, response_type: type, model: str):
+        super().__init__(wrapped, cassette)
+        self.provider = provider
+        self.response_type = response_type
+        self.model_name = model
+
+    def _request(self, func: Callable, args: tuple, kwargs: dict) -> dict:
+        return {"model": self.model_name, **_bind(func, args, kwargs)}
+
+    def _decode(self, data: dict) -> Any:
+        return self.response_type(**data)
+
+    def call(self, *args, **kwargs):
+        request = self._request(self.wrapped.call, args, kwargs)
+        return self._call(
+            "call", request, lambda: self.wrapped.call(*args, **kwargs), encode=asdict, decode=self._decode
+        )
+
+    async def acall(self, *args, **kwargs):
+        request = self._request(self.wrapped.acall, args, kwargs)
+        return await self._acall(
+            "call", request, lambda: self.wrapped.acall(*args, **kwargs), encode=asdict, decode=self._decode
+        )
+
+    def stream(self, *args, **kwargs) -> Iterator:
+        """스트리밍 호출 (텍스트 조각 + 마지막 응답을 녹화, 재생 시 대기 후 한꺼번에 yield)"""
+        request = self._request(self.wrapped.stream, args, kwargs)
+        if self.cassette.replaying:
+            entry = self.cassette.load(self.provider, "stream", request)
+            wait = self.cassette.delay(entry["latency_ms"])
+            if wait:
+                time.sleep(wait)
+            yield from entry["response"]["chunks"]
+            yield self._decode(entry["response"]["final"])
+            return
+
+        start = time.perf_counter()
+        chunks: list[str] = []
+        for event in self.wrapped.stream(*args, **kwargs):
+            if isinstance(event, self.response_type):
+                response = {"chunks": chunks, "final": asdict(event)}
+                self.cassette.put(self.provider, "stream", request, response, (time.perf_counter() - start) * 1000)
+            else:
+                chunks.append(event)
+            yield event
+
+
+class _CassetteRawSearch(_CassetteProxy):
+    """opensearch-py 클라이언트의 search() 녹화/재생 (NeighborChunkExpander용)"""
+
+    provider = "opensearch"
+
+    def search(self, **kwargs) -> dict:
+        return self._call("raw_search", kwargs, lambda: self.wrapped.search(**kwargs))
+
+
+class CassetteSearchClient(_CassetteProxy):
+    """OpenSearchClient 녹화/재생 (검색 계열 + 캐시 무효화/프로젝트 크기 조회)
+
+    search / search_with_pipeline / msearch 항목은 모두 (index, query, size, pipeline, include_vectors)
+    하나의 키로 저장됩니다. request_timeout은 키에 포함하지 않습니다.
+    색인/삭제 등 나머지 메서드는 원본 클라이언트로 그대로 위임됩니다 (재생 대상 아님).
+    """
+
+    provider = "opensearch"
+
+    def __init__(self, wrapped: Any, cassette: Cassette):
+        super().__init__(wrapped, cassette)
+        self.client = _CassetteRawSearch(wrapped.client, cassette)
+
+    @staticmethod
+    def _request(index: str, query: dict, size: int, pipeline: str | None, include_vectors: bool | None) -> dict:
+        return {"index": index, "query": query, "size": size, "pipeline": pipeline, "include_vectors": include_vectors}
+
+    def search(self, index, query, size=5, request_timeout=None, include_vectors=None) -> list[dict]:
+        return self._call(
+            "search",
+            self._request(index, query, size, None, include_vectors),
+            lambda: self.wrapped.search(index, query, size, request_timeout, include_vectors),
+        )
+
+    def search_with_pipeline(
+        self, index, query, size=5, pipeline="hybrid-rrf", request_timeout=None, include_vectors=None
+    ) -> list[dict]:
+        return self._call(
+            "search",
+            self._request(index, query, size, pipeline, include_vectors),
+            lambda: self.wrapped.search_with_pipeline(index, query, size, pipeline, request_timeout, include_vectors),
+        )
+
+    async def asearch(self, index, query, size=5, request_timeout=None, include_vectors=None) -> list[dict]:
+        return await self._acall(
+            "search",
+            self._request(index, query, size, None, include_vectors),
+            lambda: self.wrapped.asearch(index, query, size, request_timeout, include_vectors),
+        )
+
+    async def asearch_with_pipeline(
+        self, index, query, size=5, pipeline="hybrid-rrf", request_timeout=None, include_vectors=None
+    ) -> list[dict]:
+        return await self._acall(
+            "search",
+            self._request(index, query, size, pipeline, include_vectors),
+            lambda: self.wrapped.asearch_with_pipeline(index, query, size, pipeline, request_timeout, include_vectors),
+        )
+
+    def msearch(self, index, entries, request_timeout=None, include_vectors=None) -> list[list[dict]]:
+        return self.msearch_with_pipeline(
+            index, [(query, size, None) for query, size in entries], request_timeout, include_vectors
+        )
+
+    def msearch_with_pipeline(self, index, entries, request_timeout=None, include_vectors=None) -> list[list[dict]]:
+        """_msearch (항목별 저장, 재생 시 하나라도 없으면 CassetteMissError, 대기 시간은 항목 중 최대)"""
+        requests = [self._request(index, query, size, pipeline, include_vectors) for query, size, pipeline in entries]
+        if self.cassette.replaying:
+            hits, wait = self._replay_entries(requests)
+            if wait:
+                time.sleep(wait)
+            return hits
+
+        start = time.perf_counter()
+        results = self.wrapped.msearch_with_pipeline(index, entries, request_timeout, include_vectors)
+        self._record_entries(requests, results, (time.perf_counter() - start) * 1000)
+        return results
+
+    async def amsearch_with_pipeline(
+        self, index, entries, request_timeout=None, include_vectors=None
+    ) -> list[list[dict]]:
+        requests = [self._request(index, query, size, pipeline, include_vectors) for query, size, pipeline in entries]
+        if self.cassette.replaying:
+            hits, wait = self._replay_entries(requests)
+            if wait:
+                await asyncio.sleep(wait)
+            return hits
+
+        start = time.perf_counter()
+        results = await self.wrapped.amsearch_with_pipeline(index, entries, request_timeout, include_vectors)
+        self._record_entries(requests, results, (time.perf_counter() - start) * 1000)
+        return results
+
+    def _replay_entries(self, requests: list[dict]) -> tuple[list[list[dict]], float]:
+        entries = [self.cassette.load(self.provider, "search", request) for request in requests]
+        wait = self.cassette.delay(max((entry["latency_ms"] for entry in entries), default=0.0))
+        return [entry["response"] for entry in entries], wait
+
+    def _record_entries(self, requests: list[dict], results: list[list[dict]], latency_ms: float) -> None:
+        # 한 번의 왕복이므로 항목마다 전체 소요 시간 기록
+        for request, hits in zip(requests, results, strict=True):
+            self.cassette.put(self.provider, "search", request, hits, latency_ms)
+
+    def get_doc_count(self, index: str) -> int:
+        return self._call("get_doc_count", {"index": index}, lambda: self.wrapped.get_doc_count(index))
+
+    def get_doc_count_by_project(self, index: str, project_id: int) -> int:
+        return self._call(
+            "get_doc_count_by_project",
+            {"index": index, "project_id": project_id},
+            lambda: self.wrapped.get_doc_count_by_project(index, project_id),
+        )
+
+    def get_index_version(self, index: str) -> str:
+        return self._call("get_index_version", {"index": index}, lambda: self.wrapped.get_index_version(index))
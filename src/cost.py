@@ -20,6 +20,11 @@ Usage:
 # 환율 (USD → KRW)
 USD_TO_KRW = 1450
 
+# 프롬프트 캐시 가격 배율 (입력 토큰 가격 대비)
+# https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching#pricing
+CACHE_WRITE_MULTIPLIER = 1.25  # 5분 TTL 캐시 쓰기
+CACHE_READ_MULTIPLIER = 0.1  # 캐시 읽기
+
 # 모델별 가격 (USD per 1M tokens)
 # https://cloud.google.com/vertex-ai/generative-ai/pricing
 MODEL_PRICING: dict[str, dict[str, float]] = {
@@ -77,25 +82,33 @@ def calculate_cost(
     input_tokens: int,
     output_tokens: int,
     model: str = "default",
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> dict[str, float]:
     """토큰 사용량으로 비용 계산
 
     Args:
-        input_tokens: 입력 토큰 수
+        input_tokens: 입력 토큰 수 (캐시 제외)
         output_tokens: 출력 토큰 수
         model: 모델명
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_write_tokens: 프롬프트 캐시에 새로 쓴 입력 토큰 수
 
     Returns:
         dict: {
-            "input_usd": 입력 비용 (USD),
+            "input_usd": 입력 비용 (USD, 캐시 읽기/쓰기 포함),
             "output_usd": 출력 비용 (USD),
+            "cache_read_usd": 캐시 읽기 비용 (USD),
+            "cache_write_usd": 캐시 쓰기 비용 (USD),
             "total_usd": 총 비용 (USD),
             "total_krw": 총 비용 (KRW),
         }
     """
     pricing = get_pricing(model)
 
-    input_usd = (input_tokens / 1_000_000) * pricing["input"]
+    cache_read_usd = (cache_read_tokens / 1_000_000) * pricing["input"] * CACHE_READ_MULTIPLIER
+    cache_write_usd = (cache_write_tokens / 1_000_000) * pricing["input"] * CACHE_WRITE_MULTIPLIER
+    input_usd = (input_tokens / 1_000_000) * pricing["input"] + cache_read_usd + cache_write_usd
     output_usd = (output_tokens / 1_000_000) * pricing["output"]
     total_usd = input_usd + output_usd
     total_krw = total_usd * USD_TO_KRW
@@ -103,6 +116,8 @@ def calculate_cost(
     return {
         "input_usd": input_usd,
         "output_usd": output_usd,
+        "cache_read_usd": cache_read_usd,
+        "cache_write_usd": cache_write_usd,
         "total_usd": total_usd,
         "total_krw": total_krw,
     }
@@ -119,8 +134,11 @@ def format_cost(cost: dict[str, float], include_breakdown: bool = False) -> str:
         str: "$0.0120 (₩17)" 또는 "in: $0.01, out: $0.01, total: $0.02 (₩29)"
     """
     if include_breakdown:
+        cache = ""
+        if cost.get("cache_read_usd") or cost.get("cache_write_usd"):
+            cache = f" (cache read: ${cost['cache_read_usd']:.4f}, write: ${cost['cache_write_usd']:.4f})"
         return (
-            f"in: ${cost['input_usd']:.4f}, "
+            f"in: ${cost['input_usd']:.4f}{cache}, "
             f"out: ${cost['output_usd']:.4f}, "
             f"total: ${cost['total_usd']:.4f} (₩{cost['total_krw']:.0f})"
         )
@@ -131,7 +149,7 @@ def calculate_total_cost(results: list[dict], model: str = "default") -> dict[st
     """여러 결과의 총 비용 계산
 
     Args:
-        results: [{"input_tokens": int, "output_tokens": int}, ...]
+        results: [{"input_tokens": int, "output_tokens": int, "cache_read_tokens": int, "cache_write_tokens": int}, ...]
         model: 모델명
 
     Returns:
@@ -139,4 +157,6 @@ def calculate_total_cost(results: list[dict], model: str = "default") -> dict[st
     """
     total_input = sum(r.get("input_tokens", 0) for r in results)
     total_output = sum(r.get("output_tokens", 0) for r in results)
-    return calculate_cost(total_input, total_output, model)
+    total_cache_read = sum(r.get("cache_read_tokens", 0) for r in results)
+    total_cache_write = sum(r.get("cache_write_tokens", 0) for r in results)
+    return calculate_cost(total_input, total_output, model, total_cache_read, total_cache_write)
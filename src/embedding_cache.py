@@ -0,0 +1,312 @@
+"""임베딩 캐시
+
+EmbeddingClient 앞단에 두는 2단 캐시입니다.
+같은 텍스트를 다시 임베딩할 때 Bedrock 호출(100~300ms)을 건너뜁니다.
+
+- 1단: 메모리 LRU (프로세스 내)
+- 2단: SQLite 디스크 캐시 (선택, 프로세스 재시작 후에도 유지)
+
+캐시 키: model_id + dimensions + 정규화된 텍스트 (NFC, 공백 정리)
+
+Usage:
+    from src.embedding_cache import CachedEmbeddingClient
+    from src.embedding_client import EmbeddingClient
+
+    client = CachedEmbeddingClient(EmbeddingClient(), db_path="data/cache/embeddings.sqlite")
+    vector = client.embed("연차 휴가는 며칠인가요?")
+    print(client.stats())  # {"memory_hits": 0, "disk_hits": 0, "misses": 1, ...}
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from src.embedding_client import BatchEmbeddingResult, EmbeddingClient
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC + 공백 정리)"""
+    text = unicodedata.normalize("NFC", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class EmbeddingCache:
+    """메모리 LRU + SQLite 디스크 2단 캐시
+
+    메모리 조회는 _lock, SQLite 조회/쓰기는 _db_lock으로 나눠 디스크 I/O 중에도 메모리 히트가 막히지 않습니다.
+    디스크 항목 수는 삽입/삭제 시 직접 세고(COUNT(*) 없음), 디스크 히트의 accessed_at 갱신은
+    모아 두었다가 다음 쓰기 트랜잭션(또는 access_flush_size개가 모였을 때)에 함께 반영합니다.
+
+    Args:
+        max_memory_entries: 메모리 LRU 최대 항목 수
+        db_path: SQLite 파일 경로 (None이면 디스크 캐시 사용 안 함)
+        max_disk_entries: 디스크 캐시 최대 항목 수 (초과 시 오래 안 쓴 항목부터 삭제)
+        access_flush_size: 모아 둔 accessed_at 갱신이 이만큼 쌓이면 바로 반영
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 10_000,
+        db_path: str | Path | None = None,
+        max_disk_entries: int = 200_000,
+        access_flush_size: int = 256,
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.access_flush_size = access_flush_size
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._disk_count = 0
+        self._pending_access: dict[str, float] = {}
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_accessed_at ON embeddings (accessed_at)")
+            self._db.commit()
+            self._disk_count = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def has_disk(self) -> bool:
+        """SQLite 디스크 캐시 사용 여부"""
+        return self._db is not None
+
+    @staticmethod
+    def make_key(model_id: str, dimensions: int, text: str) -> str:
+        """캐시 키 생성"""
+        raw = f"{model_id}\x00{dimensions}\x00{normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        """캐시 조회 (메모리 → 디스크 순)"""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._pending_access[key] = time.time()
+                    if len(self._pending_access) >= self.access_flush_size:
+                        self._flush_access()
+                        self._db.commit()
+            if row is not None:
+                vector = array("f", row[0]).tolist()
+                with self._lock:
+                    self._put_memory(key, vector)
+                    self.disk_hits += 1
+                return vector
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, vector: list[float]) -> None:
+        """캐시 저장 (메모리 + 디스크)"""
+        self.put_many([(key, vector)])
+
+    def put_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """여러 항목 저장 (디스크는 트랜잭션 한 번)"""
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items:
+                self._put_memory(key, vector)
+
+        if self._db is None:
+            return
+        now = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in items]
+        with self._db_lock:
+            # 키가 같으면 벡터도 같으므로 기존 항목은 그대로 두고 새 항목 수만 셈
+            inserted = self._db.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, accessed_at) VALUES (?, ?, ?)", rows
+            ).rowcount
+            self._disk_count += max(0, inserted)
+            self._flush_access()
+            self._evict_disk()
+            self._db.commit()
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+                self._disk_count = 0
+                self._pending_access.clear()
+
+    def stats(self) -> dict:
+        """캐시 히트/미스 통계"""
+        with self._lock:
+            memory_hits, disk_hits, misses = self.memory_hits, self.disk_hits, self.misses
+            memory_entries = len(self._memory)
+        lookups = memory_hits + disk_hits + misses
+        return {
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_rate": round((memory_hits + disk_hits) / lookups, 4) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "disk_entries": self._disk_count,
+        }
+
+    def close(self) -> None:
+        """모아 둔 accessed_at 반영 후 SQLite 연결 종료"""
+        if self._db is not None:
+            with self._db_lock:
+                self._flush_access()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def _put_memory(self, key: str, vector: list[float]) -> None:
+        """메모리 LRU 저장 (_lock 보유 상태에서 호출)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_access(self) -> None:
+        """모아 둔 디스크 히트 accessed_at 갱신 (_db_lock 보유 상태, 커밋은 호출자가)"""
+        assert self._db is not None
+        if self._pending_access:
+            self._db.executemany(
+                "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+
+    def _evict_disk(self) -> None:
+        """디스크 용량 초과 시 오래 안 쓴 항목 삭제 (_db_lock 보유 상태에서 호출)"""
+        assert self._db is not None
+        overflow = self._disk_count - self.max_disk_entries
+        if overflow > 0:
+            deleted = self._db.execute(
+                "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            ).rowcount
+            self._disk_count -= deleted
+
+
+class CachedEmbeddingClient:
+    """캐시가 적용된 EmbeddingClient
+
+    EmbeddingClient와 동일한 인터페이스(embed, aembed, embed_batch)를 제공합니다.
+    캐시 히트 시 Bedrock 호출을 생략합니다.
+
+    Args:
+        client: 원본 EmbeddingClient
+        cache: 공유할 EmbeddingCache (None이면 새로 생성)
+        db_path: 디스크 캐시 경로 (cache를 직접 넘기지 않을 때만 사용)
+        max_memory_entries: 메모리 LRU 최대 항목 수
+    """
+
+    def __init__(
+        self,
+        client: EmbeddingClient,
+        cache: EmbeddingCache | None = None,
+        db_path: str | Path | None = None,
+        max_memory_entries: int = 10_000,
+    ):
+        self.client = client
+        self.cache = cache or EmbeddingCache(max_memory_entries=max_memory_entries, db_path=db_path)
+
+    @classmethod
+    def from_env(cls, client: EmbeddingClient) -> "CachedEmbeddingClient":
+        """EMBEDDING_CACHE_PATH 환경변수가 있으면 디스크 캐시까지 사용"""
+        return cls(client, db_path=os.getenv("EMBEDDING_CACHE_PATH") or None)
+
+    @property
+    def model_id(self) -> str:
+        return self.client.model_id
+
+    @property
+    def dimensions(self) -> int:
+        return getattr(self.client, "dimensions", 1024)
+
+    def embed(self, text: str) -> list[float]:
+        """단일 텍스트 임베딩 (캐시 우선)"""
+        key = self._key(text)
+        vector = self.cache.get(key)
+        if vector is not None:
+            return vector
+
+        vector = self.client.embed(text)
+        self.cache.put(key, vector)
+        return vector
+
+    async def aembed(self, text: str) -> list[float]:
+        """단일 텍스트 임베딩 (비동기, 캐시 우선)
+
+        디스크 캐시가 있으면 SQLite 조회/쓰기(_db_lock 대기 포함)가 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        key = self._key(text)
+        vector = await self._run_cache(self.cache.get, key)
+        if vector is not None:
+            return vector
+
+        vector = await self.client.aembed(text)
+        await self._run_cache(self.cache.put, key, vector)
+        return vector
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 세션 종료"""
+        await self.client.aclose()
+
+    def embed_batch(self, texts: list[str], **kwargs) -> BatchEmbeddingResult:
+        """배치 임베딩 (캐시 미스 항목만 Bedrock 호출)"""
+        keys = [self._key(text) for text in texts]
+        result = BatchEmbeddingResult(embeddings=[self.cache.get(key) for key in keys])
+
+        missing = [i for i, vector in enumerate(result.embeddings) if vector is None]
+        if not missing:
+            return result
+
+        fetched = self.client.embed_batch([texts[i] for i in missing], **kwargs)
+        new_items = []
+        for pos, i in enumerate(missing):
+            vector = fetched.embeddings[pos]
+            if vector is None:
+                result.errors[i] = fetched.errors.get(pos, "unknown error")
+                continue
+            result.embeddings[i] = vector
+            new_items.append((keys[i], vector))
+        self.cache.put_many(new_items)
+
+        return result
+
+    def stats(self) -> dict:
+        """캐시 히트/미스 통계"""
+        return self.cache.stats()
+
+    async def _run_cache(self, func, *args):
+        if self.cache.has_disk:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    def _key(self, text: str) -> str:
+        return EmbeddingCache.make_key(self.model_id, self.dimensions, text)
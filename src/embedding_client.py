@@ -1,13 +1,58 @@
 """AWS Bedrock Titan 임베딩 클라이언트"""
 
+import asyncio
 import json
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from urllib.parse import quote
 
+import aiohttp
 import boto3
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
+from yarl import URL
+
+from src.rate_limit import RateLimiter, aacquire_provider, acquire_provider
 
 load_dotenv()
 
+# Bedrock 스로틀링 에러 코드 (재시도 대상)
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+}
+
+
+@dataclass
+class BatchEmbeddingResult:
+    """배치 임베딩 결과
+
+    Attributes:
+        embeddings: 입력 순서와 동일한 임베딩 리스트 (실패한 항목은 None)
+        errors: 실패한 항목 {입력 인덱스: 에러 메시지}
+    """
+
+    embeddings: list[list[float] | None] = field(default_factory=list)
+    errors: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """모든 항목 성공 여부"""
+        return not self.errors
+
+    @property
+    def failed_count(self) -> int:
+        """실패한 항목 개수"""
+        return len(self.errors)
+
 
 class EmbeddingClient:
     """Bedrock Titan Embeddings V2 클라이언트"""
@@ -16,29 +61,163 @@ class EmbeddingClient:
         self,
         model_id: str = "amazon.titan-embed-text-v2:0",
         region: str | None = None,
+        dimensions: int = 1024,
+        max_workers: int = 8,
+        rate_per_sec: float = 20.0,
     ):
+        """
+        Args:
+            model_id: Bedrock 모델 ID
+            region: AWS 리전
+            dimensions: 임베딩 차원 (Titan V2: 256 | 512 | 1024)
+            max_workers: embed_batch 동시 요청 수
+            rate_per_sec: embed_batch 초당 최대 요청 수 (Bedrock 쿼터에 맞춰 조정)
+        """
         self.model_id = model_id
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
+        self.dimensions = dimensions
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_per_sec=rate_per_sec)
 
-        self.client = boto3.client(
-            "bedrock-runtime",
+        self.session = boto3.Session(
             region_name=self.region,
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
         )
+        self.client = self.session.client(
+            "bedrock-runtime",
+            # 워커 수만큼 커넥션 풀 확보 (기본 10개)
+            config=Config(max_pool_connections=max(10, max_workers)),
+        )
+
+        # 비동기 HTTP 세션 (aembed 첫 호출 시 생성, 이벤트 루프별 1개)
+        self._async_session: aiohttp.ClientSession | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
 
     def embed(self, text: str) -> list[float]:
         """단일 텍스트 임베딩"""
+        acquire_provider("bedrock")
         response = self.client.invoke_model(
             modelId=self.model_id,
             contentType="application/json",
             accept="application/json",
-            body=json.dumps({"inputText": text}),
+            body=json.dumps({"inputText": text, "dimensions": self.dimensions}),
         )
 
         result = json.loads(response["body"].read())
         return result["embedding"]
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """배치 임베딩 (순차 처리)"""
-        return [self.embed(text) for text in texts]
+    async def aembed(self, text: str) -> list[float]:
+        """단일 텍스트 임베딩 (비동기)
+
+        boto3는 블로킹이므로 SigV4로 직접 서명한 요청을 aiohttp 커넥션 풀로 보냅니다.
+        스로틀링 등 오류는 embed()와 동일하게 ClientError로 변환됩니다.
+        (오류 코드 헤더 없는 게이트웨이 5xx는 재시도 대상인 ServiceUnavailableException)
+        """
+        url = f"https://bedrock-runtime.{self.region}.amazonaws.com/model/{quote(self.model_id, safe='')}/invoke"
+        body = json.dumps({"inputText": text, "dimensions": self.dimensions})
+
+        request = AWSRequest(
+            method="POST",
+            url=url,
+            data=body,
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        credentials = self.session.get_credentials()
+        SigV4Auth(credentials.get_frozen_credentials(), "bedrock", self.region).add_auth(request)
+
+        await aacquire_provider("bedrock")
+        session = self._get_async_session()
+        async with session.post(URL(url, encoded=True), data=body, headers=dict(request.headers.items())) as resp:
+            if resp.status >= 400:
+                # 게이트웨이 오류(502/503/504)는 본문이 JSON이 아닐 수 있으므로 텍스트로 읽음
+                text = await resp.text()
+                code = resp.headers.get("x-amzn-ErrorType", "").split(":")[0]
+                if resp.status == 429:
+                    code = "ThrottlingException"
+                elif not code:
+                    code = "ServiceUnavailableException" if resp.status in (502, 503, 504) else f"HTTP{resp.status}"
+                try:
+                    payload = json.loads(text)
+                    message = payload.get("message", text) if isinstance(payload, dict) else text
+                except ValueError:
+                    message = text[:500]
+                raise ClientError({"Error": {"Code": code, "Message": message}}, "InvokeModel")
+            payload = await resp.json(content_type=None)
+
+        return payload["embedding"]
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 세션 종료"""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_loop = None
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프용 aiohttp 세션 (keep-alive 커넥션 풀)"""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_loop is not loop or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=max(10, self.max_workers) * 4),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._async_loop = loop
+        return self._async_session
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        max_workers: int | None = None,
+        max_retries: int = 5,
+    ) -> BatchEmbeddingResult:
+        """배치 임베딩 (병렬 처리 + 속도 제한)
+
+        워커 풀로 동시에 요청하되, 공유 RateLimiter로 초당 요청 수를 제한합니다.
+        스로틀링 응답을 받으면 속도를 낮추고 지수 백오프 후 재시도합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            max_workers: 동시 요청 수 (기본값: 생성자 설정)
+            max_retries: 스로틀링 시 항목별 최대 재시도 횟수
+
+        Returns:
+            BatchEmbeddingResult: 입력 순서 유지, 실패 항목은 errors에 기록
+        """
+        result = BatchEmbeddingResult(embeddings=[None] * len(texts))
+        if not texts:
+            return result
+
+        workers = min(max_workers or self.max_workers, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._embed_with_retry, text, max_retries): i for i, text in enumerate(texts)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result.embeddings[i] = future.result()
+                except Exception as e:
+                    result.errors[i] = f"{type(e).__name__}: {e}"
+
+        return result
+
+    def _embed_with_retry(self, text: str, max_retries: int) -> list[float]:
+        """속도 제한 + 스로틀링 백오프가 적용된 단일 임베딩"""
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                embedding = self.embed(text)
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code", "")
+                if code not in THROTTLING_ERROR_CODES or attempt == max_retries:
+                    raise
+                self.rate_limiter.throttle()
+                # 지수 백오프 + 지터 (최대 20초)
+                time.sleep(min(20.0, 0.5 * 2**attempt) * random.uniform(0.5, 1.0))
+                continue
+
+            self.rate_limiter.recover()
+            return embedding
+
+        raise RuntimeError("unreachable")
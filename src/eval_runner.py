@@ -0,0 +1,148 @@
+"""평가 러너 (JSONL 체크포인트 + 재개)
+
+질문셋을 query_batch로 동시에 실행하면서, 질문별 결과가 나오는 즉시 JSONL 체크포인트에
+한 줄씩 추가합니다. 중단된 실행은 resume=True로 다시 시작하면 성공 기록이 있는
+질문 ID를 건너뜁니다 (실패 기록은 다시 실행).
+
+Usage:
+    from src.eval_runner import JSONLCheckpoint, configure_rate_limits, run_checkpointed
+
+    configure_rate_limits(["vertex=2", "tavily=1"])
+    records = run_checkpointed(
+        questions,
+        lambda texts, on_result: service.query_batch(texts, concurrency=8, on_result=on_result),
+        to_record,  # (질문 dict, 결과 | 예외) → 기록 dict (id 포함)
+        checkpoint=JSONLCheckpoint("data/results/checkpoints/basic.jsonl"),
+        resume=True,
+    )
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.rate_limit import PROVIDERS, set_provider_limit
+
+# query_batch(질문 리스트, on_result) 형태의 실행 함수
+BatchRunner = Callable[[list[str], Callable[[int, Any], None]], Any]
+
+
+class JSONLCheckpoint:
+    """질문별 결과 JSONL 체크포인트 (한 줄 = 질문 하나의 기록, thread-safe 추가)
+
+    Args:
+        path: 체크포인트 파일 경로
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[int, dict]:
+        """기록 읽기 → {질문 ID: 마지막 기록}
+
+        중단으로 잘린 마지막 줄은 파일에서 잘라내고 무시합니다.
+        """
+        if not self.path.exists():
+            return {}
+        self._truncate_partial_line()
+        records: dict[int, dict] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record["id"]] = record
+        return records
+
+    def completed(self) -> dict[int, dict]:
+        """성공한 기록만 (error 키가 있는 기록은 재실행 대상)"""
+        return {question_id: record for question_id, record in self.load().items() if not record.get("error")}
+
+    def append(self, record: dict) -> None:
+        """기록 한 줄 추가 (바로 디스크에 반영)"""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self) -> None:
+        """체크포인트 삭제 (새 실행)"""
+        self.path.unlink(missing_ok=True)
+
+    def _truncate_partial_line(self) -> None:
+        with self._lock, open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+
+def run_checkpointed(
+    questions: list[dict],
+    run_batch: BatchRunner,
+    to_record: Callable[[dict, Any], dict],
+    checkpoint: JSONLCheckpoint | None = None,
+    resume: bool = False,
+    on_record: Callable[[dict], None] | None = None,
+) -> list[dict]:
+    """질문셋 실행 (체크포인트 기록 + 재개)
+
+    Args:
+        questions: 질문 dict 리스트 ({"id", "question", ...})
+        run_batch: (질문 텍스트 리스트, on_result) → 실행. 질문별 결과(또는 예외)가 나올 때마다
+            on_result(질문 번호, 결과)를 호출해야 함 (RAGPipeline/RAGServiceBase.query_batch)
+        to_record: (질문 dict, 결과 | 예외) → 저장할 기록 dict ("id" 포함, 실패 시 "error" 포함)
+        checkpoint: JSONL 체크포인트 (None이면 기록 안 함)
+        resume: True면 체크포인트의 성공 기록을 재사용하고 나머지만 실행, False면 체크포인트 초기화
+        on_record: 새 기록마다 호출 (진행률 표시 등)
+
+    Returns:
+        questions 순서의 기록 리스트 (재사용한 기록 포함)
+    """
+    done: dict[int, dict] = {}
+    if checkpoint is not None:
+        if resume:
+            done = checkpoint.completed()
+        else:
+            checkpoint.reset()
+
+    records = {q["id"]: done[q["id"]] for q in questions if q["id"] in done}
+    pending = [q for q in questions if q["id"] not in records]
+
+    def on_result(i: int, result: Any) -> None:
+        record = to_record(pending[i], result)
+        if checkpoint is not None:
+            checkpoint.append(record)
+        records[pending[i]["id"]] = record
+        if on_record is not None:
+            on_record(record)
+
+    if pending:
+        run_batch([q["question"] for q in pending], on_result)
+    return [records[q["id"]] for q in questions if q["id"] in records]
+
+
+def configure_rate_limits(specs: list[str] | None) -> dict[str, float]:
+    """공급자별 속도 제한 설정 ("공급자=초당 요청 수" 목록, 예: ["vertex=2", "tavily=1"])
+
+    Returns:
+        적용한 {공급자: 초당 요청 수}
+
+    Raises:
+        ValueError: 형식이 틀리거나 알 수 없는 공급자
+    """
+    limits: dict[str, float] = {}
+    for spec in specs or []:
+        provider, sep, rate = spec.partition("=")
+        provider = provider.strip()
+        if not sep or provider not in PROVIDERS:
+            raise ValueError(f"속도 제한 형식: 공급자=초당 요청 수 (공급자: {', '.join(PROVIDERS)}), 입력: {spec!r}")
+        limits[provider] = float(rate)
+    for provider, rate in limits.items():
+        set_provider_limit(provider, rate)
+    return limits
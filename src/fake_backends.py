@@ -0,0 +1,574 @@
+"""부하 테스트용 가짜 백엔드
+
+EmbeddingClient / LLMClient / OpenSearchClient / RerankerFilter와 같은 인터페이스를 가진
+합성 백엔드입니다. 네트워크 없이 지연 분포(로그정규 + 롱테일 스파이크), 오류/스로틀링 비율,
+토큰 수를 재현하므로, 동시 요청 100개 이상에서 파이프라인/Agent 오케스트레이션 중
+우리 코드가 병목이 되는 지점을 찾을 수 있습니다.
+
+- 지연: LatencyModel (중앙값 × exp(N(0, sigma)), spike_rate 확률로 spike_multiplier배)
+- 실패: FaultModel (error_rate → FakeBackendError, throttle_rate → FakeThrottlingError)
+  스로틀링 응답은 샘플 지연의 10%만 기다린 뒤 실패합니다 (실제 429처럼 빠르게 거절)
+- 동기 메서드는 time.sleep, 비동기 메서드는 asyncio.sleep으로 대기 (실제 I/O처럼 GIL을 놓음)
+- 같은 seed면 같은 지연/실패 순서 (동시 실행 시 호출 순서는 스케줄링에 따라 달라짐)
+
+Usage:
+    from src.fake_backends import FakeEmbeddingClient, FakeLLMClient, FakeSearchClient, LatencyModel
+
+    pipeline = RAGPipeline(
+        search_client=FakeSearchClient(),
+        embedding_client=FakeEmbeddingClient(),
+        llm_client=FakeLLMClient(latency=LatencyModel(median_ms=800, spike_rate=0.01)),
+        ...
+    )
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from src.embedding_client import BatchEmbeddingResult
+from src.llm_client import LLMResponse
+from src.rag.modules.result_filter import RerankerFilter
+
+
+class FakeBackendError(RuntimeError):
+    """가짜 백엔드 오류 (error_rate)"""
+
+
+class FakeThrottlingError(FakeBackendError):
+    """가짜 백엔드 스로틀링 (throttle_rate)"""
+
+
+@dataclass
+class LatencyModel:
+    """지연 분포 (로그정규 + 롱테일 스파이크)
+
+    Attributes:
+        median_ms: 중앙값 (밀리초)
+        sigma: 로그정규 shape (0이면 고정 지연, 0.5면 p99 ≈ 중앙값 × 3.2)
+        spike_rate: 스파이크 확률 (GC/콜드 스타트/재전송 등 롱테일)
+        spike_multiplier: 스파이크 시 지연 배율
+    """
+
+    median_ms: float = 100.0
+    sigma: float = 0.4
+    spike_rate: float = 0.0
+    spike_multiplier: float = 10.0
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """지연 한 번 샘플링 (밀리초)"""
+        ms = self.median_ms * math.exp(rng.gauss(0.0, self.sigma)) if self.sigma > 0 else self.median_ms
+        if self.spike_rate > 0 and rng.random() < self.spike_rate:
+            ms *= self.spike_multiplier
+        return ms
+
+
+@dataclass
+class FaultModel:
+    """실패 비율
+
+    Attributes:
+        error_rate: 오류 확률 (FakeBackendError)
+        throttle_rate: 스로틀링 확률 (FakeThrottlingError)
+    """
+
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+
+    def sample(self, rng: random.Random) -> str | None:
+        """ "throttle" | "error" | None"""
+        draw = rng.random()
+        if draw < self.throttle_rate:
+            return "throttle"
+        if draw < self.throttle_rate + self.error_rate:
+            return "error"
+        return None
+
+
+@dataclass
+class BackendStats:
+    """가짜 백엔드 호출 통계
+
+    Attributes:
+        calls: 요청 수 (재시도 포함)
+        errors: 오류로 실패한 요청 수
+        throttles: 스로틀링으로 실패한 요청 수
+        in_flight: 현재 진행 중인 요청 수
+        peak_in_flight: 최대 동시 요청 수
+        latencies_ms: 요청별 샘플 지연
+    """
+
+    calls: int = 0
+    errors: int = 0
+    throttles: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "throttles": self.throttles,
+            "peak_in_flight": self.peak_in_flight,
+            "mean_ms": round(sum(self.latencies_ms) / len(self.latencies_ms), 1) if self.latencies_ms else 0.0,
+        }
+
+
+class FakeBackend:
+    """지연/실패 주입 공통 (thread-safe)
+
+    Args:
+        latency: 요청 지연 분포
+        faults: 실패 비율 (None이면 실패 없음)
+        seed: 난수 시드
+    """
+
+    name = "backend"
+
+    def __init__(self, latency: LatencyModel, faults: FaultModel | None, seed: int | None):
+        self.latency = latency
+        self.faults = faults or FaultModel()
+        self.stats = BackendStats()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self, extra_ms: float = 0.0) -> tuple[float, str | None]:
+        """(대기 초, 실패 종류) 샘플링 + 요청 시작 집계"""
+        with self._lock:
+            ms = self.latency.sample_ms(self._rng) + extra_ms
+            fault = self.faults.sample(self._rng)
+            stats = self.stats
+            stats.calls += 1
+            stats.latencies_ms.append(ms)
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            if fault == "throttle":
+                stats.throttles += 1
+                ms *= 0.1
+            elif fault == "error":
+                stats.errors += 1
+        return ms / 1000, fault
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.stats.in_flight -= 1
+
+    def _raise(self, fault: str | None) -> None:
+        if fault == "throttle":
+            raise FakeThrottlingError(f"{self.name}: 요청이 너무 많습니다 (가짜 스로틀링)")
+        if fault == "error":
+            raise FakeBackendError(f"{self.name}: 가짜 오류")
+
+    def _request(self, extra_ms: float = 0.0) -> None:
+        """요청 1회 (지연 대기 후 실패 주입)"""
+        delay, fault = self._draw(extra_ms)
+        try:
+            time.sleep(delay)
+        finally:
+            self._leave()
+        self._raise(fault)
+
+    async def _arequest(self, extra_ms: float = 0.0) -> None:
+        delay, fault = self._draw(extra_ms)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._leave()
+        self._raise(fault)
+
+    def _random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+
+def _seed_for(text: str) -> int:
+    return int.from_bytes(hashlib.md5(text.encode("utf-8")).digest()[:8], "big")
+
+
+# =============================================================================
+# 임베딩
+# =============================================================================
+
+
+class FakeEmbeddingClient(FakeBackend):
+    """EmbeddingClient 대체 (텍스트별로 결정적인 단위 벡터)
+
+    Args:
+        latency: 요청 지연 분포 (기본: Bedrock Titan 단건 ~120ms)
+        faults: 실패 비율
+        seed: 난수 시드
+        dimensions: 임베딩 차원
+        max_workers: embed_batch 동시 요청 수
+    """
+
+    name = "bedrock"
+
+    def __init__(
+        self,
+        latency: LatencyModel | None = None,
+        faults: FaultModel | None = None,
+        seed: int | None = 0,
+        dimensions: int = 1024,
+        max_workers: int = 8,
+    ):
+        super().__init__(latency or LatencyModel(median_ms=120.0, sigma=0.3), faults, seed)
+        self.model_id = "fake-embedding"
+        self.dimensions = dimensions
+        self.max_workers = max_workers
+
+    def vector(self, text: str) -> list[float]:
+        """텍스트 → 결정적 단위 벡터 (같은 텍스트면 같은 벡터)
+
+        부하 측정에 가짜 백엔드 CPU가 섞이지 않도록 gauss 대신 바이트 난수로 만듭니다.
+        """
+        values = [b - 127.5 for b in random.Random(_seed_for(text)).randbytes(self.dimensions)]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    def embed(self, text: str) -> list[float]:
+        self._request()
+        return self.vector(text)
+
+    async def aembed(self, text: str) -> list[float]:
+        await self._arequest()
+        return self.vector(text)
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        max_workers: int | None = None,
+        max_retries: int = 5,
+    ) -> BatchEmbeddingResult:
+        """배치 임베딩 (EmbeddingClient처럼 워커 풀 + 스로틀링 시 지수 백오프 재시도)"""
+        result = BatchEmbeddingResult(embeddings=[None] * len(texts))
+        if not texts:
+            return result
+
+        workers = min(max_workers or self.max_workers, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._embed_with_retry, text, max_retries): i for i, text in enumerate(texts)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result.embeddings[i] = future.result()
+                except Exception as e:
+                    result.errors[i] = f"{type(e).__name__}: {e}"
+        return result
+
+    def _embed_with_retry(self, text: str, max_retries: int) -> list[float]:
+        for attempt in range(max_retries + 1):
+            try:
+                return self.embed(text)
+            except FakeThrottlingError:
+                if attempt == max_retries:
+                    raise
+                time.sleep(min(2.0, 0.05 * 2**attempt) * (0.5 + self._random()))
+        raise AssertionError("unreachable")
+
+
+# =============================================================================
+# LLM
+# =============================================================================
+
+
+class FakeLLMClient(FakeBackend):
+    """LLMClient 대체 (첫 토큰 지연 + 출력 토큰당 지연)
+
+    전체 지연 = latency 샘플(첫 토큰까지) + output_tokens × ms_per_output_token
+
+    Args:
+        latency: 첫 토큰까지 지연 분포 (기본: ~600ms)
+        faults: 실패 비율
+        seed: 난수 시드
+        output_tokens: 출력 토큰 수 중앙값 (max_tokens로 상한)
+        output_tokens_sigma: 출력 토큰 수 로그정규 shape
+        ms_per_output_token: 출력 토큰당 지연 (밀리초)
+        chars_per_token: 입력 토큰 추정용 문자/토큰 비율
+        model: 응답 모델명
+    """
+
+    name = "vertex"
+
+    def __init__(
+        self,
+        latency: LatencyModel | None = None,
+        faults: FaultModel | None = None,
+        seed: int | None = 0,
+        output_tokens: int = 200,
+        output_tokens_sigma: float = 0.3,
+        ms_per_output_token: float = 15.0,
+        chars_per_token: float = 2.5,
+        model: str = "fake-llm",
+    ):
+        super().__init__(latency or LatencyModel(median_ms=600.0, sigma=0.5), faults, seed)
+        self.output_tokens = output_tokens
+        self.output_tokens_sigma = output_tokens_sigma
+        self.ms_per_output_token = ms_per_output_token
+        self.chars_per_token = chars_per_token
+        self.model = model
+
+    def _tokens(self, prompt: str, system: str | None, max_tokens: int) -> tuple[int, int]:
+        """(입력 토큰 추정, 출력 토큰 샘플)"""
+        input_tokens = max(1, round((len(prompt) + len(system or "")) / self.chars_per_token))
+        with self._lock:
+            sampled = self.output_tokens * math.exp(self._rng.gauss(0.0, self.output_tokens_sigma))
+        return input_tokens, max(1, min(max_tokens, round(sampled)))
+
+    def _response(self, prompt: str, input_tokens: int, output_tokens: int) -> LLMResponse:
+        content = f"가짜 답변입니다 [1]. 질문 길이 {len(prompt)}자. " + "내용 " * max(0, output_tokens - 8)
+        return LLMResponse(
+            content=content.strip(),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=self.model,
+        )
+
+    def call(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        cache_prefix: str | None = None,
+    ) -> LLMResponse:
+        input_tokens, output_tokens = self._tokens(prompt, system, max_tokens)
+        self._request(output_tokens * self.ms_per_output_token)
+        return self._response(prompt, input_tokens, output_tokens)
+
+    async def acall(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        cache_prefix: str | None = None,
+    ) -> LLMResponse:
+        input_tokens, output_tokens = self._tokens(prompt, system, max_tokens)
+        await self._arequest(output_tokens * self.ms_per_output_token)
+        return self._response(prompt, input_tokens, output_tokens)
+
+    def stream(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        cache_prefix: str | None = None,
+    ):
+        """첫 토큰 지연 후 토큰 간격마다 조각을 yield, 마지막에 LLMResponse"""
+        input_tokens, output_tokens = self._tokens(prompt, system, max_tokens)
+        self._request()
+        response = self._response(prompt, input_tokens, output_tokens)
+        words = response.content.split(" ")
+        step = output_tokens / max(1, len(words))
+        for i, word in enumerate(words):
+            time.sleep(step * self.ms_per_output_token / 1000)
+            yield word if i == 0 else f" {word}"
+        yield response
+
+    async def aclose(self) -> None:
+        return None
+
+
+# =============================================================================
+# 검색
+# =============================================================================
+
+
+class _FakeRawSearch:
+    """opensearch-py 클라이언트 대체 (NeighborChunkExpander의 search(index=, body=) 호출용)"""
+
+    def __init__(self, backend: "FakeSearchClient"):
+        self.backend = backend
+
+    def search(self, index: str, body: dict, **kwargs) -> dict:
+        self.backend._request()
+        return {"hits": {"hits": self.backend.hits(body.get("size", 10))}}
+
+
+class FakeSearchClient(FakeBackend):
+    """OpenSearchClient 대체 (합성 코퍼스에서 무작위 hit 반환)
+
+    msearch는 왕복 1회 지연 + 항목당 msearch_entry_ms를 더합니다.
+
+    Args:
+        latency: 요청 지연 분포 (기본: ~40ms)
+        faults: 실패 비율
+        seed: 난수 시드
+        corpus_size: 합성 청크 수
+        chunk_chars: 청크 텍스트 길이 (컨텍스트/프롬프트 구성 비용에 영향)
+        msearch_entry_ms: _msearch 항목당 추가 지연
+        project_doc_count: get_doc_count_by_project 반환값 (작으면 쿼리 빌더가 정확 검색으로 전환)
+    """
+
+    name = "opensearch"
+
+    def __init__(
+        self,
+        latency: LatencyModel | None = None,
+        faults: FaultModel | None = None,
+        seed: int | None = 0,
+        corpus_size: int = 500,
+        chunk_chars: int = 800,
+        msearch_entry_ms: float = 5.0,
+        project_doc_count: int = 100_000,
+    ):
+        super().__init__(latency or LatencyModel(median_ms=40.0, sigma=0.4), faults, seed)
+        self.msearch_entry_ms = msearch_entry_ms
+        self.project_doc_count = project_doc_count
+        self.corpus = [self._document(i, chunk_chars) for i in range(corpus_size)]
+        self.client = _FakeRawSearch(self)
+
+    @staticmethod
+    def _document(i: int, chunk_chars: int) -> dict:
+        text = f"합성 문서 {i // 10}의 {i % 10}번째 청크입니다. " * max(1, chunk_chars // 25)
+        return {
+            "_id": f"fake-{i}",
+            "_routing": "334",
+            "_source": {
+                "text": text[:chunk_chars],
+                "chunk_text": text[:chunk_chars],
+                "file_name": f"합성문서_{i // 10}.md",
+                "document_id": i // 10,
+                "chunk_index": i % 10,
+                "page_number": i % 10 + 1,
+                "project_id": 334,
+            },
+        }
+
+    def hits(self, size: int) -> list[dict]:
+        """무작위 hit size개 (점수 내림차순)"""
+        with self._lock:
+            picks = self._rng.sample(range(len(self.corpus)), min(size, len(self.corpus)))
+        return [{**self.corpus[i], "_score": round(1.0 - rank / (size + 1), 4)} for rank, i in enumerate(picks)]
+
+    def search(self, index, query, size=5, request_timeout=None, include_vectors=None) -> list[dict]:
+        self._request()
+        return self.hits(size)
+
+    def search_with_pipeline(
+        self, index, query, size=5, pipeline="hybrid-rrf", request_timeout=None, include_vectors=None
+    ) -> list[dict]:
+        return self.search(index, query, size)
+
+    async def asearch(self, index, query, size=5, request_timeout=None, include_vectors=None) -> list[dict]:
+        await self._arequest()
+        return self.hits(size)
+
+    async def asearch_with_pipeline(
+        self, index, query, size=5, pipeline="hybrid-rrf", request_timeout=None, include_vectors=None
+    ) -> list[dict]:
+        return await self.asearch(index, query, size)
+
+    def msearch(self, index, entries, request_timeout=None, include_vectors=None) -> list[list[dict]]:
+        return self.msearch_with_pipeline(index, [(query, size, None) for query, size in entries])
+
+    def msearch_with_pipeline(self, index, entries, request_timeout=None, include_vectors=None) -> list[list[dict]]:
+        self._request(self.msearch_entry_ms * len(entries))
+        return [self.hits(size) for _, size, _ in entries]
+
+    async def amsearch_with_pipeline(
+        self, index, entries, request_timeout=None, include_vectors=None
+    ) -> list[list[dict]]:
+        await self._arequest(self.msearch_entry_ms * len(entries))
+        return [self.hits(size) for _, size, _ in entries]
+
+    def get_doc_count(self, index: str) -> int:
+        return len(self.corpus)
+
+    def get_doc_count_by_project(self, index: str, project_id: int) -> int:
+        return self.project_doc_count
+
+    def get_index_version(self, index: str) -> str:
+        return "fake-v1"
+
+    async def aclose(self) -> None:
+        return None
+
+
+# =============================================================================
+# Reranker
+# =============================================================================
+
+
+@dataclass
+class _RankedDoc:
+    doc_id: int
+    score: float
+
+
+@dataclass
+class _RankedResults:
+    results: list[_RankedDoc]
+
+
+class _FakeRanker(FakeBackend):
+    """rerankers.Reranker 대체 (rank(query, docs) → 무작위 순서)"""
+
+    name = "reranker"
+
+    def __init__(
+        self,
+        latency: LatencyModel,
+        faults: FaultModel | None,
+        seed: int | None,
+        ms_per_doc: float,
+        cpu_bound: bool,
+    ):
+        super().__init__(latency, faults, seed)
+        self.ms_per_doc = ms_per_doc
+        self.cpu_bound = cpu_bound
+
+    def rank(self, query: str, docs: list[str]) -> _RankedResults:
+        extra_ms = self.ms_per_doc * len(docs)
+        if self.cpu_bound:
+            delay, fault = self._draw(extra_ms)
+            end = time.perf_counter() + delay
+            try:
+                while time.perf_counter() < end:  # CPU 추론 대체 (GIL 경쟁 재현)
+                    pass
+            finally:
+                self._leave()
+            self._raise(fault)
+        else:
+            self._request(extra_ms)
+        with self._lock:
+            scores = [self._rng.random() for _ in docs]
+        order = sorted(range(len(docs)), key=lambda i: scores[i], reverse=True)
+        return _RankedResults([_RankedDoc(doc_id=i, score=scores[i]) for i in order])
+
+
+class FakeRerankerFilter(RerankerFilter):
+    """RerankerFilter 대체 (filter/filter_batch는 원본 그대로, 모델만 가짜)
+
+    Args:
+        top_k: 반환할 문서 수
+        batch_workers: filter_batch 동시 실행 수
+        latency: 질문당 기본 지연 분포 (기본: ~5ms)
+        ms_per_doc: 문서당 추가 지연 (cross-encoder 추론 비용)
+        cpu_bound: True면 sleep 대신 바쁜 대기 (GIL을 잡는 CPU 추론 재현)
+        faults: 실패 비율
+        seed: 난수 시드
+    """
+
+    def __init__(
+        self,
+        top_k: int = 5,
+        batch_workers: int = 4,
+        latency: LatencyModel | None = None,
+        ms_per_doc: float = 3.0,
+        cpu_bound: bool = False,
+        faults: FaultModel | None = None,
+        seed: int | None = 0,
+    ):
+        super().__init__(model_name="fake-reranker", model_type="fake", top_k=top_k, batch_workers=batch_workers)
+        self._ranker = _FakeRanker(
+            latency or LatencyModel(median_ms=5.0, sigma=0.3), faults, seed, ms_per_doc, cpu_bound
+        )
+
+    @property
+    def stats(self) -> BackendStats:
+        return self._ranker.stats
@@ -8,6 +8,8 @@ import vertexai
 from dotenv import load_dotenv
 from vertexai.generative_models import GenerativeModel
 
+from src.rate_limit import aacquire_provider, acquire_provider
+
 load_dotenv()
 
 # GCP 서비스 계정 인증 설정
@@ -58,20 +60,43 @@ class GeminiClient:
         max_tokens: int = 256,
     ) -> GeminiResponse:
         """Gemini 호출"""
-        # 시스템 프롬프트가 있으면 프롬프트에 포함
-        if system:
-            full_prompt = f"{system}\n\n{prompt}"
-        else:
-            full_prompt = prompt
-
+        acquire_provider("gemini")
         response = self.model.generate_content(
-            full_prompt,
-            generation_config={
-                "max_output_tokens": max_tokens,
-                "temperature": 0.1,  # 일관된 출력을 위해 낮은 temperature
-            },
+            self._build_prompt(prompt, system),
+            generation_config=self._generation_config(max_tokens),
         )
+        return self._to_response(response)
 
+    async def acall(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 256,
+    ) -> GeminiResponse:
+        """Gemini 호출 (비동기, gRPC asyncio 채널 사용)"""
+        await aacquire_provider("gemini")
+        response = await self.model.generate_content_async(
+            self._build_prompt(prompt, system),
+            generation_config=self._generation_config(max_tokens),
+        )
+        return self._to_response(response)
+
+    @staticmethod
+    def _build_prompt(prompt: str, system: str | None) -> str:
+        """시스템 프롬프트가 있으면 프롬프트에 포함"""
+        if system:
+            return f"{system}\n\n{prompt}"
+        return prompt
+
+    @staticmethod
+    def _generation_config(max_tokens: int) -> dict:
+        return {
+            "max_output_tokens": max_tokens,
+            "temperature": 0.1,  # 일관된 출력을 위해 낮은 temperature
+        }
+
+    def _to_response(self, response) -> GeminiResponse:
+        """Vertex 응답 → GeminiResponse"""
         # 토큰 사용량 추출
         usage = response.usage_metadata
         input_tokens = usage.prompt_token_count if usage else 0
@@ -0,0 +1,170 @@
+"""인덱스 스키마 (생성용 settings + mappings)
+
+rag-index-fargate-live는 생성 설정을 바꿀 수 없으므로, 최적화된 설정으로 새 인덱스를 만들고
+프로젝트 데이터를 재색인할 때 사용합니다 (cli.py create-index / reindex).
+
+벡터 (embedding):
+- engine: faiss (네이티브 HNSW, ef_search 인덱스 설정 가능) | lucene (네이티브 메모리 불필요, 필터 검색에 유리)
+- encoding:
+    float - 원본 float32
+    fp16  - faiss SQ fp16 (그래프/벡터 메모리 절반, recall 손실 거의 없음)
+    byte  - lucene SQ (float 입력을 내부에서 int7로 양자화, 메모리 약 1/4)
+- space_type: l2 (기존 인덱스와 같은 1/(1+d²) 점수, 정확 검색/점수 필터 호환)
+
+텍스트: HybridQueryBuilder.SEARCH_FIELDS (chunk_text, text.ko, text.en)와 같은 필드를
+Nori(korean) / english 분석기로 매핑합니다. Nori는 analysis-nori 플러그인이 필요합니다.
+
+Usage:
+    body = build_index_body(engine="faiss", encoding="fp16", m=16, ef_construction=128)
+    client.create_index("rag-index-optimized", body)
+"""
+
+ENGINES = ("faiss", "lucene")
+ENCODINGS = ("float", "fp16", "byte")
+
+# 재색인 시 벡터를 옮길 필드 (기존 인덱스 필드명 순서대로 탐색)
+SOURCE_VECTOR_FIELDS = ["embedding", "embedding_vector"]
+
+# Nori 품사 필터 - 조사/어미/기호 등 검색에 쓸모없는 품사 제거 (Nori 기본 stoptags)
+NORI_STOPTAGS = "E IC J MAG MAJ MM SP SSC SSO SC SE XPN XSA XSN XSV UNA NA VSV".split()
+
+ANALYSIS = {
+    "tokenizer": {
+        "korean_tokenizer": {"type": "nori_tokenizer", "decompound_mode": "mixed"},
+    },
+    "filter": {
+        "korean_pos": {"type": "nori_part_of_speech", "stoptags": NORI_STOPTAGS},
+    },
+    "analyzer": {
+        "korean": {
+            "type": "custom",
+            "tokenizer": "korean_tokenizer",
+            "filter": ["korean_pos", "nori_readingform", "lowercase"],
+        },
+    },
+}
+
+# 벡터 외 필드 매핑 (text.ko / text.en / chunk_text = HybridQueryBuilder.SEARCH_FIELDS)
+TEXT_PROPERTIES = {
+    "text": {
+        "type": "text",
+        "analyzer": "korean",
+        "fields": {
+            "ko": {"type": "text", "analyzer": "korean"},
+            "en": {"type": "text", "analyzer": "english"},
+        },
+    },
+    "chunk_text": {"type": "text", "analyzer": "korean"},
+    "content": {"type": "text", "analyzer": "korean"},
+    "file_name": {"type": "text", "analyzer": "korean", "fields": {"keyword": {"type": "keyword"}}},
+    "original_filename": {"type": "keyword"},
+    "file_type": {"type": "keyword"},
+    "md5_hash": {"type": "keyword"},
+    "project_id": {"type": "integer"},
+    "document_id": {"type": "long"},
+    "chunk_index": {"type": "integer"},
+    "page_number": {"type": "integer"},
+}
+
+
+def _vector_method(engine: str, encoding: str, m: int, ef_construction: int) -> dict:
+    """knn_vector method 정의 (엔진/인코딩 조합 검증)"""
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 engine: {engine} ({' | '.join(ENGINES)})")
+    if encoding not in ENCODINGS:
+        raise ValueError(f"지원하지 않는 encoding: {encoding} ({' | '.join(ENCODINGS)})")
+
+    parameters: dict = {"m": m, "ef_construction": ef_construction}
+    if encoding == "fp16":
+        if engine != "faiss":
+            raise ValueError("fp16 인코딩은 faiss 엔진만 지원합니다 (lucene은 byte 사용)")
+        parameters["encoder"] = {"name": "sq", "parameters": {"type": "fp16"}}
+    elif encoding == "byte":
+        if engine != "lucene":
+            raise ValueError("byte 인코딩은 lucene 엔진만 지원합니다 (faiss는 fp16 사용)")
+        parameters["encoder"] = {"name": "sq"}
+
+    return {"name": "hnsw", "engine": engine, "space_type": "l2", "parameters": parameters}
+
+
+def build_index_body(
+    dimensions: int = 1024,
+    engine: str = "faiss",
+    encoding: str = "fp16",
+    m: int = 16,
+    ef_construction: int = 128,
+    ef_search: int = 100,
+    shards: int = 1,
+    replicas: int = 0,
+    refresh_interval: str = "1s",
+    source_vectors: bool = True,
+    routing_required: bool = False,
+) -> dict:
+    """인덱스 생성 body (settings + mappings)
+
+    Args:
+        dimensions: 임베딩 차원
+        engine: 벡터 엔진 (faiss | lucene)
+        encoding: 벡터 인코딩 (float | fp16 | byte)
+        m: HNSW 노드당 연결 수
+        ef_construction: 그래프 생성 탐색 폭
+        ef_search: 기본 검색 탐색 폭 (faiss만 인덱스 설정으로 적용, lucene은 k 사용)
+        shards: primary 샤드 수 (단일 노드/수십만 청크면 1)
+        replicas: 레플리카 수 (단일 노드는 0)
+        refresh_interval: 리프레시 주기 (대량 색인 중에는 "-1" 후 복구)
+        source_vectors: _source에 벡터 저장 여부 (False면 디스크 절약, 스냅샷/include_vectors 불가)
+        routing_required: project_id 라우팅 인덱스 (색인/조회/삭제 모두 routing 필수,
+            프로젝트 필터 검색은 샤드 1개만 조회 - OpenSearchClient가 자동 감지)
+    """
+    settings: dict = {
+        "index": {
+            "knn": True,
+            "number_of_shards": shards,
+            "number_of_replicas": replicas,
+            "refresh_interval": refresh_interval,
+        },
+        "analysis": ANALYSIS,
+    }
+    if engine == "faiss":
+        settings["index"]["knn.algo_param.ef_search"] = ef_search
+
+    mappings: dict = {
+        "dynamic": False,
+        "properties": {
+            "embedding": {
+                "type": "knn_vector",
+                "dimension": dimensions,
+                "method": _vector_method(engine, encoding, m, ef_construction),
+            },
+            **TEXT_PROPERTIES,
+        },
+    }
+    if not source_vectors:
+        mappings["_source"] = {"excludes": ["embedding"]}
+    if routing_required:
+        mappings["_routing"] = {"required": True}
+
+    return {"settings": settings, "mappings": mappings}
+
+
+def search_pipeline_body(rank_constant: int) -> dict:
+    """RRF 하이브리드 검색 파이프라인 body (hybrid-rrf / hybrid-rrf-tuned와 같은 형식)"""
+    return {
+        "phase_results_processors": [
+            {"score-ranker-processor": {"combination": {"technique": "rrf", "rank_constant": rank_constant}}}
+        ]
+    }
+
+
+def to_index_doc(source: dict) -> dict:
+    """기존 인덱스 _source → 새 인덱스 문서
+
+    벡터는 embedding 필드 하나로 옮기고(embedding_vector 중복 저장 제거), 나머지 필드는 그대로 둡니다.
+    매핑에 없는 필드는 dynamic=false라 _source에만 남고 색인되지 않습니다.
+    """
+    vector = next((source[f] for f in SOURCE_VECTOR_FIELDS if source.get(f)), None)
+    if vector is None:
+        raise ValueError("임베딩 필드 없음 (include_vectors=True로 조회 필요)")
+    doc = {key: value for key, value in source.items() if key not in SOURCE_VECTOR_FIELDS}
+    doc["embedding"] = vector
+    return doc
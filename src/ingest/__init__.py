@@ -0,0 +1,29 @@
+"""문서 수집 모듈
+
+로컬 파일을 청크로 나누고 임베딩해 OpenSearch에 대량 색인합니다.
+"""
+
+from .chunker import Chunk, TextChunker
+from .ingestor import BulkIngestor, IngestStats, chunk_hash, chunk_id, to_chunk_doc
+from .loader import SourceDocument, iter_documents, stable_document_id
+from .sync import IncrementalSync, SyncManifest, SyncStats
+
+__all__ = [
+    # Loader
+    "SourceDocument",
+    "iter_documents",
+    "stable_document_id",
+    # Chunker
+    "Chunk",
+    "TextChunker",
+    # Ingestor
+    "BulkIngestor",
+    "IngestStats",
+    "chunk_hash",
+    "chunk_id",
+    "to_chunk_doc",
+    # Incremental sync
+    "IncrementalSync",
+    "SyncManifest",
+    "SyncStats",
+]
@@ -0,0 +1,98 @@
+"""텍스트 청커
+
+문서 텍스트를 chunk_size 글자 안팎의 청크로 나눕니다.
+청크 경계는 문단(빈 줄) → 줄 → 문장 → 공백 순으로 가까운 구분자에 맞추고,
+이웃 청크는 chunk_overlap 글자만큼 겹칩니다.
+
+각 청크는 원문 기준 [character_start, character_end) 범위를 가지므로
+text[chunk.character_start:chunk.character_end] == chunk.text 입니다.
+
+Usage:
+    chunker = TextChunker(chunk_size=1000, chunk_overlap=100)
+    for chunk in chunker.split(text):
+        print(chunk.chunk_index, chunk.character_start, chunk.character_end)
+"""
+
+from dataclasses import dataclass
+
+# 청크 경계 후보 (앞에 있을수록 우선)
+SEPARATORS = ("\n\n", "\n", ". ", "? ", "! ", " ")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """원문 내 청크
+
+    Attributes:
+        chunk_index: 문서 내 순서 (0부터)
+        text: 청크 텍스트
+        character_start: 원문 시작 위치 (포함)
+        character_end: 원문 끝 위치 (미포함)
+        line_number: 시작 줄 번호 (1부터)
+    """
+
+    chunk_index: int
+    text: str
+    character_start: int
+    character_end: int
+    line_number: int
+
+
+class TextChunker:
+    """구분자 경계 기반 고정 길이 청커
+
+    Args:
+        chunk_size: 청크 최대 글자 수
+        chunk_overlap: 이웃 청크 겹침 글자 수 (chunk_size보다 작아야 함)
+        min_chunk_size: 경계 탐색 최소 길이 (이보다 짧게 자르지 않음, 기본 chunk_size / 2)
+    """
+
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 100, min_chunk_size: int | None = None):
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"chunk_overlap({chunk_overlap})은 chunk_size({chunk_size})보다 작아야 합니다")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.min_chunk_size = chunk_size // 2 if min_chunk_size is None else min_chunk_size
+
+    def split(self, text: str) -> list[Chunk]:
+        """텍스트 → 청크 리스트 (공백뿐인 구간은 건너뜀)"""
+        chunks: list[Chunk] = []
+        start = self._skip_whitespace(text, 0)
+        while start < len(text):
+            end = self._boundary(text, start)
+            chunk_text = text[start:end].rstrip()
+            if chunk_text:
+                chunks.append(
+                    Chunk(
+                        chunk_index=len(chunks),
+                        text=chunk_text,
+                        character_start=start,
+                        character_end=start + len(chunk_text),
+                        line_number=text.count("\n", 0, start) + 1,
+                    )
+                )
+            if end >= len(text):
+                break
+            # 겹침 구간도 단어 중간에서 시작하지 않도록 다음 공백 뒤로 맞춤
+            overlap_start = max(end - self.chunk_overlap, start + 1)
+            space = text.find(" ", overlap_start, end)
+            next_start = space + 1 if self.chunk_overlap and space != -1 else end
+            start = self._skip_whitespace(text, next_start)
+        return chunks
+
+    def _boundary(self, text: str, start: int) -> int:
+        """start에서 시작하는 청크의 끝 위치 (가장 우선순위 높은 구분자 직후)"""
+        limit = start + self.chunk_size
+        if limit >= len(text):
+            return len(text)
+        for separator in SEPARATORS:
+            position = text.rfind(separator, start + self.min_chunk_size, limit)
+            if position != -1:
+                return position + len(separator)
+        return limit
+
+    @staticmethod
+    def _skip_whitespace(text: str, position: int) -> int:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        return position
@@ -0,0 +1,264 @@
+"""대량 수집 (BulkIngestor)
+
+문서 → 청크 → 배치 임베딩 → _bulk 색인을 스트리밍으로 처리합니다.
+
+    iter_documents ─→ TextChunker ─→ embed_batch (메인 스레드, 배치 내 병렬)
+                                          │
+                                          ▼ 대기 중인 bulk 요청이 max_pending개면 완료될 때까지 대기 (back-pressure)
+                                     bulk 워커 풀 (workers개) ─→ OpenSearch _bulk (실패 시 지수 백오프 재시도)
+
+임베딩과 색인이 겹쳐 실행되고, OpenSearch가 느려지면 임베딩도 멈추므로 메모리 사용량이
+max_pending × bulk_size 청크로 제한됩니다. 청크 ID는 "{document_id}_{chunk_index}"라
+같은 문서를 다시 수집하면 덮어씁니다 (재시도도 중복 없이 안전).
+
+Usage:
+    embedder = CachedEmbeddingClient(EmbeddingClient())
+    ingestor = BulkIngestor(OpenSearchClient(), embedder, "rag-index", project_id=334, workers=4)
+    stats = ingestor.ingest(iter_documents("data/test_docs", project_id=334))
+    print(f"{stats.docs_per_sec:.1f} docs/s")
+"""
+
+import hashlib
+import random
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .chunker import Chunk, TextChunker
+from .loader import SourceDocument
+
+
+@dataclass
+class IngestStats:
+    """수집 결과
+
+    Attributes:
+        documents: 처리한 문서 수
+        chunks: 생성한 청크 수
+        embedded: 임베딩한 청크 수 (벡터를 재사용한 청크 제외)
+        indexed: 색인된 청크 수
+        failed: 임베딩/색인 실패 청크 수
+        retries: _bulk 재시도 횟수
+        embed_seconds: 임베딩 대기 시간 합
+        elapsed_seconds: 전체 소요 시간
+        errors: 실패 사유 (최대 MAX_ERRORS개)
+    """
+
+    MAX_ERRORS = 20
+
+    documents: int = 0
+    chunks: int = 0
+    embedded: int = 0
+    indexed: int = 0
+    failed: int = 0
+    retries: int = 0
+    embed_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def docs_per_sec(self) -> float:
+        """색인 처리량 (청크 문서/초)"""
+        return self.indexed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def add_error(self, message: str) -> None:
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(message)
+
+
+def chunk_id(document_id: int, chunk_index: int) -> str:
+    """청크 문서 ID (재수집 시 덮어쓰기 기준)"""
+    return f"{document_id}_{chunk_index}"
+
+
+def chunk_hash(text: str) -> str:
+    """청크 텍스트 MD5 (색인 문서 md5_hash, 증분 동기화 비교 키)"""
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def to_chunk_doc(document: SourceDocument, chunk: Chunk, project_id: int) -> dict:
+    """문서 + 청크 → 색인 문서 (embedding 제외, index_schema 필드명)
+
+    md5_hash는 파일이 아니라 청크 텍스트의 해시입니다 (같은 텍스트 = 같은 임베딩).
+    """
+    return {
+        "text": chunk.text,
+        "chunk_text": chunk.text,
+        "project_id": project_id,
+        "document_id": document.document_id,
+        "chunk_index": chunk.chunk_index,
+        "page_number": 1,
+        "line_number": chunk.line_number,
+        "character_start": chunk.character_start,
+        "character_end": chunk.character_end,
+        "file_name": document.file_name,
+        "original_filename": document.file_name,
+        "source_path": document.relative_path,
+        "file_type": document.file_type,
+        "md5_hash": chunk_hash(chunk.text),
+        "upload_source": "ingest",
+        "created_at": datetime.now().isoformat(),
+    }
+
+
+class BulkIngestor:
+    """문서 대량 수집기
+
+    Args:
+        search_client: OpenSearchClient (bulk_index 사용)
+        embedding_client: embed_batch를 제공하는 임베딩 클라이언트 (EmbeddingClient / CachedEmbeddingClient)
+        index: 대상 인덱스
+        project_id: 수집 문서의 프로젝트 ID
+        chunker: 텍스트 청커 (기본값: TextChunker())
+        embed_batch_size: embed_batch 1회 텍스트 수
+        bulk_size: _bulk 요청당 청크 수 (1024차원 기준 200개 ≈ 4MB)
+        workers: 동시 _bulk 요청 수
+        max_pending: 대기 중인 _bulk 요청 상한 (기본값: workers × 2)
+        max_retries: _bulk 요청 실패 시 최대 재시도 횟수 (429는 문서 단위로도 재시도)
+        backoff_seconds: 재시도 기본 대기 시간 (지수 증가, 최대 30초)
+        routing_field: 라우팅 키 필드 (project_id 라우팅 인덱스면 ROUTING_FIELD)
+    """
+
+    def __init__(
+        self,
+        search_client: Any,
+        embedding_client: Any,
+        index: str,
+        project_id: int,
+        chunker: TextChunker | None = None,
+        embed_batch_size: int = 64,
+        bulk_size: int = 200,
+        workers: int = 4,
+        max_pending: int | None = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        routing_field: str | None = None,
+    ):
+        self.search_client = search_client
+        self.embedding_client = embedding_client
+        self.index = index
+        self.project_id = project_id
+        self.chunker = chunker or TextChunker()
+        self.embed_batch_size = embed_batch_size
+        self.bulk_size = bulk_size
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.routing_field = routing_field
+
+    def ingest(self, documents: Iterable[SourceDocument]) -> IngestStats:
+        """문서 수집 (청크 → 임베딩 → 병렬 _bulk)"""
+        stats = IngestStats()
+        return self.index_chunks(self._chunk_documents(documents, stats), stats)
+
+    def chunk_document(self, document: SourceDocument) -> list[tuple[str, dict]]:
+        """문서 → [(청크 ID, 색인 문서)] (embedding 제외)"""
+        return [
+            (chunk_id(document.document_id, chunk.chunk_index), to_chunk_doc(document, chunk, self.project_id))
+            for chunk in self.chunker.split(document.text)
+        ]
+
+    def _chunk_documents(self, documents: Iterable[SourceDocument], stats: IngestStats) -> Iterator[tuple[str, dict]]:
+        for document in documents:
+            stats.documents += 1
+            yield from self.chunk_document(document)
+
+    def index_chunks(self, chunks: Iterable[tuple[str, dict]], stats: IngestStats | None = None) -> IngestStats:
+        """청크 문서 색인 (embedding이 이미 있는 문서는 임베딩 생략)
+
+        Args:
+            chunks: (청크 ID, 색인 문서) 순회
+            stats: 누적할 통계 (None이면 새로 생성)
+        """
+        stats = stats or IngestStats()
+        start = time.perf_counter()
+        pending: set[Future] = set()
+        to_embed: list[tuple[str, dict]] = []
+        to_index: list[tuple[str, dict]] = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+
+            def submit(batch: list[tuple[str, dict]]) -> None:
+                nonlocal pending
+                while len(pending) >= self.max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect(done, stats)
+                pending.add(executor.submit(self._bulk_with_retry, batch))
+
+            def flush_embed() -> None:
+                to_index.extend(self._embed(to_embed, stats))
+                to_embed.clear()
+                while len(to_index) >= self.bulk_size:
+                    submit(to_index[: self.bulk_size])
+                    del to_index[: self.bulk_size]
+
+            for item in chunks:
+                stats.chunks += 1
+                to_embed.append(item)
+                if len(to_embed) >= self.embed_batch_size:
+                    flush_embed()
+
+            flush_embed()
+            if to_index:
+                submit(to_index)
+            self._collect(wait(pending).done, stats)
+
+        stats.elapsed_seconds = time.perf_counter() - start
+        return stats
+
+    def _embed(self, batch: list[tuple[str, dict]], stats: IngestStats) -> list[tuple[str, dict]]:
+        """청크 배치 임베딩 (embedding 없는 문서만, 실패 청크는 제외하고 stats에 기록)"""
+        missing = [i for i, (_, doc) in enumerate(batch) if "embedding" not in doc]
+        if not missing:
+            return list(batch)
+        start = time.perf_counter()
+        result = self.embedding_client.embed_batch([batch[i][1]["chunk_text"] for i in missing])
+        stats.embed_seconds += time.perf_counter() - start
+
+        vectors = dict(zip(missing, result.embeddings))
+        errors = {missing[pos]: message for pos, message in result.errors.items()}
+        embedded = []
+        for i, (doc_id, doc) in enumerate(batch):
+            if i not in vectors:
+                embedded.append((doc_id, doc))
+            elif vectors[i] is None:
+                stats.failed += 1
+                stats.add_error(f"embed {doc_id}: {errors.get(i, 'unknown error')}")
+            else:
+                stats.embedded += 1
+                embedded.append((doc_id, {**doc, "embedding": vectors[i]}))
+        return embedded
+
+    def _bulk_with_retry(self, batch: list[tuple[str, dict]]) -> tuple[int, int, int, str | None]:
+        """_bulk 요청 (실패 시 배치 전체 재시도) → (색인 수, 실패 수, 재시도 수, 에러)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                indexed = self.search_client.bulk_index(
+                    self.index,
+                    batch,
+                    chunk_size=len(batch),
+                    routing_field=self.routing_field,
+                    max_retries=self.max_retries,
+                )
+                return indexed, 0, attempt, None
+            except Exception as e:
+                if attempt == self.max_retries:
+                    return 0, len(batch), attempt, f"bulk {batch[0][0]}..: {type(e).__name__}: {e}"
+                # 지수 백오프 + 지터 (최대 30초)
+                time.sleep(min(30.0, self.backoff_seconds * 2**attempt) * random.uniform(0.5, 1.0))
+        raise RuntimeError("unreachable")
+
+    @staticmethod
+    def _collect(done: Iterable[Future], stats: IngestStats) -> None:
+        """완료된 _bulk 결과를 stats에 합산"""
+        for future in done:
+            indexed, failed, retries, error = future.result()
+            stats.indexed += indexed
+            stats.failed += failed
+            stats.retries += retries
+            if error:
+                stats.add_error(error)
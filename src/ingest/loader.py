@@ -0,0 +1,67 @@
+"""원본 문서 로더
+
+디렉터리에서 텍스트 파일을 찾아 SourceDocument로 읽습니다.
+document_id는 (project_id, 상대 경로)에서 만든 안정적인 정수라
+같은 파일을 다시 수집하면 같은 청크 ID로 덮어씁니다.
+"""
+
+import hashlib
+import mimetypes
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_PATTERNS = ("**/*.txt", "**/*.md")
+
+
+@dataclass(frozen=True)
+class SourceDocument:
+    """수집 대상 문서
+
+    Attributes:
+        document_id: (project_id, relative_path) 기반 안정 ID (양의 63비트 정수)
+        relative_path: 수집 루트 기준 경로 (POSIX)
+        text: 문서 텍스트
+        md5_hash: 파일 내용 MD5
+        file_type: MIME 타입
+    """
+
+    document_id: int
+    relative_path: str
+    text: str
+    md5_hash: str
+    file_type: str
+
+    @property
+    def file_name(self) -> str:
+        return self.relative_path.rsplit("/", 1)[-1]
+
+
+def stable_document_id(project_id: int, relative_path: str) -> int:
+    """(project_id, 경로) → 양의 63비트 정수 (OpenSearch long 범위)"""
+    digest = hashlib.sha1(f"{project_id}:{relative_path}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+def iter_documents(
+    root: str | Path,
+    project_id: int,
+    patterns: tuple[str, ...] = DEFAULT_PATTERNS,
+    encoding: str = "utf-8",
+) -> Iterator[SourceDocument]:
+    """root 아래 patterns에 맞는 파일을 경로 순서대로 읽기 (빈 파일 제외)"""
+    root = Path(root)
+    paths = sorted({path for pattern in patterns for path in root.glob(pattern) if path.is_file()})
+    for path in paths:
+        raw = path.read_bytes()
+        text = raw.decode(encoding)
+        if not text.strip():
+            continue
+        relative_path = path.relative_to(root).as_posix()
+        yield SourceDocument(
+            document_id=stable_document_id(project_id, relative_path),
+            relative_path=relative_path,
+            text=text,
+            md5_hash=hashlib.md5(raw).hexdigest(),
+            file_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        )
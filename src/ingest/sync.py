@@ -0,0 +1,282 @@
+"""증분 동기화 (IncrementalSync)
+
+로컬 문서와 색인 상태를 md5_hash로 비교해 바뀐 청크만 임베딩/색인하고,
+로컬에 없는 청크(고아)는 일괄 삭제합니다. 로컬 폴더가 프로젝트의 원본(source of truth)입니다.
+
+비교 단계:
+1. 파일: 매니페스트의 파일 MD5가 같으면 청크 분할도 하지 않고 건너뜀
+2. 청크: 같은 청크 ID에 md5_hash·위치(character_start/end)가 같으면 건너뜀
+3. 벡터: 텍스트가 같은 청크(md5_hash)가 이미 색인돼 있으면 _mget으로 벡터를 복사 (임베딩 생략)
+4. 나머지 청크만 임베딩 → BulkIngestor로 upsert
+5. 새 청크 집합에 없는 이전 청크 ID → bulk 삭제 (라우팅 인덱스면 routing 지정)
+
+매니페스트 (JSON):
+    {"version", "index", "project_id", "chunk_size", "chunk_overlap", "updated_at",
+     "documents": {document_id: {"path", "md5_hash", "chunks": {청크 ID: [md5_hash, start, end]}}}}
+매니페스트가 없거나 대상/청크 설정이 다르면(또는 verify=True) 인덱스를 조회해 색인 상태를 만듭니다.
+이 경우 파일 MD5는 알 수 없으므로 모든 파일을 청크 단위로 비교합니다.
+임베딩/색인 실패가 있으면 매니페스트를 지워 다음 동기화가 실제 색인 상태에서 다시 시작합니다.
+
+Usage:
+    sync = IncrementalSync(ingestor, "data/manifests/rag-index_334.json")
+    stats = sync.run(iter_documents("data/test_docs", project_id=334))
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .ingestor import BulkIngestor, IngestStats
+from .loader import SourceDocument
+
+MANIFEST_VERSION = 1
+
+# 인덱스 조회로 색인 상태를 만들 때 가져올 필드 (벡터 제외)
+STATE_FIELDS = ["document_id", "md5_hash", "character_start", "character_end", "source_path"]
+
+# 벡터 재사용 _mget 배치 크기
+VECTOR_FETCH_BATCH = 100
+
+
+@dataclass
+class DocumentEntry:
+    """색인된 문서 상태
+
+    Attributes:
+        path: 수집 루트 기준 경로 (인덱스 조회로 만든 경우 source_path, 없으면 "")
+        md5_hash: 파일 MD5 (인덱스 조회로 만든 경우 "")
+        chunks: 청크 ID → [md5_hash, character_start, character_end]
+    """
+
+    path: str
+    md5_hash: str
+    chunks: dict[str, list] = field(default_factory=dict)
+
+
+@dataclass
+class SyncManifest:
+    """프로젝트 색인 상태 (로컬 매니페스트)"""
+
+    index: str
+    project_id: int
+    chunk_size: int
+    chunk_overlap: int
+    documents: dict[int, DocumentEntry] = field(default_factory=dict)
+
+    def matches(self, ingestor: BulkIngestor) -> bool:
+        """같은 대상/청크 설정으로 만든 매니페스트인지"""
+        return (self.index, self.project_id, self.chunk_size, self.chunk_overlap) == (
+            ingestor.index,
+            ingestor.project_id,
+            ingestor.chunker.chunk_size,
+            ingestor.chunker.chunk_overlap,
+        )
+
+    @classmethod
+    def empty(cls, ingestor: BulkIngestor) -> "SyncManifest":
+        return cls(ingestor.index, ingestor.project_id, ingestor.chunker.chunk_size, ingestor.chunker.chunk_overlap)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SyncManifest | None":
+        """매니페스트 읽기 (없거나 버전이 다르면 None)"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(
+            index=data["index"],
+            project_id=data["project_id"],
+            chunk_size=data["chunk_size"],
+            chunk_overlap=data["chunk_overlap"],
+            documents={int(doc_id): DocumentEntry(**entry) for doc_id, entry in data["documents"].items()},
+        )
+
+    def save(self, path: str | Path) -> None:
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체 - 중단돼도 이전 매니페스트 유지)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "index": self.index,
+            "project_id": self.project_id,
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "updated_at": datetime.now().isoformat(),
+            "documents": {
+                str(doc_id): {"path": entry.path, "md5_hash": entry.md5_hash, "chunks": entry.chunks}
+                for doc_id, entry in self.documents.items()
+            },
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @property
+    def chunk_count(self) -> int:
+        return sum(len(entry.chunks) for entry in self.documents.values())
+
+
+@dataclass
+class SyncStats:
+    """동기화 결과
+
+    Attributes:
+        documents: 로컬 문서 수
+        unchanged_documents: 파일 MD5가 같아 건너뛴 문서 수
+        changed_documents: 다시 비교한 문서 수 (새 문서 포함)
+        new_documents: 새 문서 수
+        removed_documents: 로컬에서 사라진 문서 수
+        unchanged_chunks: 바뀐 문서 중 그대로인 청크 수
+        upserts: 색인할 청크 수
+        reused_vectors: 기존 벡터를 복사한 청크 수
+        deleted: 삭제한 고아 청크 수 (dry_run이면 삭제 예정 수)
+        source: 이전 상태 출처 ("manifest" | "index")
+        elapsed_seconds: 전체 소요 시간
+        ingest: 색인 통계 (임베딩 수/시간, 실패 등)
+    """
+
+    documents: int = 0
+    unchanged_documents: int = 0
+    changed_documents: int = 0
+    new_documents: int = 0
+    removed_documents: int = 0
+    unchanged_chunks: int = 0
+    upserts: int = 0
+    reused_vectors: int = 0
+    deleted: int = 0
+    source: str = "manifest"
+    elapsed_seconds: float = 0.0
+    ingest: IngestStats = field(default_factory=IngestStats)
+
+
+class IncrementalSync:
+    """md5_hash 기반 증분 동기화
+
+    Args:
+        ingestor: BulkIngestor (대상 인덱스/프로젝트/청커/라우팅 설정 사용)
+        manifest_path: 로컬 매니페스트 경로 (None이면 매번 인덱스 조회)
+    """
+
+    def __init__(self, ingestor: BulkIngestor, manifest_path: str | Path | None = None):
+        self.ingestor = ingestor
+        self.client = ingestor.search_client
+        self.manifest_path = manifest_path
+        # project_id 라우팅 인덱스면 _mget/삭제에도 routing 필요
+        self.routing = str(ingestor.project_id) if ingestor.routing_field else None
+
+    def run(self, documents: Iterable[SourceDocument], verify: bool = False, dry_run: bool = False) -> SyncStats:
+        """동기화 실행
+
+        Args:
+            documents: 로컬 문서 전체 (iter_documents)
+            verify: 매니페스트를 무시하고 인덱스를 조회해 비교
+            dry_run: 비교만 하고 색인/삭제/매니페스트 저장 안 함
+
+        Returns:
+            SyncStats
+        """
+        start = time.perf_counter()
+        stats = SyncStats()
+        previous = None if verify or self.manifest_path is None else SyncManifest.load(self.manifest_path)
+        if previous is None or not previous.matches(self.ingestor):
+            previous = self.scan_index()
+            stats.source = "index"
+
+        current = SyncManifest.empty(self.ingestor)
+        upserts: list[tuple[str, dict]] = []
+        for document in documents:
+            stats.documents += 1
+            old = previous.documents.get(document.document_id)
+            if old is not None and old.md5_hash == document.md5_hash:
+                stats.unchanged_documents += 1
+                current.documents[document.document_id] = old
+                continue
+
+            stats.changed_documents += 1
+            if old is None:
+                stats.new_documents += 1
+            entry = DocumentEntry(path=document.relative_path, md5_hash=document.md5_hash)
+            for doc_id, doc in self.ingestor.chunk_document(document):
+                signature = [doc["md5_hash"], doc["character_start"], doc["character_end"]]
+                entry.chunks[doc_id] = signature
+                if old is not None and old.chunks.get(doc_id) == signature:
+                    stats.unchanged_chunks += 1
+                else:
+                    upserts.append((doc_id, doc))
+            current.documents[document.document_id] = entry
+
+        stats.removed_documents = len(previous.documents.keys() - current.documents.keys())
+        live_ids = {doc_id for entry in current.documents.values() for doc_id in entry.chunks}
+        orphans = [doc_id for entry in previous.documents.values() for doc_id in entry.chunks if doc_id not in live_ids]
+        stats.upserts = len(upserts)
+
+        if dry_run:
+            stats.deleted = len(orphans)
+            stats.elapsed_seconds = time.perf_counter() - start
+            return stats
+
+        # 텍스트가 같은 기존 청크 (md5_hash → 청크 ID), 삭제 전에 벡터를 복사해야 하므로 upsert 먼저
+        by_hash = {
+            signature[0]: doc_id for entry in previous.documents.values() for doc_id, signature in entry.chunks.items()
+        }
+        stats.ingest = self.ingestor.index_chunks(self._with_reused_vectors(upserts, by_hash, stats))
+        if stats.ingest.failed:
+            # 어느 청크가 실패했는지 알 수 없으므로 매니페스트를 지워 다음 동기화는 인덱스 조회로 비교 (삭제도 보류)
+            if self.manifest_path is not None:
+                Path(self.manifest_path).unlink(missing_ok=True)
+        else:
+            if orphans:
+                stats.deleted = self.client.bulk_delete(self.ingestor.index, orphans, routing=self.routing)
+            if self.manifest_path is not None:
+                current.save(self.manifest_path)
+        stats.elapsed_seconds = time.perf_counter() - start
+        return stats
+
+    def scan_index(self) -> SyncManifest:
+        """인덱스 조회로 프로젝트 색인 상태 생성 (파일 MD5 없음)"""
+        manifest = SyncManifest.empty(self.ingestor)
+        hits = self.client.iter_docs_by_project(
+            self.ingestor.index, self.ingestor.project_id, source_fields=STATE_FIELDS
+        )
+        for hit in hits:
+            source = hit["_source"]
+            document_id = int(source.get("document_id") or 0)
+            entry = manifest.documents.setdefault(document_id, DocumentEntry(source.get("source_path", ""), ""))
+            entry.chunks[hit["_id"]] = [
+                source.get("md5_hash", ""),
+                source.get("character_start"),
+                source.get("character_end"),
+            ]
+        return manifest
+
+    def _with_reused_vectors(
+        self, upserts: list[tuple[str, dict]], by_hash: dict[str, str], stats: SyncStats
+    ) -> list[tuple[str, dict]]:
+        """upsert 청크에 같은 텍스트의 기존 벡터 첨부 (VECTOR_FETCH_BATCH개씩 _mget)
+
+        색인 중에 조회하면 이번 동기화가 이미 덮어쓴 청크 ID의 벡터를 읽을 수 있으므로
+        색인 시작 전에 모든 벡터를 가져온다.
+        """
+        sources = {doc_id: by_hash[doc["md5_hash"]] for doc_id, doc in upserts if doc["md5_hash"] in by_hash}
+        source_ids = sorted(set(sources.values()))
+        vectors: dict[str, list[float]] = {}
+        for offset in range(0, len(source_ids), VECTOR_FETCH_BATCH):
+            batch = source_ids[offset : offset + VECTOR_FETCH_BATCH]
+            vectors.update(self.client.get_vectors(self.ingestor.index, batch, routing=self.routing))
+
+        result = []
+        for doc_id, doc in upserts:
+            vector = vectors.get(sources.get(doc_id, ""))
+            if vector is not None:
+                stats.reused_vectors += 1
+                doc = {**doc, "embedding": vector}
+            result.append((doc_id, doc))
+        return result
@@ -1,12 +1,16 @@
 """Vertex AI Claude LLM 클라이언트"""
 
+import asyncio
 import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from anthropic import AnthropicVertex
+from anthropic import AnthropicVertex, AsyncAnthropicVertex
 from dotenv import load_dotenv
 
+from src.rate_limit import aacquire_provider, acquire_provider
+
 load_dotenv()
 
 # GCP 서비스 계정 인증 설정
@@ -14,15 +18,34 @@ _credentials_path = Path(__file__).parent.parent / "credentials" / "gcp-service-
 if _credentials_path.exists() and not os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(_credentials_path)
 
+# Anthropic 프롬프트 캐시 최소 prefix 길이 (Sonnet/Opus 1024 토큰, Haiku 2048 토큰)
+# 브레이크포인트까지의 prefix가 이보다 짧으면 캐시 읽기/쓰기가 일어나지 않음
+MIN_CACHE_TOKENS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 추정 (한글 등 비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰)
+
+    캐시 브레이크포인트 배치 판단용 근사치입니다 (정확한 값은 응답 usage 기준).
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return len(text) - ascii_chars + ascii_chars // 4
+
 
 @dataclass
 class LLMResponse:
-    """LLM 응답 결과"""
+    """LLM 응답 결과
+
+    input_tokens는 캐시되지 않은 입력 토큰만 포함합니다 (Anthropic usage 기준).
+    캐시에서 읽은 토큰과 캐시에 새로 쓴 토큰은 별도로 집계됩니다.
+    """
 
     content: str
     input_tokens: int
     output_tokens: int
     model: str
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class LLMClient:
@@ -33,10 +56,24 @@ class LLMClient:
         model: str | None = None,
         project_id: str | None = None,
         region: str | None = None,
+        prompt_cache: bool = True,
+        min_cache_tokens: int = MIN_CACHE_TOKENS,
     ):
+        """
+        Args:
+            model: Vertex AI Claude 모델명
+            project_id: GCP 프로젝트 ID
+            region: GCP 리전
+            prompt_cache: 시스템 프롬프트 / 문서 prefix에 cache_control 브레이크포인트 설정 여부
+            min_cache_tokens: 브레이크포인트를 둘 최소 prefix 토큰 수 (추정치 기준, Haiku는 2048)
+                StrictPromptTemplate 시스템 프롬프트(~540자)만으로는 못 미치므로 기본 구성에서는
+                RAGPipeline(cache_documents=True)로 문서 구간까지 포함해야 캐시가 동작합니다.
+        """
         self.model = model or os.getenv("VERTEX_CLAUDE_MODEL", "claude-sonnet-4-5@20250929")
         self.project_id = project_id or os.getenv("GCP_PROJECT_ID")
         self.region = region or os.getenv("GCP_REGION", "global")
+        self.prompt_cache = prompt_cache
+        self.min_cache_tokens = min_cache_tokens
 
         if not self.project_id:
             raise ValueError("GCP_PROJECT_ID 환경변수가 필요합니다")
@@ -46,27 +83,141 @@ class LLMClient:
             region=self.region,
         )
 
+        # 비동기 클라이언트 (acall 첫 호출 시 생성, 이벤트 루프별 1개)
+        self._async_client: AsyncAnthropicVertex | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
     def call(
         self,
         prompt: str,
         system: str | None = None,
         max_tokens: int = 1024,
+        cache_prefix: str | None = None,
+    ) -> LLMResponse:
+        """LLM 호출
+
+        Args:
+            prompt: 사용자 프롬프트
+            system: 시스템 프롬프트 (prompt_cache=True면 캐시 브레이크포인트 설정)
+            max_tokens: 최대 출력 토큰
+            cache_prefix: prompt 앞부분 중 캐시할 고정 구간 (예: 참고 문서).
+                prompt가 이 문자열로 시작하면 별도 블록으로 분리해 캐시 브레이크포인트 설정
+        """
+        acquire_provider("vertex")
+        response = self.client.messages.create(**self._build_kwargs(prompt, system, max_tokens, cache_prefix))
+        return self._to_response(response)
+
+    def stream(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        cache_prefix: str | None = None,
+    ) -> Iterator[str | LLMResponse]:
+        """LLM 스트리밍 호출
+
+        생성되는 텍스트 조각(str)을 도착하는 즉시 yield하고,
+        마지막에 토큰 사용량이 포함된 LLMResponse를 한 번 yield합니다.
+
+        Usage:
+            for event in client.stream("질문"):
+                if isinstance(event, LLMResponse):
+                    print(event.output_tokens)
+                else:
+                    print(event, end="", flush=True)
+        """
+        acquire_provider("vertex")
+        with self.client.messages.stream(**self._build_kwargs(prompt, system, max_tokens, cache_prefix)) as stream:
+            for text in stream.text_stream:
+                yield text
+            final = stream.get_final_message()
+
+        yield self._to_response(final)
+
+    async def acall(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        cache_prefix: str | None = None,
     ) -> LLMResponse:
-        """LLM 호출"""
+        """LLM 호출 (비동기)"""
+        await aacquire_provider("vertex")
+        client = self._get_async_client()
+        response = await client.messages.create(**self._build_kwargs(prompt, system, max_tokens, cache_prefix))
+        return self._to_response(response)
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트 종료"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_loop = None
+
+    def _build_kwargs(
+        self,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        cache_prefix: str | None = None,
+    ) -> dict:
+        """messages.create 요청 파라미터
+
+        prompt_cache=True면 고정 구간 끝에 cache_control 브레이크포인트를 둡니다.
+        (tools → system → messages 순으로 prefix가 누적 캐시됨)
+        누적 prefix 추정 토큰 수가 min_cache_tokens 미만인 브레이크포인트는 캐시되지 않으므로 생략합니다.
+        """
+        cache_control = {"type": "ephemeral"}
+        system_tokens = estimate_tokens(system) if system else 0
+        cache_system = self.prompt_cache and system_tokens >= self.min_cache_tokens
+
+        content: str | list[dict] = prompt
+        if (
+            self.prompt_cache
+            and cache_prefix
+            and prompt.startswith(cache_prefix)
+            and len(prompt) > len(cache_prefix)
+            and system_tokens + estimate_tokens(cache_prefix) >= self.min_cache_tokens
+        ):
+            content = [
+                {"type": "text", "text": cache_prefix, "cache_control": cache_control},
+                {"type": "text", "text": prompt[len(cache_prefix) :]},
+            ]
+
         kwargs = {
             "model": self.model,
             "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [{"role": "user", "content": content}],
         }
 
         if system:
-            kwargs["system"] = system
+            if cache_system:
+                kwargs["system"] = [{"type": "text", "text": system, "cache_control": cache_control}]
+            else:
+                kwargs["system"] = system
 
-        response = self.client.messages.create(**kwargs)
+        return kwargs
 
+    @staticmethod
+    def _to_response(response) -> LLMResponse:
+        """Anthropic 응답 → LLMResponse"""
+        usage = response.usage
         return LLMResponse(
             content=response.content[0].text,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
             model=response.model,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
         )
+
+    def _get_async_client(self) -> AsyncAnthropicVertex:
+        """현재 이벤트 루프용 비동기 클라이언트 (httpx 커넥션 풀 공유)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncAnthropicVertex(
+                project_id=self.project_id,
+                region=self.region,
+            )
+            self._async_loop = loop
+        return self._async_client
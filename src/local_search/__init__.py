@@ -0,0 +1,29 @@
+"""로컬 검색 모듈
+
+OpenSearch 없이 프로세스 내에서 검색하기 위한 스냅샷/인덱스를 제공합니다.
+"""
+
+from .bm25 import BM25Index
+from .client import LocalSearchClient
+from .fusion import reciprocal_rank_fusion
+from .snapshot import ChunkSnapshot, SnapshotWriter
+from .tokenizer import english_tokens, korean_tokens
+from .vector_index import BruteForceIndex, HNSWIndex, VectorIndex
+
+__all__ = [
+    # Client
+    "LocalSearchClient",
+    # Vector index
+    "VectorIndex",
+    "BruteForceIndex",
+    "HNSWIndex",
+    # Text index
+    "BM25Index",
+    "korean_tokens",
+    "english_tokens",
+    # Fusion
+    "reciprocal_rank_fusion",
+    # Snapshot
+    "ChunkSnapshot",
+    "SnapshotWriter",
+]
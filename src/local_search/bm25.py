@@ -0,0 +1,65 @@
+"""BM25 역색인
+
+Lucene BM25Similarity와 같은 공식을 사용합니다.
+    idf(t)    = ln(1 + (N - df + 0.5) / (df + 0.5))
+    score(d)  = Σ idf(t) · tf / (tf + k1 · (1 - b + b · |d| / avgdl))
+
+문서별 tf 항은 생성 시 미리 계산해 두므로, 검색은 질의어마다 postings 배열에
+idf를 곱해 더하는 것뿐입니다 (수백~수천 청크 기준 수십 µs).
+"""
+
+from collections import Counter
+
+import numpy as np
+
+
+class BM25Index:
+    """단일 필드 BM25 역색인
+
+    Args:
+        documents: 문서별 토큰 리스트 (순서 = 행 번호)
+        k1: tf 포화 계수 (Lucene 기본값 1.2)
+        b: 문서 길이 정규화 계수 (Lucene 기본값 0.75)
+    """
+
+    def __init__(self, documents: list[list[str]], k1: float = 1.2, b: float = 0.75):
+        self.size = len(documents)
+        lengths = np.array([len(tokens) for tokens in documents], dtype=np.float32)
+        avgdl = float(lengths.mean()) if self.size and lengths.sum() else 1.0
+        norms = k1 * (1 - b + b * lengths / avgdl)
+
+        postings: dict[str, tuple[list[int], list[float]]] = {}
+        for row, tokens in enumerate(documents):
+            for term, tf in Counter(tokens).items():
+                rows, weights = postings.setdefault(term, ([], []))
+                rows.append(row)
+                weights.append(tf / (tf + norms[row]))
+
+        # term → (행 번호, idf · tf 항)
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, (rows, weights) in postings.items():
+            idf = np.log(1 + (self.size - len(rows) + 0.5) / (len(rows) + 0.5))
+            self._postings[term] = (
+                np.array(rows, dtype=np.int64),
+                (idf * np.array(weights, dtype=np.float32)).astype(np.float32),
+            )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._postings)
+
+    def scores(self, tokens: list[str]) -> np.ndarray:
+        """질의 토큰 → 문서별 BM25 점수 (N,) (매칭 없는 문서는 0)
+
+        중복 질의어는 Lucene과 같이 그만큼 가중됩니다.
+        """
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term, count in Counter(tokens).items():
+            posting = self._postings.get(term)
+            if posting is not None:
+                rows, weights = posting
+                scores[rows] += count * weights
+        return scores
@@ -0,0 +1,429 @@
+"""로컬 검색 클라이언트 (LocalSearchClient)
+
+ChunkSnapshot 위에서 OpenSearchClient와 같은 인터페이스(search / search_with_pipeline /
+asearch / msearch ...)로 검색합니다. RAGPipeline의 search_client 자리에 그대로 넣으면
+SSH 터널/네트워크 왕복 없이 프로세스 내에서 검색합니다.
+
+지원 쿼리:
+- knn: {"knn": {"embedding": {"vector", "k", "filter", "method_parameters"}}}
+  (method_parameters.ef_search는 HNSW 인덱스에만 적용, rescore는 원본 벡터 검색이라 무시)
+- script_score: knn_score 정확 검색 (space_type l2 / cosinesimil, query는 필터 절)
+- multi_match / match: BM25 (필드 부스트 "chunk_text^4.0" 등, best_fields = 필드별 점수 최댓값)
+- bool: must(점수 절 1개) + filter
+- hybrid: 서브쿼리별 결과를 RRF로 융합 (search_with_pipeline의 pipeline → rank_constant)
+- 필터: term / terms / bool(filter, must) - 숫자 컬럼(project_id, document_id 등)
+
+프로젝트 필터(term project_id)는 프로젝트별 인덱스를 한 번 만들어 재사용합니다.
+- 벡터: 청크 수가 hnsw_threshold 이상이면 HNSWIndex, 미만이면 BruteForceIndex
+- 텍스트: (컬럼, 분석기)별 BM25Index (chunk_text와 text.ko처럼 같은 조합은 공유)
+
+Usage:
+    from src.local_search import LocalSearchClient
+
+    client = LocalSearchClient.from_snapshot("data/snapshots/334")
+    hits = client.search("rag-index-fargate-live", KNNQueryBuilder().build(q, emb, 334), size=5)
+
+    # 하이브리드 (HybridQueryBuilder 쿼리 그대로)
+    hits = client.search_with_pipeline(index, HybridQueryBuilder().build(q, emb, 334), size=20)
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from .bm25 import BM25Index
+from .fusion import DEFAULT_RANK_CONSTANT, PIPELINE_RANK_CONSTANTS, reciprocal_rank_fusion
+from .snapshot import ChunkSnapshot
+from .tokenizer import ANALYZERS
+from .vector_index import BruteForceIndex, HNSWIndex, VectorIndex, l2_score
+
+# knn 쿼리에서 허용하는 벡터 필드명 (스냅샷에는 하나의 임베딩 행렬로 저장됨)
+VECTOR_FIELDS = ("embedding", "embedding_vector")
+
+# 검색 필드 → (스냅샷 문자열 컬럼, 분석기) - OpenSearch 매핑(text.ko=nori, text.en=english) 근사
+FIELD_ANALYZERS = {
+    "chunk_text": ("chunk_text", "korean"),
+    "text": ("text", "korean"),
+    "text.ko": ("text", "korean"),
+    "text.en": ("text", "english"),
+    "file_name": ("file_name", "korean"),
+}
+
+# 캐시하지 않는 후보 집합 키 (project_id 단일 필터/필터 없음 이외)
+_UNCACHED = object()
+
+
+class LocalSearchClient:
+    """스냅샷 기반 프로세스 내 검색 클라이언트
+
+    Args:
+        snapshot: 검색 대상 스냅샷
+        hnsw_threshold: 이 청크 수 이상인 프로젝트는 HNSW 근사 검색 사용
+        hnsw_ef_search: HNSW 검색 탐색 폭
+
+    Note:
+        index 인자는 OpenSearchClient와의 호환을 위해 받기만 하고, 결과 hit의 _index로만 사용합니다.
+        request_timeout도 같은 이유로 받지만 무시합니다.
+    """
+
+    def __init__(
+        self,
+        snapshot: ChunkSnapshot,
+        hnsw_threshold: int = 10_000,
+        hnsw_ef_search: int = 100,
+    ):
+        self.snapshot = snapshot
+        self.hnsw_threshold = hnsw_threshold
+        self.hnsw_ef_search = hnsw_ef_search
+        self._indexes: dict[object, VectorIndex] = {}
+        self._text_indexes: dict[tuple[object, str, str], BM25Index] = {}
+
+    @classmethod
+    def from_snapshot(cls, path: str | Path, **kwargs) -> "LocalSearchClient":
+        """스냅샷 디렉터리에서 생성"""
+        return cls(ChunkSnapshot.open(path), **kwargs)
+
+    # =========================================================================
+    # OpenSearchClient 호환 API
+    # =========================================================================
+
+    def search(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 수행"""
+        return self._run(index, query, size, DEFAULT_RANK_CONSTANT, include_vectors)
+
+    def search_with_pipeline(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        pipeline: str = "hybrid-rrf",
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 파이프라인 사용 검색 (pipeline 이름으로 RRF rank_constant 결정)"""
+        rank_constant = PIPELINE_RANK_CONSTANTS.get(pipeline, DEFAULT_RANK_CONSTANT)
+        return self._run(index, query, size, rank_constant, include_vectors)
+
+    async def asearch(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 수행 (비동기, CPU 작업이 ms 단위라 이벤트 루프에서 바로 실행)"""
+        return self.search(index, query, size, request_timeout, include_vectors)
+
+    async def asearch_with_pipeline(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        pipeline: str = "hybrid-rrf",
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 파이프라인 사용 검색 (비동기)"""
+        return self.search_with_pipeline(index, query, size, pipeline, request_timeout, include_vectors)
+
+    def msearch(
+        self,
+        index: str,
+        entries: list[tuple[dict, int]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """여러 검색 실행 (입력 순서 유지)"""
+        return [self.search(index, query, size, include_vectors=include_vectors) for query, size in entries]
+
+    def msearch_with_pipeline(
+        self,
+        index: str,
+        entries: list[tuple[dict, int, str | None]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """검색 파이프라인별 여러 검색 실행 (입력 순서 유지)"""
+        return [
+            self.search_with_pipeline(index, query, size, pipeline or "", include_vectors=include_vectors)
+            for query, size, pipeline in entries
+        ]
+
+    async def amsearch_with_pipeline(
+        self,
+        index: str,
+        entries: list[tuple[dict, int, str | None]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """검색 파이프라인별 여러 검색 실행 (비동기)"""
+        return self.msearch_with_pipeline(index, entries, request_timeout, include_vectors)
+
+    def get_index_version(self, index: str) -> str:
+        """스냅샷 버전 (답변 캐시 무효화용, 스냅샷을 다시 만들면 바뀜)"""
+        meta = self.snapshot.meta
+        return f"snapshot:{meta['created_at']}:{meta['count']}"
+
+    def get_doc_count_by_project(self, index: str, project_id: int) -> int:
+        """프로젝트 청크 개수"""
+        return int(np.count_nonzero(self.snapshot.project_id == project_id))
+
+    # =========================================================================
+    # 쿼리 실행
+    # =========================================================================
+
+    def _run(self, index: str, query: dict, size: int, rank_constant: int, include_vectors: bool | None) -> list[dict]:
+        """쿼리 실행 → hit 리스트"""
+        rows, scores = self._execute(query.get("query", {"match_all": {}}), size, [], rank_constant)
+        return self._to_hits(index, rows, scores, bool(include_vectors))
+
+    def _execute(
+        self,
+        query: dict,
+        size: int,
+        filters: list[dict],
+        rank_constant: int = DEFAULT_RANK_CONSTANT,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """쿼리 실행 → (행 번호, 점수) 점수 내림차순
+
+        Args:
+            query: 쿼리 절 (query 키 안쪽)
+            size: 최대 반환 개수
+            filters: 상위 bool에서 내려온 필터 절
+            rank_constant: hybrid 쿼리 RRF 상수
+        """
+        (kind, body), *rest = query.items()
+        if rest:
+            raise ValueError(f"쿼리 절은 하나의 키만 가질 수 있습니다: {list(query)}")
+
+        if kind == "knn":
+            return self._knn(body, size, filters)
+        if kind == "script_score":
+            return self._script_score(body, size, filters)
+        if kind in ("multi_match", "match"):
+            return self._text(kind, body, size, filters)
+        if kind == "bool":
+            musts = _as_list(body.get("must"))
+            if len(musts) > 1 or "should" in body or "must_not" in body:
+                raise ValueError("bool 쿼리는 must 절 1개 + filter만 지원합니다")
+            inner = musts[0] if musts else {"match_all": {}}
+            return self._execute(inner, size, [*filters, *_as_list(body.get("filter"))], rank_constant)
+        if kind == "hybrid":
+            return self._hybrid(body["queries"], size, filters, rank_constant)
+        if kind == "match_all":
+            _, rows = self._candidates(_merge_filters(filters))
+            rows = np.arange(len(self.snapshot)) if rows is None else rows
+            return rows[:size], np.ones(min(size, len(rows)), dtype=np.float32)
+        raise ValueError(f"지원하지 않는 쿼리 타입: {kind}")
+
+    def _knn(self, clause: dict, size: int, filters: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+        """knn 쿼리 실행 (k와 size 중 작은 값만큼 반환)"""
+        (field, params), *rest = clause.items()
+        if rest or field not in VECTOR_FIELDS:
+            raise ValueError(f"지원하지 않는 knn 필드: {list(clause)}")
+
+        k = min(params.get("k", size), size)
+        vector = np.asarray(params["vector"], dtype=np.float32)
+        filter_clause = _merge_filters([*filters, *_as_list(params.get("filter"))])
+        index = self._vector_index(filter_clause)
+        ef_search = params.get("method_parameters", {}).get("ef_search")
+        if ef_search and isinstance(index, HNSWIndex):
+            return index.search(vector, k, ef_search=ef_search)
+        return index.search(vector, k)
+
+    def _script_score(self, body: dict, size: int, filters: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+        """script_score(knn_score) 정확 검색 (query 절에 맞는 모든 후보를 점수화)"""
+        script = body["script"]
+        params = script.get("params", {})
+        if script.get("lang") != "knn" or script.get("source") != "knn_score":
+            raise ValueError(f"지원하지 않는 script: {script.get('lang')}/{script.get('source')}")
+        if params.get("field") not in VECTOR_FIELDS:
+            raise ValueError(f"지원하지 않는 knn 필드: {params.get('field')}")
+
+        rows, _ = self._execute(body.get("query", {"match_all": {}}), len(self.snapshot), filters)
+        vector = np.asarray(params["query_value"], dtype=np.float32)
+        vectors = np.asarray(self.snapshot.embeddings[rows], dtype=np.float32)
+
+        space_type = params.get("space_type", "l2")
+        if space_type == "l2":
+            scores = l2_score(((vectors - vector) ** 2).sum(axis=1))
+        elif space_type == "cosinesimil":
+            norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(vector)
+            scores = 1 + (vectors @ vector) / np.where(norms > 0, norms, 1.0)
+        else:
+            raise ValueError(f"지원하지 않는 space_type: {space_type}")
+        return _top(rows, scores.astype(np.float32), size)
+
+    def _text(self, kind: str, body: dict, size: int, filters: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+        """multi_match / match BM25 검색 (best_fields: 필드별 부스트 점수의 최댓값)"""
+        if kind == "multi_match":
+            text = body["query"]
+            fields = [_parse_field(f) for f in body["fields"]]
+        else:
+            (field, value), *_ = body.items()
+            text = value["query"] if isinstance(value, dict) else value
+            fields = [(field, 1.0)]
+
+        key, rows = self._candidates(_merge_filters(filters))
+        scores: np.ndarray | None = None
+        for field, boost in fields:
+            if field not in FIELD_ANALYZERS:
+                raise ValueError(f"검색할 수 없는 필드: {field}")
+            column, analyzer = FIELD_ANALYZERS[field]
+            field_scores = boost * self._text_index(key, rows, column, analyzer).scores(ANALYZERS[analyzer](text))
+            scores = field_scores if scores is None else np.maximum(scores, field_scores)
+
+        if scores is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return _top(np.arange(len(scores)) if rows is None else rows, scores, size)
+
+    def _hybrid(
+        self,
+        queries: list[dict],
+        size: int,
+        filters: list[dict],
+        rank_constant: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """서브쿼리 결과 RRF 융합"""
+        rankings = [self._execute(query, size, filters)[0].tolist() for query in queries]
+        fused = reciprocal_rank_fusion(rankings, rank_constant=rank_constant)[:size]
+        rows = np.array([row for row, _ in fused], dtype=np.int64)
+        return rows, np.array([score for _, score in fused], dtype=np.float32)
+
+    def _candidates(self, filter_clause: dict | None) -> tuple[object, np.ndarray | None]:
+        """필터 → (캐시 키, 후보 행 번호)
+
+        필터 없음은 (None, None), 단일 project_id 필터는 (project_id, 행),
+        그 외 필터는 (_UNCACHED, 행)입니다.
+        """
+        if filter_clause is None:
+            return None, None
+        project_id = self._project_filter(filter_clause)
+        if project_id is not None:
+            return project_id, np.flatnonzero(self.snapshot.project_id == project_id)
+        return _UNCACHED, np.flatnonzero(self._filter_mask(filter_clause))
+
+    def _vector_index(self, filter_clause: dict | None) -> VectorIndex:
+        """필터에 맞는 벡터 인덱스
+
+        필터 없음 / 단일 project_id 필터는 인덱스를 캐시하고, 그 외 필터는 매번 정확 검색합니다.
+        """
+        key, rows = self._candidates(filter_clause)
+        if key is _UNCACHED:
+            return BruteForceIndex(self.snapshot.embeddings, rows)
+
+        index = self._indexes.get(key)
+        if index is None:
+            size = len(self.snapshot) if rows is None else len(rows)
+            if size >= self.hnsw_threshold:
+                index = HNSWIndex(self.snapshot.embeddings, rows, ef_search=self.hnsw_ef_search)
+            else:
+                index = BruteForceIndex(self.snapshot.embeddings, rows)
+            self._indexes[key] = index
+        return index
+
+    def _text_index(self, key: object, rows: np.ndarray | None, column: str, analyzer: str) -> BM25Index:
+        """후보 행의 (컬럼, 분석기) BM25 인덱스 (캐시 키가 있으면 재사용)"""
+        cache_key = (key, column, analyzer)
+        if key is not _UNCACHED and cache_key in self._text_indexes:
+            return self._text_indexes[cache_key]
+
+        tokenize = ANALYZERS[analyzer]
+        row_ids = range(len(self.snapshot)) if rows is None else rows.tolist()
+        index = BM25Index([tokenize(self.snapshot.string(column, row)) for row in row_ids])
+        if key is not _UNCACHED:
+            self._text_indexes[cache_key] = index
+        return index
+
+    @staticmethod
+    def _project_filter(filter_clause: dict | None) -> int | None:
+        """{"term": {"project_id": X}} 형태면 X"""
+        if not filter_clause or list(filter_clause) != ["term"]:
+            return None
+        term = filter_clause["term"]
+        if list(term) != ["project_id"]:
+            return None
+        value = term["project_id"]
+        return int(value["value"] if isinstance(value, dict) else value)
+
+    def _filter_mask(self, clause: dict | list) -> np.ndarray:
+        """필터 → 행 마스크 (term / terms / bool)"""
+        if isinstance(clause, list):
+            mask = np.ones(len(self.snapshot), dtype=bool)
+            for item in clause:
+                mask &= self._filter_mask(item)
+            return mask
+
+        (kind, body), *rest = clause.items()
+        if rest:
+            raise ValueError(f"필터 절은 하나의 키만 가질 수 있습니다: {list(clause)}")
+
+        if kind == "term":
+            (field, value), *_ = body.items()
+            value = value["value"] if isinstance(value, dict) else value
+            return self._column(field) == int(value)
+        if kind == "terms":
+            (field, values), *_ = body.items()
+            return np.isin(self._column(field), [int(v) for v in values])
+        if kind == "bool":
+            mask = np.ones(len(self.snapshot), dtype=bool)
+            for key in ("filter", "must"):
+                if key in body:
+                    mask &= self._filter_mask(body[key])
+            return mask
+        raise ValueError(f"지원하지 않는 필터: {kind}")
+
+    def _column(self, field: str) -> np.ndarray:
+        """숫자 컬럼 (필터용)"""
+        if field not in self.snapshot.meta["numeric_columns"]:
+            raise ValueError(f"필터할 수 없는 필드: {field}")
+        return getattr(self.snapshot, field)
+
+    def _to_hits(self, index: str, rows: np.ndarray, scores: np.ndarray, include_vectors: bool) -> list[dict]:
+        """(행 번호, 점수) → OpenSearch hit 리스트"""
+        hits = []
+        for row, score in zip(rows.tolist(), scores.tolist()):
+            hit = {"_index": index, **self.snapshot.to_hit(row, score=score)}
+            if include_vectors:
+                hit["_source"]["embedding"] = self.snapshot.embeddings[row].astype(np.float32).tolist()
+            hits.append(hit)
+        return hits
+
+
+def _as_list(value: dict | list | None) -> list[dict]:
+    """단일 절 / 절 리스트 / None → 리스트"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _merge_filters(filters: list[dict]) -> dict | None:
+    """필터 절 리스트 → 단일 필터 절 (없으면 None)"""
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return {"bool": {"filter": filters}}
+
+
+def _parse_field(spec: str) -> tuple[str, float]:
+    """ "chunk_text^4.0" → ("chunk_text", 4.0)"""
+    field, _, boost = spec.partition("^")
+    return field, float(boost) if boost else 1.0
+
+
+def _top(rows: np.ndarray, scores: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """점수 > 0인 상위 size개 (점수 내림차순, 동점은 행 번호 순)"""
+    matched = np.flatnonzero(scores > 0)
+    if len(matched) > size:
+        matched = matched[np.argpartition(-scores[matched], size - 1)[:size]]
+    order = matched[np.lexsort((matched, -scores[matched]))]
+    return rows[order], scores[order]
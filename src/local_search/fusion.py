@@ -0,0 +1,47 @@
+"""검색 결과 융합 (Fusion)
+
+여러 검색 결과 순위를 하나로 합칩니다. OpenSearch score-ranker-processor(RRF)와 같은 공식입니다.
+    rrf(d) = Σ weight_i / (rank_constant + rank_i(d))    (rank는 1부터)
+
+Usage:
+    fused = reciprocal_rank_fusion([bm25_ids, knn_ids], rank_constant=60)
+    # [(id, score), ...] 점수 내림차순
+"""
+
+from collections.abc import Hashable, Sequence
+
+# 검색 파이프라인 이름 → RRF rank_constant (클러스터 설정과 동일하게 유지)
+PIPELINE_RANK_CONSTANTS = {
+    "hybrid-rrf": 60,
+    "hybrid-rrf-tuned": 20,
+}
+
+DEFAULT_RANK_CONSTANT = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    rank_constant: int = DEFAULT_RANK_CONSTANT,
+    weights: Sequence[float] | None = None,
+) -> list[tuple[Hashable, float]]:
+    """RRF 융합
+
+    Args:
+        rankings: 검색 결과별 키(행 번호, _id 등) 리스트, 각각 순위 순
+        rank_constant: 하위 순위 감쇠 상수 (작을수록 상위 순위 비중 ↑)
+        weights: 검색 결과별 가중치 (None이면 모두 1.0)
+
+    Returns:
+        [(키, 점수), ...] 점수 내림차순 (동점은 먼저 등장한 순서)
+    """
+    if weights is None:
+        weights = [1.0] * len(rankings)
+    if len(weights) != len(rankings):
+        raise ValueError(f"weights 길이({len(weights)})가 rankings 길이({len(rankings)})와 다릅니다")
+
+    scores: dict[Hashable, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + weight / (rank_constant + rank)
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,272 @@
+"""청크 스냅샷 (컬럼형 + mmap)
+
+OpenSearch 청크를 로컬에서 빠르게 열 수 있는 바이너리 디렉터리 형식으로 저장합니다.
+JSON 파싱 없이 np.load(mmap_mode="r")로 열기 때문에 로드가 수 ms이고,
+실제로 접근한 페이지만 메모리에 올라갑니다.
+
+디렉터리 구조:
+    meta.json               버전, 청크 수, 차원, dtype, 컬럼 목록
+    embeddings.npy          (N, D) float32 | float16 임베딩 행렬
+    <숫자 컬럼>.npy          (N,) int64 - document_id, chunk_index, page_number, project_id
+    <문자열 컬럼>.bin        UTF-8 바이트 연결 - id, text, chunk_text, file_name
+    <문자열 컬럼>.offsets.npy (N+1,) int64 - i번째 값 = bin[offsets[i]:offsets[i+1]]
+
+Usage:
+    from src.local_search.snapshot import ChunkSnapshot, SnapshotWriter
+
+    # 쓰기 (스트리밍, 메모리 사용량 일정)
+    with SnapshotWriter("data/snapshots/334", dimensions=1024) as writer:
+        for hit in client.iter_docs_by_project(index, 334, include_vectors=True):
+            writer.add_hit(hit)
+
+    # 읽기 (zero-copy)
+    snapshot = ChunkSnapshot.open("data/snapshots/334")
+    snapshot.embeddings.shape   # (78, 1024), np.memmap
+    snapshot.text(0)            # 첫 청크 본문
+    snapshot.to_hit(0)          # OpenSearch hit 형식 {"_id", "_source": {...}}
+"""
+
+import json
+import mmap
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+# 숫자 컬럼 (_source 필드명, 값이 없으면 -1)
+NUMERIC_COLUMNS = ["document_id", "chunk_index", "page_number", "project_id"]
+
+# 문자열 컬럼 (id는 OpenSearch _id, 나머지는 _source 필드명)
+STRING_COLUMNS = ["id", "text", "chunk_text", "file_name"]
+
+# _source에서 임베딩을 찾을 필드 (순서대로)
+EMBEDDING_FIELDS = ["embedding", "embedding_vector"]
+
+
+class SnapshotWriter:
+    """스냅샷 스트리밍 작성기
+
+    임베딩은 임시 raw 파일에 이어 쓰고, close() 시 .npy로 변환합니다.
+    청크 수를 미리 몰라도 되고, 메모리에는 숫자 컬럼/오프셋(청크당 수십 바이트)만 유지합니다.
+
+    Args:
+        path: 스냅샷 디렉터리
+        dimensions: 임베딩 차원
+        dtype: 임베딩 저장 타입 ("float32" | "float16", float16은 용량 절반)
+        source: 출처 설명 (meta.json에 기록, 예: 인덱스명)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        dimensions: int = 1024,
+        dtype: str = "float32",
+        source: str = "",
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError("dtype은 float32 또는 float16이어야 합니다")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dimensions = dimensions
+        self.dtype = np.dtype(dtype)
+        self.source = source
+        self.count = 0
+
+        self._raw_path = self.path / "embeddings.raw.tmp"
+        self._raw = open(self._raw_path, "wb")
+        self._numeric = {name: array("q") for name in NUMERIC_COLUMNS}
+        self._blobs = {name: open(self.path / f"{name}.bin", "wb") for name in STRING_COLUMNS}
+        self._offsets = {name: array("q", [0]) for name in STRING_COLUMNS}
+
+    def add(self, chunk_id: str, source: dict, embedding: list[float] | np.ndarray) -> None:
+        """청크 1개 추가
+
+        Args:
+            chunk_id: OpenSearch _id
+            source: _source 딕셔너리
+            embedding: 임베딩 벡터
+        """
+        vector = np.asarray(embedding, dtype=self.dtype)
+        if vector.shape != (self.dimensions,):
+            raise ValueError(f"임베딩 차원 불일치: {vector.shape} (기대값: {self.dimensions})")
+        self._raw.write(vector.tobytes())
+
+        for name in NUMERIC_COLUMNS:
+            value = source.get(name)
+            self._numeric[name].append(int(value) if value is not None else -1)
+
+        values = {"id": chunk_id, **{name: source.get(name) or "" for name in STRING_COLUMNS if name != "id"}}
+        for name in STRING_COLUMNS:
+            data = str(values[name]).encode("utf-8")
+            self._blobs[name].write(data)
+            self._offsets[name].append(self._offsets[name][-1] + len(data))
+
+        self.count += 1
+
+    def add_hit(self, hit: dict) -> None:
+        """OpenSearch hit 추가 (include_vectors=True로 조회한 결과)"""
+        source = hit["_source"]
+        embedding = next((source[f] for f in EMBEDDING_FIELDS if source.get(f)), None)
+        if embedding is None:
+            raise ValueError(f"임베딩 필드 없음: {hit.get('_id')} (include_vectors=True로 조회 필요)")
+        self.add(hit["_id"], source, embedding)
+
+    def close(self) -> Path:
+        """파일 마무리 (.npy 변환 + meta.json 기록)
+
+        Returns:
+            스냅샷 디렉터리 경로
+        """
+        self._raw.close()
+        for blob in self._blobs.values():
+            blob.close()
+
+        # raw → .npy (청크 단위 복사로 메모리 사용량 제한)
+        matrix = np.lib.format.open_memmap(
+            self.path / "embeddings.npy", mode="w+", dtype=self.dtype, shape=(self.count, self.dimensions)
+        )
+        if self.count:
+            raw = np.memmap(self._raw_path, dtype=self.dtype, mode="r", shape=(self.count, self.dimensions))
+            step = 65_536
+            for start in range(0, self.count, step):
+                matrix[start : start + step] = raw[start : start + step]
+            del raw
+        matrix.flush()
+        del matrix
+        self._raw_path.unlink()
+
+        for name, values in self._numeric.items():
+            np.save(self.path / f"{name}.npy", np.frombuffer(values, dtype=np.int64))
+        for name, offsets in self._offsets.items():
+            np.save(self.path / f"{name}.offsets.npy", np.frombuffer(offsets, dtype=np.int64))
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "count": self.count,
+            "dimensions": self.dimensions,
+            "dtype": self.dtype.name,
+            "numeric_columns": NUMERIC_COLUMNS,
+            "string_columns": STRING_COLUMNS,
+            "source": self.source,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        (self.path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        return self.path
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._raw.close()
+            for blob in self._blobs.values():
+                blob.close()
+
+
+class _StringColumn:
+    """mmap 기반 문자열 컬럼 (접근 시에만 디코딩)"""
+
+    def __init__(self, blob_path: Path, offsets: np.ndarray):
+        self.offsets = offsets
+        self._file = open(blob_path, "rb")
+        # 빈 파일은 mmap 불가
+        self._data: mmap.mmap | bytes = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] > 0 else b""
+        )
+
+    def __getitem__(self, i: int) -> str:
+        return self._data[self.offsets[i] : self.offsets[i + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+
+class ChunkSnapshot:
+    """스냅샷 읽기 (zero-copy)
+
+    embeddings와 숫자 컬럼은 np.memmap(읽기 전용), 문자열은 mmap 슬라이스로 제공합니다.
+    open()은 파일 헤더만 읽으므로 청크 수와 무관하게 수 ms 안에 끝납니다.
+
+    Attributes:
+        embeddings: (N, D) 임베딩 행렬
+        document_id, chunk_index, page_number, project_id: (N,) int64 컬럼 (없는 값은 -1)
+    """
+
+    def __init__(self, path: Path, meta: dict):
+        self.path = path
+        self.meta = meta
+        self.embeddings: np.ndarray = np.load(path / "embeddings.npy", mmap_mode="r")
+
+        self._numeric = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in meta["numeric_columns"]}
+        self._strings = {
+            name: _StringColumn(path / f"{name}.bin", np.load(path / f"{name}.offsets.npy", mmap_mode="r"))
+            for name in meta["string_columns"]
+        }
+
+    @classmethod
+    def open(cls, path: str | Path) -> "ChunkSnapshot":
+        """스냅샷 열기"""
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {meta.get('version')}")
+        return cls(path, meta)
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def dimensions(self) -> int:
+        return self.meta["dimensions"]
+
+    @property
+    def document_id(self) -> np.ndarray:
+        return self._numeric["document_id"]
+
+    @property
+    def chunk_index(self) -> np.ndarray:
+        return self._numeric["chunk_index"]
+
+    @property
+    def page_number(self) -> np.ndarray:
+        return self._numeric["page_number"]
+
+    @property
+    def project_id(self) -> np.ndarray:
+        return self._numeric["project_id"]
+
+    def id(self, i: int) -> str:
+        """i번째 청크의 OpenSearch _id"""
+        return self._strings["id"][i]
+
+    def text(self, i: int) -> str:
+        """i번째 청크 본문"""
+        return self._strings["text"][i]
+
+    def string(self, column: str, i: int) -> str:
+        """문자열 컬럼 값"""
+        return self._strings[column][i]
+
+    def to_hit(self, i: int, score: float = 0.0) -> dict:
+        """OpenSearch 검색 hit 형식으로 변환 (벡터 제외)"""
+        source: dict = {name: self._strings[name][i] for name in self.meta["string_columns"] if name != "id"}
+        for name, column in self._numeric.items():
+            value = int(column[i])
+            source[name] = value if value >= 0 else None
+        return {"_id": self.id(i), "_score": score, "_source": source}
+
+    def close(self) -> None:
+        """mmap 해제"""
+        for column in self._strings.values():
+            column.close()
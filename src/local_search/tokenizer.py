@@ -0,0 +1,65 @@
+"""토크나이저 (로컬 BM25용)
+
+OpenSearch 인덱스 분석기를 근사합니다.
+- korean_tokens: Nori 대체. 한글 연속 구간은 문자 bigram, 영문/숫자는 단어 단위.
+  형태소 분석 없이도 "휴가는" ↔ "휴가" 같은 조사/어미 변형이 bigram "휴가"로 매칭됩니다.
+- english_tokens: english 분석기 대체. 영문/숫자 단어만, 불용어 제거 + 간단한 복수형 처리.
+
+Usage:
+    korean_tokens("연차 휴가는 며칠?")  # ["연차", "휴가", "가는", "며칠"]
+    english_tokens("The Pricing plans")   # ["pricing", "plan"]
+"""
+
+import re
+import unicodedata
+
+# 한글 음절 / 영문·숫자 연속 구간
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+")
+_LATIN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Lucene EnglishAnalyzer 기본 불용어
+ENGLISH_STOPWORDS = frozenset(
+    "a an and are as at be but by for if in into is it no not of on or such "
+    "that the their then there these they this to was will with".split()
+)
+
+
+def _normalize(text: str) -> str:
+    """NFKC 정규화 + 소문자 (전각 문자/호환 자모 통일)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def korean_tokens(text: str, ngram: int = 2) -> list[str]:
+    """한글 n-gram + 영문/숫자 단어 토큰
+
+    Args:
+        text: 입력 텍스트
+        ngram: 한글 n-gram 크기 (n보다 짧은 구간은 그대로 1개 토큰)
+    """
+    tokens: list[str] = []
+    for match in _TOKEN_PATTERN.finditer(_normalize(text)):
+        run = match.group()
+        if not ("가" <= run[0] <= "힣") or len(run) <= ngram:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + ngram] for i in range(len(run) - ngram + 1))
+    return tokens
+
+
+def english_tokens(text: str) -> list[str]:
+    """영문/숫자 단어 토큰 (불용어 제거, 복수형 s 제거)"""
+    tokens: list[str] = []
+    for word in _LATIN_PATTERN.findall(_normalize(text)):
+        if word in ENGLISH_STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+# 분석기 이름 → 토크나이저 (필드 매핑은 LocalSearchClient.FIELD_ANALYZERS)
+ANALYZERS = {
+    "korean": korean_tokens,
+    "english": english_tokens,
+}
@@ -0,0 +1,126 @@
+"""벡터 인덱스 (정확 검색 / HNSW 근사 검색)
+
+ChunkSnapshot 임베딩 행렬 위에서 동작하는 프로세스 내 KNN 인덱스입니다.
+점수는 OpenSearch 인덱스 설정(lucene, l2)과 같은 1 / (1 + L2²)를 사용하므로
+원격 검색 결과와 점수 스케일이 같습니다 (min_score 필터 등 그대로 사용 가능).
+
+구현체:
+- BruteForceIndex: NumPy 행렬곱 정확 검색 (소규모 프로젝트, 수만 청크까지 수 ms)
+- HNSWIndex: hnswlib 근사 검색 (대규모 프로젝트, 선택 의존성)
+"""
+
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+
+def l2_score(squared_distances: np.ndarray) -> np.ndarray:
+    """L2² 거리 → OpenSearch l2 점수 (1 / (1 + d²))"""
+    return 1.0 / (1.0 + np.maximum(squared_distances, 0.0))
+
+
+@runtime_checkable
+class VectorIndex(Protocol):
+    """벡터 인덱스 프로토콜"""
+
+    def search(self, vector: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """최근접 k개 검색
+
+        Args:
+            vector: (D,) 쿼리 벡터
+            k: 반환 개수
+
+        Returns:
+            (행 번호, 점수) - 점수 내림차순, 행 번호는 생성 시 전달한 rows 기준
+        """
+        ...
+
+
+class BruteForceIndex:
+    """NumPy 정확 검색
+
+    ||q - x||² = ||q||² + ||x||² - 2·q·x 로 계산하며, ||x||²는 생성 시 미리 계산합니다.
+    float32 memmap은 복사 없이 그대로 사용하고, float16은 한 번만 float32로 변환합니다.
+
+    Args:
+        embeddings: (N, D) 전체 임베딩 행렬
+        rows: 이 인덱스가 담당할 행 번호 (None이면 전체)
+    """
+
+    def __init__(self, embeddings: np.ndarray, rows: np.ndarray | None = None):
+        if rows is not None:
+            embeddings = embeddings[rows]
+        self.rows = rows if rows is not None else np.arange(len(embeddings))
+        self.vectors = np.asarray(embeddings, dtype=np.float32)
+        self.norms = np.einsum("ij,ij->i", self.vectors, self.vectors)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, vector: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        if len(self.rows) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = np.asarray(vector, dtype=np.float32)
+        distances = self.norms - 2.0 * (self.vectors @ query) + float(query @ query)
+
+        k = min(k, len(distances))
+        top = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+        top = top[np.argsort(distances[top], kind="stable")]
+        return self.rows[top], l2_score(distances[top])
+
+
+class HNSWIndex:
+    """hnswlib 기반 근사 검색 (대규모 프로젝트용)
+
+    Usage:
+        pip install hnswlib
+
+    Args:
+        embeddings: (N, D) 전체 임베딩 행렬
+        rows: 이 인덱스가 담당할 행 번호 (None이면 전체)
+        m: 그래프 연결 수 (OpenSearch 기본값 16)
+        ef_construction: 생성 시 탐색 폭
+        ef_search: 검색 시 탐색 폭 (k보다 작으면 k 사용)
+
+    Note:
+        hnswlib 패키지가 없으면 ImportError 발생.
+        lazy import로 BruteForceIndex는 의존성 없이 사용 가능.
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        rows: np.ndarray | None = None,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 100,
+    ):
+        try:
+            import hnswlib  # pyright: ignore[reportMissingImports]
+        except ImportError as e:
+            raise ImportError("hnswlib 패키지가 필요합니다. pip install hnswlib 로 설치하세요.") from e
+
+        if rows is not None:
+            embeddings = embeddings[rows]
+        self.rows = rows if rows is not None else np.arange(len(embeddings))
+        self.ef_search = ef_search
+
+        self._index = hnswlib.Index(space="l2", dim=embeddings.shape[1])
+        self._index.init_index(max_elements=max(len(self.rows), 1), M=m, ef_construction=ef_construction)
+        if len(self.rows):
+            self._index.add_items(np.asarray(embeddings, dtype=np.float32), np.arange(len(self.rows)))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, vector: np.ndarray, k: int, ef_search: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """최근접 k개 검색 (ef_search를 주면 이번 검색만 탐색 폭 변경)"""
+        k = min(k, len(self.rows))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        self._index.set_ef(max(ef_search or self.ef_search, k))
+        labels, distances = self._index.knn_query(np.asarray(vector, dtype=np.float32), k=k)
+        # hnswlib l2 공간은 제곱 거리를 반환
+        return self.rows[labels[0].astype(np.int64)], l2_score(distances[0])
@@ -1,16 +1,112 @@
 """OpenSearch 클라이언트 모듈"""
 
+import asyncio
 import os
 import warnings
+from collections.abc import Iterable, Iterator
+from typing import Literal
 
 import urllib3
 from dotenv import load_dotenv
-from opensearchpy import OpenSearch, RequestsHttpConnection
+from opensearchpy import (
+    AsyncHttpConnection,
+    AsyncOpenSearch,
+    OpenSearch,
+    RequestsHttpConnection,
+    Urllib3HttpConnection,
+    helpers,
+)
 
 # SSL 경고 숨기기 (터널 환경에서 정상)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 warnings.filterwarnings("ignore", message=".*verify_certs=False.*")
 
+Transport = Literal["requests", "urllib3"]
+
+# 전송 계층별 커넥션 클래스
+CONNECTION_CLASSES = {
+    "requests": RequestsHttpConnection,
+    "urllib3": Urllib3HttpConnection,
+}
+
+# 검색 응답에 포함할 _source 필드 (allow-list)
+# 청크 텍스트 + 출처 표시/이웃 청크 확장/필터에 쓰는 메타데이터만 가져옴
+SOURCE_FIELDS = [
+    "text",
+    "chunk_text",
+    "content",
+    "file_name",
+    "original_filename",
+    "file_type",
+    "page_number",
+    "document_id",
+    "chunk_index",
+    "project_id",
+]
+
+# 벡터 필드 (1024 float, 문서당 JSON ~20KB) - include_vectors=True일 때만 포함
+VECTOR_FIELDS = ["embedding", "embedding_vector"]
+
+# 전체 조회(PIT + search_after) 정렬 기준 - (document_id, chunk_index) 순서 + PIT 내 유일한 _shard_doc
+# (document_id 누락/중복 청크가 있어도 페이지 경계에서 hit가 누락/중복되지 않음)
+PIT_TIEBREAKER = {"_shard_doc": "asc"}
+EXPORT_SORT = [{"document_id": "asc"}, {"chunk_index": "asc"}, PIT_TIEBREAKER]
+
+# 프로젝트 라우팅 키 (cli.py reindex --route-by-project로 색인한 인덱스)
+ROUTING_FIELD = "project_id"
+
+
+def _as_list(value) -> list:
+    """단일 절 / 절 리스트 / None → 리스트"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _required_projects(clause) -> set[str] | None:
+    """쿼리가 반드시 만족해야 하는 project_id 집합 (제약 없으면 None)
+
+    bool의 filter/must, knn filter, script_score query는 AND(교집합),
+    hybrid 서브쿼리는 OR(합집합, 하나라도 제약이 없으면 None)로 계산합니다.
+    should/must_not 안의 project_id 조건은 필수 조건이 아니므로 무시합니다.
+    """
+    if not isinstance(clause, dict) or len(clause) != 1:
+        return None
+    ((kind, body),) = clause.items()
+    if not isinstance(body, dict):
+        return None
+
+    if kind == "term" and ROUTING_FIELD in body:
+        value = body[ROUTING_FIELD]
+        return {str(value["value"] if isinstance(value, dict) else value)}
+    if kind == "terms" and ROUTING_FIELD in body:
+        return {str(value) for value in body[ROUTING_FIELD]}
+    if kind == "bool":
+        children = [_required_projects(c) for c in [*_as_list(body.get("filter")), *_as_list(body.get("must"))]]
+        constrained = [c for c in children if c is not None]
+        return set.intersection(*constrained) if constrained else None
+    if kind == "knn" and len(body) == 1:
+        ((_, params),) = body.items()
+        return _required_projects(params.get("filter")) if isinstance(params, dict) else None
+    if kind == "script_score":
+        return _required_projects(body.get("query"))
+    if kind == "hybrid":
+        subqueries = [_required_projects(q) for q in body.get("queries", [])]
+        if not subqueries or any(s is None for s in subqueries):
+            return None
+        return set().union(*subqueries)
+    return None
+
+
+def project_routing(query: dict) -> str | None:
+    """검색 쿼리 → routing 값 (필수 project_id 조건이 없으면 None)
+
+    {"query": {"knn": {"embedding": {"filter": {"term": {"project_id": 334}}}}}} → "334"
+    여러 프로젝트면 쉼표로 연결합니다 (해당 샤드들만 검색).
+    """
+    projects = _required_projects(query.get("query"))
+    return ",".join(sorted(projects)) if projects else None
+
 
 class OpenSearchClient:
     def __init__(
@@ -19,7 +115,38 @@ class OpenSearchClient:
         port: int = 9443,
         username: str | None = None,
         password: str | None = None,
+        transport: Transport | None = None,
+        pool_maxsize: int | None = None,
+        keep_alive: bool = True,
+        http_compress: bool | None = None,
+        timeout: float = 10.0,
+        source_fields: list[str] | None = SOURCE_FIELDS,
+        include_vectors: bool = False,
+        use_ssl: bool = True,
+        project_routing: bool | None = None,
     ):
+        """
+        Args:
+            host: OpenSearch 호스트 (터널 사용 시 localhost)
+            port: 포트
+            username: 사용자명 (기본: OPENSEARCH_USERNAME)
+            password: 비밀번호 (기본: OPENSEARCH_PASSWORD)
+            transport: HTTP 전송 계층 "requests" | "urllib3" (기본: OPENSEARCH_TRANSPORT 또는 requests)
+            pool_maxsize: 호스트당 유지할 커넥션 수 (기본: OPENSEARCH_POOL_MAXSIZE 또는 10).
+                동시 검색 수보다 작으면 초과 요청마다 새 TLS 연결을 맺고 버림
+            keep_alive: False면 요청마다 연결 종료 (Connection: close, 비교용)
+            http_compress: 요청 gzip 압축 + 응답 압축 요청 (기본: OPENSEARCH_HTTP_COMPRESS 또는 False).
+                KNN 벡터(1024 float JSON) 요청/대용량 응답의 전송량 감소, 원격 연결에서 유리
+            timeout: 요청 기본 타임아웃 (초, 메서드별 request_timeout으로 덮어쓰기 가능)
+            source_fields: 검색 응답 _source allow-list (None이면 벡터를 제외한 전체 필드)
+            include_vectors: 기본적으로 벡터 필드 포함 여부 (메서드별 include_vectors로 덮어쓰기 가능)
+            use_ssl: HTTPS 사용 (보안 플러그인을 끈 로컬 단일 노드는 False, 예: port=9200)
+            project_routing: 쿼리의 project_id 조건으로 routing 지정 여부.
+                None이면 인덱스 매핑의 _routing.required로 자동 판단 (인덱스별 1회 조회 후 캐시).
+                project_id 라우팅 인덱스는 해당 프로젝트 샤드 1개만 검색합니다.
+
+        쿼리에 "_source"가 직접 지정되어 있으면 그대로 사용합니다.
+        """
         load_dotenv()
 
         self.host = host
@@ -27,14 +154,38 @@ class OpenSearchClient:
         self.username = username or os.getenv("OPENSEARCH_USERNAME")
         self.password = password or os.getenv("OPENSEARCH_PASSWORD")
 
+        self.transport = transport or os.getenv("OPENSEARCH_TRANSPORT", "requests")
+        if self.transport not in CONNECTION_CLASSES:
+            raise ValueError(f"지원하지 않는 transport: {self.transport} (requests | urllib3)")
+        self.pool_maxsize = pool_maxsize or int(os.getenv("OPENSEARCH_POOL_MAXSIZE", "10"))
+        self.keep_alive = keep_alive
+        if http_compress is None:
+            http_compress = os.getenv("OPENSEARCH_HTTP_COMPRESS", "").lower() in ("1", "true", "yes")
+        self.http_compress = http_compress
+        self.timeout = timeout
+        self.source_fields = source_fields
+        self.include_vectors = include_vectors
+        self.use_ssl = use_ssl
+        self.project_routing = project_routing
+        self._routed_indices: dict[str, bool] = {}
+
         self.client = OpenSearch(
             hosts=[{"host": self.host, "port": self.port}],
-            http_auth=(self.username, self.password),
-            use_ssl=True,
+            http_auth=(self.username, self.password) if self.username else None,
+            use_ssl=self.use_ssl,
             verify_certs=False,
-            connection_class=RequestsHttpConnection,
+            ssl_show_warn=False,
+            connection_class=CONNECTION_CLASSES[self.transport],
+            pool_maxsize=self.pool_maxsize,
+            http_compress=self.http_compress,
+            timeout=self.timeout,
+            headers=None if self.keep_alive else {"Connection": "close"},
         )
 
+        # 비동기 클라이언트 (asearch 첫 호출 시 생성, 이벤트 루프별 1개)
+        self._async_client: AsyncOpenSearch | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
     def get_info(self) -> dict:
         """클러스터 정보 반환"""
         return self.client.info()
@@ -43,12 +194,20 @@ class OpenSearchClient:
         """인덱스 목록 반환"""
         return self.client.cat.indices(format="json")  # type: ignore[call-arg]
 
-    def search(self, index: str, query: dict, size: int = 5) -> list[dict]:
+    def search(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
         """검색 수행"""
         response = self.client.search(
             index=index,
-            body=query,
+            body=self._with_source(query, include_vectors),
             size=size,  # type: ignore[call-arg]
+            params={**self._routing_params(index, query), **self._request_params(request_timeout)},
         )
         return response["hits"]["hits"]
 
@@ -58,16 +217,283 @@ class OpenSearchClient:
         query: dict,
         size: int = 5,
         pipeline: str = "hybrid-rrf",
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
     ) -> list[dict]:
         """검색 파이프라인 사용 검색 (하이브리드 RRF 등)"""
         response = self.client.search(
             index=index,
-            body=query,
+            body=self._with_source(query, include_vectors),
+            size=size,  # type: ignore[call-arg]
+            params={
+                "search_pipeline": pipeline,
+                **self._routing_params(index, query),
+                **self._request_params(request_timeout),
+            },
+        )
+        return response["hits"]["hits"]
+
+    async def asearch(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 수행 (비동기)"""
+        client = self._get_async_client()
+        response = await client.search(
+            index=index,
+            body=self._with_source(query, include_vectors),
             size=size,  # type: ignore[call-arg]
-            params={"search_pipeline": pipeline},
+            params={**await self._arouting_params(index, query), **self._request_params(request_timeout)},
         )
         return response["hits"]["hits"]
 
+    async def asearch_with_pipeline(
+        self,
+        index: str,
+        query: dict,
+        size: int = 5,
+        pipeline: str = "hybrid-rrf",
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """검색 파이프라인 사용 검색 (비동기)"""
+        client = self._get_async_client()
+        response = await client.search(
+            index=index,
+            body=self._with_source(query, include_vectors),
+            size=size,  # type: ignore[call-arg]
+            params={
+                "search_pipeline": pipeline,
+                **await self._arouting_params(index, query),
+                **self._request_params(request_timeout),
+            },
+        )
+        return response["hits"]["hits"]
+
+    def msearch(
+        self,
+        index: str,
+        entries: list[tuple[dict, int]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """여러 검색을 _msearch 한 번으로 실행
+
+        Args:
+            index: 인덱스명
+            entries: [(query, size), ...]
+            request_timeout: 요청 타임아웃 (초)
+            include_vectors: 벡터 필드 포함 여부 (None이면 생성자 설정)
+
+        Returns:
+            입력 순서와 동일한 hit 리스트의 리스트
+        """
+        return self.msearch_with_pipeline(
+            index, [(query, size, None) for query, size in entries], request_timeout, include_vectors
+        )
+
+    def msearch_with_pipeline(
+        self,
+        index: str,
+        entries: list[tuple[dict, int, str | None]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """검색 파이프라인별 _msearch 실행
+
+        search_pipeline은 _msearch URL 파라미터라 요청 전체에 적용되므로,
+        같은 파이프라인끼리 묶어 파이프라인 종류당 한 번씩 호출합니다.
+        (보통은 모두 같은 파이프라인이므로 1회 왕복)
+
+        Args:
+            index: 인덱스명
+            entries: [(query, size, pipeline | None), ...]
+            request_timeout: 요청 타임아웃 (초)
+            include_vectors: 벡터 필드 포함 여부 (None이면 생성자 설정)
+
+        Returns:
+            입력 순서와 동일한 hit 리스트의 리스트
+
+        Raises:
+            RuntimeError: 개별 검색이 실패한 경우 (실패한 항목 인덱스 포함)
+        """
+        results: list[list[dict]] = [[] for _ in entries]
+
+        for pipeline, positions in self._group_by_pipeline(entries).items():
+            params = self._request_params(request_timeout)
+            if pipeline:
+                params["search_pipeline"] = pipeline
+
+            body = self._msearch_body(index, [entries[i] for i in positions], include_vectors, self._is_routed(index))
+            response = self.client.msearch(body=body, params=params)
+            self._collect_msearch(response, positions, results)
+
+        return results
+
+    async def amsearch_with_pipeline(
+        self,
+        index: str,
+        entries: list[tuple[dict, int, str | None]],
+        request_timeout: float | None = None,
+        include_vectors: bool | None = None,
+    ) -> list[list[dict]]:
+        """검색 파이프라인별 _msearch 실행 (비동기, 파이프라인 그룹끼리 동시 실행)"""
+        client = self._get_async_client()
+        groups = list(self._group_by_pipeline(entries).items())
+        routed = await self._ais_routed(index)
+
+        async def run(pipeline: str | None, positions: list[int]) -> dict:
+            params = self._request_params(request_timeout)
+            if pipeline:
+                params["search_pipeline"] = pipeline
+            body = self._msearch_body(index, [entries[i] for i in positions], include_vectors, routed)
+            return await client.msearch(body=body, params=params)
+
+        responses = await asyncio.gather(*(run(pipeline, positions) for pipeline, positions in groups))
+
+        results: list[list[dict]] = [[] for _ in entries]
+        for (_, positions), response in zip(groups, responses):
+            self._collect_msearch(response, positions, results)
+        return results
+
+    @staticmethod
+    def _group_by_pipeline(entries: list[tuple[dict, int, str | None]]) -> dict[str | None, list[int]]:
+        """파이프라인별 입력 인덱스 묶음 (입력 순서 유지)"""
+        groups: dict[str | None, list[int]] = {}
+        for i, (_, _, pipeline) in enumerate(entries):
+            groups.setdefault(pipeline, []).append(i)
+        return groups
+
+    def _msearch_body(
+        self,
+        index: str,
+        entries: list[tuple[dict, int, str | None]],
+        include_vectors: bool | None,
+        routed: bool = False,
+    ) -> list[dict]:
+        """_msearch NDJSON 본문 (header, body 쌍, routed면 항목별 header에 routing)"""
+        body: list[dict] = []
+        for query, size, _ in entries:
+            header = {"index": index}
+            routing = project_routing(query) if routed else None
+            if routing:
+                header["routing"] = routing
+            body.append(header)
+            body.append({**self._with_source(query, include_vectors), "size": size})
+        return body
+
+    def _is_routed(self, index: str) -> bool:
+        """project_id 라우팅 인덱스 여부 (project_routing=None이면 매핑으로 판단, 캐시)"""
+        if self.project_routing is not None:
+            return self.project_routing
+        if index not in self._routed_indices:
+            try:
+                self._routed_indices[index] = self._routing_required(self.client.indices.get_mapping(index=index))
+            except Exception:
+                self._routed_indices[index] = False
+        return self._routed_indices[index]
+
+    async def _ais_routed(self, index: str) -> bool:
+        """project_id 라우팅 인덱스 여부 (비동기)"""
+        if self.project_routing is not None:
+            return self.project_routing
+        if index not in self._routed_indices:
+            try:
+                mappings = await self._get_async_client().indices.get_mapping(index=index)
+                self._routed_indices[index] = self._routing_required(mappings)
+            except Exception:
+                self._routed_indices[index] = False
+        return self._routed_indices[index]
+
+    @staticmethod
+    def _routing_required(mappings: dict) -> bool:
+        """get_mapping 응답 → 모든 인덱스가 _routing.required인지 (alias면 전체 기준)"""
+        values = [m.get("mappings", {}).get("_routing", {}).get("required", False) for m in mappings.values()]
+        return bool(values) and all(values)
+
+    def _routing_params(self, index: str, query: dict) -> dict:
+        """검색 요청 routing 파라미터 (라우팅 인덱스 + 필수 project_id 조건이 있을 때만)"""
+        routing = project_routing(query)
+        if routing is None or not self._is_routed(index):
+            return {}
+        return {"routing": routing}
+
+    async def _arouting_params(self, index: str, query: dict) -> dict:
+        """검색 요청 routing 파라미터 (비동기)"""
+        routing = project_routing(query)
+        if routing is None or not await self._ais_routed(index):
+            return {}
+        return {"routing": routing}
+
+    def source_filter(self, include_vectors: bool | None = None) -> dict | None:
+        """검색 요청용 _source 필터
+
+        Args:
+            include_vectors: 벡터 필드 포함 여부 (None이면 생성자 설정)
+
+        Returns:
+            _source 값 (None이면 필터 없음 = 전체 필드)
+        """
+        if include_vectors is None:
+            include_vectors = self.include_vectors
+
+        if self.source_fields is None:
+            return None if include_vectors else {"excludes": VECTOR_FIELDS}
+        if include_vectors:
+            return {"includes": [*self.source_fields, *VECTOR_FIELDS]}
+        return {"includes": list(self.source_fields)}
+
+    def _with_source(self, query: dict, include_vectors: bool | None) -> dict:
+        """쿼리에 _source 필터 추가 (이미 지정된 경우 그대로, 원본은 수정 안 함)"""
+        if "_source" in query:
+            return query
+        source = self.source_filter(include_vectors)
+        return query if source is None else {**query, "_source": source}
+
+    @staticmethod
+    def _collect_msearch(response: dict, positions: list[int], results: list[list[dict]]) -> None:
+        """_msearch 응답을 원래 위치에 배치"""
+        for position, item in zip(positions, response["responses"]):
+            if "error" in item:
+                reason = item["error"].get("reason", item["error"]) if isinstance(item["error"], dict) else item["error"]
+                raise RuntimeError(f"msearch 항목 {position} 실패: {reason}")
+            results[position] = item["hits"]["hits"]
+
+    @staticmethod
+    def _request_params(request_timeout: float | None) -> dict:
+        """요청별 파라미터 (타임아웃 지정 시에만 포함)"""
+        return {"request_timeout": request_timeout} if request_timeout is not None else {}
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트 종료"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_loop = None
+
+    def _get_async_client(self) -> AsyncOpenSearch:
+        """현재 이벤트 루프용 AsyncOpenSearch (aiohttp 커넥션 풀)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncOpenSearch(
+                hosts=[{"host": self.host, "port": self.port}],
+                http_auth=(self.username, self.password) if self.username else None,
+                use_ssl=self.use_ssl,
+                verify_certs=False,
+                ssl_show_warn=False,
+                connection_class=AsyncHttpConnection,
+                pool_maxsize=self.pool_maxsize,
+                http_compress=self.http_compress,
+                timeout=self.timeout,
+                headers=None if self.keep_alive else {"Connection": "close"},
+            )
+            self._async_loop = loop
+        return self._async_client
+
     def get_sample_docs(self, index: str, size: int = 1) -> list[dict]:
         """샘플 문서 조회 (구조 파악용)"""
         response = self.client.search(
@@ -86,39 +512,273 @@ class OpenSearchClient:
         response = self.client.count(index=index)
         return response["count"]
 
+    def get_index_version(self, index: str) -> str:
+        """인덱스 변경 감지용 버전 문자열
+
+        인덱스 UUID + primary 샤드의 문서 수/색인·삭제 누적 횟수로 구성합니다.
+        문서가 추가/수정/삭제되거나 인덱스가 재생성되면 값이 바뀝니다.
+        (alias면 연결된 모든 인덱스 기준)
+        """
+        response = self.client.indices.stats(index=index, metric="docs,indexing")
+        parts = []
+        for name, stats in sorted(response["indices"].items()):
+            primaries = stats["primaries"]
+            parts.append(
+                ":".join(
+                    str(v)
+                    for v in (
+                        name,
+                        stats.get("uuid", ""),
+                        primaries["docs"]["count"],
+                        primaries["docs"]["deleted"],
+                        primaries["indexing"]["index_total"],
+                        primaries["indexing"]["delete_total"],
+                    )
+                )
+            )
+        return "|".join(parts)
+
     def get_doc_count_by_project(self, index: str, project_id: int) -> int:
         """project_id별 문서 개수"""
         query = {"query": {"term": {"project_id": project_id}}}
         response = self.client.count(index=index, body=query)
         return response["count"]
 
-    def get_docs_by_project(self, index: str, project_id: int, size: int = 100) -> list[dict]:
+    def get_project_doc_counts(self, index: str, size: int = 1000) -> dict[int, int]:
+        """프로젝트별 문서 개수 (terms 집계, 문서 많은 순 최대 size개)"""
+        body = {"size": 0, "aggs": {"projects": {"terms": {"field": "project_id", "size": size}}}}
+        response = self.client.search(index=index, body=body)
+        return {int(bucket["key"]): bucket["doc_count"] for bucket in response["aggregations"]["projects"]["buckets"]}
+
+    def get_docs_by_project(
+        self,
+        index: str,
+        project_id: int,
+        size: int = 100,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
         """project_id로 문서 조회"""
-        query = {"query": {"term": {"project_id": project_id}}}
+        query = self._with_source({"query": {"term": {"project_id": project_id}}}, include_vectors)
         response = self.client.search(index=index, body=query, size=size)  # type: ignore[call-arg]
         return response["hits"]["hits"]
 
-    def get_all_docs_by_project(self, index: str, project_id: int) -> list[dict]:
-        """project_id로 모든 문서 조회 (scroll API 사용)"""
-        query = {"query": {"term": {"project_id": project_id}}}
-        docs = []
+    def get_all_docs_by_project(
+        self,
+        index: str,
+        project_id: int,
+        include_vectors: bool | None = None,
+    ) -> list[dict]:
+        """project_id로 모든 문서 조회
+
+        결과를 모두 메모리에 올리므로 작은 프로젝트용입니다.
+        대용량은 iter_docs_by_project()로 스트리밍하세요.
+        """
+        return list(self.iter_docs_by_project(index, project_id, include_vectors=include_vectors))
+
+    def iter_docs_by_project(
+        self,
+        index: str,
+        project_id: int,
+        page_size: int = 1000,
+        keep_alive: str = "2m",
+        include_vectors: bool | None = None,
+        source_fields: list[str] | None = None,
+    ) -> Iterator[dict]:
+        """project_id의 모든 문서를 페이지 단위로 yield (PIT + search_after)"""
+        yield from self.iter_docs(
+            index,
+            {"term": {"project_id": project_id}},
+            page_size=page_size,
+            keep_alive=keep_alive,
+            include_vectors=include_vectors,
+            source_fields=source_fields,
+        )
+
+    def iter_docs(
+        self,
+        index: str,
+        query: dict | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "2m",
+        sort: list[dict] | None = None,
+        include_vectors: bool | None = None,
+        source_fields: list[str] | None = None,
+    ) -> Iterator[dict]:
+        """쿼리에 맞는 모든 문서를 스트리밍 조회 (Point-in-Time + search_after)
+
+        scroll과 달리 서버에 결과 스냅샷 컨텍스트를 페이지마다 유지하지 않고,
+        한 페이지씩만 메모리에 올립니다. 종료 시(중단 포함) PIT를 삭제합니다.
+
+        Args:
+            index: 인덱스명
+            query: 검색 쿼리 (None이면 match_all)
+            page_size: 페이지 크기 (최대 10000)
+            keep_alive: PIT 유지 시간 (페이지 간 최대 간격)
+            sort: 정렬 기준 (기본: document_id, chunk_index, _shard_doc)
+                _shard_doc 타이브레이커가 없으면 끝에 붙여 정렬 키가 항상 유일하도록 함
+            include_vectors: 벡터 필드 포함 여부 (None이면 생성자 설정)
+            source_fields: 이번 조회만 쓸 _source allow-list (None이면 생성자 설정 + include_vectors)
+
+        Yields:
+            검색 hit ({"_id", "_source", "sort", ...})
+        """
+        sort = list(sort or EXPORT_SORT)
+        if not any("_shard_doc" in clause for clause in sort if isinstance(clause, dict)):
+            sort.append(PIT_TIEBREAKER)
+
+        pit_id = self.client.create_pit(index=index, params={"keep_alive": keep_alive})["pit_id"]
+        body = self._with_source(
+            {
+                "size": page_size,
+                "query": query or {"match_all": {}},
+                "sort": sort,
+                **({"_source": {"includes": source_fields}} if source_fields else {}),
+            },
+            include_vectors,
+        )
+
+        try:
+            search_after = None
+            while True:
+                request = {**body, "pit": {"id": pit_id, "keep_alive": keep_alive}}
+                if search_after is not None:
+                    request["search_after"] = search_after
+
+                response = self.client.search(body=request)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                yield from hits
+
+                if len(hits) < page_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            try:
+                self.client.delete_pit(body={"pit_id": [pit_id]})
+            except Exception:
+                pass  # keep_alive 경과 후 자동 만료되므로 원래 예외를 가리지 않음
+
+    def index_exists(self, index: str) -> bool:
+        """인덱스 존재 여부"""
+        return bool(self.client.indices.exists(index=index))
+
+    def create_index(self, index: str, body: dict) -> dict:
+        """인덱스 생성 (body는 index_schema.build_index_body 결과)"""
+        return self.client.indices.create(index=index, body=body)
+
+    def delete_index(self, index: str) -> dict:
+        """인덱스 삭제"""
+        return self.client.indices.delete(index=index)
+
+    def update_index_settings(self, index: str, settings: dict) -> dict:
+        """동적 인덱스 설정 변경 (refresh_interval 등)"""
+        return self.client.indices.put_settings(index=index, body={"index": settings})
+
+    def refresh(self, index: str) -> None:
+        """색인 결과를 검색에 반영"""
+        self.client.indices.refresh(index=index)
+
+    def bulk_index(
+        self,
+        index: str,
+        docs: Iterable[tuple[str, dict]],
+        chunk_size: int = 500,
+        routing_field: str | None = None,
+        max_retries: int = 0,
+    ) -> int:
+        """문서 일괄 색인 (스트리밍, chunk_size개씩 _bulk 요청)
+
+        Args:
+            index: 인덱스명
+            docs: (문서 ID, 문서) 순회 - 같은 ID는 덮어씀
+            chunk_size: _bulk 요청당 문서 수 (1024차원 벡터 기준 500개 ≈ 10MB)
+            routing_field: 라우팅 키로 쓸 문서 필드 (예: ROUTING_FIELD, None이면 _id 해시)
+            max_retries: 429(큐 포화) 문서 재시도 횟수 (지수 백오프, helpers.streaming_bulk)
+
+        Returns:
+            색인된 문서 수
+
+        Raises:
+            BulkIndexError: 재시도 후에도 실패한 문서가 있을 때
+        """
+        actions = (
+            {
+                "_index": index,
+                "_id": doc_id,
+                "_source": doc,
+                **({"_routing": str(doc[routing_field])} if routing_field else {}),
+            }
+            for doc_id, doc in docs
+        )
+        success, _ = helpers.bulk(
+            self.client, actions, chunk_size=chunk_size, max_retries=max_retries, request_timeout=self.timeout * 6
+        )
+        return success
+
+    def bulk_delete(
+        self, index: str, doc_ids: Iterable[str], chunk_size: int = 1000, routing: str | None = None
+    ) -> int:
+        """문서 일괄 삭제 (없는 ID는 무시)
+
+        Args:
+            index: 인덱스명
+            doc_ids: 삭제할 문서 ID
+            chunk_size: _bulk 요청당 삭제 수
+            routing: 라우팅 값 (project_id 라우팅 인덱스는 필수 - 없으면 다른 샤드에서 찾아 404)
+
+        Returns:
+            삭제된 문서 수
+        """
+        actions = (
+            {"_op_type": "delete", "_index": index, "_id": doc_id, **({"_routing": routing} if routing else {})}
+            for doc_id in doc_ids
+        )
+        deleted = 0
+        for ok, item in helpers.streaming_bulk(
+            self.client, actions, chunk_size=chunk_size, raise_on_error=False, request_timeout=self.timeout * 6
+        ):
+            result = item["delete"]
+            if ok:
+                deleted += 1
+            elif result.get("status") != 404:
+                raise RuntimeError(f"삭제 실패 {result.get('_id')}: {result.get('error')}")
+        return deleted
+
+    def get_vectors(
+        self, index: str, doc_ids: list[str], field: str = "embedding", routing: str | None = None
+    ) -> dict[str, list[float]]:
+        """문서 ID → 벡터 (_mget, 없거나 벡터 없는 문서는 제외)"""
+        if not doc_ids:
+            return {}
+        params = {"_source_includes": field, **({"routing": routing} if routing else {})}
+        response = self.client.mget(index=index, body={"ids": doc_ids}, params=params)
+        return {
+            doc["_id"]: doc["_source"][field]
+            for doc in response["docs"]
+            if doc.get("found") and doc.get("_source", {}).get(field)
+        }
+
+    def get_index_store_size(self, index: str) -> int:
+        """primary 샤드 저장 용량 (bytes)"""
+        response = self.client.indices.stats(index=index, metric="store")
+        return sum(stats["primaries"]["store"]["size_in_bytes"] for stats in response["indices"].values())
 
-        # 첫 번째 요청
-        response = self.client.search(index=index, body=query, size=100, scroll="2m")  # type: ignore[call-arg]
-        scroll_id = response["_scroll_id"]
-        hits = response["hits"]["hits"]
-        docs.extend(hits)
+    def get_knn_memory_kb(self) -> int | None:
+        """k-NN 네이티브 그래프 메모리 사용량 (KB, 노드 합계, faiss/nmslib만 해당)
 
-        # scroll로 나머지 가져오기
-        while hits:
-            response = self.client.scroll(scroll_id=scroll_id, scroll="2m")  # type: ignore[call-arg]
-            scroll_id = response["_scroll_id"]
-            hits = response["hits"]["hits"]
-            docs.extend(hits)
+        k-NN 통계 API가 없으면(플러그인 미설치/권한 없음) None.
+        """
+        try:
+            response = self.client.transport.perform_request("GET", "/_plugins/_knn/stats")
+        except Exception:
+            return None
+        return sum(node.get("graph_memory_usage", 0) for node in response.get("nodes", {}).values())
 
-        return docs
+    def put_search_pipeline(self, name: str, body: dict) -> dict:
+        """검색 파이프라인 생성/갱신 (index_schema.search_pipeline_body)"""
+        return self.client.transport.perform_request("PUT", f"/_search/pipeline/{name}", body=body)
 
     def get_texts_by_project(self, index: str, project_id: int) -> list[str]:
         """project_id로 text 필드만 추출"""
-        docs = self.get_all_docs_by_project(index, project_id)
+        docs = self.iter_docs_by_project(index, project_id)
         return [doc["_source"].get("text", "") for doc in docs if doc["_source"].get("text")]
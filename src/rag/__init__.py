@@ -3,6 +3,7 @@
 Basic RAG 파이프라인과 서비스를 제공합니다.
 """
 
+from .answer_cache import SemanticAnswerCache
 from .pipeline import (
     RAGPipeline,
     create_full_pipeline,
@@ -21,4 +22,6 @@ __all__ = [
     "create_minimal_pipeline",
     "create_standard_pipeline",
     "create_full_pipeline",
+    # Cache
+    "SemanticAnswerCache",
 ]
@@ -0,0 +1,212 @@
+"""시맨틱 답변 캐시 (SemanticAnswerCache)
+
+질문 임베딩이 이전 질문과 충분히 비슷하면 검색/LLM 없이 저장된 RAGResult를 반환합니다.
+"연차 휴가는 며칠인가?" ↔ "연차 며칠이야" 같은 유사 질문 반복에 효과적입니다.
+
+- 조회 단위(scope): project_id + 파이프라인 설정 지문 (설정이 다르면 캐시 공유 안 함)
+- 유사도: 코사인 유사도 ≥ threshold
+- 만료: ttl_seconds 경과 시 무효
+- 인덱스 변경: index_version_fn 결과가 바뀌면 전체 무효화
+  (버전 조회 실패 시 다음 확인까지 캐시 미사용, 무효화 전에 계산된 답변은 저장 안 함)
+
+Usage:
+    from src.rag.answer_cache import SemanticAnswerCache
+
+    cache = SemanticAnswerCache(
+        threshold=0.95,
+        ttl_seconds=3600,
+        index_version_fn=lambda: client.get_index_version("rag-index-fargate-live"),
+    )
+    pipeline = RAGPipeline(..., answer_cache=cache)
+
+    result = pipeline.query("연차 며칠이야")
+    result.timings["cache_hit"]  # 1.0 (히트) / 0.0 (미스)
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from .types import RAGResult
+
+
+@dataclass
+class _Entry:
+    """캐시 항목"""
+
+    result: RAGResult
+    created_at: float
+
+
+class SemanticAnswerCache:
+    """임베딩 유사도 기반 답변 캐시
+
+    Args:
+        threshold: 히트로 판단할 최소 코사인 유사도
+        ttl_seconds: 항목 유효 시간 (초)
+        max_entries: scope별 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+        index_version_fn: 현재 인덱스 버전을 반환하는 함수 (None이면 인덱스 변경 감지 안 함)
+        version_check_interval: 인덱스 버전 확인 주기 (초, 매 조회마다 OpenSearch 호출 방지)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1000,
+        index_version_fn: Callable[[], str | None] | None = None,
+        version_check_interval: float = 30.0,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold는 0 초과 1 이하여야 합니다")
+
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.index_version_fn = index_version_fn
+        self.version_check_interval = version_check_interval
+
+        # scope → (정규화된 임베딩 행렬, 항목 리스트), 행 순서 = 항목 순서
+        self._vectors: dict[str, np.ndarray] = {}
+        self._entries: dict[str, list[_Entry]] = {}
+        self._lock = threading.Lock()
+
+        self._index_version: str | None = None
+        self._version_checked_at = 0.0
+        self._version_ok = True
+
+        # 무효화 세대 - lookup 후 읽어 두었다가 store에 넘기면 그 사이 무효화된 답변은 저장 안 함
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, scope: str, embedding: list[float]) -> tuple[RAGResult, float] | None:
+        """유사 질문 조회
+
+        Returns:
+            (저장된 RAGResult, 유사도) 또는 None (인덱스 버전 확인 실패 시에도 None)
+        """
+        if not self._check_index_version():
+            with self._lock:
+                self.misses += 1
+            return None
+        query = self._normalize(embedding)
+
+        with self._lock:
+            self._expire(scope)
+            matrix = self._vectors.get(scope)
+            if matrix is None or len(matrix) == 0:
+                self.misses += 1
+                return None
+
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return self._entries[scope][best].result, similarity
+
+    def store(self, scope: str, embedding: list[float], result: RAGResult, generation: int | None = None) -> None:
+        """답변 저장
+
+        Args:
+            scope: 조회 단위
+            embedding: 질문 임베딩
+            result: 저장할 결과
+            generation: 답변 계산 전(lookup 직후)에 읽은 self.generation
+                (그 사이 무효화됐으면 이전 인덱스 기준 답변이므로 저장 안 함)
+        """
+        if not self._check_index_version():
+            return
+        vector = self._normalize(embedding)[np.newaxis, :]
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            matrix = self._vectors.get(scope)
+            entries = self._entries.setdefault(scope, [])
+            self._vectors[scope] = vector if matrix is None else np.vstack([matrix, vector])
+            entries.append(_Entry(result=result, created_at=time.time()))
+
+            overflow = len(entries) - self.max_entries
+            if overflow > 0:
+                self._vectors[scope] = self._vectors[scope][overflow:]
+                del entries[:overflow]
+
+    def invalidate(self, scope: str | None = None) -> None:
+        """캐시 무효화 (scope=None이면 전체)"""
+        with self._lock:
+            if scope is None:
+                self._vectors.clear()
+                self._entries.clear()
+            else:
+                self._vectors.pop(scope, None)
+                self._entries.pop(scope, None)
+            self.invalidations += 1
+            self.generation += 1
+
+    def stats(self) -> dict:
+        """캐시 히트/미스 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "invalidations": self.invalidations,
+            "index_version": self._index_version,
+        }
+
+    def _expire(self, scope: str) -> None:
+        """TTL 지난 항목 삭제 (lock 보유 상태에서 호출, 항목은 생성 순서로 정렬됨)"""
+        entries = self._entries.get(scope)
+        if not entries:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        expired = 0
+        while expired < len(entries) and entries[expired].created_at < cutoff:
+            expired += 1
+        if expired:
+            self._vectors[scope] = self._vectors[scope][expired:]
+            del entries[:expired]
+
+    def _check_index_version(self) -> bool:
+        """인덱스 버전이 바뀌었으면 전체 무효화 (version_check_interval마다 확인)
+
+        Returns:
+            캐시 사용 가능 여부 - 버전 조회가 실패하면 다음 확인까지 False (조회는 미스, 저장은 생략)
+        """
+        if self.index_version_fn is None:
+            return True
+        now = time.time()
+        if now - self._version_checked_at < self.version_check_interval:
+            return self._version_ok
+        self._version_checked_at = now
+
+        try:
+            version = self.index_version_fn()
+        except Exception as e:
+            print(f"⚠️ 인덱스 버전 확인 실패, 답변 캐시 미사용: {e}")
+            self._version_ok = False
+            return False
+
+        self._version_ok = True
+        if self._index_version is not None and version != self._index_version:
+            self.invalidate()
+        self._index_version = version
+        return True
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        """L2 정규화 (내적 = 코사인 유사도)"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
@@ -5,9 +5,16 @@
 
 from .chunk_expander import ChunkExpander, NeighborChunkExpander, NoopChunkExpander
 from .context_builder import ContextBuilder, RankedContextBuilder, SimpleContextBuilder
+from .fusion import ResultFusion, RRFFusion, ZScoreFusion
 from .preprocessor import KoreanPreprocessor, NoopPreprocessor, Preprocessor
 from .prompt_template import PromptTemplate, SimplePromptTemplate, StrictPromptTemplate
-from .query_builder import HybridQueryBuilder, KNNQueryBuilder, QueryBuilder
+from .query_builder import (
+    HybridQueryBuilder,
+    KNNQueryBuilder,
+    ProjectSizeCache,
+    QueryBuilder,
+    SubQueryBuilder,
+)
 from .query_enhancer import NoopQueryEnhancer, QueryEnhancer
 from .result_filter import (
     CompositeFilter,
@@ -15,6 +22,7 @@ from .result_filter import (
     RerankerFilter,
     ResultFilter,
     TopKFilter,
+    batch_filter,
 )
 
 __all__ = [
@@ -26,6 +34,10 @@ __all__ = [
     "ContextBuilder",
     "RankedContextBuilder",
     "SimpleContextBuilder",
+    # Fusion
+    "ResultFusion",
+    "RRFFusion",
+    "ZScoreFusion",
     # Preprocessor
     "KoreanPreprocessor",
     "NoopPreprocessor",
@@ -37,7 +49,9 @@ __all__ = [
     # Query Builder
     "HybridQueryBuilder",
     "KNNQueryBuilder",
+    "ProjectSizeCache",
     "QueryBuilder",
+    "SubQueryBuilder",
     # Query Enhancer
     "NoopQueryEnhancer",
     "QueryEnhancer",
@@ -47,4 +61,5 @@ __all__ = [
     "RerankerFilter",
     "ResultFilter",
     "TopKFilter",
+    "batch_filter",
 ]
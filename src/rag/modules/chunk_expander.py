@@ -12,6 +12,8 @@
 
 from typing import Any, Protocol, runtime_checkable
 
+from src.opensearch_client import SOURCE_FIELDS
+
 
 @runtime_checkable
 class ChunkExpander(Protocol):
@@ -46,12 +48,15 @@ class NeighborChunkExpander:
     """이웃 청크 배치 조회로 확장
 
     검색된 청크의 앞뒤 N개 청크를 한 번의 배치 쿼리로 조회합니다.
+    project_id 라우팅 인덱스면 검색 결과의 _routing으로 해당 샤드만 조회합니다
+    (이웃 청크는 같은 문서 = 같은 프로젝트라 같은 샤드에 있음).
 
     Args:
         opensearch_client: OpenSearch 클라이언트
         index_name: 인덱스 이름
         window: 앞뒤 청크 확장 범위 (기본값: 5)
         max_results: 최대 반환 결과 수 (기본값: 80)
+        source_fields: 이웃 청크 _source allow-list (기본값: 벡터 제외 SOURCE_FIELDS)
 
     Example:
         expander = NeighborChunkExpander(client, "rag-index", window=5)
@@ -65,11 +70,13 @@ class NeighborChunkExpander:
         index_name: str,
         window: int = 5,
         max_results: int = 80,
+        source_fields: list[str] | None = None,
     ):
         self.client = opensearch_client
         self.index = index_name
         self.window = window
         self.max_results = max_results
+        self.source_fields = source_fields or SOURCE_FIELDS
 
     def expand(self, results: list[dict]) -> list[dict]:
         if not results:
@@ -108,12 +115,12 @@ class NeighborChunkExpander:
         body = {
             "size": self.max_results,
             "query": {"bool": {"should": should_clauses, "minimum_should_match": 1}},
-            "_source": {"excludes": ["embedding"]},
+            "_source": {"includes": self.source_fields},
             "sort": [{"document_id": "asc"}, {"chunk_index": "asc"}],
         }
 
         try:
-            response = self.client.search(index=self.index, body=body)
+            response = self.client.search(index=self.index, body=body, **self._routing(results))
             neighbor_hits = response.get("hits", {}).get("hits", [])
         except Exception as e:
             print(f"⚠️ 이웃 청크 조회 실패: {e}")
@@ -122,6 +129,14 @@ class NeighborChunkExpander:
         # 3. 원본 + 이웃 병합 (중복 제거)
         return self._merge_results(results, neighbor_hits)
 
+    @staticmethod
+    def _routing(results: list[dict]) -> dict:
+        """검색 결과 _routing → search routing 인자 (하나라도 없으면 전체 샤드 조회)"""
+        routings = {r.get("_routing") for r in results}
+        if None in routings:
+            return {}
+        return {"routing": ",".join(sorted(routings))}
+
     def _merge_results(
         self,
         originals: list[dict],
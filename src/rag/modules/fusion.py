@@ -0,0 +1,123 @@
+"""결과 융합 (ResultFusion)
+
+BM25 / KNN 검색 결과를 클라이언트에서 하나의 순위로 합칩니다.
+클러스터에 hybrid-rrf 검색 파이프라인이 없거나, 클러스터 변경 없이
+가중치/상수를 조정하고 싶을 때 사용합니다.
+
+파이프라인 위치:
+    BM25 검색 ┐
+              ├→ ResultFusion → ResultFilter → ...
+    KNN 검색  ┘
+
+구현체:
+- RRFFusion: 순위 기반 (Reciprocal Rank Fusion), 점수 스케일 무관
+- ZScoreFusion: 점수 기반 (검색별 z-score 정규화 후 가중합)
+
+권장 사용:
+    pipeline = RAGPipeline(..., query_builder=HybridQueryBuilder(), fusion=RRFFusion(rank_constant=60))
+"""
+
+from collections.abc import Hashable
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from src.local_search.fusion import DEFAULT_RANK_CONSTANT, reciprocal_rank_fusion
+
+
+@runtime_checkable
+class ResultFusion(Protocol):
+    """결과 융합 프로토콜"""
+
+    def fuse(self, result_lists: list[list[dict]], size: int) -> list[dict]:
+        """검색 결과 융합
+
+        Args:
+            result_lists: 검색별 결과 리스트 (각각 점수 내림차순)
+                          [[{"_id": str, "_score": float, "_source": {...}}, ...], ...]
+            size: 반환할 최대 개수
+
+        Returns:
+            융합 점수 내림차순 결과 리스트 (_score는 융합 점수로 교체)
+        """
+        ...
+
+
+def _check_weights(weights: list[float] | None, count: int) -> list[float]:
+    """가중치 검증 (None이면 모두 1.0)"""
+    if weights is None:
+        return [1.0] * count
+    if len(weights) != count:
+        raise ValueError(f"weights 길이({len(weights)})가 검색 결과 수({count})와 다릅니다")
+    return list(weights)
+
+
+def _rescored(hits_by_id: dict[str, dict], fused: list[tuple[Hashable, float]], size: int) -> list[dict]:
+    """융합 점수로 hit 복사본 생성 (원본 hit은 수정 안 함)"""
+    return [{**hits_by_id[doc_id], "_score": score} for doc_id, score in fused[:size]]
+
+
+def _index_hits(result_lists: list[list[dict]]) -> dict[str, dict]:
+    """_id → hit (처음 등장한 hit 사용)"""
+    hits_by_id: dict[str, dict] = {}
+    for hits in result_lists:
+        for hit in hits:
+            hits_by_id.setdefault(hit["_id"], hit)
+    return hits_by_id
+
+
+class RRFFusion:
+    """RRF 융합
+
+    score(d) = Σ weight_i / (rank_constant + rank_i(d))
+    OpenSearch score-ranker-processor와 같은 공식이므로 weights=None이면
+    hybrid-rrf 파이프라인(rank_constant=60)과 같은 순위가 나옵니다.
+
+    Args:
+        rank_constant: 하위 순위 감쇠 상수 (작을수록 상위 순위 비중 ↑)
+        weights: 검색별 가중치 [bm25, knn] (None이면 동일 가중치)
+    """
+
+    def __init__(self, rank_constant: int = DEFAULT_RANK_CONSTANT, weights: list[float] | None = None):
+        self.rank_constant = rank_constant
+        self.weights = weights
+
+    def fuse(self, result_lists: list[list[dict]], size: int) -> list[dict]:
+        weights = _check_weights(self.weights, len(result_lists))
+        rankings = [[hit["_id"] for hit in hits] for hits in result_lists]
+        fused = reciprocal_rank_fusion(rankings, rank_constant=self.rank_constant, weights=weights)
+        return _rescored(_index_hits(result_lists), fused, size)
+
+
+class ZScoreFusion:
+    """z-score 가중합 융합
+
+    검색별 점수를 (score - 평균) / 표준편차로 정규화한 뒤 가중합합니다.
+    한쪽 검색에만 있는 문서는 다른 검색에서 그 검색의 최저 z-score를 받은 것으로 계산합니다.
+    BM25 점수 차이가 큰 질문(정확한 용어 매칭)에서 RRF보다 점수 차이를 잘 반영합니다.
+
+    Args:
+        weights: 검색별 가중치 [bm25, knn] (None이면 동일 가중치)
+    """
+
+    def __init__(self, weights: list[float] | None = None):
+        self.weights = weights
+
+    def fuse(self, result_lists: list[list[dict]], size: int) -> list[dict]:
+        weights = _check_weights(self.weights, len(result_lists))
+        hits_by_id = _index_hits(result_lists)
+
+        totals = dict.fromkeys(hits_by_id, 0.0)
+        for hits, weight in zip(result_lists, weights):
+            if not hits:
+                continue
+            scores = np.array([hit.get("_score") or 0.0 for hit in hits], dtype=np.float64)
+            std = scores.std()
+            z = (scores - scores.mean()) / std if std > 0 else np.zeros_like(scores)
+            by_id = {hit["_id"]: float(value) for hit, value in zip(hits, z)}
+            floor = float(z.min())
+            for doc_id in totals:
+                totals[doc_id] += weight * by_id.get(doc_id, floor)
+
+        fused: list[tuple[Hashable, float]] = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return _rescored(hits_by_id, fused, size)
@@ -4,11 +4,32 @@
 
 구현체:
 - KNNQueryBuilder: 순수 벡터 검색 (베이스라인)
-- HybridQueryBuilder: KNN + BM25 결합 (RRF 파이프라인)
+- HybridQueryBuilder: KNN + BM25 결합 (RRF 파이프라인 또는 클라이언트 융합)
+
+작은 프로젝트 정확 검색:
+    project_size(프로젝트 청크 수 조회 함수)를 주면 청크 수가 exact_threshold 미만인 프로젝트는
+    근사 knn 대신 script_score(knn_score) 정확 검색을 사용합니다.
+    필터된 HNSW는 후보가 적을수록 그래프 탐색이 비효율적이고 recall도 떨어지는 반면,
+    수백~수천 청크의 전수 계산은 수 ms면 끝납니다.
+
+    sizes = ProjectSizeCache(partial(client.get_doc_count_by_project, index))
+    builder = KNNQueryBuilder(project_size=sizes, exact_threshold=2000)
+
+근사 knn 튜닝 (cli.py sweep으로 recall/레이턴시를 보고 선택):
+    - knn_k: KNN 후보 수 (None이면 검색 size와 같음)
+    - ef_search: HNSW 검색 탐색 폭 (method_parameters, 클수록 recall↑ 레이턴시↑)
+    - rescore / oversample_factor: 양자화(fp16/byte, on_disk) 인덱스에서 원본 벡터로 재점수화
+
+    builder = HybridQueryBuilder(ef_search=64, knn_k=40)
 """
 
+import time
+from collections.abc import Callable
 from typing import Protocol, runtime_checkable
 
+# 정확 검색 임계값 기본값 (cli.py bench-exact로 클러스터별 조정)
+DEFAULT_EXACT_THRESHOLD = 2000
+
 
 @runtime_checkable
 class QueryBuilder(Protocol):
@@ -35,10 +56,144 @@ class QueryBuilder(Protocol):
         ...
 
 
-class KNNQueryBuilder:
+@runtime_checkable
+class SubQueryBuilder(Protocol):
+    """BM25 / KNN 서브쿼리를 따로 생성하는 빌더 프로토콜 (클라이언트 융합용)"""
+
+    def build_bm25(self, query: str, project_id: int) -> dict:
+        """BM25 단독 쿼리 (임베딩 없이 생성 가능)"""
+        ...
+
+    def build_knn(self, embedding: list[float], project_id: int, k: int = 5) -> dict:
+        """KNN 단독 쿼리"""
+        ...
+
+
+class ProjectSizeCache:
+    """project_id → 청크 수 캐시 (TTL)
+
+    쿼리마다 count 요청을 보내지 않도록 프로젝트별 청크 수를 ttl_seconds 동안 재사용합니다.
+    청크 수는 색인/삭제 때만 바뀌고, 임계값 근처가 아니면 조금 늦게 반영돼도 결과는 같습니다.
+    조회가 실패하면(타임아웃, 인덱스 없음 등) None을 반환해 근사 knn으로 검색하고,
+    장애 중 모든 쿼리가 실패할 count 요청을 보내지 않도록 실패도 failure_ttl_seconds 동안 기억합니다.
+
+    Args:
+        count_fn: project_id → 청크 수 (예: partial(client.get_doc_count_by_project, index))
+        ttl_seconds: 캐시 유지 시간
+        failure_ttl_seconds: 조회 실패 후 다시 시도하기까지의 시간
+    """
+
+    def __init__(self, count_fn: Callable[[int], int], ttl_seconds: float = 600.0, failure_ttl_seconds: float = 30.0):
+        self.count_fn = count_fn
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self._counts: dict[int, tuple[int | None, float]] = {}
+
+    def __call__(self, project_id: int) -> int | None:
+        cached = self._counts.get(project_id)
+        now = time.monotonic()
+        if cached is not None:
+            ttl = self.ttl_seconds if cached[0] is not None else self.failure_ttl_seconds
+            if now - cached[1] < ttl:
+                return cached[0]
+        try:
+            count = self.count_fn(project_id)
+        except Exception as e:
+            print(f"⚠️ 프로젝트 청크 수 조회 실패, 근사 knn 사용: {e}")
+            count = None
+        self._counts[project_id] = (count, now)
+        return count
+
+    def invalidate(self, project_id: int | None = None) -> None:
+        """캐시 삭제 (project_id=None이면 전체)"""
+        if project_id is None:
+            self._counts.clear()
+        else:
+            self._counts.pop(project_id, None)
+
+
+class _VectorClauseBuilder:
+    """KNN 절 생성 공통 로직 (근사 knn / 정확 script_score 선택)
+
+    Args:
+        project_size: project_id → 청크 수 (None이면 항상 근사 knn, 조회 실패나 None 반환도 근사 knn)
+        exact_threshold: 청크 수가 이 값 미만이면 정확 검색
+        space_type: 정확 검색 거리 함수 (l2: 인덱스와 같은 1/(1+d²) 점수, cosinesimil: 1+cos)
+        knn_k: 근사 knn 후보 수 (None이면 build의 k)
+        ef_search: HNSW 검색 탐색 폭 (None이면 인덱스 설정값)
+        rescore: 재점수화 여부 (None이면 엔진 기본값)
+        oversample_factor: 재점수화 후보 배수 (지정하면 rescore 사용)
+    """
+
+    def __init__(
+        self,
+        project_size: Callable[[int], int | None] | None = None,
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+        space_type: str = "l2",
+        knn_k: int | None = None,
+        ef_search: int | None = None,
+        rescore: bool | None = None,
+        oversample_factor: float | None = None,
+    ):
+        self.project_size = project_size
+        self.exact_threshold = exact_threshold
+        self.space_type = space_type
+        self.knn_k = knn_k
+        self.ef_search = ef_search
+        self.rescore = rescore
+        self.oversample_factor = oversample_factor
+
+    def use_exact(self, project_id: int) -> bool:
+        """정확 검색 여부 (청크 수 < exact_threshold, 청크 수를 모르면 근사 knn)"""
+        if self.project_size is None:
+            return False
+        try:
+            size = self.project_size(project_id)
+        except Exception as e:
+            print(f"⚠️ 프로젝트 청크 수 조회 실패, 근사 knn 사용: {e}")
+            return False
+        return size is not None and size < self.exact_threshold
+
+    def _vector_clause(self, embedding: list[float], project_id: int, k: int) -> dict:
+        """knn 절 또는 script_score 절
+
+        script_score는 필터된 문서 전체를 점수화하므로 반환 개수는 k가 아니라 검색 size로 정해집니다.
+        """
+        project_filter = {"term": {"project_id": project_id}}
+        if self.use_exact(project_id):
+            return {
+                "script_score": {
+                    "query": {"bool": {"filter": [project_filter]}},
+                    "script": {
+                        "source": "knn_score",
+                        "lang": "knn",
+                        "params": {
+                            "field": "embedding",
+                            "query_value": embedding,
+                            "space_type": self.space_type,
+                        },
+                    },
+                }
+            }
+        params: dict = {
+            "vector": embedding,
+            "k": self.knn_k or k,
+            "filter": project_filter,
+        }
+        if self.ef_search is not None:
+            params["method_parameters"] = {"ef_search": self.ef_search}
+        if self.oversample_factor is not None:
+            params["rescore"] = {"oversample_factor": self.oversample_factor}
+        elif self.rescore is not None:
+            params["rescore"] = self.rescore
+        return {"knn": {"embedding": params}}
+
+
+class KNNQueryBuilder(_VectorClauseBuilder):
     """순수 벡터 검색 (베이스라인)
 
     의미적 유사도만 사용. 디버깅 및 비교용.
+    project_size를 주면 작은 프로젝트는 정확 검색 (모듈 docstring 참고).
     """
 
     def build(
@@ -48,24 +203,18 @@ class KNNQueryBuilder:
         project_id: int,
         k: int = 5,
     ) -> dict:
-        return {
-            "query": {
-                "knn": {
-                    "embedding": {
-                        "vector": embedding,
-                        "k": k,
-                        "filter": {"term": {"project_id": project_id}},
-                    }
-                }
-            }
-        }
+        return {"query": self._vector_clause(embedding, project_id, k)}
 
 
-class HybridQueryBuilder:
+class HybridQueryBuilder(_VectorClauseBuilder):
     """KNN + BM25 하이브리드 검색
 
     RRF (Reciprocal Rank Fusion) 파이프라인 사용.
     검색 시 search_pipeline="hybrid-rrf" 파라미터 필요.
+
+    파이프라인이 없는 클러스터에서는 build_bm25() / build_knn()으로 서브쿼리를 따로 실행하고
+    클라이언트에서 융합합니다 (RAGPipeline fusion 모드).
+    project_size를 주면 작은 프로젝트의 KNN 서브쿼리는 정확 검색 (모듈 docstring 참고).
     """
 
     # 검색 필드 및 가중치
@@ -85,38 +234,35 @@ class HybridQueryBuilder:
         project_id: int,
         k: int = 5,
     ) -> dict:
-        filter_clause = {"term": {"project_id": project_id}}
-
-        # BM25 서브쿼리
-        bm25_query = {
-            "bool": {
-                "must": [
-                    {
-                        "multi_match": {
-                            "query": query,
-                            "fields": self.SEARCH_FIELDS,
-                        }
-                    }
-                ],
-                "filter": [filter_clause],
-            }
-        }
-
-        # KNN 서브쿼리
-        knn_query = {
-            "knn": {
-                "embedding": {
-                    "vector": embedding,
-                    "k": k,
-                    "filter": filter_clause,
+        return {
+            "query": {
+                "hybrid": {
+                    "queries": [
+                        self.build_bm25(query, project_id)["query"],
+                        self.build_knn(embedding, project_id, k)["query"],
+                    ],
                 }
             }
         }
 
+    def build_bm25(self, query: str, project_id: int) -> dict:
+        """BM25 서브쿼리 (단독 실행 가능, 임베딩 불필요)"""
         return {
             "query": {
-                "hybrid": {
-                    "queries": [bm25_query, knn_query],
+                "bool": {
+                    "must": [
+                        {
+                            "multi_match": {
+                                "query": query,
+                                "fields": self.SEARCH_FIELDS,
+                            }
+                        }
+                    ],
+                    "filter": [{"term": {"project_id": project_id}}],
                 }
             }
         }
+
+    def build_knn(self, embedding: list[float], project_id: int, k: int = 5) -> dict:
+        """KNN 서브쿼리 (단독 실행 가능)"""
+        return {"query": self._vector_clause(embedding, project_id, k)}
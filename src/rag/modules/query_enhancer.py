@@ -39,6 +39,14 @@ class NoopQueryEnhancer:
         """원본 쿼리 그대로 반환"""
         return query
 
+    async def aenhance(
+        self,
+        query: str,
+        history: list[dict] | None = None,
+    ) -> str:
+        """원본 쿼리 그대로 반환 (비동기)"""
+        return query
+
 
 class LLMQueryEnhancer:
     """LLM 기반 쿼리 개선 (기존 Flash 로직 포팅)
@@ -90,24 +98,35 @@ Return ONLY the rewritten query, nothing else."""
         history: list[dict] | None = None,
     ) -> str:
         """대화 히스토리를 활용해 쿼리 개선"""
-        # 스킵 조건 1: 히스토리 없음
-        if not history or len(history) == 0:
+        user_prompt = self._build_prompt(query, history)
+        if user_prompt is None:
             return query
 
-        # 스킵 조건 2: 현재 메시지만 있음 (첫 질문)
-        if len(history) == 1:
+        # LLM 호출
+        try:
+            response = self.llm.call(
+                prompt=user_prompt,
+                system=self.SYSTEM_PROMPT,
+                max_tokens=256,
+            )
+            enhanced = response.content.strip()
+            return enhanced if enhanced else query
+        except Exception as e:
+            print(f"⚠️ QueryEnhancer 실패, 원본 반환: {e}")
             return query
 
-        # 최근 N개 메시지만 사용
-        recent = history[-self.max_history :]
-
-        # 컨텍스트 구성 (길이 제한)
-        context = self._build_context(recent)
+    async def aenhance(
+        self,
+        query: str,
+        history: list[dict] | None = None,
+    ) -> str:
+        """대화 히스토리를 활용해 쿼리 개선 (비동기, llm_client.acall 사용)"""
+        user_prompt = self._build_prompt(query, history)
+        if user_prompt is None:
+            return query
 
-        # LLM 호출
         try:
-            user_prompt = self.USER_PROMPT_TEMPLATE.format(context=context, query=query)
-            response = self.llm.call(
+            response = await self.llm.acall(
                 prompt=user_prompt,
                 system=self.SYSTEM_PROMPT,
                 max_tokens=256,
@@ -118,6 +137,23 @@ Return ONLY the rewritten query, nothing else."""
             print(f"⚠️ QueryEnhancer 실패, 원본 반환: {e}")
             return query
 
+    def _build_prompt(self, query: str, history: list[dict] | None) -> str | None:
+        """LLM 프롬프트 생성 (개선이 필요 없으면 None)"""
+        # 스킵 조건 1: 히스토리 없음
+        if not history or len(history) == 0:
+            return None
+
+        # 스킵 조건 2: 현재 메시지만 있음 (첫 질문)
+        if len(history) == 1:
+            return None
+
+        # 최근 N개 메시지만 사용
+        recent = history[-self.max_history :]
+
+        # 컨텍스트 구성 (길이 제한)
+        context = self._build_context(recent)
+        return self.USER_PROMPT_TEMPLATE.format(context=context, query=query)
+
     def _build_context(self, messages: list[dict]) -> str:
         """히스토리를 컨텍스트 문자열로 변환"""
         lines = []
@@ -4,8 +4,12 @@
 
 권장 파이프라인:
     검색 (size=50) → TopKFilter(k=20) → RerankerFilter(top_k=5)
+
+여러 질문을 한 번에 필터링할 때는 batch_filter()를 사용합니다.
+filter_batch()를 제공하는 필터(RerankerFilter, CompositeFilter)는 질문 묶음 단위로 처리합니다.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol, runtime_checkable
 
 
@@ -26,6 +30,23 @@ class ResultFilter(Protocol):
         ...
 
 
+def batch_filter(result_filter: ResultFilter, queries: list[str], result_lists: list[list[dict]]) -> list[list[dict]]:
+    """여러 질문의 검색 결과 필터링 (filter_batch가 있으면 한 번에, 없으면 질문별 filter)
+
+    Args:
+        result_filter: 결과 필터
+        queries: 질문 리스트
+        result_lists: 질문별 검색 결과 (queries와 같은 순서)
+
+    Returns:
+        질문별 필터링된 결과 리스트
+    """
+    filter_batch = getattr(result_filter, "filter_batch", None)
+    if filter_batch is not None:
+        return filter_batch(queries, result_lists)
+    return [result_filter.filter(query, results) for query, results in zip(queries, result_lists)]
+
+
 class NoopFilter:
     """필터링 안 함 (베이스라인)
 
@@ -162,6 +183,10 @@ class RerankerFilter:
     Note:
         rerankers 패키지가 없으면 ImportError 발생.
         lazy import로 다른 필터들은 의존성 없이 사용 가능.
+
+        rerankers/FlashRank의 rank()는 질문 하나씩만 받으므로, filter_batch()는
+        한 번 로드한 모델로 여러 질문을 batch_workers개씩 동시에 재정렬합니다
+        (ONNX 추론은 GIL을 놓으므로 스레드로 병렬 실행됨).
     """
 
     def __init__(
@@ -169,10 +194,12 @@ class RerankerFilter:
         model_name: str = "ms-marco-MiniLM-L-12-v2",
         model_type: str = "flashrank",
         top_k: int = 5,
+        batch_workers: int = 4,
     ):
         self.model_name = model_name
         self.model_type = model_type
         self.top_k = top_k
+        self.batch_workers = batch_workers
         self._ranker = None  # lazy init
 
     @property
@@ -214,6 +241,14 @@ class RerankerFilter:
 
         return [results[i] for i in top_indices]
 
+    def filter_batch(self, queries: list[str], result_lists: list[list[dict]]) -> list[list[dict]]:
+        """여러 질문 재정렬 (모델 공유, batch_workers개 동시 실행)"""
+        if len(queries) <= 1 or self.batch_workers <= 1:
+            return [self.filter(query, results) for query, results in zip(queries, result_lists)]
+        _ = self.ranker  # 스레드에서 모델을 중복 로드하지 않도록 먼저 초기화
+        with ThreadPoolExecutor(max_workers=min(self.batch_workers, len(queries))) as executor:
+            return list(executor.map(self.filter, queries, result_lists))
+
 
 class CompositeFilter:
     """필터 체이닝
@@ -234,3 +269,9 @@ class CompositeFilter:
         for f in self.filters:
             results = f.filter(query, results)
         return results
+
+    def filter_batch(self, queries: list[str], result_lists: list[list[dict]]) -> list[list[dict]]:
+        """여러 질문을 필터 단계별로 한 번에 처리"""
+        for f in self.filters:
+            result_lists = batch_filter(f, queries, result_lists)
+        return result_lists
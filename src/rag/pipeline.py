@@ -12,14 +12,40 @@ Usage:
     # 전체 구성 (하이브리드 + 리랭킹)
     pipeline = create_full_pipeline(project_id=334)
     result = pipeline.query("연차 휴가는 며칠인가요?")
+
+    # 비동기 실행 (독립 단계 동시 실행)
+    result = await pipeline.aquery("연차 휴가는 며칠인가요?")
+
+    # 유사 질문 답변 캐시
+    pipeline = create_standard_pipeline(project_id=334, answer_cache=True)
+
+    # 클라이언트 융합 (hybrid-rrf 파이프라인 없이 BM25/KNN 따로 검색 후 RRF)
+    pipeline = create_standard_pipeline(project_id=334, fusion=RRFFusion(rank_constant=20, weights=[1.0, 1.5]))
+
+    # 로컬 스냅샷 검색 (OpenSearch 없이)
+    pipeline = create_minimal_pipeline(project_id=334, snapshot="data/snapshots/334")
+
+    # 여러 질문 일괄 실행 (임베딩/검색/필터는 묶어서, LLM은 최대 8개 동시 호출)
+    results = pipeline.query_batch(questions, concurrency=8, return_exceptions=True)
 """
 
+import asyncio
+import hashlib
+import json
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import partial
 
+from src.cassette import with_cassette
+from src.embedding_cache import CachedEmbeddingClient
 from src.embedding_client import EmbeddingClient
-from src.llm_client import LLMClient
+from src.llm_client import LLMClient, LLMResponse
+from src.local_search import LocalSearchClient
 from src.opensearch_client import OpenSearchClient
 
+from .answer_cache import SemanticAnswerCache
 from .modules import (
     ChunkExpander,
     CompositeFilter,
@@ -33,19 +59,31 @@ from .modules import (
     NoopPreprocessor,
     NoopQueryEnhancer,
     Preprocessor,
+    ProjectSizeCache,
     PromptTemplate,
     QueryBuilder,
     QueryEnhancer,
     RankedContextBuilder,
     RerankerFilter,
     ResultFilter,
+    ResultFusion,
     SimpleContextBuilder,
     SimplePromptTemplate,
     StrictPromptTemplate,
+    SubQueryBuilder,
     TopKFilter,
+    batch_filter,
 )
 from .types import RAGResult
 
+# latency_ms 합계에서 제외하는 timings 항목 (다른 구간과 겹치거나 시간이 아닌 값)
+NON_STAGE_TIMINGS = {"ttft_ms", "cache_hit", "wall", "search_bm25"}
+
+
+def _total_ms(timings: dict[str, float]) -> float:
+    """단계별 소요 시간 합계"""
+    return round(sum(ms for name, ms in timings.items() if name not in NON_STAGE_TIMINGS), 1)
+
 
 class RAGPipeline:
     """RAG 파이프라인
@@ -57,8 +95,10 @@ class RAGPipeline:
         1. 쿼리 개선 (선택) - 대화 히스토리 기반 질문 명확화
         2. 전처리 (선택) - 질문 정규화
         3. 임베딩 생성 - 질문 벡터화
+           (답변 캐시 조회 (선택) - 유사 질문이면 저장된 답변 반환, 4~10단계 생략)
         4. 검색 쿼리 생성 - KNN 또는 하이브리드
         5. 검색 실행 - OpenSearch 호출
+           (fusion 모드: BM25/KNN 따로 검색 후 클라이언트에서 융합)
         6. 결과 필터링 (선택) - Top-K, Reranking 등
         7. 청크 확장 (선택) - 이웃 청크 추가
         8. 컨텍스트 생성 - LLM 주입용 문자열
@@ -69,8 +109,8 @@ class RAGPipeline:
     def __init__(
         self,
         # 필수 클라이언트
-        search_client: OpenSearchClient,
-        embedding_client: EmbeddingClient,
+        search_client: OpenSearchClient | LocalSearchClient,
+        embedding_client: EmbeddingClient | CachedEmbeddingClient,
         llm_client: LLMClient,
         # 조립 가능한 컴포넌트
         query_builder: QueryBuilder,
@@ -85,10 +125,13 @@ class RAGPipeline:
         project_id: int = 334,
         search_size: int = 20,
         search_pipeline: str | None = None,
+        cache_documents: bool = False,
+        answer_cache: SemanticAnswerCache | None = None,
+        fusion: ResultFusion | None = None,
     ):
         """
         Args:
-            search_client: OpenSearch 클라이언트
+            search_client: OpenSearch 클라이언트 (또는 스냅샷 기반 LocalSearchClient)
             embedding_client: 임베딩 클라이언트
             llm_client: LLM 클라이언트
             query_builder: 검색 쿼리 빌더
@@ -102,7 +145,20 @@ class RAGPipeline:
             project_id: 프로젝트 ID (필터용)
             search_size: 검색 결과 개수
             search_pipeline: OpenSearch 검색 파이프라인 (예: "hybrid-rrf")
+            cache_documents: 참고 문서 구간까지 프롬프트 캐시 브레이크포인트 설정 여부
+                (같은 검색 결과가 반복되는 평가/다중 턴에서 유리, 캐시 쓰기는 입력 단가의 1.25배)
+                시스템 프롬프트만으로는 최소 캐시 길이(1024 토큰)에 못 미치므로,
+                False면 기본 프롬프트 템플릿에서는 캐시 읽기/쓰기가 일어나지 않습니다.
+            answer_cache: 시맨틱 답변 캐시 (선택)
+            fusion: 클라이언트 결과 융합 (선택) - 설정 시 query_builder의 BM25/KNN 서브쿼리를
+                따로 실행해 융합 (query_builder는 SubQueryBuilder, search_pipeline은 None이어야 함)
         """
+        if fusion is not None:
+            if not isinstance(query_builder, SubQueryBuilder):
+                raise ValueError("fusion 모드는 build_bm25/build_knn을 제공하는 query_builder가 필요합니다")
+            if search_pipeline:
+                raise ValueError("fusion 모드에서는 search_pipeline을 사용할 수 없습니다")
+
         self.search_client = search_client
         self.embedding_client = embedding_client
         self.llm_client = llm_client
@@ -119,6 +175,9 @@ class RAGPipeline:
         self.project_id = project_id
         self.search_size = search_size
         self.search_pipeline = search_pipeline
+        self.cache_documents = cache_documents
+        self.answer_cache = answer_cache
+        self.fusion = fusion
 
     def query(
         self,
@@ -144,6 +203,354 @@ class RAGPipeline:
             timings[name] = round((now - start) * 1000, 1)
             start = now
 
+        processed, embedding = self._embed_question(question, history, _measure)
+
+        # 3-1. 답변 캐시 조회 (선택)
+        generation = None
+        if self.answer_cache is not None:
+            hit = self.answer_cache.lookup(self._answer_cache_scope(), embedding)
+            generation = self.answer_cache.generation
+            _measure("cache_lookup")
+            timings["cache_hit"] = 1.0 if hit else 0.0
+            if hit is not None:
+                return self._from_cache(question, hit[0], timings, _total_ms(timings))
+
+        results, system_prompt, user_prompt, cache_prefix = self._prepare(question, processed, embedding, _measure)
+
+        # 10. LLM 호출
+        response = self.llm_client.call(user_prompt, system=system_prompt, cache_prefix=cache_prefix)
+        _measure("llm")
+
+        result = RAGResult(
+            question=question,
+            answer=response.content,
+            sources=results,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cache_read_tokens=response.cache_read_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+            latency_ms=_total_ms(timings),
+            model=response.model,
+            timings=timings,
+        )
+        self._store_answer(embedding, result, generation)
+        return result
+
+    def query_stream(
+        self,
+        question: str,
+        history: list[dict] | None = None,
+    ) -> Iterator[str | RAGResult]:
+        """질문에 대한 RAG 파이프라인 실행 (답변 스트리밍)
+
+        검색~프롬프트 생성까지는 query()와 동일하고,
+        LLM 답변은 토큰(텍스트 조각)이 도착하는 즉시 yield합니다.
+        마지막에 RAGResult를 한 번 yield합니다.
+
+        timings["ttft_ms"]에는 LLM 요청부터 첫 토큰까지의 시간이 기록됩니다.
+        (timings["llm"]은 스트림 완료까지의 전체 시간, latency_ms 합계에서 ttft_ms는 제외)
+        답변 캐시 히트 시에는 저장된 답변 전체를 한 번에 yield합니다.
+
+        Usage:
+            for event in pipeline.query_stream("연차 휴가는 며칠인가요?"):
+                if isinstance(event, RAGResult):
+                    print(event.timings["ttft_ms"])
+                else:
+                    print(event, end="", flush=True)
+        """
+        start = time.time()
+        timings: dict[str, float] = {}
+
+        def _measure(name: str):
+            """단계별 시간 측정 헬퍼"""
+            nonlocal start
+            now = time.time()
+            timings[name] = round((now - start) * 1000, 1)
+            start = now
+
+        processed, embedding = self._embed_question(question, history, _measure)
+
+        # 3-1. 답변 캐시 조회 (선택)
+        generation = None
+        if self.answer_cache is not None:
+            hit = self.answer_cache.lookup(self._answer_cache_scope(), embedding)
+            generation = self.answer_cache.generation
+            _measure("cache_lookup")
+            timings["cache_hit"] = 1.0 if hit else 0.0
+            if hit is not None:
+                cached = self._from_cache(question, hit[0], timings, _total_ms(timings))
+                yield cached.answer
+                yield cached
+                return
+
+        results, system_prompt, user_prompt, cache_prefix = self._prepare(question, processed, embedding, _measure)
+
+        # 10. LLM 스트리밍 호출
+        response: LLMResponse | None = None
+        for event in self.llm_client.stream(user_prompt, system=system_prompt, cache_prefix=cache_prefix):
+            if isinstance(event, LLMResponse):
+                response = event
+                continue
+            if "ttft_ms" not in timings:
+                timings["ttft_ms"] = round((time.time() - start) * 1000, 1)
+            yield event
+        _measure("llm")
+
+        if response is None:
+            raise RuntimeError("LLM 스트림이 최종 응답 없이 종료되었습니다")
+
+        result = RAGResult(
+            question=question,
+            answer=response.content,
+            sources=results,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cache_read_tokens=response.cache_read_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+            latency_ms=_total_ms(timings),
+            model=response.model,
+            timings=timings,
+        )
+        self._store_answer(embedding, result, generation)
+        yield result
+
+    def query_batch(
+        self,
+        questions: list[str],
+        histories: list[list[dict] | None] | None = None,
+        concurrency: int = 8,
+        search_batch_size: int = 100,
+        return_exceptions: bool = False,
+        on_result: Callable[[int, RAGResult | Exception], None] | None = None,
+    ) -> list[RAGResult | Exception]:
+        """여러 질문에 대한 RAG 파이프라인 일괄 실행 (회귀 평가 등 대량 질문용)
+
+        query()를 질문마다 반복하는 대신 단계별로 모든 질문을 묶어 실행합니다.
+        - 임베딩: embed_batch 한 번 (중복 질문 제거)
+        - 검색: _msearch (요청당 search_batch_size개 검색, fusion 모드는 질문당 BM25/KNN 2개)
+          묶음 요청이 실패하면 그 묶음만 검색별로 다시 실행해 실패 질문을 가려냄
+        - 필터: batch_filter (Reranker는 모델 하나로 여러 질문 동시 재정렬)
+        - 쿼리 개선 / 청크 확장 / LLM 호출: 최대 concurrency개 동시 실행
+
+        timings의 공유 단계(embedding, search, filter 등)는 배치 전체가 그 단계에 쓴 시간,
+        llm은 질문별 호출 시간, wall은 배치 시작부터 해당 질문 완료까지(LLM 동시 실행 대기 포함)입니다.
+        latency_ms는 단계별 시간 합계입니다 (wall 제외).
+
+        Args:
+            questions: 사용자 질문 리스트
+            histories: 질문별 대화 히스토리 (선택, questions와 같은 길이)
+            concurrency: 동시 LLM 호출 수 (쿼리 개선/청크 확장에도 적용)
+            search_batch_size: _msearch 요청당 검색 수 (요청/응답 크기 제한)
+            return_exceptions: True면 실패한 질문 자리에 예외를 담아 반환,
+                False면 첫 실패 시 남은 작업을 취소하고 예외 발생
+            on_result: 질문별 결과(또는 예외)가 확정될 때마다 호출 (질문 번호, 결과) - 체크포인트 기록용,
+                호출 스레드에서 실행
+
+        Returns:
+            입력 순서와 같은 RAGResult 리스트 (return_exceptions=True면 실패 항목은 Exception)
+        """
+        if histories is not None and len(histories) != len(questions):
+            raise ValueError("histories는 questions와 길이가 같아야 합니다")
+
+        batch_start = time.time()
+        start = batch_start
+        stage_ms: dict[str, float] = {}
+        outputs: dict[int, RAGResult | Exception] = {}
+        active = list(range(len(questions)))
+
+        def _measure(name: str):
+            """공유 단계 시간 측정 헬퍼"""
+            nonlocal start
+            now = time.time()
+            stage_ms[name] = round((now - start) * 1000, 1)
+            start = now
+
+        def _emit(i: int, value: RAGResult | Exception) -> None:
+            outputs[i] = value
+            if on_result is not None:
+                on_result(i, value)
+
+        def _settle(values: dict[int, object]) -> dict:
+            """실패 항목을 outputs로 옮기고 성공 항목만 반환"""
+            nonlocal active
+            for i, value in values.items():
+                if isinstance(value, Exception):
+                    if not return_exceptions:
+                        raise value
+                    _emit(i, value)
+            active = [i for i in active if i not in outputs]
+            return {i: value for i, value in values.items() if i not in outputs}
+
+        stop_on_error = not return_exceptions
+
+        # 1~2. 쿼리 개선 (LLM, 동시 실행) + 전처리
+        processed = dict(enumerate(questions))
+        if self.query_enhancer:
+            args = {i: (questions[i], histories[i] if histories else None) for i in active}
+            processed = _settle(_map_concurrent(self.query_enhancer.enhance, args, concurrency, stop_on_error))
+            _measure("query_enhance")
+        if self.preprocessor:
+            processed = _settle(_map_each(self.preprocessor.process, {i: (processed[i],) for i in active}))
+            _measure("preprocess")
+
+        # 3. 임베딩 (embed_batch 한 번)
+        embeddings = _settle(self._embed_batch({i: processed[i] for i in active}))
+        _measure("embedding")
+
+        # 3-1. 답변 캐시 조회 (선택)
+        generation = None
+        if self.answer_cache is not None and active:
+            scope = self._answer_cache_scope()
+            hits = _settle(_map_each(partial(self.answer_cache.lookup, scope), {i: (embeddings[i],) for i in active}))
+            generation = self.answer_cache.generation
+            _measure("cache_lookup")
+            for i, hit in hits.items():
+                if hit is None:
+                    continue
+                timings = {**stage_ms, "cache_hit": 1.0, "wall": round((time.time() - batch_start) * 1000, 1)}
+                _emit(i, self._from_cache(questions[i], hit[0], timings, _total_ms(timings)))
+            active = [i for i in active if i not in outputs]
+            stage_ms["cache_hit"] = 0.0
+
+        # 4~5. 검색 쿼리 생성 + 검색 (_msearch)
+        results: dict[int, list[dict]] = {}
+        if active:
+            entries: list[tuple[dict, int, str | None]] = []
+            for i in active:
+                if self.fusion:
+                    bm25_query = self._sub_queries.build_bm25(processed[i], self.project_id)
+                    knn_query = self._sub_queries.build_knn(embeddings[i], self.project_id, self.search_size)
+                    entries += [(bm25_query, self.search_size, None), (knn_query, self.search_size, None)]
+                else:
+                    search_query = self.query_builder.build(
+                        query=processed[i],
+                        embedding=embeddings[i],
+                        project_id=self.project_id,
+                        k=self.search_size,
+                    )
+                    entries.append((search_query, self.search_size, self.search_pipeline))
+            _measure("query_build")
+
+            hits_list = self._msearch_batch(entries, search_batch_size)
+            legs = 2 if self.fusion else 1
+            searched = {}
+            for pos, i in enumerate(active):
+                question_hits = hits_list[pos * legs : (pos + 1) * legs]
+                error = next((hits for hits in question_hits if isinstance(hits, Exception)), None)
+                searched[i] = error if error is not None else question_hits
+            searched = _settle(searched)
+            _measure("search")
+
+            if self.fusion:
+                results = {i: self.fusion.fuse(legs_hits, self.search_size) for i, legs_hits in searched.items()}
+                _measure("fusion")
+            else:
+                results = {i: legs_hits[0] for i, legs_hits in searched.items()}
+
+        # 6. 결과 필터링 (선택, 질문 묶음 단위)
+        if self.result_filter and active:
+            try:
+                queries = [processed[i] for i in active]
+                results = dict(zip(active, batch_filter(self.result_filter, queries, [results[i] for i in active])))
+            except Exception as e:
+                results = _settle(dict.fromkeys(active, e))
+            _measure("filter")
+
+        # 7. 청크 확장 (선택, 동시 실행)
+        if self.chunk_expander and active:
+            args = {i: (results[i],) for i in active}
+            results = _settle(_map_concurrent(self.chunk_expander.expand, args, concurrency, stop_on_error))
+            _measure("chunk_expand")
+
+        # 8~9. 컨텍스트 + 프롬프트 생성
+        prompts: dict[int, tuple[str, str, str | None]] = {}
+        if active:
+            contexts = _settle(_map_each(self.context_builder.build, {i: (results[i],) for i in active}))
+            _measure("context_build")
+            rendered = _settle(_map_each(self.prompt_template.render, {i: (contexts[i], questions[i]) for i in active}))
+            _measure("prompt_render")
+            for i, (system_prompt, user_prompt) in rendered.items():
+                prompts[i] = (system_prompt, user_prompt, self._cache_prefix(user_prompt, contexts[i]))
+
+        # 10. LLM 호출 (최대 concurrency개 동시)
+        def _call(system_prompt: str, user_prompt: str, cache_prefix: str | None) -> tuple[LLMResponse, float, float]:
+            call_start = time.time()
+            response = self.llm_client.call(user_prompt, system=system_prompt, cache_prefix=cache_prefix)
+            end = time.time()
+            return response, round((end - call_start) * 1000, 1), round((end - batch_start) * 1000, 1)
+
+        def _finish(i: int, value: tuple[LLMResponse, float, float] | Exception) -> None:
+            """LLM 호출이 끝나는 대로 결과 확정"""
+            if isinstance(value, Exception):
+                _settle({i: value})
+                return
+            response, llm_ms, wall_ms = value
+            timings = {**stage_ms, "llm": llm_ms, "wall": wall_ms}
+            result = RAGResult(
+                question=questions[i],
+                answer=response.content,
+                sources=results[i],
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                cache_read_tokens=response.cache_read_tokens,
+                cache_write_tokens=response.cache_write_tokens,
+                latency_ms=_total_ms(timings),
+                model=response.model,
+                timings=timings,
+            )
+            self._store_answer(embeddings[i], result, generation)
+            _emit(i, result)
+
+        _map_concurrent(_call, {i: prompts[i] for i in active}, concurrency, stop_on_error, on_done=_finish)
+        return [outputs[i] for i in range(len(questions))]
+
+    def _embed_batch(self, texts: dict[int, str]) -> dict[int, list[float] | Exception]:
+        """질문 일괄 임베딩 (중복 제거 후 embed_batch 한 번) → {질문 번호: 벡터 | 예외}"""
+        if not texts:
+            return {}
+        unique = list(dict.fromkeys(texts.values()))
+        batch = self.embedding_client.embed_batch(unique)
+        vectors: dict[str, list[float] | Exception] = {}
+        for pos, text in enumerate(unique):
+            vector = batch.embeddings[pos]
+            if vector is None:
+                vectors[text] = RuntimeError(f"임베딩 실패: {batch.errors.get(pos, 'unknown error')}")
+            else:
+                vectors[text] = vector
+        return {i: vectors[text] for i, text in texts.items()}
+
+    def _msearch_batch(
+        self, entries: list[tuple[dict, int, str | None]], batch_size: int
+    ) -> list[list[dict] | Exception]:
+        """검색 일괄 실행 (batch_size개씩 _msearch, 실패한 묶음은 검색별로 재실행)"""
+        hits_list: list[list[dict] | Exception] = []
+        for offset in range(0, len(entries), batch_size):
+            chunk = entries[offset : offset + batch_size]
+            try:
+                hits_list.extend(self.search_client.msearch_with_pipeline(self.index, chunk))
+                continue
+            except Exception as e:
+                if len(chunk) == 1:
+                    hits_list.append(e)
+                    continue
+            for entry in chunk:
+                try:
+                    hits_list.extend(self.search_client.msearch_with_pipeline(self.index, [entry]))
+                except Exception as e:
+                    hits_list.append(e)
+        return hits_list
+
+    def _embed_question(
+        self,
+        question: str,
+        history: list[dict] | None,
+        _measure: Callable[[str], None],
+    ) -> tuple[str, list[float]]:
+        """쿼리 개선 ~ 임베딩 (1~3단계)
+
+        Returns:
+            (검색에 사용할 질문, 질문 임베딩)
+        """
         # 1. 쿼리 개선 (선택) - 대화 히스토리 기반
         enhanced = question
         if self.query_enhancer:
@@ -160,18 +567,46 @@ class RAGPipeline:
         embedding = self.embedding_client.embed(processed)
         _measure("embedding")
 
-        # 4. 검색 쿼리 생성
-        search_query = self.query_builder.build(
-            query=processed,
-            embedding=embedding,
-            project_id=self.project_id,
-            k=self.search_size,
-        )
-        _measure("query_build")
+        return processed, embedding
+
+    def _prepare(
+        self,
+        question: str,
+        processed: str,
+        embedding: list[float],
+        _measure: Callable[[str], None],
+    ) -> tuple[list[dict], str, str, str | None]:
+        """검색 ~ 프롬프트 생성 (4~9단계)
+
+        Returns:
+            (검색 결과, system_prompt, user_prompt, cache_prefix)
+        """
+        if self.fusion:
+            # 4. 검색 쿼리 생성 (BM25 / KNN 서브쿼리)
+            bm25_query = self._sub_queries.build_bm25(processed, self.project_id)
+            knn_query = self._sub_queries.build_knn(embedding, self.project_id, self.search_size)
+            _measure("query_build")
+
+            # 5. 검색 실행 (_msearch 한 번으로 두 검색) + 융합
+            bm25_hits, knn_hits = self.search_client.msearch(
+                self.index, [(bm25_query, self.search_size), (knn_query, self.search_size)]
+            )
+            _measure("search")
+            results = self.fusion.fuse([bm25_hits, knn_hits], self.search_size)
+            _measure("fusion")
+        else:
+            # 4. 검색 쿼리 생성
+            search_query = self.query_builder.build(
+                query=processed,
+                embedding=embedding,
+                project_id=self.project_id,
+                k=self.search_size,
+            )
+            _measure("query_build")
 
-        # 5. 검색 실행
-        results = self._search(search_query)
-        _measure("search")
+            # 5. 검색 실행
+            results = self._search(search_query)
+            _measure("search")
 
         # 6. 결과 필터링 (선택)
         if self.result_filter:
@@ -191,23 +626,252 @@ class RAGPipeline:
         system_prompt, user_prompt = self.prompt_template.render(context, question)
         _measure("prompt_render")
 
+        return results, system_prompt, user_prompt, self._cache_prefix(user_prompt, context)
+
+    @property
+    def _sub_queries(self) -> SubQueryBuilder:
+        """fusion 모드 서브쿼리 빌더 (생성자에서 SubQueryBuilder 검증됨)"""
+        assert isinstance(self.query_builder, SubQueryBuilder)
+        return self.query_builder
+
+    def _cache_prefix(self, user_prompt: str, context: str) -> str | None:
+        """프롬프트 캐시 대상 구간 (user_prompt 시작 ~ 참고 문서 끝)
+
+        cache_documents=False면 None.
+        """
+        if not self.cache_documents or not context:
+            return None
+        pos = user_prompt.find(context)
+        if pos < 0:
+            return None
+        return user_prompt[: pos + len(context)]
+
+    def _from_cache(self, question: str, cached: RAGResult, timings: dict[str, float], latency_ms: float) -> RAGResult:
+        """답변 캐시 히트 결과 (이번 요청에서는 LLM 토큰을 쓰지 않음)"""
+        return replace(
+            cached,
+            question=question,
+            input_tokens=0,
+            output_tokens=0,
+            cache_read_tokens=0,
+            cache_write_tokens=0,
+            latency_ms=latency_ms,
+            timings=timings,
+        )
+
+    def _store_answer(self, embedding: list[float], result: RAGResult, generation: int | None = None) -> None:
+        """답변 캐시 저장 (빈 답변, 조회 후 캐시가 무효화된 경우 저장 안 함)"""
+        if self.answer_cache is not None and result.answer:
+            self.answer_cache.store(self._answer_cache_scope(), embedding, result, generation)
+
+    def _answer_cache_scope(self) -> str:
+        """답변 캐시 scope (project_id + 파이프라인 설정 지문)
+
+        인덱스/검색 설정/컴포넌트/모델이 다르면 같은 질문이라도 답변이 다를 수 있으므로 분리합니다.
+        """
+        config = {
+            "index": self.index,
+            "search_size": self.search_size,
+            "search_pipeline": self.search_pipeline,
+            "embedding_model": getattr(self.embedding_client, "model_id", ""),
+            "llm_model": getattr(self.llm_client, "model", ""),
+            "components": [
+                _describe(component)
+                for component in (
+                    self.query_enhancer,
+                    self.preprocessor,
+                    self.query_builder,
+                    self.fusion,
+                    self.result_filter,
+                    self.chunk_expander,
+                    self.context_builder,
+                    self.prompt_template,
+                )
+            ],
+        }
+        digest = hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return f"{self.project_id}:{digest}"
+
+    async def aquery(
+        self,
+        question: str,
+        history: list[dict] | None = None,
+    ) -> RAGResult:
+        """질문에 대한 RAG 파이프라인 실행 (비동기)
+
+        query()와 같은 단계를 실행하되, 서로 의존하지 않는 작업은 동시에 실행합니다.
+        - 쿼리 개선(LLM)과 원본 질문 임베딩을 동시에 시작
+          (개선된 질문이 원본과 같으면 임베딩 재사용, 다르면 다시 임베딩)
+        - fusion 모드: BM25 검색은 임베딩을 기다리지 않고 질문이 확정되는 즉시 시작
+          (timings["search_bm25"]는 임베딩과 겹치는 구간)
+        - 임베딩/검색/LLM은 비동기 클라이언트(aembed, asearch, acall) 사용
+        - 블로킹 컴포넌트(Reranker, 청크 확장)는 스레드 풀에서 실행
+
+        timings에는 단계별 소요 시간(겹치는 구간 포함)과
+        실제 경과 시간("wall")이 기록됩니다. latency_ms는 wall 기준입니다.
+
+        Args:
+            question: 사용자 질문
+            history: 대화 히스토리 (선택)
+
+        Returns:
+            RAGResult: query()와 동일한 형식
+        """
+        wall_start = time.time()
+        timings: dict[str, float] = {}
+
+        async def _timed(name: str, func, *args, **kwargs):
+            """단계별 시간 측정 헬퍼 (동시 실행 단계도 각자 측정)"""
+            stage_start = time.time()
+            result = await func(*args, **kwargs)
+            timings[name] = round((time.time() - stage_start) * 1000, 1)
+            return result
+
+        def _preprocess(text: str) -> str:
+            if not self.preprocessor:
+                return text
+            stage_start = time.time()
+            processed = self.preprocessor.process(text)
+            timings["preprocess"] = round((time.time() - stage_start) * 1000, 1)
+            return processed
+
+        # 1~3. 쿼리 개선 + 전처리 + 임베딩
+        processed = _preprocess(question)
+        # 쿼리 개선이 있으면 원본 질문 임베딩을 투기적으로 먼저 시작
+        embedding_task = asyncio.create_task(_timed("embedding", self.embedding_client.aembed, processed))
+        if self.query_enhancer:
+            enhanced = await _timed("query_enhance", self._aenhance, question, history)
+            if enhanced != question:
+                embedding_task.cancel()
+                processed = _preprocess(enhanced)
+                embedding_task = asyncio.create_task(_timed("embedding", self.embedding_client.aembed, processed))
+
+        # 5-1. BM25 검색 선행 시작 (fusion 모드, 임베딩과 동시 실행)
+        bm25_task = None
+        if self.fusion:
+            bm25_query = self._sub_queries.build_bm25(processed, self.project_id)
+            bm25_task = asyncio.create_task(_timed("search_bm25", self._asearch, bm25_query))
+
+        try:
+            embedding = await embedding_task
+        except BaseException:
+            if bm25_task is not None:
+                bm25_task.cancel()
+            raise
+
+        # 3-1. 답변 캐시 조회 (선택) - 인덱스 버전 확인(동기 HTTP)이 이벤트 루프를 막지 않도록 스레드에서 실행
+        generation = None
+        if self.answer_cache is not None:
+            stage_start = time.time()
+            hit = await asyncio.to_thread(self.answer_cache.lookup, self._answer_cache_scope(), embedding)
+            generation = self.answer_cache.generation
+            timings["cache_lookup"] = round((time.time() - stage_start) * 1000, 1)
+            timings["cache_hit"] = 1.0 if hit else 0.0
+            if hit is not None:
+                if bm25_task is not None:
+                    bm25_task.cancel()
+                wall_ms = round((time.time() - wall_start) * 1000, 1)
+                timings["wall"] = wall_ms
+                return self._from_cache(question, hit[0], timings, wall_ms)
+
+        # 쿼리 생성은 프로젝트 크기 캐시 미스/만료 시 동기 count 요청을 보낼 수 있으므로 스레드에서 실행
+        if self.fusion and bm25_task is not None:
+            # 4. KNN 쿼리 생성
+            knn_query = await _timed(
+                "query_build",
+                asyncio.to_thread,
+                self._sub_queries.build_knn,
+                embedding,
+                self.project_id,
+                self.search_size,
+            )
+
+            # 5. KNN 검색 + 선행 BM25 검색 완료 대기 후 융합
+            bm25_hits, knn_hits = await _timed("search", asyncio.gather, bm25_task, self._asearch(knn_query))
+            stage_start = time.time()
+            results = self.fusion.fuse([bm25_hits, knn_hits], self.search_size)
+            timings["fusion"] = round((time.time() - stage_start) * 1000, 1)
+        else:
+            # 4. 검색 쿼리 생성
+            search_query = await _timed(
+                "query_build",
+                asyncio.to_thread,
+                self.query_builder.build,
+                query=processed,
+                embedding=embedding,
+                project_id=self.project_id,
+                k=self.search_size,
+            )
+
+            # 5. 검색 실행
+            results = await _timed("search", self._asearch, search_query)
+
+        # 6. 결과 필터링 (선택) - Reranker는 CPU 작업이므로 스레드에서 실행
+        if self.result_filter:
+            results = await _timed("filter", asyncio.to_thread, self.result_filter.filter, processed, results)
+
+        # 7. 청크 확장 (선택) - 동기 OpenSearch 클라이언트 사용
+        if self.chunk_expander:
+            results = await _timed("chunk_expand", asyncio.to_thread, self.chunk_expander.expand, results)
+
+        # 8~9. 컨텍스트 + 프롬프트 생성
+        stage_start = time.time()
+        context = self.context_builder.build(results)
+        timings["context_build"] = round((time.time() - stage_start) * 1000, 1)
+
+        stage_start = time.time()
+        system_prompt, user_prompt = self.prompt_template.render(context, question)
+        timings["prompt_render"] = round((time.time() - stage_start) * 1000, 1)
+
         # 10. LLM 호출
-        response = self.llm_client.call(user_prompt, system=system_prompt)
-        _measure("llm")
+        cache_prefix = self._cache_prefix(user_prompt, context)
+        response = await _timed(
+            "llm", self.llm_client.acall, user_prompt, system=system_prompt, cache_prefix=cache_prefix
+        )
 
-        # 전체 소요 시간
-        total_ms = sum(timings.values())
+        # 실제 경과 시간 (동시 실행 구간은 한 번만 계산)
+        wall_ms = round((time.time() - wall_start) * 1000, 1)
+        timings["wall"] = wall_ms
 
-        return RAGResult(
+        result = RAGResult(
             question=question,
             answer=response.content,
             sources=results,
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
-            latency_ms=round(total_ms, 1),
+            cache_read_tokens=response.cache_read_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+            latency_ms=wall_ms,
             model=response.model,
             timings=timings,
         )
+        # 저장 시에도 인덱스 버전을 확인하므로 스레드에서 실행
+        await asyncio.to_thread(self._store_answer, embedding, result, generation)
+        return result
+
+    async def _aenhance(self, question: str, history: list[dict] | None) -> str:
+        """쿼리 개선 (aenhance가 없으면 스레드에서 enhance 실행)"""
+        assert self.query_enhancer is not None
+        aenhance = getattr(self.query_enhancer, "aenhance", None)
+        if aenhance is not None:
+            return await aenhance(question, history)
+        return await asyncio.to_thread(self.query_enhancer.enhance, question, history)
+
+    async def _asearch(self, query: dict) -> list[dict]:
+        """OpenSearch 검색 실행 (비동기)"""
+        if self.search_pipeline:
+            return await self.search_client.asearch_with_pipeline(
+                index=self.index,
+                query=query,
+                size=self.search_size,
+                pipeline=self.search_pipeline,
+            )
+        else:
+            return await self.search_client.asearch(
+                index=self.index,
+                query=query,
+                size=self.search_size,
+            )
 
     def _search(self, query: dict) -> list[dict]:
         """OpenSearch 검색 실행
@@ -230,6 +894,84 @@ class RAGPipeline:
             )
 
 
+def _describe(component) -> dict | None:
+    """답변 캐시 scope용 컴포넌트 설정 요약 (클래스명 + 단순 타입 속성)"""
+    if component is None:
+        return None
+    attrs = {}
+    for name, value in vars(component).items():
+        if name.startswith("_"):
+            continue
+        if isinstance(value, str | int | float | bool):
+            attrs[name] = value
+        elif isinstance(value, list | tuple) and all(isinstance(v, str | int | float | bool) for v in value):
+            attrs[name] = list(value)
+        elif isinstance(value, list | tuple) and all(hasattr(v, "__dict__") for v in value):
+            attrs[name] = [_describe(v) for v in value]
+    return {"type": type(component).__name__, **attrs}
+
+
+def _map_each(func: Callable, args: dict[int, tuple]) -> dict[int, object]:
+    """args 항목별 순차 실행 → {번호: 결과 | 예외}"""
+    values: dict[int, object] = {}
+    for i, item_args in args.items():
+        try:
+            values[i] = func(*item_args)
+        except Exception as e:
+            values[i] = e
+    return values
+
+
+def _map_concurrent(
+    func: Callable,
+    args: dict[int, tuple],
+    workers: int,
+    stop_on_error: bool,
+    on_done: Callable[[int, object], None] | None = None,
+) -> dict[int, object]:
+    """args 항목을 최대 workers개 동시 실행 → {번호: 결과 | 예외}
+
+    stop_on_error면 첫 예외에서 시작 전인 작업을 취소하고 예외를 발생시킵니다.
+    on_done은 항목이 끝나는 순서대로 호출 스레드에서 호출됩니다.
+    """
+    values: dict[int, object] = {}
+    if not args:
+        return values
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(args))))
+    try:
+        futures = {executor.submit(func, *item_args): i for i, item_args in args.items()}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                values[i] = future.result()
+            except Exception as e:
+                if stop_on_error:
+                    raise
+                values[i] = e
+            if on_done is not None:
+                on_done(i, values[i])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return values
+
+
+def _search_client_for(snapshot: str | None) -> OpenSearchClient | LocalSearchClient:
+    """검색 클라이언트 (snapshot 경로가 있으면 로컬 검색)"""
+    if snapshot:
+        return LocalSearchClient.from_snapshot(snapshot)
+    return with_cassette(OpenSearchClient(), "opensearch")
+
+
+def _project_size_for(search_client: OpenSearchClient | LocalSearchClient, index: str) -> ProjectSizeCache:
+    """쿼리 빌더 정확 검색 전환용 프로젝트 청크 수 캐시"""
+    return ProjectSizeCache(partial(search_client.get_doc_count_by_project, index))
+
+
+def _answer_cache_for(search_client: OpenSearchClient | LocalSearchClient, index: str) -> SemanticAnswerCache:
+    """인덱스 변경 시 자동 무효화되는 답변 캐시"""
+    return SemanticAnswerCache(index_version_fn=partial(search_client.get_index_version, index))
+
+
 # =============================================================================
 # 팩토리 함수
 # =============================================================================
@@ -238,24 +980,32 @@ class RAGPipeline:
 def create_minimal_pipeline(
     project_id: int = 334,
     index: str = "rag-index-fargate-live",
+    answer_cache: bool = False,
+    snapshot: str | None = None,
+    knn_options: dict | None = None,
 ) -> RAGPipeline:
     """최소 구성 파이프라인
 
     - 전처리: 없음
-    - 검색: 순수 벡터 검색 (KNN)
+    - 검색: 순수 벡터 검색 (KNN, 작은 프로젝트는 정확 검색)
     - 필터: 없음
     - 확장: 없음
     - 컨텍스트: 단순 연결
     - 프롬프트: 단순 RAG
 
     베이스라인 성능 측정용.
+    answer_cache=True면 유사 질문 답변 캐시 사용.
+    snapshot을 지정하면 OpenSearch 대신 로컬 스냅샷에서 검색 (cli.py snapshot으로 생성).
+    knn_options는 쿼리 빌더 근사 knn 옵션 (knn_k / ef_search / rescore / oversample_factor).
     """
+    search_client = _search_client_for(snapshot)
+
     return RAGPipeline(
-        search_client=OpenSearchClient(),
-        embedding_client=EmbeddingClient(),
-        llm_client=LLMClient(),
+        search_client=search_client,
+        embedding_client=CachedEmbeddingClient.from_env(with_cassette(EmbeddingClient(), "bedrock")),
+        llm_client=with_cassette(LLMClient(), "vertex"),
         preprocessor=None,
-        query_builder=KNNQueryBuilder(),
+        query_builder=KNNQueryBuilder(project_size=_project_size_for(search_client, index), **(knn_options or {})),
         result_filter=None,
         chunk_expander=None,
         context_builder=SimpleContextBuilder(),
@@ -263,30 +1013,41 @@ def create_minimal_pipeline(
         index=index,
         project_id=project_id,
         search_size=5,
+        answer_cache=_answer_cache_for(search_client, index) if answer_cache else None,
     )
 
 
 def create_standard_pipeline(
     project_id: int = 334,
     index: str = "rag-index-fargate-live",
+    answer_cache: bool = False,
+    snapshot: str | None = None,
+    fusion: ResultFusion | None = None,
+    knn_options: dict | None = None,
 ) -> RAGPipeline:
     """표준 구성 파이프라인
 
     - 전처리: 없음 (Nori가 처리)
-    - 검색: 하이브리드 (KNN + BM25 with RRF)
+    - 검색: 하이브리드 (KNN + BM25 with RRF, 작은 프로젝트는 KNN 정확 검색)
     - 필터: Top-K (20 → 5)
     - 확장: 없음
     - 컨텍스트: 메타데이터 포함 + LongContextReorder
     - 프롬프트: 엄격 모드 (할루시네이션 방지)
 
     운영 권장 구성.
+    answer_cache=True면 유사 질문 답변 캐시 사용.
+    snapshot을 지정하면 로컬 스냅샷에서 검색 (BM25 + KNN RRF를 프로세스 내에서 수행).
+    fusion을 지정하면 hybrid-rrf 파이프라인 대신 클라이언트에서 융합.
+    knn_options는 쿼리 빌더 근사 knn 옵션 (knn_k / ef_search / rescore / oversample_factor).
     """
+    search_client = _search_client_for(snapshot)
+
     return RAGPipeline(
-        search_client=OpenSearchClient(),
-        embedding_client=EmbeddingClient(),
-        llm_client=LLMClient(),
+        search_client=search_client,
+        embedding_client=CachedEmbeddingClient.from_env(with_cassette(EmbeddingClient(), "bedrock")),
+        llm_client=with_cassette(LLMClient(), "vertex"),
         preprocessor=None,
-        query_builder=HybridQueryBuilder(),
+        query_builder=HybridQueryBuilder(project_size=_project_size_for(search_client, index), **(knn_options or {})),
         result_filter=TopKFilter(k=5),
         chunk_expander=None,
         context_builder=RankedContextBuilder(reorder=True),
@@ -294,33 +1055,41 @@ def create_standard_pipeline(
         index=index,
         project_id=project_id,
         search_size=20,
-        search_pipeline=HybridQueryBuilder.SEARCH_PIPELINE,
+        search_pipeline=None if fusion else HybridQueryBuilder.SEARCH_PIPELINE,
+        answer_cache=_answer_cache_for(search_client, index) if answer_cache else None,
+        fusion=fusion,
     )
 
 
 def create_full_pipeline(
     project_id: int = 334,
     index: str = "rag-index-fargate-live",
+    answer_cache: bool = False,
+    fusion: ResultFusion | None = None,
+    knn_options: dict | None = None,
 ) -> RAGPipeline:
     """전체 기능 파이프라인
 
     - 전처리: 한국어 전처리 (유니코드 정규화, 종결어미 제거)
-    - 검색: 하이브리드 (KNN + BM25 with RRF)
+    - 검색: 하이브리드 (KNN + BM25 with RRF, 작은 프로젝트는 KNN 정확 검색)
     - 필터: Top-K → Reranking (20 → 5)
     - 확장: 이웃 청크 (window=5)
     - 컨텍스트: 메타데이터 포함 + LongContextReorder
     - 프롬프트: 엄격 모드 (할루시네이션 방지)
 
     최고 품질 구성. 레이턴시가 다소 높음.
+    answer_cache=True면 유사 질문 답변 캐시 사용.
+    fusion을 지정하면 hybrid-rrf 파이프라인 대신 클라이언트에서 융합.
+    knn_options는 쿼리 빌더 근사 knn 옵션 (knn_k / ef_search / rescore / oversample_factor).
     """
-    search_client = OpenSearchClient()
+    search_client = with_cassette(OpenSearchClient(), "opensearch")
 
     return RAGPipeline(
         search_client=search_client,
-        embedding_client=EmbeddingClient(),
-        llm_client=LLMClient(),
+        embedding_client=CachedEmbeddingClient.from_env(with_cassette(EmbeddingClient(), "bedrock")),
+        llm_client=with_cassette(LLMClient(), "vertex"),
         preprocessor=KoreanPreprocessor(),
-        query_builder=HybridQueryBuilder(),
+        query_builder=HybridQueryBuilder(project_size=_project_size_for(search_client, index), **(knn_options or {})),
         result_filter=CompositeFilter(
             [
                 TopKFilter(k=20),
@@ -337,5 +1106,7 @@ def create_full_pipeline(
         index=index,
         project_id=project_id,
         search_size=50,  # Reranking 전 충분히 가져옴
-        search_pipeline=HybridQueryBuilder.SEARCH_PIPELINE,
+        search_pipeline=None if fusion else HybridQueryBuilder.SEARCH_PIPELINE,
+        answer_cache=_answer_cache_for(search_client, index) if answer_cache else None,
+        fusion=fusion,
     )
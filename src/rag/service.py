@@ -10,6 +10,8 @@ Usage:
     result = service.query("연차 휴가는 며칠인가요?")
 """
 
+from collections.abc import Callable
+
 from src.types import RAGServiceBase, ServiceResult
 
 from .pipeline import RAGPipeline, create_minimal_pipeline, create_standard_pipeline
@@ -26,14 +28,17 @@ class RAGService(RAGServiceBase):
         self,
         project_id: int = 334,
         pipeline: str = "minimal",
+        answer_cache: bool = False,
     ):
         """
         Args:
             project_id: 프로젝트 ID
             pipeline: 파이프라인 종류 ("minimal" | "standard")
+            answer_cache: 유사 질문 답변 캐시 사용 여부
         """
         self.project_id = project_id
         self._pipeline_type = pipeline
+        self._answer_cache = answer_cache
         self._pipeline: RAGPipeline | None = None
 
     @property
@@ -41,9 +46,9 @@ class RAGService(RAGServiceBase):
         """파이프라인 (lazy init)"""
         if self._pipeline is None:
             if self._pipeline_type == "standard":
-                self._pipeline = create_standard_pipeline(project_id=self.project_id)
+                self._pipeline = create_standard_pipeline(project_id=self.project_id, answer_cache=self._answer_cache)
             else:
-                self._pipeline = create_minimal_pipeline(project_id=self.project_id)
+                self._pipeline = create_minimal_pipeline(project_id=self.project_id, answer_cache=self._answer_cache)
         return self._pipeline
 
     def query(self, question: str) -> ServiceResult:
@@ -55,14 +60,47 @@ class RAGService(RAGServiceBase):
         Returns:
             ServiceResult: 통합 결과
         """
-        result: RAGResult = self.pipeline.query(question)
+        return self._to_service_result(self.pipeline.query(question))
+
+    def query_batch(
+        self,
+        questions: list[str],
+        concurrency: int = 8,
+        on_result: Callable[[int, ServiceResult | Exception], None] | None = None,
+    ) -> list[ServiceResult | Exception]:
+        """여러 질문 일괄 실행 (RAGPipeline.query_batch - 임베딩/검색 묶음 처리, LLM 동시 호출)
+
+        Args:
+            questions: 사용자 질문 리스트
+            concurrency: 동시 LLM 호출 수
+            on_result: 질문별 결과가 확정될 때마다 호출 (질문 번호, 결과 | 예외)
+
+        Returns:
+            입력 순서와 같은 결과 리스트 (실패한 질문은 Exception)
+        """
+
+        def _convert(result: RAGResult | Exception) -> ServiceResult | Exception:
+            return result if isinstance(result, Exception) else self._to_service_result(result)
+
+        results = self.pipeline.query_batch(
+            questions,
+            concurrency=concurrency,
+            return_exceptions=True,
+            on_result=None if on_result is None else lambda i, result: on_result(i, _convert(result)),
+        )
+        return [_convert(result) for result in results]
 
+    @staticmethod
+    def _to_service_result(result: RAGResult) -> ServiceResult:
+        """RAGResult → ServiceResult"""
         return ServiceResult(
             mode="basic",
             question=result.question,
             answer=result.answer,
             input_tokens=result.input_tokens,
             output_tokens=result.output_tokens,
+            cache_read_tokens=result.cache_read_tokens,
+            cache_write_tokens=result.cache_write_tokens,
             latency_ms=result.latency_ms,
             model=result.model,
             sources=[
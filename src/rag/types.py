@@ -11,8 +11,10 @@ class RAGResult:
         question: 원본 사용자 질문
         answer: LLM 생성 답변
         sources: 검색된 문서 리스트 [{"_id": str, "_score": float, "_source": {...}}, ...]
-        input_tokens: LLM 입력 토큰 수
+        input_tokens: LLM 입력 토큰 수 (프롬프트 캐시 토큰 제외)
         output_tokens: LLM 출력 토큰 수
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_write_tokens: 프롬프트 캐시에 새로 쓴 입력 토큰 수
         latency_ms: 전체 파이프라인 소요 시간 (밀리초)
         model: 사용된 LLM 모델명
         timings: 단계별 소요 시간 (밀리초) {"embedding": 100.5, "search": 50.2, ...}
@@ -23,6 +25,8 @@ class RAGResult:
     sources: list[dict] = field(default_factory=list)
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     latency_ms: float = 0.0
     model: str = ""
     timings: dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,142 @@
+"""요청 속도 제한기 (RateLimiter)
+
+외부 API(Bedrock, Vertex AI 등) 호출 빈도를 초당 요청 수로 제한합니다.
+여러 스레드가 하나의 리미터를 공유할 수 있습니다 (thread-safe).
+
+Usage:
+    from src.rate_limit import RateLimiter
+
+    limiter = RateLimiter(rate_per_sec=20)
+    limiter.acquire()  # 토큰이 생길 때까지 대기
+
+    # 스로틀링 응답을 받으면 속도를 낮추고, 성공하면 서서히 회복
+    limiter.throttle()
+    limiter.recover()
+
+    # 공급자별 공유 제한 (LLMClient / EmbeddingClient / GeminiClient / Agent가 호출 전에 대기)
+    set_provider_limit("vertex", 2.0)
+    acquire_provider("vertex")
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """토큰 버킷 기반 적응형 속도 제한기
+
+    - acquire(): 토큰 1개 소비 (없으면 대기)
+    - throttle(): 스로틀링 발생 시 현재 속도를 절반으로 (최소 min_rate)
+    - recover(): 성공 시 현재 속도를 조금씩 원래 속도로 회복 (AIMD)
+
+    Args:
+        rate_per_sec: 최대 초당 요청 수
+        burst: 순간 허용 요청 수 (기본값: rate_per_sec 올림)
+        min_rate: 스로틀링 시 하한 속도 (기본값: 0.5 rps)
+        recover_step: 성공 1회당 회복하는 속도 (기본값: 최대 속도의 5%)
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int | None = None,
+        min_rate: float = 0.5,
+        recover_step: float | None = None,
+    ):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec는 0보다 커야 합니다")
+
+        self.max_rate = rate_per_sec
+        self.min_rate = min(min_rate, rate_per_sec)
+        self.burst = burst or max(1, int(rate_per_sec + 0.999))
+        self.recover_step = recover_step or rate_per_sec * 0.05
+
+        self._rate = rate_per_sec
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """현재 적용 중인 초당 요청 수"""
+        return self._rate
+
+    def acquire(self) -> None:
+        """토큰 1개 획득 (필요 시 대기)"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """토큰 1개 획득 (비동기, 대기 중 이벤트 루프를 막지 않음)"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+    def throttle(self) -> None:
+        """스로틀링 발생 - 속도 절반으로 감소"""
+        with self._lock:
+            self._refill()
+            self._rate = max(self.min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def recover(self) -> None:
+        """요청 성공 - 속도 점진적 회복"""
+        if self._rate >= self.max_rate:
+            return
+        with self._lock:
+            self._rate = min(self.max_rate, self._rate + self.recover_step)
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+# =============================================================================
+# 공급자별 공유 리미터
+# =============================================================================
+
+# 외부 API 공급자 (vertex: Claude - LLMClient/Agent, bedrock: Titan 임베딩, gemini: Gemini, tavily: 웹 검색)
+PROVIDERS = ("vertex", "bedrock", "gemini", "tavily")
+
+_provider_limiters: dict[str, RateLimiter] = {}
+
+
+def set_provider_limit(provider: str, rate_per_sec: float | None) -> None:
+    """공급자 초당 요청 수 설정 (None이면 해제, 프로세스 전체에서 공유)"""
+    if rate_per_sec is None:
+        _provider_limiters.pop(provider, None)
+    else:
+        _provider_limiters[provider] = RateLimiter(rate_per_sec=rate_per_sec)
+
+
+def provider_limiter(provider: str) -> RateLimiter | None:
+    """공급자 리미터 (설정되지 않았으면 None)"""
+    return _provider_limiters.get(provider)
+
+
+def acquire_provider(provider: str) -> None:
+    """공급자 호출 전 대기 (제한이 없으면 즉시 반환)"""
+    limiter = _provider_limiters.get(provider)
+    if limiter is not None:
+        limiter.acquire()
+
+
+async def aacquire_provider(provider: str) -> None:
+    """공급자 호출 전 대기 (비동기)"""
+    limiter = _provider_limiters.get(provider)
+    if limiter is not None:
+        await limiter.aacquire()
@@ -4,6 +4,8 @@ RAG 서비스의 공통 인터페이스와 결과 타입을 정의합니다.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 
 
@@ -17,8 +19,10 @@ class ServiceResult:
         mode: 실행 모드 ("basic" | "agent")
         question: 원본 질문
         answer: 생성된 답변
-        input_tokens: 입력 토큰 수
+        input_tokens: 입력 토큰 수 (프롬프트 캐시 토큰 제외)
         output_tokens: 출력 토큰 수
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_write_tokens: 프롬프트 캐시에 새로 쓴 입력 토큰 수
         latency_ms: 전체 소요 시간 (밀리초)
         model: 사용된 모델명
         sources: 검색된 소스 (Basic 모드)
@@ -32,6 +36,8 @@ class ServiceResult:
     answer: str
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     latency_ms: float = 0.0
     model: str = ""
     sources: list[dict] = field(default_factory=list)
@@ -61,3 +67,36 @@ class RAGServiceBase(ABC):
             ServiceResult: 통합 결과
         """
         pass
+
+    def query_batch(
+        self,
+        questions: list[str],
+        concurrency: int = 8,
+        on_result: Callable[[int, ServiceResult | Exception], None] | None = None,
+    ) -> list[ServiceResult | Exception]:
+        """여러 질문 실행 (기본 구현: query를 최대 concurrency개 스레드에서 동시 실행)
+
+        query가 호출 간 상태를 공유하지 않아야 합니다 (Agent 모드는 질문마다 새 Agent + 검색 세션).
+
+        Args:
+            questions: 사용자 질문 리스트
+            concurrency: 동시 실행 수
+            on_result: 질문이 끝날 때마다 호출 (질문 번호, 결과 | 예외) - 호출 스레드에서 실행
+
+        Returns:
+            입력 순서와 같은 결과 리스트 (실패한 질문은 Exception)
+        """
+        results: list[ServiceResult | Exception | None] = [None] * len(questions)
+        if not questions:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(questions)))) as executor:
+            futures = {executor.submit(self.query, question): i for i, question in enumerate(questions)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = e
+                if on_result is not None:
+                    on_result(i, results[i])
+        return results
@@ -0,0 +1,127 @@
+"""SemanticAnswerCache 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.rag.answer_cache import SemanticAnswerCache
+from src.rag.types import RAGResult
+
+
+def _result(answer: str = "연차는 15일입니다.") -> RAGResult:
+    return RAGResult(question="연차 휴가는 며칠인가?", answer=answer, input_tokens=100, output_tokens=20)
+
+
+class TestLookup:
+    """조회 테스트"""
+
+    def test_similar_embedding_hits(self):
+        cache = SemanticAnswerCache(threshold=0.95)
+        cache.store("334:a", [1.0, 0.0, 0.0], _result())
+
+        hit = cache.lookup("334:a", [0.99, 0.05, 0.0])
+
+        assert hit is not None
+        result, similarity = hit
+        assert result.answer == "연차는 15일입니다."
+        assert similarity >= 0.95
+
+    def test_dissimilar_embedding_misses(self):
+        cache = SemanticAnswerCache(threshold=0.95)
+        cache.store("334:a", [1.0, 0.0, 0.0], _result())
+
+        assert cache.lookup("334:a", [0.0, 1.0, 0.0]) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_scopes_are_isolated(self):
+        """project_id/설정이 다르면 공유하지 않음"""
+        cache = SemanticAnswerCache()
+        cache.store("334:a", [1.0, 0.0], _result())
+
+        assert cache.lookup("335:a", [1.0, 0.0]) is None
+        assert cache.lookup("334:b", [1.0, 0.0]) is None
+
+    def test_returns_best_match(self):
+        cache = SemanticAnswerCache(threshold=0.9)
+        cache.store("s", [1.0, 0.0], _result("A"))
+        cache.store("s", [0.0, 1.0], _result("B"))
+
+        result, _ = cache.lookup("s", [0.1, 1.0])
+
+        assert result.answer == "B"
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            SemanticAnswerCache(threshold=0)
+
+
+class TestExpiry:
+    """TTL / 용량 / 무효화 테스트"""
+
+    def test_ttl_expires_entries(self):
+        cache = SemanticAnswerCache(ttl_seconds=60)
+        with patch("src.rag.answer_cache.time.time", return_value=1000.0):
+            cache.store("s", [1.0, 0.0], _result())
+        with patch("src.rag.answer_cache.time.time", return_value=1061.0):
+            assert cache.lookup("s", [1.0, 0.0]) is None
+
+        assert cache.stats()["entries"] == 0
+
+    def test_max_entries_evicts_oldest(self):
+        cache = SemanticAnswerCache(max_entries=2)
+        cache.store("s", [1.0, 0.0, 0.0], _result("A"))
+        cache.store("s", [0.0, 1.0, 0.0], _result("B"))
+        cache.store("s", [0.0, 0.0, 1.0], _result("C"))
+
+        assert cache.lookup("s", [1.0, 0.0, 0.0]) is None
+        assert cache.lookup("s", [0.0, 0.0, 1.0])[0].answer == "C"
+
+    def test_index_version_change_invalidates(self):
+        version = MagicMock(side_effect=["v1", "v1", "v2"])
+        cache = SemanticAnswerCache(index_version_fn=version, version_check_interval=0)
+
+        cache.store("s", [1.0, 0.0], _result())
+        assert cache.lookup("s", [1.0, 0.0]) is not None
+        assert cache.lookup("s", [1.0, 0.0]) is None
+
+        assert cache.stats()["invalidations"] == 1
+
+    def test_version_checked_at_interval(self):
+        version = MagicMock(return_value="v1")
+        cache = SemanticAnswerCache(index_version_fn=version, version_check_interval=30)
+
+        cache.store("s", [1.0, 0.0], _result())
+        for _ in range(5):
+            cache.lookup("s", [1.0, 0.0])
+
+        version.assert_called_once()
+
+    def test_version_fn_failure_is_miss(self):
+        version = MagicMock(side_effect=["v1", ConnectionError("timeout"), "v1"])
+        cache = SemanticAnswerCache(index_version_fn=version, version_check_interval=0)
+        cache.store("s", [1.0, 0.0], _result())
+
+        assert cache.lookup("s", [1.0, 0.0]) is None  # 확인 실패 → 미스
+        assert cache.lookup("s", [1.0, 0.0]) is not None  # 복구되면 기존 항목 그대로 사용
+        assert cache.stats()["misses"] == 1
+
+    def test_store_skipped_after_version_fn_failure(self):
+        version = MagicMock(side_effect=ConnectionError("timeout"))
+        cache = SemanticAnswerCache(index_version_fn=version, version_check_interval=0)
+
+        cache.store("s", [1.0, 0.0], _result())
+
+        assert cache.stats()["entries"] == 0
+
+    def test_stale_generation_not_stored(self):
+        """조회 후 무효화됐으면 이전 인덱스 기준으로 계산된 답변은 저장 안 함"""
+        cache = SemanticAnswerCache()
+        assert cache.lookup("s", [1.0, 0.0]) is None
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.store("s", [1.0, 0.0], _result(), generation)
+        assert cache.stats()["entries"] == 0
+
+        cache.store("s", [1.0, 0.0], _result(), cache.generation)
+        assert cache.stats()["entries"] == 1
@@ -0,0 +1,364 @@
+"""외부 호출 녹화/재생 (카세트) 테스트"""
+
+import asyncio
+import struct
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from strands import tool
+
+from src.agent.cassette import CassetteModel, with_cassette_tool
+from src.cassette import (
+    Cassette,
+    CassetteEmbeddingClient,
+    CassetteLLMClient,
+    CassetteMissError,
+    CassetteSearchClient,
+    active_cassette,
+    use_cassette,
+    with_cassette,
+)
+from src.embedding_client import BatchEmbeddingResult
+from src.llm_client import LLMResponse
+from src.rag.modules.context_builder import SimpleContextBuilder
+from src.rag.modules.prompt_template import SimplePromptTemplate
+from src.rag.modules.query_builder import KNNQueryBuilder
+from src.rag.pipeline import RAGPipeline
+
+HITS = [{"_id": "doc1", "_score": 0.9, "_source": {"text": "연차는 15일입니다.", "file_name": "휴가.md"}}]
+
+
+class FakeEmbeddingClient:
+    model_id = "fake-embed"
+    dimensions = 4
+    max_workers = 2
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def embed(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return [0.1, 0.2, 0.3, float(len(text))]
+
+    async def aembed(self, text: str) -> list[float]:
+        return self.embed(text)
+
+    def embed_batch(self, texts, max_workers=None, max_retries=5) -> BatchEmbeddingResult:
+        return BatchEmbeddingResult(embeddings=[self.embed(text) for text in texts])
+
+
+class FakeLLMClient:
+    model = "fake-llm"
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, prompt, system=None, max_tokens=1024, cache_prefix=None) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(content=f"답변 {self.calls}", input_tokens=10, output_tokens=5, model=self.model)
+
+    async def acall(self, prompt, system=None, max_tokens=1024, cache_prefix=None) -> LLMResponse:
+        return self.call(prompt, system, max_tokens, cache_prefix)
+
+    def stream(self, prompt, system=None, max_tokens=1024, cache_prefix=None):
+        self.calls += 1
+        yield "연차는 "
+        yield "15일"
+        yield LLMResponse(content="연차는 15일", input_tokens=10, output_tokens=3, model=self.model)
+
+
+class FakeSearchClient:
+    def __init__(self):
+        self.client = MagicMock()
+        self.client.search.return_value = {"hits": {"hits": HITS}}
+        self.searches = 0
+
+    def search(self, index, query, size=5, request_timeout=None, include_vectors=None):
+        self.searches += 1
+        return HITS
+
+    def search_with_pipeline(
+        self, index, query, size=5, pipeline="hybrid-rrf", request_timeout=None, include_vectors=None
+    ):
+        self.searches += 1
+        return HITS
+
+    def msearch_with_pipeline(self, index, entries, request_timeout=None, include_vectors=None):
+        self.searches += len(entries)
+        return [HITS for _ in entries]
+
+    def get_doc_count_by_project(self, index, project_id):
+        return 120
+
+    def get_index_version(self, index):
+        return "v1"
+
+    def refresh(self, index):
+        return f"refreshed {index}"
+
+
+@pytest.fixture
+def record(tmp_path):
+    return Cassette(tmp_path / "cassette", mode="record")
+
+
+@pytest.fixture
+def replay(tmp_path):
+    return Cassette(tmp_path / "cassette", mode="replay")
+
+
+@pytest.fixture(autouse=True)
+def reset_active():
+    yield
+    use_cassette(None)
+
+
+class TestCassette:
+    """카세트 저장소 테스트"""
+
+    def test_record_then_replay(self, record, replay):
+        func = MagicMock(return_value={"answer": 42})
+
+        assert record.call("vertex", "call", {"prompt": "질문"}, func) == {"answer": 42}
+        assert replay.call("vertex", "call", {"prompt": "질문"}, func) == {"answer": 42}
+
+        func.assert_called_once()
+        assert record.stats()["recorded"] == 1
+        assert replay.stats()["hits"] == 1
+        assert len(list(record.path.rglob("*.json"))) == 1
+
+    def test_replay_miss(self, replay):
+        with pytest.raises(CassetteMissError, match="vertex.call"):
+            replay.call("vertex", "call", {"prompt": "없는 질문"}, MagicMock())
+        assert replay.stats()["misses"] == 1
+
+    def test_key_is_content_addressed(self):
+        assert Cassette.key("opensearch", "search", {"a": 1, "b": 2}) == Cassette.key(
+            "opensearch", "search", {"b": 2, "a": 1}
+        )
+        assert Cassette.key("opensearch", "search", {"a": 1}) != Cassette.key("opensearch", "search", {"a": 2})
+        assert Cassette.key("opensearch", "search", {"a": (1, 2)}) == Cassette.key(
+            "opensearch", "search", {"a": [1, 2]}
+        )
+
+    def test_key_ignores_float32_rounding(self):
+        """임베딩 디스크 캐시(float32)에서 나온 벡터도 같은 키"""
+        vector = [0.123456789, -1.987654321]
+        as_float32 = [struct.unpack("f", struct.pack("f", v))[0] for v in vector]
+
+        assert as_float32 != vector
+        assert Cassette.key("opensearch", "search", {"vector": vector}) == Cassette.key(
+            "opensearch", "search", {"vector": as_float32}
+        )
+
+    def test_replay_latency(self, tmp_path):
+        path = tmp_path / "cassette"
+        Cassette(path, mode="record").put("vertex", "call", {"p": 1}, "ok", latency_ms=50)
+
+        start = time.perf_counter()
+        Cassette(path, mode="replay").call("vertex", "call", {"p": 1}, MagicMock())
+        assert time.perf_counter() - start < 0.04
+
+        start = time.perf_counter()
+        Cassette(path, mode="replay", latency_scale=1.0).call("vertex", "call", {"p": 1}, MagicMock())
+        assert time.perf_counter() - start >= 0.05
+
+    def test_async_shares_entries(self, record, replay):
+        async def func():
+            return "비동기"
+
+        assert asyncio.run(record.acall("vertex", "call", {"p": 1}, func)) == "비동기"
+        assert replay.call("vertex", "call", {"p": 1}, MagicMock()) == "비동기"
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="모드"):
+            Cassette(tmp_path, mode="rewind")
+
+
+class TestActiveCassette:
+    """전역 카세트 설정 테스트"""
+
+    def test_without_cassette_returns_client(self):
+        use_cassette(None)
+        client = FakeLLMClient()
+        assert with_cassette(client, "vertex") is client
+
+    def test_wraps_by_provider(self, tmp_path):
+        use_cassette(tmp_path, mode="record")
+
+        assert isinstance(with_cassette(FakeEmbeddingClient(), "bedrock"), CassetteEmbeddingClient)
+        assert isinstance(with_cassette(FakeLLMClient(), "vertex"), CassetteLLMClient)
+        assert isinstance(with_cassette(FakeSearchClient(), "opensearch"), CassetteSearchClient)
+        with pytest.raises(ValueError):
+            with_cassette(FakeLLMClient(), "openai")
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        import src.cassette as cassette_module
+
+        monkeypatch.setenv("RAG_CASSETTE", str(tmp_path))
+        monkeypatch.setenv("RAG_CASSETTE_LATENCY", "0.5")
+        monkeypatch.setattr(cassette_module, "_env_checked", False)
+
+        cassette = active_cassette()
+        assert cassette.path == tmp_path
+        assert cassette.mode == "replay"
+        assert cassette.latency_scale == 0.5
+
+
+class TestClientProxies:
+    """클라이언트 프록시 테스트"""
+
+    def test_embedding_single_and_batch_share_entries(self, record, replay):
+        wrapped = FakeEmbeddingClient()
+        CassetteEmbeddingClient(wrapped, record).embed_batch(["연차", "복지"])
+        client = CassetteEmbeddingClient(FakeEmbeddingClient(), replay)
+
+        assert client.embed("연차") == [0.1, 0.2, 0.3, 2.0]
+        result = client.embed_batch(["복지", "없음"])
+        assert result.embeddings[0] == [0.1, 0.2, 0.3, 2.0]
+        assert result.embeddings[1] is None
+        assert "CassetteMissError" in result.errors[1]
+        assert client.model_id == "fake-embed"
+
+    def test_llm_call_acall_share_entries(self, record, replay):
+        response = CassetteLLMClient(FakeLLMClient(), record, "vertex", LLMResponse, "fake-llm").call("질문", "시스템")
+        wrapped = FakeLLMClient()
+        client = CassetteLLMClient(wrapped, replay, "vertex", LLMResponse, "fake-llm")
+
+        assert client.call(prompt="질문", system="시스템", max_tokens=1024) == response
+        assert asyncio.run(client.acall("질문", system="시스템")) == response
+        assert wrapped.calls == 0
+        with pytest.raises(CassetteMissError):
+            client.call("질문", "시스템", max_tokens=10)
+
+    def test_llm_stream(self, record, replay):
+        recorded = list(CassetteLLMClient(FakeLLMClient(), record, "vertex", LLMResponse, "fake-llm").stream("질문"))
+        replayed = list(CassetteLLMClient(FakeLLMClient(), replay, "vertex", LLMResponse, "fake-llm").stream("질문"))
+
+        assert replayed == recorded
+        assert isinstance(replayed[-1], LLMResponse)
+
+    def test_search_and_msearch_share_entries(self, record, replay):
+        query = {"query": {"knn": {"embedding": {"vector": [0.5, 0.25], "k": 5}}}}
+        CassetteSearchClient(FakeSearchClient(), record).search("idx", query, size=5)
+        CassetteSearchClient(FakeSearchClient(), record).search_with_pipeline("idx", query, size=5)
+        wrapped = FakeSearchClient()
+        client = CassetteSearchClient(wrapped, replay)
+
+        assert client.msearch_with_pipeline("idx", [(query, 5, None), (query, 5, "hybrid-rrf")]) == [HITS, HITS]
+        assert asyncio.run(client.asearch("idx", query, 5)) == HITS
+        assert wrapped.searches == 0
+        with pytest.raises(CassetteMissError):
+            client.msearch("idx", [(query, 5), (query, 10)])
+
+    def test_search_metadata_and_raw_client(self, record, replay):
+        recorder = CassetteSearchClient(FakeSearchClient(), record)
+        recorder.get_doc_count_by_project("idx", 334)
+        recorder.get_index_version("idx")
+        recorder.client.search(index="idx", body={"size": 10})
+        client = CassetteSearchClient(FakeSearchClient(), replay)
+
+        assert client.get_doc_count_by_project("idx", 334) == 120
+        assert client.get_index_version("idx") == "v1"
+        assert client.client.search(index="idx", body={"size": 10}) == {"hits": {"hits": HITS}}
+        client.client.wrapped.search.assert_not_called()
+        assert client.refresh("idx") == "refreshed idx"
+
+
+class TestPipelineReplay:
+    """파이프라인 녹화 → 오프라인 재생 테스트"""
+
+    QUESTIONS = ["연차는 며칠?", "복지 제도는?"]
+
+    @staticmethod
+    def make_pipeline(cassette: Cassette) -> tuple[RAGPipeline, FakeLLMClient]:
+        llm = FakeLLMClient()
+        pipeline = RAGPipeline(
+            search_client=CassetteSearchClient(FakeSearchClient(), cassette),
+            embedding_client=CassetteEmbeddingClient(FakeEmbeddingClient(), cassette),
+            llm_client=CassetteLLMClient(llm, cassette, "vertex", LLMResponse, "fake-llm"),
+            query_builder=KNNQueryBuilder(),
+            context_builder=SimpleContextBuilder(),
+            prompt_template=SimplePromptTemplate(),
+            index="idx",
+            project_id=334,
+        )
+        return pipeline, llm
+
+    def test_query_recording_replays_in_batch(self, record, replay):
+        recorder, _ = self.make_pipeline(record)
+        recorded = [recorder.query(q) for q in self.QUESTIONS]
+        pipeline, llm = self.make_pipeline(replay)
+
+        replayed = pipeline.query_batch(self.QUESTIONS)
+
+        assert [r.answer for r in replayed] == [r.answer for r in recorded]
+        assert [r.sources for r in replayed] == [r.sources for r in recorded]
+        assert llm.calls == 0
+        assert replay.stats()["misses"] == 0
+
+    def test_unrecorded_question_fails_alone(self, record, replay):
+        recorder, _ = self.make_pipeline(record)
+        recorder.query_batch(self.QUESTIONS[:1])
+        pipeline, _ = self.make_pipeline(replay)
+
+        results = pipeline.query_batch(self.QUESTIONS, return_exceptions=True)
+
+        assert results[0].answer == "답변 1"
+        assert isinstance(results[1], Exception)
+
+
+class TestAgentCassette:
+    """Agent 모델/도구 녹화/재생 테스트"""
+
+    def test_tool(self, tmp_path):
+        calls = []
+
+        @tool
+        async def web_search(query: str, max_results: int = 3) -> dict:
+            """웹 검색
+
+            Args:
+                query: 검색어
+                max_results: 결과 수
+            """
+            calls.append(query)
+            return {"results": [query] * max_results}
+
+        use_cassette(tmp_path, mode="record")
+        recorder = with_cassette_tool(web_search)
+        use_cassette(tmp_path, mode="replay")
+        player = with_cassette_tool(web_search)
+
+        assert player.tool_spec == web_search.tool_spec
+        tool_use = {"toolUseId": "t1", "name": "web_search", "input": {"query": "연차", "max_results": 2}}
+
+        async def run(agent_tool):
+            return [event async for event in agent_tool.stream(tool_use, {})][-1].tool_result
+
+        recorded = asyncio.run(run(recorder))
+        replayed = asyncio.run(run(player))
+
+        assert replayed == recorded
+        assert recorded["status"] == "success"
+        assert calls == ["연차"]
+
+    def test_model_stream(self, record, replay):
+        events = [{"messageStart": {"role": "assistant"}}, {"contentBlockDelta": {"delta": {"text": "안녕"}}}]
+        wrapped = MagicMock()
+        wrapped.get_config.return_value = {"model_id": "fake"}
+
+        async def stream(*args, **kwargs):
+            for event in events:
+                yield event
+
+        wrapped.stream = stream
+        messages = [{"role": "user", "content": [{"text": "질문"}]}]
+
+        async def collect(model):
+            return [event async for event in model.stream(messages, None, "시스템")]
+
+        assert asyncio.run(collect(CassetteModel(wrapped, record))) == events
+        wrapped.stream = MagicMock(side_effect=AssertionError("재생 중 모델 호출"))
+        assert asyncio.run(collect(CassetteModel(wrapped, replay))) == events
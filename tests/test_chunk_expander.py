@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock
 
 import pytest
-from src.rag.chunk_expander import (
+from src.rag.modules.chunk_expander import (
     ChunkExpander,
     NeighborChunkExpander,
     NoopChunkExpander,
@@ -125,6 +125,26 @@ class TestNeighborChunkExpander:
         assert range_filter["gte"] == 3  # max(0, 5-2)
         assert range_filter["lte"] == 7  # 5+2
 
+    def test_routes_by_result_routing(self, mock_opensearch_client, sample_results):
+        """project_id 라우팅 인덱스 결과(_routing)면 해당 샤드만 조회"""
+        mock_opensearch_client.search.return_value = {"hits": {"hits": []}}
+        for result in sample_results:
+            result["_routing"] = "334"
+        expander = NeighborChunkExpander(mock_opensearch_client, "test-index")
+
+        expander.expand(sample_results)
+
+        assert mock_opensearch_client.search.call_args.kwargs["routing"] == "334"
+
+    def test_no_routing_without_result_routing(self, mock_opensearch_client, sample_results):
+        mock_opensearch_client.search.return_value = {"hits": {"hits": []}}
+        sample_results[0]["_routing"] = "334"
+        expander = NeighborChunkExpander(mock_opensearch_client, "test-index")
+
+        expander.expand(sample_results)
+
+        assert "routing" not in mock_opensearch_client.search.call_args.kwargs
+
     def test_merges_original_and_neighbors(self, mock_opensearch_client, sample_results):
         """원본과 이웃 병합"""
         # 이웃 청크 응답 Mock
@@ -301,14 +321,18 @@ class TestNeighborChunkExpander:
         assert range_filter["lte"] == 6  # 1+5
 
     def test_excludes_embedding_from_source(self, mock_opensearch_client, sample_results):
-        """embedding 필드 제외 확인"""
+        """_source allow-list 적용 (벡터 필드 제외) 확인"""
         mock_opensearch_client.search.return_value = {"hits": {"hits": []}}
         expander = NeighborChunkExpander(mock_opensearch_client, "test-index")
 
         expander.expand(sample_results)
 
         body = mock_opensearch_client.search.call_args.kwargs["body"]
-        assert body["_source"]["excludes"] == ["embedding"]
+        includes = body["_source"]["includes"]
+        assert "text" in includes
+        assert "chunk_index" in includes
+        assert "embedding" not in includes
+        assert "embedding_vector" not in includes
 
 
 class TestChunkExpanderComparison:
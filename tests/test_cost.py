@@ -0,0 +1,37 @@
+"""비용 계산 테스트"""
+
+import pytest
+
+from src.cost import calculate_cost, calculate_total_cost
+
+
+class TestCalculateCost:
+    """calculate_cost 테스트"""
+
+    def test_input_output_only(self):
+        cost = calculate_cost(1_000_000, 1_000_000, "claude-sonnet-4-5-20250929")
+
+        assert cost["input_usd"] == pytest.approx(3.0)
+        assert cost["output_usd"] == pytest.approx(15.0)
+        assert cost["cache_read_usd"] == 0
+        assert cost["cache_write_usd"] == 0
+
+    def test_cache_tokens_priced_separately(self):
+        """캐시 읽기 0.1배, 캐시 쓰기 1.25배"""
+        cost = calculate_cost(
+            0, 0, "claude-sonnet-4-5-20250929", cache_read_tokens=1_000_000, cache_write_tokens=1_000_000
+        )
+
+        assert cost["cache_read_usd"] == pytest.approx(0.3)
+        assert cost["cache_write_usd"] == pytest.approx(3.75)
+        assert cost["total_usd"] == pytest.approx(4.05)
+
+    def test_total_cost_sums_cache_tokens(self):
+        results = [
+            {"input_tokens": 100, "output_tokens": 10, "cache_read_tokens": 1000},
+            {"input_tokens": 100, "output_tokens": 10, "cache_write_tokens": 1000},
+        ]
+
+        total = calculate_total_cost(results, "claude-sonnet-4-5-20250929")
+
+        assert total == calculate_cost(200, 20, "claude-sonnet-4-5-20250929", 1000, 1000)
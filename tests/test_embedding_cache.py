@@ -0,0 +1,170 @@
+"""EmbeddingCache 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.embedding_cache import CachedEmbeddingClient, EmbeddingCache, normalize_text
+from src.embedding_client import BatchEmbeddingResult
+
+
+@pytest.fixture
+def inner_client():
+    """Bedrock 호출 대신 텍스트 길이를 벡터로 반환하는 Mock"""
+    client = MagicMock()
+    client.model_id = "amazon.titan-embed-text-v2:0"
+    client.dimensions = 1024
+    client.embed.side_effect = lambda text: [float(len(text)), 0.5]
+    client.embed_batch.side_effect = lambda texts, **kw: BatchEmbeddingResult(
+        embeddings=[[float(len(t)), 0.5] for t in texts]
+    )
+    return client
+
+
+class TestNormalizeText:
+    """캐시 키 정규화 테스트"""
+
+    def test_collapses_whitespace(self):
+        assert normalize_text("  연차   휴가\n며칠 ") == "연차 휴가 며칠"
+
+    def test_unicode_nfc(self):
+        # 자모 분리형(NFD)과 완성형(NFC)이 같은 키
+        assert normalize_text("가") == "가"
+
+
+class TestEmbeddingCache:
+    """2단 캐시 테스트"""
+
+    def test_key_depends_on_model_and_dimensions(self):
+        a = EmbeddingCache.make_key("m1", 1024, "연차")
+        assert a == EmbeddingCache.make_key("m1", 1024, " 연차 ")
+        assert a != EmbeddingCache.make_key("m2", 1024, "연차")
+        assert a != EmbeddingCache.make_key("m1", 512, "연차")
+
+    def test_memory_lru_eviction(self):
+        cache = EmbeddingCache(max_memory_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # a를 최근 사용으로
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        db_path = tmp_path / "emb.sqlite"
+        cache = EmbeddingCache(db_path=db_path)
+        cache.put("k", [0.25, 0.5])
+        cache.close()
+
+        reopened = EmbeddingCache(db_path=db_path)
+        assert reopened.get("k") == [0.25, 0.5]
+        assert reopened.stats()["disk_hits"] == 1
+
+    def test_disk_size_eviction(self, tmp_path):
+        cache = EmbeddingCache(max_memory_entries=1, db_path=tmp_path / "emb.sqlite", max_disk_entries=2)
+        for i in range(5):
+            cache.put(f"k{i}", [float(i)])
+
+        assert cache.stats()["disk_entries"] == 2
+        assert cache.get("k4") == [4.0]
+        assert cache.get("k0") is None
+
+    def test_put_many_single_transaction(self, tmp_path):
+        cache = EmbeddingCache(db_path=tmp_path / "emb.sqlite", max_disk_entries=3)
+        before = cache._db.total_changes
+
+        cache.put_many([(f"k{i}", [float(i)]) for i in range(5)])
+        cache.put_many([("k4", [4.0])])  # 기존 키는 다시 세지 않음
+
+        assert cache.stats()["disk_entries"] == 3
+        assert cache._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 3
+        assert cache._db.total_changes - before == 5 + 2  # 삽입 5 + 삭제 2
+        cache.close()
+
+        assert EmbeddingCache(db_path=tmp_path / "emb.sqlite").stats()["disk_entries"] == 3
+
+    def test_disk_hit_access_deferred(self, tmp_path):
+        db_path = tmp_path / "emb.sqlite"
+        cache = EmbeddingCache(db_path=db_path)
+        cache.put("k", [1.0])
+        cache.close()
+
+        cache = EmbeddingCache(max_memory_entries=0, db_path=db_path, access_flush_size=3)
+        accessed_at = cache._db.execute("SELECT accessed_at FROM embeddings").fetchone()[0]
+        cache.get("k")
+        assert cache._db.execute("SELECT accessed_at FROM embeddings").fetchone()[0] == accessed_at
+
+        cache.put("other", [2.0])  # 다음 쓰기 트랜잭션에서 함께 반영
+        assert cache._db.execute("SELECT accessed_at FROM embeddings WHERE key = 'k'").fetchone()[0] > accessed_at
+
+    def test_memory_hit_not_blocked_by_disk(self, tmp_path):
+        cache = EmbeddingCache(db_path=tmp_path / "emb.sqlite")
+        cache.put("k", [1.0])
+
+        with cache._db_lock:  # 다른 스레드가 디스크 I/O 중
+            assert cache.get("k") == [1.0]
+
+    def test_stats_counters(self):
+        cache = EmbeddingCache()
+        cache.get("missing")
+        cache.put("k", [1.0])
+        cache.get("k")
+
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestCachedEmbeddingClient:
+    """CachedEmbeddingClient 테스트"""
+
+    def test_warm_hit_skips_bedrock(self, inner_client):
+        client = CachedEmbeddingClient(inner_client)
+
+        first = client.embed("연차 휴가는 며칠인가요?")
+        second = client.embed("연차 휴가는  며칠인가요? ")
+
+        assert first == second
+        inner_client.embed.assert_called_once()
+
+    def test_batch_only_embeds_misses(self, inner_client):
+        client = CachedEmbeddingClient(inner_client)
+        client.embed("bb")
+
+        result = client.embed_batch(["a", "bb", "ccc"])
+
+        assert result.embeddings == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5]]
+        inner_client.embed_batch.assert_called_once()
+        assert inner_client.embed_batch.call_args.args[0] == ["a", "ccc"]
+
+    def test_aembed_disk_tier_off_event_loop(self, inner_client, tmp_path):
+        """디스크 잠금 대기 중에도 이벤트 루프는 계속 돈다"""
+        inner_client.aembed = AsyncMock(return_value=[1.0, 0.5])
+        client = CachedEmbeddingClient(inner_client, db_path=tmp_path / "emb.sqlite")
+
+        async def run():
+            client.cache._db_lock.acquire()  # 다른 스레드가 디스크 I/O 중
+            task = asyncio.create_task(client.aembed("연차"))
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            client.cache._db_lock.release()
+            return await task
+
+        assert asyncio.run(run()) == [1.0, 0.5]
+        assert client.cache.get(client._key("연차")) == [1.0, 0.5]
+        assert client.stats()["misses"] == 1
+
+    def test_batch_failures_not_cached(self, inner_client):
+        inner_client.embed_batch.side_effect = lambda texts, **kw: BatchEmbeddingResult(
+            embeddings=[None], errors={0: "ThrottlingException"}
+        )
+        client = CachedEmbeddingClient(inner_client)
+
+        result = client.embed_batch(["a"])
+
+        assert result.errors == {0: "ThrottlingException"}
+        assert client.stats()["memory_entries"] == 0
@@ -0,0 +1,233 @@
+"""EmbeddingClient 테스트"""
+
+import asyncio
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.embedding_client import BatchEmbeddingResult, EmbeddingClient
+from src.rate_limit import RateLimiter
+
+
+def _bedrock_response(vector: list[float]) -> dict:
+    """invoke_model 응답 형식"""
+    return {"body": io.BytesIO(json.dumps({"embedding": vector}).encode())}
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "InvokeModel")
+
+
+@pytest.fixture
+def client():
+    """boto3 없이 생성한 EmbeddingClient"""
+    with patch("src.embedding_client.boto3") as mock_boto3:
+        mock_boto3.Session.return_value.client.return_value = MagicMock()
+        yield EmbeddingClient(max_workers=4, rate_per_sec=1000)
+
+
+class TestEmbed:
+    """단일 임베딩 테스트"""
+
+    def test_returns_embedding(self, client):
+        client.client.invoke_model.return_value = _bedrock_response([0.1, 0.2])
+
+        assert client.embed("연차") == [0.1, 0.2]
+
+    def test_request_body(self, client):
+        client.client.invoke_model.return_value = _bedrock_response([0.1])
+
+        client.embed("연차")
+
+        body = json.loads(client.client.invoke_model.call_args.kwargs["body"])
+        assert body["inputText"] == "연차"
+
+
+class _FakeResponse:
+    """aiohttp 응답 Mock (async context manager)"""
+
+    def __init__(self, status: int, payload: dict | str, headers: dict | None = None):
+        self.status = status
+        self._payload = payload
+        self.headers = headers or {}
+
+    async def json(self, content_type=None):
+        if isinstance(self._payload, str):
+            return json.loads(self._payload)
+        return self._payload
+
+    async def text(self):
+        return self._payload if isinstance(self._payload, str) else json.dumps(self._payload)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestAsyncEmbed:
+    """비동기 임베딩 테스트"""
+
+    @pytest.fixture
+    def async_client(self, client):
+        client.session.get_credentials.return_value.get_frozen_credentials.return_value = MagicMock(
+            access_key="AKIA", secret_key="secret", token=None
+        )
+        return client
+
+    def test_aembed_signs_and_parses(self, async_client):
+        session = MagicMock()
+        session.post.return_value = _FakeResponse(200, {"embedding": [0.3, 0.4]})
+
+        with patch.object(async_client, "_get_async_session", return_value=session):
+            vector = asyncio.run(async_client.aembed("연차"))
+
+        assert vector == [0.3, 0.4]
+        headers = session.post.call_args.kwargs["headers"]
+        assert headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+        assert "amazon.titan-embed-text-v2%3A0" in str(session.post.call_args.args[0])
+
+    def test_aembed_throttling_raises_client_error(self, async_client):
+        session = MagicMock()
+        session.post.return_value = _FakeResponse(429, {"message": "Too many requests"})
+
+        with patch.object(async_client, "_get_async_session", return_value=session):
+            with pytest.raises(ClientError) as exc_info:
+                asyncio.run(async_client.aembed("연차"))
+
+        assert exc_info.value.response["Error"]["Code"] == "ThrottlingException"
+
+    def test_aembed_non_json_gateway_error(self, async_client):
+        """JSON이 아닌 502 본문도 JSONDecodeError가 아닌 재시도 가능한 ClientError로 변환"""
+        session = MagicMock()
+        session.post.return_value = _FakeResponse(502, "<html>502 Bad Gateway</html>")
+
+        with patch.object(async_client, "_get_async_session", return_value=session):
+            with pytest.raises(ClientError) as exc_info:
+                asyncio.run(async_client.aembed("연차"))
+
+        error = exc_info.value.response["Error"]
+        assert error["Code"] == "ServiceUnavailableException"
+        assert "Bad Gateway" in error["Message"]
+
+    def test_aembed_error_type_header(self, async_client):
+        session = MagicMock()
+        session.post.return_value = _FakeResponse(
+            400, {"message": "Malformed input"}, headers={"x-amzn-ErrorType": "ValidationException:http://..."}
+        )
+
+        with patch.object(async_client, "_get_async_session", return_value=session):
+            with pytest.raises(ClientError) as exc_info:
+                asyncio.run(async_client.aembed("연차"))
+
+        assert exc_info.value.response["Error"] == {"Code": "ValidationException", "Message": "Malformed input"}
+
+
+class TestEmbedBatch:
+    """배치 임베딩 테스트"""
+
+    def test_preserves_input_order(self, client):
+        """병렬 처리해도 입력 순서 유지"""
+        client.client.invoke_model.side_effect = lambda **kw: _bedrock_response(
+            [float(len(json.loads(kw["body"])["inputText"]))]
+        )
+        texts = ["a" * n for n in range(1, 21)]
+
+        result = client.embed_batch(texts)
+
+        assert isinstance(result, BatchEmbeddingResult)
+        assert result.ok
+        assert result.embeddings == [[float(n)] for n in range(1, 21)]
+
+    def test_empty_input(self, client):
+        result = client.embed_batch([])
+
+        assert result.embeddings == []
+        assert result.ok
+        client.client.invoke_model.assert_not_called()
+
+    def test_reports_failures_per_item(self, client):
+        """실패한 항목만 None + errors에 기록"""
+
+        def invoke(**kw):
+            if json.loads(kw["body"])["inputText"] == "bad":
+                raise _client_error("ValidationException")
+            return _bedrock_response([1.0])
+
+        client.client.invoke_model.side_effect = invoke
+
+        result = client.embed_batch(["ok", "bad", "ok"])
+
+        assert result.embeddings[0] == [1.0]
+        assert result.embeddings[1] is None
+        assert result.embeddings[2] == [1.0]
+        assert list(result.errors) == [1]
+        assert "ValidationException" in result.errors[1]
+        assert result.failed_count == 1
+
+    @patch("src.embedding_client.time.sleep")
+    def test_retries_on_throttling(self, mock_sleep, client):
+        """스로틀링 시 백오프 후 재시도, 속도 감소"""
+        client.client.invoke_model.side_effect = [
+            _client_error("ThrottlingException"),
+            _bedrock_response([1.0]),
+        ]
+
+        result = client.embed_batch(["연차"])
+
+        assert result.ok
+        assert result.embeddings == [[1.0]]
+        assert client.client.invoke_model.call_count == 2
+        assert mock_sleep.called
+        assert client.rate_limiter.rate < client.rate_limiter.max_rate
+
+    @patch("src.embedding_client.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep, client):
+        client.client.invoke_model.side_effect = _client_error("ThrottlingException")
+
+        result = client.embed_batch(["연차"], max_retries=2)
+
+        assert result.embeddings == [None]
+        assert "ThrottlingException" in result.errors[0]
+        assert client.client.invoke_model.call_count == 3
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_throttle_halves_rate(self):
+        limiter = RateLimiter(rate_per_sec=10, min_rate=1)
+
+        limiter.throttle()
+        assert limiter.rate == 5
+
+        limiter.throttle()
+        limiter.throttle()
+        limiter.throttle()
+        assert limiter.rate == 1  # 하한
+
+    def test_recover_up_to_max(self):
+        limiter = RateLimiter(rate_per_sec=10, recover_step=4)
+        limiter.throttle()
+
+        limiter.recover()
+        assert limiter.rate == 9
+        limiter.recover()
+        assert limiter.rate == 10
+
+    def test_acquire_within_burst_does_not_block(self):
+        limiter = RateLimiter(rate_per_sec=5)
+
+        with patch("src.rate_limit.time.sleep") as mock_sleep:
+            for _ in range(5):
+                limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate_per_sec=0)
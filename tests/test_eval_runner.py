@@ -0,0 +1,172 @@
+"""평가 러너 (체크포인트/재개/속도 제한) 테스트"""
+
+import threading
+import time
+
+import pytest
+from src.eval_runner import JSONLCheckpoint, configure_rate_limits, run_checkpointed
+from src.rate_limit import acquire_provider, provider_limiter, set_provider_limit
+from src.types import RAGServiceBase, ServiceResult
+
+QUESTIONS = [{"id": i, "question": f"질문 {i}"} for i in range(1, 6)]
+
+
+def to_record(q: dict, result) -> dict:
+    if isinstance(result, Exception):
+        return {"id": q["id"], "answer": "", "error": str(result)}
+    return {"id": q["id"], "answer": result.answer}
+
+
+class FakeService(RAGServiceBase):
+    """질문 텍스트에 fail이 있으면 실패하는 서비스 (동시 실행 수 기록)"""
+
+    def __init__(self, delay: float = 0.0, fail: set[str] | None = None):
+        self.delay = delay
+        self.fail = fail or set()
+        self.calls: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def query(self, question: str) -> ServiceResult:
+        with self._lock:
+            self.calls.append(question)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            if question in self.fail:
+                raise RuntimeError(f"{question} 실패")
+            return ServiceResult(mode="fake", question=question, answer=f"답변: {question}")
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def run(service: FakeService, checkpoint: JSONLCheckpoint, resume: bool = False, questions=QUESTIONS) -> list[dict]:
+    return run_checkpointed(
+        questions,
+        lambda texts, on_result: service.query_batch(texts, concurrency=3, on_result=on_result),
+        to_record,
+        checkpoint=checkpoint,
+        resume=resume,
+    )
+
+
+class TestJSONLCheckpoint:
+    """JSONL 체크포인트 테스트"""
+
+    def test_append_and_load(self, tmp_path):
+        checkpoint = JSONLCheckpoint(tmp_path / "cp" / "run.jsonl")
+        checkpoint.append({"id": 1, "answer": "a"})
+        checkpoint.append({"id": 2, "answer": "", "error": "boom"})
+        checkpoint.append({"id": 1, "answer": "b"})
+
+        assert checkpoint.load() == {1: {"id": 1, "answer": "b"}, 2: {"id": 2, "answer": "", "error": "boom"}}
+        assert set(checkpoint.completed()) == {1}
+
+    def test_partial_last_line_dropped(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        path.write_text('{"id": 1, "answer": "a"}\n{"id": 2, "ans', encoding="utf-8")
+        checkpoint = JSONLCheckpoint(path)
+
+        assert set(checkpoint.load()) == {1}
+        checkpoint.append({"id": 2, "answer": "b"})
+        assert set(checkpoint.load()) == {1, 2}
+
+    def test_missing_file(self, tmp_path):
+        assert JSONLCheckpoint(tmp_path / "none.jsonl").load() == {}
+
+
+class TestRunCheckpointed:
+    """체크포인트 기반 실행 테스트"""
+
+    def test_records_in_question_order(self, tmp_path):
+        checkpoint = JSONLCheckpoint(tmp_path / "run.jsonl")
+
+        records = run(FakeService(), checkpoint)
+
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+        assert records[0]["answer"] == "답변: 질문 1"
+        assert len(checkpoint.path.read_text(encoding="utf-8").splitlines()) == 5
+
+    def test_resume_skips_completed_and_retries_errors(self, tmp_path):
+        checkpoint = JSONLCheckpoint(tmp_path / "run.jsonl")
+        first = run(FakeService(fail={"질문 2"}), checkpoint)
+        assert first[1]["error"] == "질문 2 실패"
+
+        service = FakeService()
+        records = run(service, checkpoint, resume=True)
+
+        assert service.calls == ["질문 2"]
+        assert [r["id"] for r in records] == [1, 2, 3, 4, 5]
+        assert "error" not in records[1]
+
+    def test_without_resume_starts_over(self, tmp_path):
+        checkpoint = JSONLCheckpoint(tmp_path / "run.jsonl")
+        run(FakeService(), checkpoint)
+
+        service = FakeService()
+        run(service, checkpoint)
+
+        assert len(service.calls) == 5
+        assert len(checkpoint.path.read_text(encoding="utf-8").splitlines()) == 5
+
+    def test_checkpoint_written_as_results_finish(self, tmp_path):
+        """실행 중 중단돼도 끝난 질문은 체크포인트에 남아 있음"""
+        checkpoint = JSONLCheckpoint(tmp_path / "run.jsonl")
+        seen: list[int] = []
+
+        def run_batch(texts, on_result):
+            on_result(0, ServiceResult(mode="fake", question=texts[0], answer="ok"))
+            seen.append(len(checkpoint.load()))
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            run_checkpointed(QUESTIONS, run_batch, to_record, checkpoint=checkpoint)
+
+        assert seen == [1]
+        assert set(checkpoint.completed()) == {1}
+
+    def test_service_query_batch_runs_concurrently(self, tmp_path):
+        service = FakeService(delay=0.02)
+
+        run(service, JSONLCheckpoint(tmp_path / "run.jsonl"))
+
+        assert service.peak == 3
+
+
+class TestRateLimits:
+    """공급자별 속도 제한 설정 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_limits(self):
+        yield
+        for provider in ("vertex", "tavily"):
+            set_provider_limit(provider, None)
+
+    def test_configure(self):
+        assert configure_rate_limits(["vertex=2", "tavily=0.5"]) == {"vertex": 2.0, "tavily": 0.5}
+        assert provider_limiter("vertex").max_rate == 2.0
+        assert provider_limiter("bedrock") is None
+
+    def test_rejects_unknown_provider(self):
+        with pytest.raises(ValueError, match="공급자"):
+            configure_rate_limits(["openai=3"])
+        with pytest.raises(ValueError):
+            configure_rate_limits(["vertex"])
+
+    def test_acquire_waits_for_token(self):
+        set_provider_limit("tavily", 20.0)
+        limiter = provider_limiter("tavily")
+        limiter._tokens = 0.0
+
+        start = time.monotonic()
+        acquire_provider("tavily")
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_unconfigured_provider_does_not_wait(self):
+        start = time.monotonic()
+        acquire_provider("gemini")
+        assert time.monotonic() - start < 0.01
@@ -0,0 +1,211 @@
+"""부하 테스트용 가짜 백엔드 테스트"""
+
+import asyncio
+import math
+import random
+import time
+
+import pytest
+
+from src.agent import AgentRAG
+from src.agent.fake_model import FakeAgentModel
+from src.agent.tools import SearchSession
+from src.fake_backends import (
+    FakeBackendError,
+    FakeEmbeddingClient,
+    FakeLLMClient,
+    FakeRerankerFilter,
+    FakeSearchClient,
+    FakeThrottlingError,
+    FaultModel,
+    LatencyModel,
+)
+from src.llm_client import LLMResponse
+from src.rag.modules.context_builder import SimpleContextBuilder
+from src.rag.modules.prompt_template import SimplePromptTemplate
+from src.rag.modules.query_builder import KNNQueryBuilder
+from src.rag.pipeline import RAGPipeline
+
+FAST = LatencyModel(median_ms=1.0, sigma=0.0)
+
+
+class TestLatencyModel:
+    """지연 분포 테스트"""
+
+    def test_lognormal_median(self):
+        model = LatencyModel(median_ms=100.0, sigma=0.5)
+        rng = random.Random(0)
+        samples = sorted(model.sample_ms(rng) for _ in range(5000))
+
+        assert samples[len(samples) // 2] == pytest.approx(100.0, rel=0.05)
+        assert samples[-1] > 300.0
+
+    def test_spikes(self):
+        model = LatencyModel(median_ms=10.0, sigma=0.0, spike_rate=0.1, spike_multiplier=20.0)
+        rng = random.Random(0)
+        samples = [model.sample_ms(rng) for _ in range(2000)]
+        spikes = [s for s in samples if s > 10.0]
+
+        assert set(spikes) == {200.0}
+        assert len(spikes) / len(samples) == pytest.approx(0.1, abs=0.03)
+
+    def test_fault_rates(self):
+        faults = FaultModel(error_rate=0.1, throttle_rate=0.2)
+        rng = random.Random(0)
+        drawn = [faults.sample(rng) for _ in range(5000)]
+
+        assert drawn.count("error") / len(drawn) == pytest.approx(0.1, abs=0.02)
+        assert drawn.count("throttle") / len(drawn) == pytest.approx(0.2, abs=0.02)
+
+
+class TestFakeClients:
+    """임베딩/LLM/검색 가짜 클라이언트 테스트"""
+
+    def test_embedding_vector_deterministic_unit(self):
+        client = FakeEmbeddingClient(latency=FAST, dimensions=16)
+
+        vector = client.embed("연차")
+
+        assert len(vector) == 16
+        assert math.sqrt(sum(v * v for v in vector)) == pytest.approx(1.0)
+        assert client.embed("연차") == vector
+        assert client.embed("출장") != vector
+        assert client.stats.calls == 3
+
+    def test_errors_raise(self):
+        client = FakeEmbeddingClient(latency=FAST, faults=FaultModel(error_rate=1.0))
+
+        with pytest.raises(FakeBackendError):
+            client.embed("연차")
+        assert client.stats.errors == 1
+        assert client.stats.in_flight == 0
+
+    def test_embed_batch_retries_throttles(self):
+        client = FakeEmbeddingClient(latency=FAST, faults=FaultModel(throttle_rate=0.3), seed=1, dimensions=8)
+
+        result = client.embed_batch([f"질문 {i}" for i in range(30)], max_retries=10)
+
+        assert not result.errors
+        assert all(len(e) == 8 for e in result.embeddings)
+        assert client.stats.throttles > 0
+        assert client.stats.calls == 30 + client.stats.throttles
+
+    def test_embed_batch_peak_in_flight(self):
+        client = FakeEmbeddingClient(latency=LatencyModel(median_ms=20.0, sigma=0.0), max_workers=4)
+
+        client.embed_batch([f"질문 {i}" for i in range(12)])
+
+        assert client.stats.peak_in_flight == 4
+
+    def test_llm_tokens_and_latency(self):
+        client = FakeLLMClient(latency=FAST, output_tokens=100, output_tokens_sigma=0.0, ms_per_output_token=0.2)
+
+        start = time.perf_counter()
+        response = client.call("가" * 250, system="나" * 50, max_tokens=60)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert response.input_tokens == 120
+        assert response.output_tokens == 60  # max_tokens 상한
+        assert elapsed_ms >= 1.0 + 60 * 0.2
+        assert asyncio.run(client.acall("질문")).output_tokens == 100
+
+    def test_llm_throttle(self):
+        client = FakeLLMClient(latency=FAST, faults=FaultModel(throttle_rate=1.0))
+
+        with pytest.raises(FakeThrottlingError):
+            client.call("질문")
+        assert client.stats.throttles == 1
+
+    def test_llm_stream(self):
+        client = FakeLLMClient(latency=FAST, output_tokens=20, output_tokens_sigma=0.0, ms_per_output_token=0.0)
+
+        chunks = list(client.stream("질문"))
+
+        assert isinstance(chunks[-1], LLMResponse)
+        assert "".join(chunks[:-1]) == chunks[-1].content
+        assert chunks[-1].output_tokens == 20
+
+    def test_search_and_msearch(self):
+        client = FakeSearchClient(latency=FAST, corpus_size=50)
+
+        hits = client.search("index", {}, size=5)
+        batches = client.msearch_with_pipeline("index", [({}, 3, None), ({}, 7, None)])
+
+        assert len(hits) == 5
+        assert [h["_score"] for h in hits] == sorted((h["_score"] for h in hits), reverse=True)
+        assert [len(b) for b in batches] == [3, 7]
+        assert client.stats.calls == 2  # msearch는 왕복 1회
+        assert len(client.client.search(index="index", body={"size": 4})["hits"]["hits"]) == 4
+
+
+class TestFakeReranker:
+    """가짜 Reranker 테스트"""
+
+    def test_filter_batch(self):
+        reranker = FakeRerankerFilter(top_k=2, latency=FAST, ms_per_doc=0.0)
+        results = [
+            [{"_id": f"{q}-{i}", "_score": 1.0, "_source": {"text": f"문서 {i}"}} for i in range(5)] for q in range(3)
+        ]
+
+        filtered = reranker.filter_batch(["질문 1", "질문 2", "질문 3"], results)
+
+        assert [len(r) for r in filtered] == [2, 2, 2]
+        assert reranker.stats.calls == 3
+
+    def test_cpu_bound_holds_cpu(self):
+        reranker = FakeRerankerFilter(top_k=1, latency=FAST, ms_per_doc=5.0, cpu_bound=True)
+        results = [{"_id": str(i), "_score": 1.0, "_source": {"text": "문서"}} for i in range(4)]
+
+        cpu_start = time.process_time()
+        reranker.filter("질문", results)
+
+        assert time.process_time() - cpu_start >= 0.015
+
+
+class TestLoad:
+    """가짜 백엔드로 동시 실행 테스트"""
+
+    @pytest.fixture
+    def pipeline(self):
+        return RAGPipeline(
+            search_client=FakeSearchClient(latency=FAST),
+            embedding_client=FakeEmbeddingClient(latency=FAST, dimensions=8),
+            llm_client=FakeLLMClient(latency=LatencyModel(median_ms=20.0, sigma=0.0), ms_per_output_token=0.0),
+            query_builder=KNNQueryBuilder(),
+            context_builder=SimpleContextBuilder(),
+            prompt_template=SimplePromptTemplate(),
+            index="index",
+            project_id=334,
+        )
+
+    def test_query_batch_concurrency(self, pipeline):
+        results = pipeline.query_batch([f"질문 {i}" for i in range(100)], concurrency=100)
+
+        assert len(results) == 100
+        assert all(r.sources for r in results)
+        assert pipeline.llm_client.stats.peak_in_flight > 50
+
+    def test_aquery_concurrency(self, pipeline):
+        async def run():
+            return await asyncio.gather(*(pipeline.aquery(f"질문 {i}") for i in range(100)))
+
+        results = asyncio.run(run())
+
+        assert len(results) == 100
+        assert pipeline.llm_client.stats.peak_in_flight > 50
+
+    def test_agent_tool_round(self):
+        model = FakeAgentModel(latency=FAST, ms_per_output_token=0.0, tool_rounds=1)
+        search = SearchSession(
+            search_client=FakeSearchClient(latency=FAST),
+            embedding_client=FakeEmbeddingClient(latency=FAST, dimensions=8),
+        )
+        agent = AgentRAG(model=model, search=search, print_stream=False)
+
+        result = agent.query("연차는 며칠인가요?")
+
+        assert result.answer.startswith("가짜 답변")
+        assert result.tool_calls[0]["name"] == "search_documents"
+        assert result.sources
+        assert model.stats.calls == 2
+        assert result.output_tokens > 0
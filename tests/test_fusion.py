@@ -0,0 +1,74 @@
+"""ResultFusion 테스트"""
+
+import pytest
+
+from src.rag.modules.fusion import ResultFusion, RRFFusion, ZScoreFusion
+
+
+def _hits(*pairs: tuple[str, float]) -> list[dict]:
+    return [{"_id": doc_id, "_score": score, "_source": {"text": doc_id}} for doc_id, score in pairs]
+
+
+BM25 = _hits(("a", 10.0), ("b", 6.0), ("c", 1.0))
+KNN = _hits(("c", 0.9), ("a", 0.8), ("d", 0.5))
+
+
+class TestRRFFusion:
+    """RRFFusion 테스트"""
+
+    def test_rank_based_scores(self):
+        fused = RRFFusion(rank_constant=60).fuse([BM25, KNN], size=10)
+
+        assert [hit["_id"] for hit in fused] == ["a", "c", "b", "d"]
+        assert fused[0]["_score"] == pytest.approx(1 / 61 + 1 / 62)
+
+    def test_size_limit(self):
+        assert len(RRFFusion().fuse([BM25, KNN], size=2)) == 2
+
+    def test_weights_favor_knn(self):
+        fused = RRFFusion(weights=[1.0, 3.0]).fuse([BM25, KNN], size=10)
+
+        assert fused[0]["_id"] == "c"
+
+    def test_does_not_mutate_input(self):
+        RRFFusion().fuse([BM25, KNN], size=10)
+
+        assert BM25[0]["_score"] == 10.0
+
+    def test_weights_length_mismatch(self):
+        with pytest.raises(ValueError, match="weights"):
+            RRFFusion(weights=[1.0]).fuse([BM25, KNN], size=10)
+
+    def test_implements_protocol(self):
+        assert isinstance(RRFFusion(), ResultFusion)
+
+
+class TestZScoreFusion:
+    """ZScoreFusion 테스트"""
+
+    def test_score_based_ranking(self):
+        fused = ZScoreFusion().fuse([BM25, KNN], size=10)
+
+        # a: BM25 최고점 + KNN 2위 → 1위, d: KNN에만 있고 BM25 최저 z를 받음 → 최하위
+        assert fused[0]["_id"] == "a"
+        assert fused[-1]["_id"] == "d"
+
+    def test_score_gaps_matter(self):
+        """BM25 점수 차이가 크면 RRF와 순위가 달라짐"""
+        bm25 = _hits(("x", 30.0), ("y", 1.0), ("z", 0.9), ("w", 0.8))
+        knn = _hits(("y", 0.91), ("z", 0.905), ("x", 0.90), ("w", 0.5))
+
+        zscore = [hit["_id"] for hit in ZScoreFusion().fuse([bm25, knn], size=4)]
+        rrf = [hit["_id"] for hit in RRFFusion().fuse([bm25, knn], size=4)]
+
+        assert zscore[0] == "x"
+        assert rrf[0] == "y"
+
+    def test_constant_scores(self):
+        fused = ZScoreFusion().fuse([_hits(("a", 1.0), ("b", 1.0)), []], size=10)
+
+        assert {hit["_id"] for hit in fused} == {"a", "b"}
+        assert all(hit["_score"] == 0.0 for hit in fused)
+
+    def test_implements_protocol(self):
+        assert isinstance(ZScoreFusion(), ResultFusion)
@@ -0,0 +1,90 @@
+"""인덱스 스키마 (create-index / reindex) 테스트"""
+
+import pytest
+
+from src.index_schema import build_index_body, search_pipeline_body, to_index_doc
+from src.rag.modules.query_builder import HybridQueryBuilder
+
+
+class TestBuildIndexBody:
+    """인덱스 생성 body 테스트"""
+
+    def test_faiss_fp16(self):
+        """faiss + fp16 → SQ fp16 인코더, ef_search 인덱스 설정"""
+        body = build_index_body(engine="faiss", encoding="fp16", m=24, ef_construction=256, ef_search=64)
+
+        method = body["mappings"]["properties"]["embedding"]["method"]
+        assert method["engine"] == "faiss"
+        assert method["space_type"] == "l2"
+        assert method["parameters"]["m"] == 24
+        assert method["parameters"]["ef_construction"] == 256
+        assert method["parameters"]["encoder"] == {"name": "sq", "parameters": {"type": "fp16"}}
+        assert body["settings"]["index"]["knn"] is True
+        assert body["settings"]["index"]["knn.algo_param.ef_search"] == 64
+
+    def test_lucene_byte(self):
+        """lucene + byte → lucene SQ 인코더, ef_search 설정 없음"""
+        body = build_index_body(engine="lucene", encoding="byte")
+
+        method = body["mappings"]["properties"]["embedding"]["method"]
+        assert method["engine"] == "lucene"
+        assert method["parameters"]["encoder"] == {"name": "sq"}
+        assert "knn.algo_param.ef_search" not in body["settings"]["index"]
+
+    def test_float_has_no_encoder(self):
+        body = build_index_body(engine="lucene", encoding="float", dimensions=8)
+
+        embedding = body["mappings"]["properties"]["embedding"]
+        assert embedding["dimension"] == 8
+        assert "encoder" not in embedding["method"]["parameters"]
+
+    @pytest.mark.parametrize(("engine", "encoding"), [("lucene", "fp16"), ("faiss", "byte"), ("nmslib", "float")])
+    def test_unsupported_combinations(self, engine, encoding):
+        with pytest.raises(ValueError):
+            build_index_body(engine=engine, encoding=encoding)
+
+    def test_text_fields_match_search_fields(self):
+        """HybridQueryBuilder.SEARCH_FIELDS의 모든 필드가 매핑에 존재"""
+        properties = build_index_body()["mappings"]["properties"]
+
+        for spec in HybridQueryBuilder.SEARCH_FIELDS:
+            field, _, _ = spec.partition("^")
+            name, _, subfield = field.partition(".")
+            mapping = properties[name] if not subfield else properties[name]["fields"][subfield]
+            assert mapping["type"] == "text"
+
+        assert properties["text"]["fields"]["ko"]["analyzer"] == "korean"
+        assert properties["text"]["fields"]["en"]["analyzer"] == "english"
+
+    def test_nori_analyzer(self):
+        analysis = build_index_body()["settings"]["analysis"]
+
+        assert analysis["tokenizer"]["korean_tokenizer"]["type"] == "nori_tokenizer"
+        assert analysis["analyzer"]["korean"]["tokenizer"] == "korean_tokenizer"
+
+    def test_source_vectors_excluded(self):
+        assert build_index_body(source_vectors=False)["mappings"]["_source"] == {"excludes": ["embedding"]}
+        assert "_source" not in build_index_body()["mappings"]
+
+    def test_routing_required(self):
+        assert build_index_body(routing_required=True)["mappings"]["_routing"] == {"required": True}
+        assert "_routing" not in build_index_body()["mappings"]
+
+
+class TestToIndexDoc:
+    """재색인 문서 변환 테스트"""
+
+    def test_moves_vector_to_embedding(self):
+        doc = to_index_doc({"text": "본문", "project_id": 334, "embedding_vector": [0.1, 0.2]})
+
+        assert doc == {"text": "본문", "project_id": 334, "embedding": [0.1, 0.2]}
+
+    def test_missing_vector(self):
+        with pytest.raises(ValueError, match="임베딩"):
+            to_index_doc({"text": "본문"})
+
+
+def test_search_pipeline_body():
+    processor = search_pipeline_body(20)["phase_results_processors"][0]["score-ranker-processor"]
+
+    assert processor["combination"] == {"technique": "rrf", "rank_constant": 20}
@@ -0,0 +1,386 @@
+"""문서 수집 (ingest) 테스트"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from src.embedding_client import BatchEmbeddingResult
+from src.ingest import (
+    BulkIngestor,
+    IncrementalSync,
+    SyncManifest,
+    TextChunker,
+    chunk_id,
+    iter_documents,
+    stable_document_id,
+)
+
+SAMPLE_TEXT = "\n\n".join(
+    f"## {i}장\n\n연차 휴가는 입사 1년 후 15일이 부여됩니다. 미사용 연차는 다음 해로 이월할 수 없습니다." * 3
+    for i in range(10)
+)
+
+
+class FakeEmbedder:
+    """embed_batch 테스트 더블 (fail_texts에 포함된 텍스트는 실패 처리)"""
+
+    def __init__(self, fail_texts: set[str] | None = None):
+        self.fail_texts = fail_texts or set()
+        self.batches: list[int] = []
+
+    def embed_batch(self, texts: list[str]) -> BatchEmbeddingResult:
+        self.batches.append(len(texts))
+        result = BatchEmbeddingResult(embeddings=[[float(len(text)), 0.0] for text in texts])
+        for i, text in enumerate(texts):
+            if text in self.fail_texts:
+                result.embeddings[i] = None
+                result.errors[i] = "ThrottlingException: rate exceeded"
+        return result
+
+
+class FakeIndex:
+    """OpenSearchClient 테스트 더블 (메모리 색인, 동기화에 쓰는 메서드만)"""
+
+    def __init__(self):
+        self.docs: dict[str, dict] = {}
+        self.delete_routings: list[str | None] = []
+
+    def bulk_index(self, index, docs, **kwargs):
+        self.docs.update(docs)
+        return len(docs)
+
+    def bulk_delete(self, index, doc_ids, routing=None, **kwargs):
+        self.delete_routings.append(routing)
+        return sum(self.docs.pop(doc_id, None) is not None for doc_id in doc_ids)
+
+    def get_vectors(self, index, doc_ids, routing=None, **kwargs):
+        return {doc_id: self.docs[doc_id]["embedding"] for doc_id in doc_ids if doc_id in self.docs}
+
+    def iter_docs_by_project(self, index, project_id, source_fields=None, **kwargs):
+        for doc_id, doc in self.docs.items():
+            if doc["project_id"] == project_id:
+                yield {"_id": doc_id, "_source": {key: doc.get(key) for key in source_fields}}
+
+
+def _write_docs(root, count: int = 3):
+    for i in range(count):
+        path = root / f"team{i % 2}" / f"doc{i}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(SAMPLE_TEXT, encoding="utf-8")
+
+
+class TestTextChunker:
+    """TextChunker 테스트"""
+
+    def test_offsets_match_source(self):
+        """text[character_start:character_end] == chunk.text"""
+        chunks = TextChunker(chunk_size=200, chunk_overlap=40).split(SAMPLE_TEXT)
+
+        assert len(chunks) > 5
+        for i, chunk in enumerate(chunks):
+            assert chunk.chunk_index == i
+            assert SAMPLE_TEXT[chunk.character_start : chunk.character_end] == chunk.text
+            assert len(chunk.text) <= 200
+            assert chunk.line_number == SAMPLE_TEXT.count("\n", 0, chunk.character_start) + 1
+
+    def test_chunks_cover_text_with_overlap(self):
+        chunks = TextChunker(chunk_size=200, chunk_overlap=40).split(SAMPLE_TEXT)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.character_start < previous.character_end  # 겹침
+            assert current.character_start > previous.character_start
+        assert chunks[-1].character_end == len(SAMPLE_TEXT.rstrip())
+
+    def test_prefers_paragraph_boundary(self):
+        chunks = TextChunker(chunk_size=200, chunk_overlap=0).split(SAMPLE_TEXT)
+
+        assert SAMPLE_TEXT[chunks[0].character_end : chunks[0].character_end + 2] == "\n\n"
+
+    def test_short_and_blank_text(self):
+        chunker = TextChunker()
+
+        assert chunker.split("   \n\n ") == []
+        assert [c.text for c in chunker.split("  짧은 문서\n")] == ["짧은 문서"]
+
+    def test_invalid_overlap(self):
+        with pytest.raises(ValueError):
+            TextChunker(chunk_size=100, chunk_overlap=100)
+
+
+class TestIterDocuments:
+    """파일 로더 테스트"""
+
+    def test_reads_files_with_stable_ids(self, tmp_path):
+        _write_docs(tmp_path)
+        (tmp_path / "empty.txt").write_text(" \n", encoding="utf-8")
+
+        docs = list(iter_documents(tmp_path, project_id=334))
+
+        assert [d.relative_path for d in docs] == ["team0/doc0.txt", "team0/doc2.txt", "team1/doc1.txt"]
+        assert docs[0].document_id == stable_document_id(334, "team0/doc0.txt")
+        assert docs[0].document_id != stable_document_id(335, "team0/doc0.txt")
+        assert 0 < docs[0].document_id < 2**63
+        assert docs[0].file_name == "doc0.txt"
+        assert docs[0].file_type == "text/plain"
+        assert len(docs[0].md5_hash) == 32
+
+
+class TestBulkIngestor:
+    """BulkIngestor 테스트 (Mock OpenSearch)"""
+
+    def _search_client(self):
+        client = MagicMock()
+        client.bulk_index.side_effect = lambda index, docs, **kwargs: len(docs)
+        return client
+
+    def test_indexes_all_chunks(self, tmp_path):
+        _write_docs(tmp_path)
+        client = self._search_client()
+        embedder = FakeEmbedder()
+        ingestor = BulkIngestor(
+            client,
+            embedder,
+            "idx",
+            project_id=334,
+            chunker=TextChunker(chunk_size=200, chunk_overlap=20),
+            embed_batch_size=8,
+            bulk_size=10,
+        )
+
+        stats = ingestor.ingest(iter_documents(tmp_path, project_id=334))
+
+        indexed = [doc for call in client.bulk_index.call_args_list for doc in call.args[1]]
+        assert stats.documents == 3
+        assert stats.indexed == stats.chunks == len(indexed)
+        assert stats.failed == 0
+        assert max(embedder.batches) == 8
+        assert all(len(call.args[1]) <= 10 for call in client.bulk_index.call_args_list)
+        assert len({doc_id for doc_id, _ in indexed}) == len(indexed)
+
+        doc_id, doc = indexed[0]
+        assert doc_id == chunk_id(doc["document_id"], doc["chunk_index"])
+        assert doc["project_id"] == 334
+        assert doc["embedding"] == [float(len(doc["chunk_text"])), 0.0]
+        assert doc["character_end"] - doc["character_start"] == len(doc["chunk_text"])
+
+    def test_embedding_failures_are_skipped(self, tmp_path):
+        _write_docs(tmp_path, count=1)
+        first = TextChunker(chunk_size=200, chunk_overlap=20).split(SAMPLE_TEXT)[0].text
+        ingestor = BulkIngestor(
+            self._search_client(),
+            FakeEmbedder(fail_texts={first}),
+            "idx",
+            project_id=1,
+            chunker=TextChunker(chunk_size=200, chunk_overlap=20),
+        )
+
+        stats = ingestor.ingest(iter_documents(tmp_path, project_id=1))
+
+        assert stats.failed == 1
+        assert stats.indexed == stats.chunks - 1
+        assert "ThrottlingException" in stats.errors[0]
+
+    def test_retries_failed_bulk(self, tmp_path):
+        _write_docs(tmp_path, count=1)
+        client = self._search_client()
+        client.bulk_index.side_effect = [ConnectionError("reset"), 5, 5, 5, 5, 5, 5, 5]
+        ingestor = BulkIngestor(
+            client,
+            FakeEmbedder(),
+            "idx",
+            project_id=1,
+            chunker=TextChunker(chunk_size=2000, chunk_overlap=0),
+            bulk_size=100,
+            backoff_seconds=0.0,
+            routing_field="project_id",
+        )
+
+        stats = ingestor.ingest(iter_documents(tmp_path, project_id=1))
+
+        assert stats.retries == 1
+        assert stats.failed == 0
+        assert client.bulk_index.call_args.kwargs["routing_field"] == "project_id"
+
+    def test_gives_up_after_max_retries(self, tmp_path):
+        _write_docs(tmp_path, count=1)
+        client = self._search_client()
+        client.bulk_index.side_effect = ConnectionError("down")
+        ingestor = BulkIngestor(
+            client, FakeEmbedder(), "idx", project_id=1, max_retries=2, backoff_seconds=0.0, bulk_size=1000
+        )
+
+        stats = ingestor.ingest(iter_documents(tmp_path, project_id=1))
+
+        assert client.bulk_index.call_count == 3
+        assert stats.indexed == 0
+        assert stats.failed == stats.chunks
+        assert "ConnectionError" in stats.errors[0]
+
+    def test_back_pressure_limits_in_flight_requests(self, tmp_path):
+        """느린 OpenSearch에서도 모든 청크 색인, 동시 _bulk 요청은 workers 이하"""
+        _write_docs(tmp_path, count=4)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_bulk(index, docs, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return len(docs)
+
+        client = MagicMock()
+        client.bulk_index.side_effect = slow_bulk
+        ingestor = BulkIngestor(
+            client,
+            FakeEmbedder(),
+            "idx",
+            project_id=1,
+            chunker=TextChunker(chunk_size=100, chunk_overlap=0),
+            embed_batch_size=4,
+            bulk_size=4,
+            workers=2,
+            max_pending=2,
+        )
+
+        stats = ingestor.ingest(iter_documents(tmp_path, project_id=1))
+
+        assert stats.indexed == stats.chunks
+        assert client.bulk_index.call_count > 4
+        assert peak <= 2
+        assert stats.docs_per_sec > 0
+
+
+class TestIncrementalSync:
+    """IncrementalSync 테스트 (메모리 색인)"""
+
+    def _sync(self, tmp_path, index: FakeIndex, embedder: FakeEmbedder, **kwargs):
+        ingestor = BulkIngestor(
+            index, embedder, "idx", project_id=334, chunker=TextChunker(chunk_size=200, chunk_overlap=20), **kwargs
+        )
+        return IncrementalSync(ingestor, tmp_path / "manifest.json")
+
+    def _run(self, tmp_path, sync, **kwargs):
+        return sync.run(iter_documents(tmp_path / "docs", project_id=334), **kwargs)
+
+    def test_first_sync_indexes_everything(self, tmp_path):
+        _write_docs(tmp_path / "docs")
+        index, embedder = FakeIndex(), FakeEmbedder()
+
+        stats = self._run(tmp_path, self._sync(tmp_path, index, embedder))
+
+        assert stats.source == "index"
+        assert stats.new_documents == 3
+        assert stats.ingest.embedded == stats.upserts == len(index.docs)
+        manifest = SyncManifest.load(tmp_path / "manifest.json")
+        assert manifest.chunk_count == len(index.docs)
+
+    def test_unchanged_files_are_skipped(self, tmp_path):
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+        self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+
+        embedder = FakeEmbedder()
+        stats = self._run(tmp_path, self._sync(tmp_path, index, embedder))
+
+        assert stats.source == "manifest"
+        assert stats.unchanged_documents == 3
+        assert stats.upserts == stats.deleted == 0
+        assert embedder.batches == []
+
+    def test_only_changed_chunks_are_embedded(self, tmp_path):
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+        self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+        before = len(index.docs)
+
+        path = tmp_path / "docs" / "team0" / "doc0.txt"
+        path.write_text(SAMPLE_TEXT.replace("## 9장", "## 9장 (개정)"), encoding="utf-8")
+        embedder = FakeEmbedder()
+        stats = self._run(tmp_path, self._sync(tmp_path, index, embedder))
+
+        assert stats.changed_documents == 1
+        assert stats.unchanged_chunks > 0
+        assert 0 < stats.upserts < 4
+        assert stats.ingest.embedded == sum(embedder.batches) == stats.upserts - stats.reused_vectors
+        assert len(index.docs) == before
+
+    def test_renamed_file_reuses_vectors_and_deletes_orphans(self, tmp_path):
+        """같은 텍스트는 기존 벡터 복사, 사라진 경로의 청크는 삭제"""
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+        self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+        chunks_per_doc = len(index.docs) // 3
+
+        (tmp_path / "docs" / "team0" / "doc0.txt").rename(tmp_path / "docs" / "team0" / "moved.txt")
+        (tmp_path / "docs" / "team1" / "doc1.txt").unlink()
+        embedder = FakeEmbedder()
+        stats = self._run(tmp_path, self._sync(tmp_path, index, embedder, routing_field="project_id"))
+
+        assert stats.new_documents == 1
+        assert stats.removed_documents == 2
+        assert stats.reused_vectors == stats.upserts == chunks_per_doc
+        assert embedder.batches == []
+        assert stats.deleted == 2 * chunks_per_doc
+        assert len(index.docs) == 2 * chunks_per_doc
+        assert index.delete_routings == ["334"]
+
+    def test_vectors_fetched_before_indexing(self, tmp_path, monkeypatch):
+        """색인 중에 덮어쓴 청크 ID의 벡터를 읽지 않도록 모든 _mget이 _bulk보다 먼저"""
+        monkeypatch.setattr("src.ingest.sync.VECTOR_FETCH_BATCH", 2)
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+        self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+
+        (tmp_path / "docs" / "team0" / "doc0.txt").rename(tmp_path / "docs" / "team0" / "moved.txt")
+        calls = []
+        get_vectors, bulk_index = index.get_vectors, index.bulk_index
+        monkeypatch.setattr(index, "get_vectors", lambda *a, **kw: calls.append("mget") or get_vectors(*a, **kw))
+        monkeypatch.setattr(index, "bulk_index", lambda *a, **kw: calls.append("bulk") or bulk_index(*a, **kw))
+        stats = self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder(), bulk_size=2, embed_batch_size=2))
+
+        assert stats.reused_vectors == stats.upserts > 2
+        assert calls.count("mget") > 1
+        assert "bulk" not in calls[: calls.count("mget")]
+
+    def test_verify_rebuilds_state_from_index(self, tmp_path):
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+        self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+        index.docs.pop(next(iter(index.docs)))  # 매니페스트 밖에서 삭제된 청크
+
+        stats = self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()), verify=True)
+
+        assert stats.source == "index"
+        assert stats.upserts == 1
+        assert stats.unchanged_chunks == len(index.docs) - 1
+
+    def test_dry_run_changes_nothing(self, tmp_path):
+        _write_docs(tmp_path / "docs")
+        index = FakeIndex()
+
+        stats = self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()), dry_run=True)
+
+        assert stats.upserts > 0
+        assert index.docs == {}
+        assert not (tmp_path / "manifest.json").exists()
+
+    def test_failure_resyncs_from_index(self, tmp_path):
+        """실패 후에는 매니페스트 없이 인덱스 기준으로 비교 → 실패한 청크만 다시 임베딩"""
+        _write_docs(tmp_path / "docs", count=1)
+        index = FakeIndex()
+        first = TextChunker(chunk_size=200, chunk_overlap=20).split(SAMPLE_TEXT)[0].text
+
+        stats = self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder(fail_texts={first})))
+        assert stats.ingest.failed == 1
+        assert not (tmp_path / "manifest.json").exists()
+
+        retry = self._run(tmp_path, self._sync(tmp_path, index, FakeEmbedder()))
+
+        assert retry.source == "index"
+        assert retry.ingest.embedded == retry.upserts == 1
+        assert SyncManifest.load(tmp_path / "manifest.json").chunk_count == len(index.docs)
@@ -0,0 +1,189 @@
+"""LLMClient 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.llm_client import MIN_CACHE_TOKENS, LLMClient, LLMResponse, estimate_tokens
+from src.rag.modules.prompt_template import StrictPromptTemplate
+
+
+def _anthropic_message(text: str = "답변", input_tokens: int = 100, output_tokens: int = 20, **usage):
+    """Anthropic messages.create 응답 형식"""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens, **usage),
+        model="claude-sonnet-4-5@20250929",
+    )
+
+
+@pytest.fixture
+def llm():
+    """Vertex 연결 없이 생성한 LLMClient"""
+    with (
+        patch("src.llm_client.AnthropicVertex") as mock_sync,
+        patch("src.llm_client.AsyncAnthropicVertex") as mock_async,
+    ):
+        mock_sync.return_value.messages.create.return_value = _anthropic_message()
+        mock_async.return_value.messages.create = AsyncMock(return_value=_anthropic_message("비동기 답변"))
+        mock_async.return_value.close = AsyncMock()
+        yield LLMClient(project_id="test-project")
+
+
+class TestCall:
+    """동기 호출 테스트"""
+
+    def test_returns_llm_response(self, llm):
+        response = llm.call("질문", system="시스템")
+
+        assert isinstance(response, LLMResponse)
+        assert response.content == "답변"
+        assert response.input_tokens == 100
+        assert response.output_tokens == 20
+
+    def test_system_prompt_optional(self, llm):
+        llm.call("질문")
+
+        kwargs = llm.client.messages.create.call_args.kwargs
+        assert "system" not in kwargs
+        assert kwargs["messages"] == [{"role": "user", "content": "질문"}]
+
+
+LONG_SYSTEM = "답변 규칙입니다. " * 200  # 추정 ~1400 토큰
+LONG_DOCS = "## 문서\n" + "연차는 입사 1년 후 15일입니다. " * 100
+
+
+class TestPromptCache:
+    """프롬프트 캐시 테스트"""
+
+    def test_system_prompt_has_cache_breakpoint(self, llm):
+        llm.call("질문", system=LONG_SYSTEM)
+
+        system = llm.client.messages.create.call_args.kwargs["system"]
+        assert system == [{"type": "text", "text": LONG_SYSTEM, "cache_control": {"type": "ephemeral"}}]
+
+    def test_cache_prefix_splits_user_content(self, llm):
+        llm.call(f"{LONG_DOCS}\n\n## 질문\n연차는?", cache_prefix=LONG_DOCS)
+
+        content = llm.client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert content[0] == {"type": "text", "text": LONG_DOCS, "cache_control": {"type": "ephemeral"}}
+        assert content[1] == {"type": "text", "text": "\n\n## 질문\n연차는?"}
+
+    def test_short_prefix_skips_breakpoint(self, llm):
+        """최소 캐시 길이(MIN_CACHE_TOKENS) 미만 prefix에는 브레이크포인트를 두지 않음"""
+        llm.call("## 문서\n연차 15일\n\n## 질문\n연차는?", system="시스템", cache_prefix="## 문서\n연차 15일")
+
+        kwargs = llm.client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "시스템"
+        assert kwargs["messages"][0]["content"] == "## 문서\n연차 15일\n\n## 질문\n연차는?"
+
+    def test_strict_system_prompt_alone_not_cached(self, llm):
+        """StrictPromptTemplate 시스템 프롬프트는 최소 길이 미만 → 문서 구간과 합쳐야 캐시"""
+        system = StrictPromptTemplate.SYSTEM
+        assert estimate_tokens(system) < MIN_CACHE_TOKENS
+
+        llm.call(f"{LONG_DOCS}\n\n## 질문\n연차는?", system=system, cache_prefix=LONG_DOCS)
+
+        kwargs = llm.client.messages.create.call_args.kwargs
+        assert kwargs["system"] == system
+        assert kwargs["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("연차휴가") == 4
+
+    def test_cache_prefix_ignored_when_not_prefix(self, llm):
+        llm.call("질문", cache_prefix="다른 문서")
+
+        assert llm.client.messages.create.call_args.kwargs["messages"][0]["content"] == "질문"
+
+    def test_disabled(self):
+        with patch("src.llm_client.AnthropicVertex"), patch("src.llm_client.AsyncAnthropicVertex"):
+            llm = LLMClient(project_id="test-project", prompt_cache=False)
+        llm.client.messages.create.return_value = _anthropic_message()
+
+        llm.call("문서\n질문", system="시스템", cache_prefix="문서")
+
+        kwargs = llm.client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "시스템"
+        assert kwargs["messages"][0]["content"] == "문서\n질문"
+
+    def test_cache_usage_mapped(self, llm):
+        llm.client.messages.create.return_value = _anthropic_message(
+            cache_read_input_tokens=1800, cache_creation_input_tokens=0
+        )
+
+        response = llm.call("질문", system="시스템")
+
+        assert response.cache_read_tokens == 1800
+        assert response.cache_write_tokens == 0
+        assert response.input_tokens == 100
+
+
+class _FakeStream:
+    """messages.stream() 컨텍스트 매니저 Mock"""
+
+    def __init__(self, chunks: list[str]):
+        self.text_stream = iter(chunks)
+        self._text = "".join(chunks)
+
+    def get_final_message(self):
+        return _anthropic_message(self._text, output_tokens=len(self._text))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestStream:
+    """스트리밍 호출 테스트"""
+
+    def test_yields_chunks_then_response(self, llm):
+        llm.client.messages.stream.return_value = _FakeStream(["연차는 ", "15일", "입니다."])
+
+        events = list(llm.stream("질문", system="시스템"))
+
+        assert events[:-1] == ["연차는 ", "15일", "입니다."]
+        assert isinstance(events[-1], LLMResponse)
+        assert events[-1].content == "연차는 15일입니다."
+        assert llm.client.messages.stream.call_args.kwargs["system"] == "시스템"
+
+
+class TestAsyncCall:
+    """비동기 호출 테스트"""
+
+    def test_acall_returns_same_type(self, llm):
+        response = asyncio.run(llm.acall("질문", system="시스템"))
+
+        assert isinstance(response, LLMResponse)
+        assert response.content == "비동기 답변"
+
+    def test_async_client_reused_within_loop(self, llm):
+        async def run():
+            await asyncio.gather(*(llm.acall(f"질문 {i}") for i in range(5)))
+            return llm._async_client
+
+        with patch("src.llm_client.AsyncAnthropicVertex") as mock_async:
+            mock_async.return_value.messages.create = AsyncMock(return_value=_anthropic_message())
+            asyncio.run(run())
+
+        mock_async.assert_called_once()
+
+    def test_aclose(self, llm):
+        async def run():
+            await llm.acall("질문")
+            await llm.aclose()
+
+        asyncio.run(run())
+        assert llm._async_client is None
+
+
+def test_requires_project_id(monkeypatch):
+    monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+    with patch("src.llm_client.AnthropicVertex", MagicMock()):
+        with pytest.raises(ValueError):
+            LLMClient()
@@ -0,0 +1,360 @@
+"""LocalSearchClient / 벡터 인덱스 테스트"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.local_search import (
+    BM25Index,
+    BruteForceIndex,
+    HNSWIndex,
+    LocalSearchClient,
+    SnapshotWriter,
+    english_tokens,
+    korean_tokens,
+    reciprocal_rank_fusion,
+)
+from src.rag.modules import HybridQueryBuilder, KNNQueryBuilder
+
+DIMENSIONS = 8
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(60, DIMENSIONS)).astype(np.float32)
+
+
+@pytest.fixture
+def client(tmp_path, vectors):
+    """project 334 (0~39행) + project 335 (40~59행) 스냅샷"""
+    with SnapshotWriter(tmp_path, dimensions=DIMENSIONS, source="test") as writer:
+        for i, vector in enumerate(vectors):
+            source = {
+                "text": f"청크 {i}",
+                "document_id": i // 10,
+                "chunk_index": i % 10,
+                "project_id": 334 if i < 40 else 335,
+            }
+            writer.add(f"c{i}", source, vector)
+    return LocalSearchClient.from_snapshot(tmp_path)
+
+
+def _exact_top(vectors: np.ndarray, query: np.ndarray, rows: np.ndarray, k: int) -> list[int]:
+    distances = ((vectors[rows] - query) ** 2).sum(axis=1)
+    return rows[np.argsort(distances)[:k]].tolist()
+
+
+def _knn_rank(client: LocalSearchClient, vector: np.ndarray, chunk_id: str) -> int:
+    """project 334 안에서 chunk_id의 KNN 순위 (1부터)"""
+    hits = client.search("rag-index", KNNQueryBuilder().build("", vector.tolist(), project_id=334, k=4), size=4)
+    return [hit["_id"] for hit in hits].index(chunk_id) + 1
+
+
+class TestBruteForceIndex:
+    """정확 검색 테스트"""
+
+    def test_matches_exact_l2(self, vectors):
+        query = vectors[7] + 0.01
+        rows, scores = BruteForceIndex(vectors).search(query, k=5)
+
+        assert rows.tolist() == _exact_top(vectors, query, np.arange(60), 5)
+        assert rows[0] == 7
+        assert np.all(np.diff(scores) <= 0)
+        assert 0 < scores[0] <= 1
+
+    def test_rows_subset(self, vectors):
+        subset = np.arange(40, 60)
+        rows, _ = BruteForceIndex(vectors, subset).search(vectors[3], k=3)
+
+        assert set(rows.tolist()) <= set(subset.tolist())
+
+    def test_k_larger_than_index(self, vectors):
+        rows, _ = BruteForceIndex(vectors[:3]).search(vectors[0], k=10)
+
+        assert len(rows) == 3
+
+    def test_empty(self, vectors):
+        rows, scores = BruteForceIndex(vectors, np.array([], dtype=np.int64)).search(vectors[0], k=5)
+
+        assert len(rows) == 0 and len(scores) == 0
+
+
+class TestHNSWIndex:
+    """HNSW 근사 검색 테스트 (hnswlib 설치 시)"""
+
+    def test_recall(self, vectors):
+        pytest.importorskip("hnswlib")
+        query = vectors[11]
+        rows, scores = HNSWIndex(vectors).search(query, k=5)
+
+        assert rows[0] == 11
+        assert scores[0] == pytest.approx(1.0)
+
+
+class TestLocalSearchClient:
+    """OpenSearchClient 호환 검색 테스트"""
+
+    def test_knn_respects_project_filter(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[45].tolist(), project_id=334, k=5)
+
+        hits = client.search("rag-index", query, size=5)
+
+        assert len(hits) == 5
+        assert all(hit["_source"]["project_id"] == 334 for hit in hits)
+        expected = _exact_top(vectors, vectors[45], np.arange(40), 5)
+        assert [hit["_id"] for hit in hits] == [f"c{i}" for i in expected]
+
+    def test_hit_format(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[2].tolist(), project_id=334, k=1)
+
+        hit = client.search("rag-index", query, size=5)[0]
+
+        assert hit["_index"] == "rag-index"
+        assert hit["_id"] == "c2"
+        assert hit["_score"] == pytest.approx(1.0)
+        assert hit["_source"]["text"] == "청크 2"
+        assert "embedding" not in hit["_source"]
+
+    def test_include_vectors(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[2].tolist(), project_id=334, k=1)
+
+        hit = client.search("rag-index", query, size=1, include_vectors=True)[0]
+
+        assert hit["_source"]["embedding"] == pytest.approx(vectors[2].tolist())
+
+    def test_size_limits_k(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[0].tolist(), project_id=335, k=10)
+
+        assert len(client.search("rag-index", query, size=3)) == 3
+
+    def test_bool_filter(self, client, vectors):
+        query = {
+            "query": {
+                "knn": {
+                    "embedding": {
+                        "vector": vectors[0].tolist(),
+                        "k": 20,
+                        "filter": {
+                            "bool": {"filter": [{"term": {"project_id": 334}}, {"terms": {"document_id": [1, 2]}}]}
+                        },
+                    }
+                }
+            }
+        }
+
+        hits = client.search("rag-index", query, size=20)
+
+        assert sorted(hit["_source"]["document_id"] for hit in hits) == [1] * 10 + [2] * 10
+
+    def test_project_index_is_cached(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[0].tolist(), project_id=334, k=5)
+
+        client.search("rag-index", query)
+        client.search("rag-index", query)
+
+        assert list(client._indexes) == [334]
+
+    def test_hnsw_threshold(self, client, vectors):
+        client.hnsw_threshold = 10
+        query = KNNQueryBuilder().build("질문", vectors[0].tolist(), project_id=334, k=5)
+
+        try:
+            import hnswlib  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="hnswlib"):
+                client.search("rag-index", query)
+        else:
+            client.search("rag-index", query)
+            assert isinstance(client._indexes[334], HNSWIndex)
+
+    def test_async_and_msearch(self, client, vectors):
+        query = KNNQueryBuilder().build("질문", vectors[0].tolist(), project_id=334, k=5)
+
+        single = client.search("rag-index", query)
+        assert asyncio.run(client.asearch_with_pipeline("rag-index", query)) == single
+        assert client.msearch("rag-index", [(query, 5), (query, 2)]) == [single, single[:2]]
+
+    def test_script_score_matches_exact_knn(self, client, vectors):
+        """script_score 정확 검색 = 정확 knn (같은 l2 점수)"""
+        builder = KNNQueryBuilder(project_size=lambda project_id: 40)
+        query = builder.build("질문", vectors[45].tolist(), project_id=334, k=5)
+        assert "script_score" in query["query"]
+
+        hits = client.search("rag-index", query, size=5)
+        knn_hits = client.search("rag-index", KNNQueryBuilder().build("질문", vectors[45].tolist(), 334), size=5)
+
+        assert [hit["_id"] for hit in hits] == [hit["_id"] for hit in knn_hits]
+        assert [hit["_score"] for hit in hits] == pytest.approx([hit["_score"] for hit in knn_hits])
+
+    def test_script_score_cosine(self, client, vectors):
+        """cosinesimil 점수 = 1 + cos"""
+        builder = KNNQueryBuilder(project_size=lambda project_id: 20, space_type="cosinesimil")
+        query = builder.build("질문", (vectors[50] * 3).tolist(), project_id=335, k=3)
+
+        hits = client.search("rag-index", query, size=3)
+
+        assert hits[0]["_id"] == "c50"
+        assert hits[0]["_score"] == pytest.approx(2.0)
+        assert all(hit["_source"]["project_id"] == 335 for hit in hits)
+
+    def test_unsupported_query(self, client):
+        with pytest.raises(ValueError, match="지원하지 않는 쿼리"):
+            client.search("rag-index", {"query": {"range": {"chunk_index": {"gte": 1}}}})
+
+    def test_index_version_and_count(self, client):
+        assert client.get_index_version("rag-index").startswith("snapshot:")
+        assert client.get_doc_count_by_project("rag-index", 335) == 20
+
+
+class TestTokenizer:
+    """토크나이저 테스트"""
+
+    def test_korean_bigrams(self):
+        assert korean_tokens("연차 휴가는 며칠?") == ["연차", "휴가", "가는", "며칠"]
+
+    def test_korean_mixed_and_normalized(self):
+        assert korean_tokens("FlowSync API 요금") == ["flowsync", "api", "요금"]
+        assert korean_tokens("ＡＰＩ") == ["api"]  # 전각 → 반각
+
+    def test_single_syllable(self):
+        assert korean_tokens("팀 휴가") == ["팀", "휴가"]
+
+    def test_english_stopwords_and_plural(self):
+        assert english_tokens("The pricing Plans for teams and access") == ["pricing", "plan", "team", "access"]
+
+    def test_english_ignores_hangul(self):
+        assert english_tokens("연차 API") == ["api"]
+
+
+class TestBM25Index:
+    """BM25 테스트"""
+
+    def test_ranks_matching_document_first(self):
+        index = BM25Index([["연차", "휴가"], ["재택", "근무"], ["휴가", "신청", "휴가"]])
+
+        scores = index.scores(["휴가"])
+
+        assert scores[1] == 0
+        assert scores[2] > scores[0] > 0
+
+    def test_rare_term_weighs_more(self):
+        index = BM25Index([["공통", "희귀"], ["공통"], ["공통"]])
+
+        scores = index.scores(["희귀"])
+        common = index.scores(["공통"])
+
+        assert scores[0] > common[0]
+
+    def test_lucene_formula(self):
+        index = BM25Index([["a"], ["b", "c"]])
+
+        # idf = ln(1 + (2 - 1 + 0.5) / (1 + 0.5)), norm = 1.2 * (1 - 0.75 + 0.75 * 1 / 1.5)
+        expected = np.log(1 + 1.5 / 1.5) * 1 / (1 + 1.2 * (0.25 + 0.5))
+        assert index.scores(["a"])[0] == pytest.approx(expected, rel=1e-5)
+
+    def test_unknown_term(self):
+        assert not BM25Index([["a"]]).scores(["z"]).any()
+
+
+class TestReciprocalRankFusion:
+    """RRF 테스트"""
+
+    def test_combines_rankings(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], rank_constant=60)
+
+        assert [key for key, _ in fused] == ["b", "a", "d", "c"]
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+    def test_weights(self):
+        fused = reciprocal_rank_fusion([["a"], ["b"]], weights=[1.0, 2.0])
+
+        assert fused[0][0] == "b"
+
+    def test_weights_length_mismatch(self):
+        with pytest.raises(ValueError):
+            reciprocal_rank_fusion([["a"], ["b"]], weights=[1.0])
+
+
+@pytest.fixture
+def text_client(tmp_path, vectors):
+    """본문 검색용 스냅샷 (334: 휴가/재택 문서, 335: 휴가 문서)"""
+    texts = [
+        "연차 휴가는 입사 1년 후 15일이 부여됩니다.",
+        "재택근무는 주 2회까지 가능합니다.",
+        "API rate limit은 분당 100회입니다.",
+        "휴가 신청은 FlowSync에서 합니다.",
+        "다른 프로젝트의 연차 휴가 규정",
+    ]
+    with SnapshotWriter(tmp_path, dimensions=DIMENSIONS) as writer:
+        for i, text in enumerate(texts):
+            source = {"text": text, "chunk_text": text, "document_id": i, "project_id": 334 if i < 4 else 335}
+            writer.add(f"t{i}", source, vectors[i])
+    return LocalSearchClient.from_snapshot(tmp_path)
+
+
+class TestLocalHybrid:
+    """BM25 / 하이브리드 검색 테스트"""
+
+    def _bm25_query(self, text: str, project_id: int = 334) -> dict:
+        return {
+            "query": {
+                "bool": {
+                    "must": [{"multi_match": {"query": text, "fields": HybridQueryBuilder.SEARCH_FIELDS}}],
+                    "filter": [{"term": {"project_id": project_id}}],
+                }
+            }
+        }
+
+    def test_bm25_with_project_filter(self, text_client):
+        hits = text_client.search("rag-index", self._bm25_query("연차 휴가 며칠"), size=5)
+
+        assert [hit["_id"] for hit in hits] == ["t0", "t3"]  # t4는 다른 프로젝트
+
+    def test_english_field(self, text_client):
+        hits = text_client.search("rag-index", self._bm25_query("rate limits"), size=5)
+
+        assert hits[0]["_id"] == "t2"
+
+    def test_field_boost_best_fields(self, text_client):
+        query = {"query": {"multi_match": {"query": "재택근무", "fields": ["chunk_text^4.0", "text.ko"]}}}
+        boosted = text_client.search("rag-index", query, size=1)[0]["_score"]
+
+        query["query"]["multi_match"]["fields"] = ["text.ko"]
+        plain = text_client.search("rag-index", query, size=1)[0]["_score"]
+
+        assert boosted == pytest.approx(plain * 4.0, rel=1e-5)
+
+    def test_match_query(self, text_client):
+        hits = text_client.search("rag-index", {"query": {"match": {"text": "재택"}}}, size=5)
+
+        assert [hit["_id"] for hit in hits] == ["t1"]
+
+    def test_hybrid_rrf(self, text_client, vectors):
+        query = HybridQueryBuilder().build("연차 휴가", vectors[2].tolist(), project_id=334, k=4)
+
+        hits = text_client.search_with_pipeline("rag-index", query, size=4, pipeline="hybrid-rrf")
+
+        ids = [hit["_id"] for hit in hits]
+        assert set(ids) <= {"t0", "t1", "t2", "t3"}
+        assert ids[0] == "t0"  # BM25 1위 + KNN 상위
+        assert hits[0]["_score"] == pytest.approx(1 / 61 + 1 / (60 + _knn_rank(text_client, vectors[2], "t0")))
+
+    def test_pipeline_rank_constant(self, text_client, vectors):
+        query = HybridQueryBuilder().build("재택", vectors[1].tolist(), project_id=334, k=4)
+
+        hits = text_client.search_with_pipeline("rag-index", query, size=4, pipeline="hybrid-rrf-tuned")
+
+        assert hits[0]["_id"] == "t1"
+        assert hits[0]["_score"] == pytest.approx(2 / 21)
+
+    def test_text_index_is_shared(self, text_client):
+        text_client.search("rag-index", self._bm25_query("휴가"), size=5)
+
+        # 인덱스는 (컬럼, 분석기) 단위 - text.ko / text.en은 같은 컬럼이지만 분석기가 다름
+        assert sorted(key[1:] for key in text_client._text_indexes) == [
+            ("chunk_text", "korean"),
+            ("text", "english"),
+            ("text", "korean"),
+        ]
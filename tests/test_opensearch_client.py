@@ -38,3 +38,490 @@ class TestOpenSearchIndex:
         mapping = opensearch_client.get_index_mapping(test_index)
         assert test_index in mapping
         assert "mappings" in mapping[test_index]
+
+    def test_get_index_version(self, opensearch_client, test_index):
+        """인덱스 버전 조회 (변경 없으면 동일)"""
+        version = opensearch_client.get_index_version(test_index)
+        assert isinstance(version, str)
+        assert version == opensearch_client.get_index_version(test_index)
+
+
+class TestAsyncSearch:
+    """비동기 검색 테스트 (Mock)"""
+
+    def test_asearch_returns_hits(self):
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        from opensearch_client import OpenSearchClient
+
+        hits = [{"_id": "1", "_score": 1.0, "_source": {"text": "연차"}}]
+        with patch("opensearch_client.AsyncOpenSearch") as mock_async:
+            mock_async.return_value.search = AsyncMock(return_value={"hits": {"hits": hits}})
+            client = OpenSearchClient(username="u", password="p")
+
+            result = asyncio.run(client.asearch_with_pipeline("idx", {"query": {}}, size=3))
+
+        assert result == hits
+        kwargs = mock_async.return_value.search.call_args.kwargs
+        assert kwargs["params"] == {"search_pipeline": "hybrid-rrf"}
+        assert kwargs["size"] == 3
+
+
+class TestTransportConfig:
+    """전송 계층 설정 테스트 (연결 없이 생성만)"""
+
+    def _connection(self, client):
+        return client.client.transport.connection_pool.connection
+
+    def test_urllib3_with_pool_and_compress(self):
+        from opensearchpy import Urllib3HttpConnection
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p", transport="urllib3", pool_maxsize=32, http_compress=True)
+
+        connection = self._connection(client)
+        assert isinstance(connection, Urllib3HttpConnection)
+        assert connection.http_compress is True
+        assert connection.pool.pool.maxsize == 32  # urllib3 LifoQueue 크기
+
+    def test_requests_keep_alive_off(self):
+        from opensearchpy import RequestsHttpConnection
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p", transport="requests", keep_alive=False, timeout=3)
+
+        connection = self._connection(client)
+        assert isinstance(connection, RequestsHttpConnection)
+        assert connection.headers["connection"] == "close"
+        assert connection.timeout == 3
+
+    def test_invalid_transport(self):
+        import pytest
+
+        from opensearch_client import OpenSearchClient
+
+        with pytest.raises(ValueError):
+            OpenSearchClient(username="u", password="p", transport="httpx")  # type: ignore[arg-type]
+
+    def test_request_timeout_passed_per_request(self):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p")
+        client.client = MagicMock()
+        client.client.search.return_value = {"hits": {"hits": []}}
+
+        client.search_with_pipeline("idx", {"query": {}}, request_timeout=2.5)
+
+        params = client.client.search.call_args.kwargs["params"]
+        assert params == {"search_pipeline": "hybrid-rrf", "request_timeout": 2.5}
+
+
+class TestMSearch:
+    """_msearch 배치 검색 테스트 (Mock)"""
+
+    def _client(self, responses: list[dict]):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p")
+        client.client = MagicMock()
+        client.client.msearch.side_effect = [{"responses": r} for r in responses]
+        return client
+
+    @staticmethod
+    def _hits(doc_id: str) -> dict:
+        return {"hits": {"hits": [{"_id": doc_id, "_score": 1.0, "_source": {}}]}}
+
+    def test_single_round_trip(self):
+        client = self._client([[self._hits("a"), self._hits("b")]])
+
+        results = client.msearch("idx", [({"query": {"match": {"text": "연차"}}}, 3), ({"query": {}}, 5)])
+
+        assert [r[0]["_id"] for r in results] == ["a", "b"]
+        client.client.msearch.assert_called_once()
+        body = client.client.msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "idx"}
+        assert body[1]["size"] == 3
+        assert body[3]["size"] == 5
+        assert "search_pipeline" not in client.client.msearch.call_args.kwargs["params"]
+
+    def test_does_not_mutate_query(self):
+        client = self._client([[self._hits("a")]])
+        query = {"query": {}}
+
+        client.msearch("idx", [(query, 3)])
+
+        assert query == {"query": {}}
+
+    def test_groups_by_pipeline_and_keeps_order(self):
+        client = self._client([[self._hits("a"), self._hits("c")], [self._hits("b")]])
+
+        results = client.msearch_with_pipeline(
+            "idx",
+            [({"query": {}}, 5, "hybrid-rrf"), ({"query": {}}, 5, None), ({"query": {}}, 5, "hybrid-rrf")],
+        )
+
+        assert [r[0]["_id"] for r in results] == ["a", "b", "c"]
+        assert client.client.msearch.call_count == 2
+        first_params = client.client.msearch.call_args_list[0].kwargs["params"]
+        assert first_params == {"search_pipeline": "hybrid-rrf"}
+
+    def test_item_error_raises(self):
+        import pytest
+
+        client = self._client([[self._hits("a"), {"error": {"reason": "parse error"}}]])
+
+        with pytest.raises(RuntimeError, match="항목 1"):
+            client.msearch("idx", [({"query": {}}, 5), ({"query": {}}, 5)])
+
+    def test_empty_entries(self):
+        client = self._client([])
+
+        assert client.msearch("idx", []) == []
+        client.client.msearch.assert_not_called()
+
+    def test_async_msearch(self):
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        from opensearch_client import OpenSearchClient
+
+        with patch("opensearch_client.AsyncOpenSearch") as mock_async:
+            mock_async.return_value.msearch = AsyncMock(
+                return_value={"responses": [self._hits("a"), self._hits("b")]}
+            )
+            client = OpenSearchClient(username="u", password="p")
+
+            results = asyncio.run(
+                client.amsearch_with_pipeline("idx", [({"query": {}}, 5, "hybrid-rrf"), ({"query": {}}, 5, "hybrid-rrf")])
+            )
+
+        assert [r[0]["_id"] for r in results] == ["a", "b"]
+        mock_async.return_value.msearch.assert_awaited_once()
+
+
+class TestSourceProjection:
+    """_source allow-list 테스트 (Mock)"""
+
+    def _client(self, **kwargs):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p", **kwargs)
+        client.client = MagicMock()
+        client.client.search.return_value = {"hits": {"hits": []}}
+        client.client.msearch.return_value = {"responses": [{"hits": {"hits": []}}]}
+        return client
+
+    def _sent_source(self, client):
+        return client.client.search.call_args.kwargs["body"]["_source"]
+
+    def test_default_allow_list_without_vectors(self):
+        from opensearch_client import SOURCE_FIELDS
+
+        client = self._client()
+
+        client.search_with_pipeline("idx", {"query": {}})
+
+        assert self._sent_source(client) == {"includes": SOURCE_FIELDS}
+
+    def test_opt_in_vectors_per_call(self):
+        client = self._client()
+
+        client.search("idx", {"query": {}}, include_vectors=True)
+
+        includes = self._sent_source(client)["includes"]
+        assert "embedding" in includes
+        assert "embedding_vector" in includes
+
+    def test_no_allow_list_still_excludes_vectors(self):
+        client = self._client(source_fields=None)
+
+        client.search("idx", {"query": {}})
+
+        assert self._sent_source(client) == {"excludes": ["embedding", "embedding_vector"]}
+
+    def test_explicit_source_respected(self):
+        client = self._client()
+        query = {"query": {}, "_source": ["text"]}
+
+        client.search("idx", query)
+
+        assert self._sent_source(client) == ["text"]
+
+    def test_query_not_mutated(self):
+        client = self._client()
+        query = {"query": {}}
+
+        client.search("idx", query)
+
+        assert "_source" not in query
+
+    def test_msearch_projection(self):
+        client = self._client()
+
+        client.msearch("idx", [({"query": {}}, 5)])
+
+        body = client.client.msearch.call_args.kwargs["body"]
+        assert "embedding" not in body[1]["_source"]["includes"]
+
+
+class TestIterDocs:
+    """PIT + search_after 스트리밍 조회 테스트 (Mock)"""
+
+    def _client(self, pages: list[list[dict]]):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p")
+        client.client = MagicMock()
+        client.client.create_pit.return_value = {"pit_id": "pit-1"}
+        client.client.search.side_effect = [{"pit_id": "pit-1", "hits": {"hits": page}} for page in pages]
+        return client
+
+    @staticmethod
+    def _hit(doc_id: int, chunk: int) -> dict:
+        return {"_id": f"{doc_id}_{chunk}", "_source": {"text": "t"}, "sort": [doc_id, chunk]}
+
+    def test_pages_with_search_after(self):
+        client = self._client([[self._hit(1, 0), self._hit(1, 1)], [self._hit(2, 0)]])
+
+        hits = list(client.iter_docs_by_project("idx", 334, page_size=2))
+
+        assert [h["_id"] for h in hits] == ["1_0", "1_1", "2_0"]
+        requests = [c.kwargs["body"] for c in client.client.search.call_args_list]
+        assert "search_after" not in requests[0]
+        assert requests[1]["search_after"] == [1, 1]
+        assert requests[0]["pit"] == {"id": "pit-1", "keep_alive": "2m"}
+        assert requests[0]["query"] == {"term": {"project_id": 334}}
+        assert "embedding_vector" not in requests[0]["_source"]["includes"]
+        client.client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-1"]})
+
+    def test_exact_page_boundary_stops_on_empty_page(self):
+        client = self._client([[self._hit(1, 0), self._hit(1, 1)], []])
+
+        hits = list(client.iter_docs_by_project("idx", 334, page_size=2))
+
+        assert len(hits) == 2
+        assert client.client.search.call_count == 2
+
+    def test_pit_deleted_when_consumer_stops_early(self):
+        client = self._client([[self._hit(1, 0), self._hit(1, 1)], [self._hit(2, 0)]])
+
+        iterator = client.iter_docs_by_project("idx", 334, page_size=2)
+        next(iterator)
+        iterator.close()
+
+        client.client.delete_pit.assert_called_once()
+        assert client.client.search.call_count == 1
+
+    def test_duplicate_sort_keys_across_page_boundary(self):
+        """(document_id, chunk_index)가 겹쳐도 _shard_doc 타이브레이커로 누락/중복 없음"""
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        # (document_id, chunk_index, _shard_doc) - 같은 키 3개가 page_size=2 경계에 걸침
+        docs = [(1, 0, 10), (1, 0, 11), (1, 0, 12), (2, 0, 13), (2, 0, 14)]
+
+        def search(body):
+            fields = [next(iter(clause)) for clause in body["sort"]]
+            index = {"document_id": 0, "chunk_index": 1, "_shard_doc": 2}
+            keyed = sorted([doc[index[f]] for f in fields] for doc in docs)
+            after = body.get("search_after")
+            page = [key for key in keyed if after is None or key > after][: body["size"]]
+            return {"pit_id": "pit-1", "hits": {"hits": [{"_id": str(key[-1]), "sort": key} for key in page]}}
+
+        client = OpenSearchClient(username="u", password="p")
+        client.client = MagicMock()
+        client.client.create_pit.return_value = {"pit_id": "pit-1"}
+        client.client.search.side_effect = search
+
+        hits = [h["_id"] for h in client.iter_docs_by_project("idx", 334, page_size=2)]
+        assert hits == ["10", "11", "12", "13", "14"]
+
+        custom = [h["_id"] for h in client.iter_docs("idx", sort=[{"document_id": "asc"}], page_size=2)]
+        assert custom == ["10", "11", "12", "13", "14"]
+
+    def test_get_all_docs_uses_generator(self):
+        client = self._client([[self._hit(1, 0)]])
+
+        docs = client.get_all_docs_by_project("idx", 334)
+
+        assert len(docs) == 1
+        client.client.scroll.assert_not_called()
+
+
+class TestIndexManagement:
+    """인덱스 생성/재색인 헬퍼 테스트 (Mock)"""
+
+    def _client(self, **kwargs):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p", **kwargs)
+        client.client = MagicMock()
+        return client
+
+    def test_local_node_without_ssl_or_auth(self):
+        from unittest.mock import patch
+
+        with patch("opensearch_client.OpenSearch") as mock_opensearch:
+            from opensearch_client import OpenSearchClient
+
+            with patch.dict("os.environ", {"OPENSEARCH_USERNAME": "", "OPENSEARCH_PASSWORD": ""}):
+                OpenSearchClient(port=9200, use_ssl=False)
+
+        kwargs = mock_opensearch.call_args.kwargs
+        assert kwargs["use_ssl"] is False
+        assert kwargs["http_auth"] is None
+
+    def test_bulk_index_streams_actions(self):
+        from unittest.mock import patch
+
+        client = self._client()
+        with patch("opensearch_client.helpers.bulk", return_value=(2, [])) as mock_bulk:
+            count = client.bulk_index("idx", iter([("a", {"text": "1"}), ("b", {"text": "2"})]), chunk_size=100)
+
+        actions = list(mock_bulk.call_args.args[1])
+        assert count == 2
+        assert actions[0] == {"_index": "idx", "_id": "a", "_source": {"text": "1"}}
+        assert mock_bulk.call_args.kwargs["chunk_size"] == 100
+
+    def test_bulk_delete_with_routing_ignores_missing(self):
+        from unittest.mock import patch
+
+        client = self._client()
+        results = [(True, {"delete": {"_id": "a", "status": 200}}), (False, {"delete": {"_id": "b", "status": 404}})]
+        with patch("opensearch_client.helpers.streaming_bulk", return_value=iter(results)) as mock_bulk:
+            deleted = client.bulk_delete("idx", ["a", "b"], routing="334")
+
+        actions = list(mock_bulk.call_args.args[1])
+        assert deleted == 1
+        assert actions[0] == {"_op_type": "delete", "_index": "idx", "_id": "a", "_routing": "334"}
+
+    def test_get_vectors_skips_missing(self):
+        client = self._client()
+        client.client.mget.return_value = {
+            "docs": [
+                {"_id": "a", "found": True, "_source": {"embedding": [0.1, 0.2]}},
+                {"_id": "b", "found": False},
+            ]
+        }
+
+        vectors = client.get_vectors("idx", ["a", "b"], routing="334")
+
+        assert vectors == {"a": [0.1, 0.2]}
+        assert client.client.mget.call_args.kwargs["params"] == {"_source_includes": "embedding", "routing": "334"}
+
+    def test_store_size_sums_primaries(self):
+        client = self._client()
+        client.client.indices.stats.return_value = {
+            "indices": {
+                "a": {"primaries": {"store": {"size_in_bytes": 100}}},
+                "b": {"primaries": {"store": {"size_in_bytes": 50}}},
+            }
+        }
+
+        assert client.get_index_store_size("a,b") == 150
+
+
+class TestProjectRouting:
+    """project_id 라우팅 테스트 (Mock)"""
+
+    def _client(self, routed: bool, **kwargs):
+        from unittest.mock import MagicMock
+
+        from opensearch_client import OpenSearchClient
+
+        client = OpenSearchClient(username="u", password="p", **kwargs)
+        client.client = MagicMock()
+        client.client.search.return_value = {"hits": {"hits": []}}
+        mappings = {"_routing": {"required": True}} if routed else {}
+        client.client.indices.get_mapping.return_value = {"idx": {"mappings": mappings}}
+        return client
+
+    def test_routing_from_knn_filter(self):
+        from opensearch_client import project_routing
+
+        query = {"query": {"knn": {"embedding": {"vector": [0.1], "k": 5, "filter": {"term": {"project_id": 334}}}}}}
+        assert project_routing(query) == "334"
+
+    def test_routing_from_hybrid_union(self):
+        from opensearch_client import project_routing
+
+        query = {
+            "query": {
+                "hybrid": {
+                    "queries": [
+                        {"bool": {"must": [{"match": {"text": "휴가"}}], "filter": [{"term": {"project_id": 2}}]}},
+                        {"knn": {"embedding": {"vector": [0.1], "k": 5, "filter": {"terms": {"project_id": [1, 2]}}}}},
+                    ]
+                }
+            }
+        }
+        assert project_routing(query) == "1,2"
+
+    def test_no_routing_without_required_filter(self):
+        """should/must_not 조건이나 제약 없는 hybrid 서브쿼리는 routing 불가"""
+        from opensearch_client import project_routing
+
+        optional = {"query": {"bool": {"should": [{"term": {"project_id": 1}}]}}}
+        unconstrained = {"query": {"hybrid": {"queries": [{"match_all": {}}, {"term": {"project_id": 1}}]}}}
+        assert project_routing(optional) is None
+        assert project_routing(unconstrained) is None
+        assert project_routing({"query": {"match_all": {}}}) is None
+
+    def test_search_routes_on_routed_index(self):
+        client = self._client(routed=True)
+        query = {"query": {"bool": {"filter": [{"term": {"project_id": 334}}]}}}
+
+        client.search_with_pipeline("idx", query, pipeline="hybrid-rrf")
+        client.search("idx", query)
+
+        assert client.client.search.call_args_list[0].kwargs["params"]["routing"] == "334"
+        assert client.client.search.call_args.kwargs["params"] == {"routing": "334"}
+        client.client.indices.get_mapping.assert_called_once()  # 매핑 조회는 인덱스별 1회
+
+    def test_search_skips_routing_on_unrouted_index(self):
+        client = self._client(routed=False)
+
+        client.search("idx", {"query": {"term": {"project_id": 334}}})
+
+        assert client.client.search.call_args.kwargs["params"] == {}
+
+    def test_explicit_setting_skips_mapping_lookup(self):
+        client = self._client(routed=False, project_routing=True)
+
+        client.search("idx", {"query": {"term": {"project_id": 7}}})
+
+        assert client.client.search.call_args.kwargs["params"] == {"routing": "7"}
+        client.client.indices.get_mapping.assert_not_called()
+
+    def test_msearch_header_routing(self):
+        client = self._client(routed=True)
+        client.client.msearch.return_value = {"responses": [{"hits": {"hits": []}}, {"hits": {"hits": []}}]}
+
+        client.msearch("idx", [({"query": {"term": {"project_id": 3}}}, 5), ({"query": {"match_all": {}}}, 5)])
+
+        body = client.client.msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "idx", "routing": "3"}
+        assert body[2] == {"index": "idx"}
+
+    def test_bulk_index_routing_field(self):
+        from unittest.mock import patch
+
+        client = self._client(routed=True)
+        with patch("opensearch_client.helpers.bulk", return_value=(1, [])) as mock_bulk:
+            client.bulk_index("idx", iter([("a", {"project_id": 334})]), routing_field="project_id")
+
+        assert list(mock_bulk.call_args.args[1])[0]["_routing"] == "334"
@@ -1,15 +1,22 @@
 """RAG 파이프라인 테스트"""
 
+import asyncio
+import threading
+import time
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.rag.answer_cache import SemanticAnswerCache
 from src.rag.pipeline import RAGPipeline, create_minimal_pipeline
 from src.rag.types import RAGResult
-from src.rag.query_builder import KNNQueryBuilder
-from src.rag.context_builder import SimpleContextBuilder
-from src.rag.prompt_template import SimplePromptTemplate
-from src.rag.result_filter import TopKFilter
-from src.rag.preprocessor import NoopPreprocessor
+from src.rag.modules.fusion import RRFFusion
+from src.rag.modules.query_builder import HybridQueryBuilder, KNNQueryBuilder, ProjectSizeCache
+from src.rag.modules.context_builder import SimpleContextBuilder
+from src.rag.modules.prompt_template import SimplePromptTemplate
+from src.rag.modules.result_filter import CompositeFilter, RerankerFilter, TopKFilter
+from src.rag.modules.preprocessor import NoopPreprocessor
+from src.embedding_client import BatchEmbeddingResult
 from src.llm_client import LLMResponse
 
 
@@ -222,6 +229,502 @@ class TestRAGPipeline:
         call_args = mock_search_client.search_with_pipeline.call_args
         assert call_args.kwargs["pipeline"] == "hybrid-rrf"
 
+    def test_cache_prefix_disabled_by_default(self, pipeline, mock_llm_client):
+        """cache_documents=False면 cache_prefix 없이 호출"""
+        pipeline.query("테스트")
+
+        assert mock_llm_client.call.call_args.kwargs["cache_prefix"] is None
+
+    def test_cache_documents_passes_prefix(self, pipeline, mock_llm_client):
+        """cache_documents=True면 user_prompt의 문서 구간까지를 cache_prefix로 전달"""
+        mock_llm_client.call.return_value = LLMResponse(
+            content="답변", input_tokens=20, output_tokens=10, model="m", cache_read_tokens=500
+        )
+        pipeline.cache_documents = True
+
+        result = pipeline.query("연차 휴가는 며칠인가요?")
+
+        prompt = mock_llm_client.call.call_args.args[0]
+        prefix = mock_llm_client.call.call_args.kwargs["cache_prefix"]
+        assert prompt.startswith(prefix)
+        assert "15일" in prefix
+        assert "연차 휴가는 며칠인가요?" not in prefix
+        assert result.cache_read_tokens == 500
+
+
+class TestRAGPipelineAnswerCache:
+    """답변 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def cached_pipeline(self, pipeline):
+        pipeline.answer_cache = SemanticAnswerCache(threshold=0.95)
+        return pipeline
+
+    def test_second_query_skips_search_and_llm(self, cached_pipeline, mock_search_client, mock_llm_client):
+        first = cached_pipeline.query("연차 휴가는 며칠인가?")
+        second = cached_pipeline.query("연차 며칠이야")
+
+        assert first.timings["cache_hit"] == 0.0
+        assert second.timings["cache_hit"] == 1.0
+        assert second.question == "연차 며칠이야"
+        assert second.answer == first.answer
+        assert second.sources == first.sources
+        assert second.input_tokens == 0
+        assert "search" not in second.timings
+        assert mock_search_client.search.call_count == 1
+        assert mock_llm_client.call.call_count == 1
+
+    def test_latency_excludes_marker(self, cached_pipeline):
+        cached_pipeline.query("연차")
+        result = cached_pipeline.query("연차")
+
+        stages = sum(ms for name, ms in result.timings.items() if name != "cache_hit")
+        assert result.latency_ms == round(stages, 1)
+
+    def test_config_change_misses(self, cached_pipeline, mock_llm_client):
+        cached_pipeline.query("연차")
+        cached_pipeline.search_size = 10
+        result = cached_pipeline.query("연차")
+
+        assert result.timings["cache_hit"] == 0.0
+        assert mock_llm_client.call.call_count == 2
+
+    def test_stream_hit_yields_full_answer(self, cached_pipeline):
+        first = cached_pipeline.query("연차")
+
+        events = list(cached_pipeline.query_stream("연차"))
+
+        assert events == [first.answer, events[-1]]
+        assert events[-1].timings["cache_hit"] == 1.0
+
+    def test_aquery_hit(self, cached_pipeline, mock_search_client, mock_embedding_client, mock_llm_client):
+        mock_embedding_client.aembed = AsyncMock(return_value=[0.1] * 1024)
+        mock_search_client.asearch = AsyncMock(return_value=mock_search_client.search.return_value)
+        mock_llm_client.acall = AsyncMock(return_value=mock_llm_client.call.return_value)
+
+        asyncio.run(cached_pipeline.aquery("연차"))
+        result = asyncio.run(cached_pipeline.aquery("연차"))
+
+        assert result.timings["cache_hit"] == 1.0
+        assert result.latency_ms == result.timings["wall"]
+        mock_llm_client.acall.assert_awaited_once()
+
+    def test_aquery_version_check_off_event_loop(self, async_pipeline):
+        """인덱스 버전 확인(동기 HTTP)은 이벤트 루프 스레드 밖에서 실행"""
+        threads = []
+
+        def index_version():
+            threads.append(threading.current_thread())
+            return "v1"
+
+        async_pipeline.answer_cache = SemanticAnswerCache(index_version_fn=index_version, version_check_interval=0)
+
+        asyncio.run(async_pipeline.aquery("연차"))
+
+        assert len(threads) == 2  # lookup + store
+        assert threading.main_thread() not in threads
+
+    def test_version_fn_failure_degrades_to_miss(self, cached_pipeline, mock_llm_client):
+        cached_pipeline.answer_cache.index_version_fn = MagicMock(side_effect=ConnectionError("timeout"))
+        cached_pipeline.answer_cache.version_check_interval = 0
+
+        result = cached_pipeline.query("연차")
+
+        assert result.timings["cache_hit"] == 0.0
+        assert result.answer == mock_llm_client.call.return_value.content
+
+
+class TestRAGPipelineStream:
+    """RAGPipeline.query_stream 테스트"""
+
+    @pytest.fixture
+    def stream_pipeline(self, pipeline, mock_llm_client):
+        final = mock_llm_client.call.return_value
+        mock_llm_client.stream.side_effect = lambda *a, **kw: iter(["연차 휴가는 ", "15일입니다.", final])
+        return pipeline
+
+    def test_yields_tokens_then_result(self, stream_pipeline):
+        events = list(stream_pipeline.query_stream("연차 휴가는 며칠인가요?"))
+
+        assert events[:-1] == ["연차 휴가는 ", "15일입니다."]
+        result = events[-1]
+        assert isinstance(result, RAGResult)
+        assert result.output_tokens == 30
+        assert result.source_count == 2
+
+    def test_records_ttft_separately(self, stream_pipeline):
+        result = list(stream_pipeline.query_stream("테스트"))[-1]
+
+        assert "ttft_ms" in result.timings
+        assert "llm" in result.timings
+        assert result.timings["ttft_ms"] <= result.timings["llm"]
+        stages = sum(ms for name, ms in result.timings.items() if name != "ttft_ms")
+        assert result.latency_ms == round(stages, 1)
+
+    def test_does_not_call_blocking_llm(self, stream_pipeline, mock_llm_client):
+        list(stream_pipeline.query_stream("테스트"))
+
+        mock_llm_client.call.assert_not_called()
+        mock_llm_client.stream.assert_called_once()
+
+
+@pytest.fixture
+def async_pipeline(pipeline, mock_search_client, mock_embedding_client, mock_llm_client):
+    """비동기 클라이언트 메서드가 설정된 파이프라인"""
+    mock_search_client.asearch = AsyncMock(return_value=mock_search_client.search.return_value)
+    mock_search_client.asearch_with_pipeline = AsyncMock(return_value=mock_search_client.search.return_value)
+    mock_embedding_client.aembed = AsyncMock(return_value=[0.1] * 1024)
+    mock_llm_client.acall = AsyncMock(return_value=mock_llm_client.call.return_value)
+    return pipeline
+
+
+class TestRAGPipelineAsync:
+    """RAGPipeline.aquery 테스트"""
+
+    def test_aquery_returns_result(self, async_pipeline, mock_search_client, mock_llm_client):
+        result = asyncio.run(async_pipeline.aquery("연차 휴가는 며칠인가요?"))
+
+        assert isinstance(result, RAGResult)
+        assert result.answer == mock_llm_client.call.return_value.content
+        assert result.source_count == 2
+        mock_search_client.asearch.assert_awaited_once()
+        mock_search_client.search.assert_not_called()
+
+    def test_aquery_timings_include_wall(self, async_pipeline):
+        result = asyncio.run(async_pipeline.aquery("테스트"))
+
+        for stage in ["embedding", "query_build", "search", "context_build", "prompt_render", "llm", "wall"]:
+            assert stage in result.timings
+        assert result.latency_ms == result.timings["wall"]
+
+    def test_enhance_and_embedding_run_concurrently(self, async_pipeline, mock_embedding_client):
+        """쿼리 개선 중에 원본 질문 임베딩이 이미 시작됨"""
+        order = []
+
+        async def slow_enhance(question, history):
+            order.append("enhance_start")
+            await asyncio.sleep(0.05)
+            order.append("enhance_end")
+            return question
+
+        async def embed(text):
+            order.append("embed_start")
+            return [0.1] * 1024
+
+        enhancer = MagicMock()
+        enhancer.aenhance = slow_enhance
+        mock_embedding_client.aembed = AsyncMock(side_effect=embed)
+        async_pipeline.query_enhancer = enhancer
+
+        asyncio.run(async_pipeline.aquery("연차 며칠이야", history=[{"role": "user", "content": "연차"}]))
+
+        assert order.index("embed_start") < order.index("enhance_end")
+        # 개선 결과가 원본과 같으므로 임베딩 1회만 호출
+        mock_embedding_client.aembed.assert_awaited_once_with("연차 며칠이야")
+
+    def test_reembeds_when_query_rewritten(self, async_pipeline, mock_embedding_client):
+        enhancer = MagicMock()
+        enhancer.aenhance = AsyncMock(return_value="연차 휴가 일수")
+        async_pipeline.query_enhancer = enhancer
+
+        asyncio.run(async_pipeline.aquery("그거 며칠이야", history=[{}, {}]))
+
+        assert mock_embedding_client.aembed.await_args.args[0] == "연차 휴가 일수"
+
+    def test_query_build_off_event_loop(self, async_pipeline):
+        """쿼리 생성(프로젝트 크기 count 요청 가능)은 이벤트 루프 스레드 밖에서 실행"""
+        threads = []
+
+        def project_size(project_id):
+            threads.append(threading.current_thread())
+            return 100_000
+
+        async_pipeline.query_builder = KNNQueryBuilder(project_size=ProjectSizeCache(project_size))
+
+        result = asyncio.run(async_pipeline.aquery("테스트"))
+
+        assert threads and threading.main_thread() not in threads
+        assert "query_build" in result.timings
+
+    def test_aquery_with_search_pipeline(self, async_pipeline, mock_search_client):
+        async_pipeline.search_pipeline = "hybrid-rrf"
+
+        asyncio.run(async_pipeline.aquery("테스트"))
+
+        call_args = mock_search_client.asearch_with_pipeline.await_args
+        assert call_args.kwargs["pipeline"] == "hybrid-rrf"
+
+
+class TestRAGPipelineFusion:
+    """클라이언트 융합(fusion) 모드 테스트"""
+
+    BM25_HITS = [
+        {"_id": "doc2", "_score": 12.0, "_source": {"text": "경조사 휴가", "file_name": "복지제도.md"}},
+        {"_id": "doc3", "_score": 8.0, "_source": {"text": "휴가 신청", "file_name": "휴가정책.md"}},
+    ]
+
+    @pytest.fixture
+    def fusion_pipeline(self, pipeline, mock_search_client):
+        pipeline.query_builder = HybridQueryBuilder()
+        pipeline.fusion = RRFFusion(rank_constant=60)
+        mock_search_client.msearch.return_value = [self.BM25_HITS, mock_search_client.search.return_value]
+        return pipeline
+
+    def test_query_runs_both_legs_in_one_msearch(self, fusion_pipeline, mock_search_client):
+        result = fusion_pipeline.query("휴가")
+
+        mock_search_client.msearch.assert_called_once()
+        index, entries = mock_search_client.msearch.call_args.args
+        assert index == "test-index"
+        (bm25_query, bm25_size), (knn_query, knn_size) = entries
+        assert "multi_match" in bm25_query["query"]["bool"]["must"][0]
+        assert knn_query["query"]["knn"]["embedding"]["k"] == 5
+        assert bm25_size == knn_size == 5
+        mock_search_client.search.assert_not_called()
+        mock_search_client.search_with_pipeline.assert_not_called()
+
+        # doc2: BM25 1위 + KNN 2위 → 최상위
+        assert [r["_id"] for r in result.sources] == ["doc2", "doc1", "doc3"]
+        assert result.sources[0]["_score"] == pytest.approx(1 / 61 + 1 / 62)
+        assert "fusion" in result.timings
+
+    def test_requires_sub_query_builder(self, mock_search_client, mock_embedding_client, mock_llm_client):
+        with pytest.raises(ValueError, match="build_bm25"):
+            RAGPipeline(
+                search_client=mock_search_client,
+                embedding_client=mock_embedding_client,
+                llm_client=mock_llm_client,
+                query_builder=KNNQueryBuilder(),
+                context_builder=SimpleContextBuilder(),
+                prompt_template=SimplePromptTemplate(),
+                fusion=RRFFusion(),
+            )
+
+    def test_rejects_search_pipeline(self, mock_search_client, mock_embedding_client, mock_llm_client):
+        with pytest.raises(ValueError, match="search_pipeline"):
+            RAGPipeline(
+                search_client=mock_search_client,
+                embedding_client=mock_embedding_client,
+                llm_client=mock_llm_client,
+                query_builder=HybridQueryBuilder(),
+                context_builder=SimpleContextBuilder(),
+                prompt_template=SimplePromptTemplate(),
+                search_pipeline="hybrid-rrf",
+                fusion=RRFFusion(),
+            )
+
+    def test_fusion_settings_change_answer_cache_scope(self, fusion_pipeline):
+        scope = fusion_pipeline._answer_cache_scope()
+
+        fusion_pipeline.fusion = RRFFusion(rank_constant=60, weights=[1.0, 2.0])
+
+        assert fusion_pipeline._answer_cache_scope() != scope
+
+    def test_aquery_starts_bm25_before_embedding_finishes(
+        self, fusion_pipeline, async_pipeline, mock_search_client, mock_embedding_client
+    ):
+        order = []
+
+        async def slow_embed(text):
+            order.append("embed_start")
+            await asyncio.sleep(0.05)
+            order.append("embed_end")
+            return [0.1] * 1024
+
+        async def asearch(index, query, size):
+            order.append("knn" if "knn" in query["query"] else "bm25")
+            return self.BM25_HITS if "bool" in query["query"] else mock_search_client.search.return_value
+
+        mock_embedding_client.aembed = AsyncMock(side_effect=slow_embed)
+        mock_search_client.asearch = AsyncMock(side_effect=asearch)
+
+        result = asyncio.run(fusion_pipeline.aquery("휴가"))
+
+        assert order.index("bm25") < order.index("embed_end") < order.index("knn")
+        assert [r["_id"] for r in result.sources] == ["doc2", "doc1", "doc3"]
+        assert "search_bm25" in result.timings
+        mock_search_client.asearch_with_pipeline.assert_not_called()
+
+
+@pytest.fixture
+def batch_pipeline(pipeline, mock_search_client, mock_embedding_client):
+    """query_batch용 파이프라인 (embed_batch/msearch_with_pipeline 응답 설정)"""
+    mock_embedding_client.embed_batch.side_effect = lambda texts: BatchEmbeddingResult(
+        embeddings=[[0.1] * 1024 for _ in texts]
+    )
+    mock_search_client.msearch_with_pipeline.side_effect = lambda index, entries: [
+        mock_search_client.search.return_value for _ in entries
+    ]
+    return pipeline
+
+
+class TestRAGPipelineBatch:
+    """query_batch 일괄 실행 테스트"""
+
+    QUESTIONS = ["연차 휴가는 며칠?", "경조사 휴가는?", "휴가 신청 방법은?"]
+
+    def test_shared_stages_run_once(self, batch_pipeline, mock_search_client, mock_embedding_client, mock_llm_client):
+        results = batch_pipeline.query_batch(self.QUESTIONS)
+
+        assert [r.question for r in results] == self.QUESTIONS
+        mock_embedding_client.embed_batch.assert_called_once_with(self.QUESTIONS)
+        mock_embedding_client.embed.assert_not_called()
+        mock_search_client.msearch_with_pipeline.assert_called_once()
+        index, entries = mock_search_client.msearch_with_pipeline.call_args.args
+        assert index == "test-index"
+        assert len(entries) == 3
+        assert all(size == 5 and pipeline is None for _, size, pipeline in entries)
+        mock_search_client.search.assert_not_called()
+        assert mock_llm_client.call.call_count == 3
+        assert results[0].answer == "연차 휴가는 입사 1년차에 15일이 부여됩니다. [1]"
+        assert results[0].source_count == 2
+
+    def test_timings(self, batch_pipeline):
+        result = batch_pipeline.query_batch(self.QUESTIONS[:1])[0]
+
+        for stage in ("embedding", "query_build", "search", "context_build", "prompt_render", "llm", "wall"):
+            assert stage in result.timings
+        assert result.latency_ms == pytest.approx(
+            sum(ms for name, ms in result.timings.items() if name != "wall"), abs=0.1
+        )
+
+    def test_duplicate_questions_embedded_once(self, batch_pipeline, mock_embedding_client):
+        results = batch_pipeline.query_batch(["휴가", "휴가", "복지"])
+
+        mock_embedding_client.embed_batch.assert_called_once_with(["휴가", "복지"])
+        assert len(results) == 3
+
+    def test_search_batch_size_splits_msearch(self, batch_pipeline, mock_search_client):
+        batch_pipeline.query_batch(self.QUESTIONS, search_batch_size=2)
+
+        sizes = [len(call.args[1]) for call in mock_search_client.msearch_with_pipeline.call_args_list]
+        assert sizes == [2, 1]
+
+    def test_search_pipeline_passed_per_entry(self, batch_pipeline, mock_search_client):
+        batch_pipeline.query_builder = HybridQueryBuilder()
+        batch_pipeline.search_pipeline = "hybrid-rrf"
+
+        batch_pipeline.query_batch(self.QUESTIONS[:2])
+
+        _, entries = mock_search_client.msearch_with_pipeline.call_args.args
+        assert [pipeline for _, _, pipeline in entries] == ["hybrid-rrf", "hybrid-rrf"]
+
+    def test_fusion_sends_both_legs(self, batch_pipeline, mock_search_client):
+        batch_pipeline.query_builder = HybridQueryBuilder()
+        batch_pipeline.fusion = RRFFusion(rank_constant=60)
+
+        results = batch_pipeline.query_batch(self.QUESTIONS[:2])
+
+        _, entries = mock_search_client.msearch_with_pipeline.call_args.args
+        assert len(entries) == 4
+        assert "multi_match" in entries[0][0]["query"]["bool"]["must"][0]
+        assert "knn" in entries[1][0]["query"]
+        assert all("fusion" in r.timings for r in results)
+
+    def test_failed_search_isolated(self, batch_pipeline, mock_search_client, mock_llm_client):
+        hits = mock_search_client.search.return_value
+
+        def msearch(index, entries):
+            if any(query["query"]["knn"]["embedding"]["vector"][0] == 0.9 for query, _, _ in entries):
+                raise RuntimeError("search failed")
+            return [hits for _ in entries]
+
+        batch_pipeline.embedding_client.embed_batch.side_effect = lambda texts: BatchEmbeddingResult(
+            embeddings=[[0.9 if text == "깨진 질문" else 0.1] * 1024 for text in texts]
+        )
+        mock_search_client.msearch_with_pipeline.side_effect = msearch
+
+        results = batch_pipeline.query_batch(["휴가", "깨진 질문", "복지"], return_exceptions=True)
+
+        assert isinstance(results[1], RuntimeError)
+        assert results[0].source_count == results[2].source_count == 2
+        assert mock_llm_client.call.call_count == 2
+
+    def test_embedding_error(self, batch_pipeline, mock_embedding_client, mock_llm_client):
+        mock_embedding_client.embed_batch.side_effect = lambda texts: BatchEmbeddingResult(
+            embeddings=[None, [0.1] * 1024], errors={0: "throttled"}
+        )
+
+        results = batch_pipeline.query_batch(["휴가", "복지"], return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert "throttled" in str(results[0])
+        assert results[1].question == "복지"
+        assert mock_llm_client.call.call_count == 1
+
+    def test_raises_without_return_exceptions(self, batch_pipeline, mock_llm_client):
+        mock_llm_client.call.side_effect = RuntimeError("LLM down")
+
+        with pytest.raises(RuntimeError, match="LLM down"):
+            batch_pipeline.query_batch(self.QUESTIONS, concurrency=1)
+
+    def test_llm_concurrency_bounded(self, batch_pipeline, mock_llm_client):
+        response = mock_llm_client.call.return_value
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def call(*args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return response
+
+        mock_llm_client.call.side_effect = call
+
+        results = batch_pipeline.query_batch([f"질문 {i}" for i in range(8)], concurrency=3)
+
+        assert len(results) == 8
+        assert peak == 3
+
+    def test_on_result_called_per_question(self, batch_pipeline, mock_embedding_client):
+        mock_embedding_client.embed_batch.side_effect = lambda texts: BatchEmbeddingResult(
+            embeddings=[None] + [[0.1] * 1024] * (len(texts) - 1), errors={0: "throttled"}
+        )
+        seen: dict[int, object] = {}
+
+        results = batch_pipeline.query_batch(
+            self.QUESTIONS, return_exceptions=True, on_result=lambda i, result: seen.setdefault(i, result)
+        )
+
+        assert sorted(seen) == [0, 1, 2]
+        assert isinstance(seen[0], RuntimeError)
+        assert [seen[i] for i in range(3)] == results
+
+    def test_histories_length_checked(self, batch_pipeline):
+        with pytest.raises(ValueError, match="histories"):
+            batch_pipeline.query_batch(self.QUESTIONS, histories=[[]])
+
+    def test_batch_filter_reranks_each_question(self, batch_pipeline):
+        reranker = RerankerFilter(top_k=1)
+        reranker._ranker = MagicMock()
+        reranker._ranker.rank.side_effect = lambda query, docs: MagicMock(
+            results=[MagicMock(doc_id=i) for i in reversed(range(len(docs)))]
+        )
+        batch_pipeline.result_filter = CompositeFilter([TopKFilter(k=2), reranker])
+
+        results = batch_pipeline.query_batch(self.QUESTIONS)
+
+        assert reranker._ranker.rank.call_count == 3
+        assert sorted(call.kwargs["query"] for call in reranker._ranker.rank.call_args_list) == sorted(self.QUESTIONS)
+        assert [[s["_id"] for s in r.sources] for r in results] == [["doc2"]] * 3
+        assert "filter" in results[0].timings
+
+    def test_answer_cache_hit_skips_llm(self, batch_pipeline, mock_llm_client):
+        batch_pipeline.answer_cache = SemanticAnswerCache()
+        batch_pipeline.query_batch(self.QUESTIONS[:1])
+        mock_llm_client.call.reset_mock()
+
+        results = batch_pipeline.query_batch(self.QUESTIONS[:1])
+
+        mock_llm_client.call.assert_not_called()
+        assert results[0].timings["cache_hit"] == 1.0
+        assert results[0].input_tokens == 0
+
 
 class TestFactoryFunctions:
     """팩토리 함수 테스트"""
@@ -243,3 +746,25 @@ class TestFactoryFunctions:
         assert isinstance(pipeline.query_builder, KNNQueryBuilder)
         assert isinstance(pipeline.context_builder, SimpleContextBuilder)
         assert isinstance(pipeline.prompt_template, SimplePromptTemplate)
+
+    @patch("src.rag.pipeline.LocalSearchClient")
+    @patch("src.rag.pipeline.OpenSearchClient")
+    @patch("src.rag.pipeline.EmbeddingClient")
+    @patch("src.rag.pipeline.LLMClient")
+    def test_create_minimal_pipeline_with_snapshot(self, mock_llm, mock_embed, mock_search, mock_local):
+        """snapshot 지정 시 OpenSearch 대신 로컬 검색 클라이언트 사용"""
+        pipeline = create_minimal_pipeline(project_id=334, snapshot="data/snapshots/334")
+
+        mock_local.from_snapshot.assert_called_once_with("data/snapshots/334")
+        mock_search.assert_not_called()
+        assert pipeline.search_client is mock_local.from_snapshot.return_value
+
+    @patch("src.rag.pipeline.OpenSearchClient")
+    @patch("src.rag.pipeline.EmbeddingClient")
+    @patch("src.rag.pipeline.LLMClient")
+    def test_knn_options_forwarded_to_query_builder(self, mock_llm, mock_embed, mock_search):
+        """knn_options가 쿼리 빌더 근사 knn 옵션으로 전달되는지 확인"""
+        pipeline = create_minimal_pipeline(knn_options={"ef_search": 64, "knn_k": 40})
+
+        assert pipeline.query_builder.ef_search == 64
+        assert pipeline.query_builder.knn_k == 40
@@ -2,9 +2,10 @@
 
 import pytest
 
-from src.rag.query_builder import (
+from src.rag.modules.query_builder import (
     HybridQueryBuilder,
     KNNQueryBuilder,
+    ProjectSizeCache,
     QueryBuilder,
 )
 
@@ -197,6 +198,147 @@ class TestHybridQueryBuilder:
         builder = HybridQueryBuilder()
         assert isinstance(builder, QueryBuilder)
 
+    def test_standalone_subqueries_match_hybrid(self):
+        """build_bm25 / build_knn 단독 쿼리 = hybrid 서브쿼리"""
+        builder = HybridQueryBuilder()
+
+        hybrid = builder.build(query="테스트", embedding=DUMMY_EMBEDDING, project_id=334, k=7)
+
+        assert builder.build_bm25("테스트", 334)["query"] == hybrid["query"]["hybrid"]["queries"][0]
+        assert builder.build_knn(DUMMY_EMBEDDING, 334, k=7)["query"] == hybrid["query"]["hybrid"]["queries"][1]
+
+
+class TestExactSearch:
+    """작은 프로젝트 정확 검색 (script_score) 전환 테스트"""
+
+    def test_small_project_uses_script_score(self):
+        """청크 수 < exact_threshold면 script_score"""
+        builder = KNNQueryBuilder(project_size=lambda project_id: 78, exact_threshold=1000)
+
+        query = builder.build("테스트", DUMMY_EMBEDDING, 334)["query"]
+
+        assert "script_score" in query
+        assert query["script_score"]["query"] == {"bool": {"filter": [{"term": {"project_id": 334}}]}}
+        script = query["script_score"]["script"]
+        assert script["lang"] == "knn"
+        assert script["source"] == "knn_score"
+        assert script["params"] == {"field": "embedding", "query_value": DUMMY_EMBEDDING, "space_type": "l2"}
+
+    def test_large_project_uses_knn(self):
+        """청크 수 >= exact_threshold면 근사 knn"""
+        builder = KNNQueryBuilder(project_size=lambda project_id: 1000, exact_threshold=1000)
+
+        assert "knn" in builder.build("테스트", DUMMY_EMBEDDING, 334)["query"]
+
+    def test_without_project_size_uses_knn(self):
+        """project_size가 없으면 항상 근사 knn"""
+        assert not KNNQueryBuilder().use_exact(334)
+        assert "knn" in HybridQueryBuilder().build_knn(DUMMY_EMBEDDING, 334)["query"]
+
+    def test_hybrid_knn_subquery(self):
+        """하이브리드 KNN 서브쿼리도 전환, BM25 서브쿼리는 그대로"""
+        builder = HybridQueryBuilder(project_size=lambda project_id: 10, space_type="cosinesimil")
+
+        queries = builder.build("테스트", DUMMY_EMBEDDING, 334)["query"]["hybrid"]["queries"]
+
+        assert "bool" in queries[0]
+        assert queries[1]["script_score"]["script"]["params"]["space_type"] == "cosinesimil"
+
+    def test_project_size_cache(self):
+        """프로젝트별 청크 수는 TTL 동안 한 번만 조회"""
+        calls = []
+
+        def count(project_id: int) -> int:
+            calls.append(project_id)
+            return 78
+
+        sizes = ProjectSizeCache(count)
+        builder = KNNQueryBuilder(project_size=sizes)
+        for _ in range(3):
+            builder.build("테스트", DUMMY_EMBEDDING, 334)
+        builder.build("테스트", DUMMY_EMBEDDING, 335)
+
+        assert calls == [334, 335]
+
+        sizes.invalidate(334)
+        assert sizes(334) == 78
+        assert calls == [334, 335, 334]
+
+    def test_project_size_cache_ttl(self):
+        """TTL이 지나면 다시 조회"""
+        calls = []
+        sizes = ProjectSizeCache(lambda project_id: calls.append(project_id) or 5, ttl_seconds=0)
+
+        sizes(334)
+        sizes(334)
+
+        assert calls == [334, 334]
+
+    def test_project_size_failure_falls_back_to_knn(self):
+        """청크 수 조회가 실패하면 쿼리는 근사 knn으로"""
+
+        def count(project_id: int) -> int:
+            raise ConnectionError("count timeout")
+
+        assert "knn" in KNNQueryBuilder(project_size=count).build("테스트", DUMMY_EMBEDDING, 334)["query"]
+        assert (
+            "knn"
+            in KNNQueryBuilder(project_size=ProjectSizeCache(count)).build("테스트", DUMMY_EMBEDDING, 334)["query"]
+        )
+
+    def test_project_size_cache_remembers_failure(self):
+        """실패는 failure_ttl_seconds 동안 재조회하지 않음"""
+        calls = []
+
+        def count(project_id: int) -> int:
+            calls.append(project_id)
+            raise ConnectionError("count timeout")
+
+        sizes = ProjectSizeCache(count, failure_ttl_seconds=60)
+        assert sizes(334) is None
+        assert sizes(334) is None
+        assert calls == [334]
+
+        sizes.failure_ttl_seconds = 0
+        sizes(334)
+        assert calls == [334, 334]
+
+
+class TestKNNTuning:
+    """근사 knn 튜닝 옵션 (knn_k / ef_search / rescore) 테스트"""
+
+    def test_defaults_omit_options(self):
+        """옵션 미지정 시 클러스터 기본값 사용 (키 없음)"""
+        knn = KNNQueryBuilder().build("테스트", DUMMY_EMBEDDING, 334)["query"]["knn"]["embedding"]
+
+        assert "method_parameters" not in knn
+        assert "rescore" not in knn
+
+    def test_ef_search_and_knn_k(self):
+        """ef_search → method_parameters, knn_k는 build의 k보다 우선"""
+        builder = KNNQueryBuilder(ef_search=64, knn_k=40)
+
+        knn = builder.build("테스트", DUMMY_EMBEDDING, 334, k=5)["query"]["knn"]["embedding"]
+
+        assert knn["method_parameters"] == {"ef_search": 64}
+        assert knn["k"] == 40
+
+    def test_rescore(self):
+        """oversample_factor가 있으면 rescore 객체, 없으면 bool"""
+        oversampled = HybridQueryBuilder(oversample_factor=2.0, rescore=False).build_knn(DUMMY_EMBEDDING, 334)
+        plain = HybridQueryBuilder(rescore=False).build_knn(DUMMY_EMBEDDING, 334)
+
+        assert oversampled["query"]["knn"]["embedding"]["rescore"] == {"oversample_factor": 2.0}
+        assert plain["query"]["knn"]["embedding"]["rescore"] is False
+
+    def test_exact_search_ignores_knn_options(self):
+        """정확 검색(script_score)에는 HNSW 옵션을 붙이지 않음"""
+        builder = KNNQueryBuilder(project_size=lambda project_id: 10, ef_search=64)
+
+        query = builder.build("테스트", DUMMY_EMBEDDING, 334)["query"]
+
+        assert "method_parameters" not in query["script_score"]["script"]["params"]
+
 
 class TestQueryBuilderComparison:
     """QueryBuilder 비교 테스트"""
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from src.rag.query_enhancer import LLMQueryEnhancer, NoopQueryEnhancer
+from src.rag.modules.query_enhancer import LLMQueryEnhancer, NoopQueryEnhancer
 
 
 class TestNoopQueryEnhancer:
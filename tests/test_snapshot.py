@@ -0,0 +1,119 @@
+"""ChunkSnapshot / SnapshotWriter 테스트"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.local_search.snapshot import ChunkSnapshot, SnapshotWriter
+
+
+def _hit(i: int, dimensions: int = 4, field: str = "embedding") -> dict:
+    return {
+        "_id": f"chunk-{i}",
+        "_source": {
+            "text": f"본문 {i} — 연차 휴가",
+            "chunk_text": f"청크 {i}",
+            "file_name": f"doc{i // 2}.pdf",
+            "document_id": 100 + i // 2,
+            "chunk_index": i % 2,
+            "page_number": None if i == 0 else i,
+            "project_id": 334,
+            field: [float(i + d) for d in range(dimensions)],
+        },
+    }
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "snap"
+    with SnapshotWriter(path, dimensions=4, source="test-index") as writer:
+        for i in range(5):
+            writer.add_hit(_hit(i, field="embedding" if i % 2 else "embedding_vector"))
+    return path
+
+
+class TestSnapshotRoundTrip:
+    """쓰기 → 읽기 왕복 테스트"""
+
+    def test_embeddings_are_memmapped(self, snapshot_path):
+        snapshot = ChunkSnapshot.open(snapshot_path)
+
+        assert isinstance(snapshot.embeddings, np.memmap)
+        assert snapshot.embeddings.dtype == np.float32
+        assert snapshot.embeddings.shape == (5, 4)
+        assert snapshot.embeddings[3].tolist() == [3.0, 4.0, 5.0, 6.0]
+        assert not snapshot.embeddings.flags.writeable
+
+    def test_columns(self, snapshot_path):
+        snapshot = ChunkSnapshot.open(snapshot_path)
+
+        assert len(snapshot) == 5
+        assert snapshot.document_id.tolist() == [100, 100, 101, 101, 102]
+        assert snapshot.chunk_index.tolist() == [0, 1, 0, 1, 0]
+        assert snapshot.page_number[0] == -1  # 없는 값
+        assert snapshot.id(2) == "chunk-2"
+        assert snapshot.text(4) == "본문 4 — 연차 휴가"
+        assert snapshot.string("file_name", 3) == "doc1.pdf"
+
+    def test_to_hit(self, snapshot_path):
+        hit = ChunkSnapshot.open(snapshot_path).to_hit(0, score=0.5)
+
+        assert hit["_id"] == "chunk-0"
+        assert hit["_score"] == 0.5
+        assert hit["_source"]["page_number"] is None
+        assert hit["_source"]["chunk_text"] == "청크 0"
+        assert "embedding" not in hit["_source"]
+
+    def test_meta(self, snapshot_path):
+        meta = json.loads((snapshot_path / "meta.json").read_text(encoding="utf-8"))
+
+        assert meta["count"] == 5
+        assert meta["dimensions"] == 4
+        assert meta["source"] == "test-index"
+        assert not (snapshot_path / "embeddings.raw.tmp").exists()
+
+    def test_float16(self, tmp_path):
+        with SnapshotWriter(tmp_path, dimensions=4, dtype="float16") as writer:
+            writer.add_hit(_hit(1))
+
+        snapshot = ChunkSnapshot.open(tmp_path)
+        assert snapshot.embeddings.dtype == np.float16
+        assert snapshot.embeddings[0].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_empty_snapshot(self, tmp_path):
+        with SnapshotWriter(tmp_path, dimensions=4):
+            pass
+
+        snapshot = ChunkSnapshot.open(tmp_path)
+        assert len(snapshot) == 0
+        assert snapshot.embeddings.shape == (0, 4)
+
+
+class TestSnapshotValidation:
+    """입력 검증 테스트"""
+
+    def test_dimension_mismatch(self, tmp_path):
+        with pytest.raises(ValueError, match="차원"):
+            with SnapshotWriter(tmp_path, dimensions=8) as writer:
+                writer.add_hit(_hit(0))
+
+    def test_missing_embedding(self, tmp_path):
+        hit = _hit(0)
+        del hit["_source"]["embedding"]
+
+        with pytest.raises(ValueError, match="임베딩 필드 없음"):
+            with SnapshotWriter(tmp_path, dimensions=4) as writer:
+                writer.add_hit(hit)
+
+    def test_invalid_dtype(self, tmp_path):
+        with pytest.raises(ValueError):
+            SnapshotWriter(tmp_path, dtype="int8")
+
+    def test_unsupported_version(self, snapshot_path):
+        meta_path = snapshot_path / "meta.json"
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta_path.write_text(json.dumps({**meta, "version": 99}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="버전"):
+            ChunkSnapshot.open(snapshot_path)